@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark gracza komputerowego MCTS (`game_ai.MCTSBot`).
+
+1. Opóźnienie ruchu: bot wybiera ruchy za wszystkich graczy przy stole
+   (domyślnie 4) i mierzy czas każdej decyzji - mediana, p95 i maksimum
+   względem limitu `--time` - oraz liczbę iteracji na ruch ze wszystkich
+   procesów (`--workers`).
+2. Z `--match N`: N gier bota na miejscu 1 przeciw strategiom
+   `--opponent` z `game_policies` i jego procent zwycięstw.
+
+Uruchomienie:
+    python benchmark_ai.py --time 1.0 --workers 4 --moves 60
+    python benchmark_ai.py --time 0.2 --match 10 --max-rounds 4
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import time
+
+from game_ai import MCTSBot, advance
+from game_engine import GameEngine
+from game_model import GameData
+from game_policies import POLICIES, play_game
+
+def percentile(values, p):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+def latency(bot: MCTSBot, engine: GameEngine, players: int, moves: int, seed: int):
+    engine.new_game(players, seed=seed)
+    times = []
+    iterations = []
+    while len(times) < moves and not engine.game_ended:
+        advance(engine)
+        if engine.game_ended:
+            break
+        started = time.perf_counter()
+        move = bot.choose_move(engine)
+        times.append(time.perf_counter() - started)
+        iterations.append(bot.last_iterations)
+        engine.apply_move(move)
+
+    late = sum(1 for t in times if t > bot.time_limit)
+    print(f"\n⏱️ MCTS: {len(times)} ruchów ({players} graczy), limit {bot.time_limit:.2f} s, "
+          f"procesy: {bot.workers or 'bez puli'}")
+    print(f"   opóźnienie: mediana {percentile(times, 0.5):.3f} s, p95 {percentile(times, 0.95):.3f} s, "
+          f"max {max(times):.3f} s, po limicie: {late}")
+    print(f"   iteracje na ruch: średnio {sum(iterations) / len(iterations):.0f}, "
+          f"max {max(iterations)} (runda {engine.current_round})")
+
+def match(bot: MCTSBot, engine: GameEngine, players: int, games: int, opponent: str, seed: int):
+    wins = 0.0
+    for i in range(games):
+        policies = [bot] + [POLICIES[opponent]() for _ in range(players - 1)]
+        play_game(engine, policies, seed=seed + i)
+        best = max(p.prestige_points for p in engine.players)
+        winners = [seat for seat, p in enumerate(engine.players) if p.prestige_points == best]
+        if 0 in winners:
+            wins += 1 / len(winners)
+        print(f"   gra {i + 1}: PZ {[p.prestige_points for p in engine.players]} ({engine.end_condition})")
+    print(f"\n🏆 MCTS przeciw '{opponent}': {wins / games:.0%} zwycięstw w {games} grach "
+          f"(losowo: {1 / players:.0%})")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark gracza komputerowego MCTS")
+    parser.add_argument('--time', type=float, default=1.0, help="Limit czasu na ruch (s)")
+    parser.add_argument('--iterations', type=int, default=None, help="Limit iteracji na ruch")
+    parser.add_argument('--workers', type=int, default=None, help="Procesy (0 - w bieżącym procesie)")
+    parser.add_argument('--players', type=int, default=4, choices=[2, 3, 4])
+    parser.add_argument('--moves', type=int, default=40, help="Ruchy w pomiarze opóźnienia")
+    parser.add_argument('--match', type=int, default=0, help="Gier przeciw strategiom skryptowym")
+    parser.add_argument('--opponent', default='scripted', choices=sorted(POLICIES))
+    parser.add_argument('--max-rounds', type=int, default=None, help="Limit rund w meczu")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    game_data = GameData()
+    with contextlib.redirect_stdout(io.StringIO()):
+        game_data.load_data()
+    engine = GameEngine(game_data)
+    engine.max_rounds = args.max_rounds or game_data.scenarios[0].max_rounds
+
+    bot = MCTSBot(time_limit=args.time, iterations=args.iterations, workers=args.workers,
+                  rng=random.Random(args.seed))
+    try:
+        latency(bot, engine, args.players, args.moves, args.seed)
+        if args.match:
+            match(bot, engine, args.players, args.match, args.opponent, args.seed)
+    finally:
+        bot.close()
+
+if __name__ == '__main__':
+    main()
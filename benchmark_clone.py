@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark kopiowania stanu gry: `GameEngine.clone()` kontra `copy.deepcopy`.
+
+Kopiowany jest silnik w trakcie gry (po kilku rundach strategii
+skryptowej). Benchmark sprawdza też, że kopia jest wierna (ten sam
+snapshot) i niezależna (dokończenie gry na kopii nie zmienia oryginału).
+
+Uruchomienie:
+    python benchmark_clone.py --copies 2000 --rounds 4
+"""
+
+import argparse
+import contextlib
+import copy
+import io
+import json
+import time
+
+from game_engine import GameEngine
+from game_journal import snapshot_game
+from game_model import GameData
+from game_policies import POLICIES, play_round
+
+def timed(function, count: int) -> float:
+    started = time.perf_counter()
+    for _ in range(count):
+        function()
+    return (time.perf_counter() - started) / count
+
+def state_key(engine: GameEngine) -> str:
+    return json.dumps(snapshot_game(engine), sort_keys=True)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark kopiowania stanu gry PRINCIPIA")
+    parser.add_argument('--copies', type=int, default=2000)
+    parser.add_argument('--rounds', type=int, default=4, help="Rozegrane rundy przed kopiowaniem")
+    parser.add_argument('--players', type=int, default=3, choices=[2, 3, 4])
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    game_data = GameData()
+    with contextlib.redirect_stdout(io.StringIO()):
+        game_data.load_data()
+    engine = GameEngine(game_data)
+    policies = [POLICIES['scripted']() for _ in range(args.players)]
+    engine.new_game(args.players, seed=args.seed)
+    for _ in range(args.rounds):
+        if not engine.game_ended:
+            play_round(engine, policies)
+
+    # Wierność i niezależność kopii
+    before = state_key(engine)
+    clone = engine.clone()
+    faithful = state_key(clone) == before
+    while not clone.game_ended:
+        play_round(clone, policies)
+    independent = state_key(engine) == before
+
+    deep = timed(lambda: copy.deepcopy(engine), max(1, args.copies // 20))
+    fast = timed(engine.clone, args.copies)
+
+    print(f"\n🧬 Kopia gry po {engine.current_round - 1} rundach ({args.players} graczy)")
+    print(f"   copy.deepcopy: {deep * 1e6:9.1f} µs")
+    print(f"   clone():       {fast * 1e6:9.1f} µs  ({deep / fast:.0f}x szybciej)")
+    print(f"   {'✅' if faithful else '❌'} kopia wierna, {'✅' if independent else '❌'} oryginał nienaruszony")
+
+if __name__ == '__main__':
+    main()
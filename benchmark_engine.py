@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark silnika gry bez interfejsu.
+
+Rozgrywa pełne gry `GameEngine` strategią z `game_policies` (domyślnie
+skryptową) na raz wczytanych danych w jednym procesie i podaje
+liczbę gier na sekundę. Gra kończy się warunkiem z `check_end_game`
+albo po limicie rund scenariusza.
+
+Z `--legal-moves` mierzy też generator ruchów: gry losowymi dozwolonymi
+ruchami i liczba wywołań `GameEngine.legal_moves` na sekundę. Dla strategii
+heurystycznych (`MovePolicy`) podaje też średni czas jednej decyzji.
+
+Uruchomienie:
+    python benchmark_engine.py --games 2000 --players 3
+    python benchmark_engine.py --games 500 --legal-moves
+    python benchmark_engine.py --games 500 --policy greedy-pz
+"""
+
+import argparse
+import random
+import time
+from collections import Counter
+
+from game_engine import GameEngine
+from game_model import GameData, GamePhase
+from game_policies import POLICIES, MovePolicy, play_game
+
+def legal_moves_rate(engine: GameEngine, players: int, games: int, seed: int = 0):
+    """Gry losowymi dozwolonymi ruchami (faza grantów bez grantów); czas samego legal_moves"""
+    rng = random.Random(seed)
+    calls = 0
+    moves_total = 0
+    spent = 0.0
+    for i in range(games):
+        engine.new_game(players, seed=seed + i)
+        while not engine.game_ended:
+            engine.next_phase()
+            while engine.current_phase == GamePhase.AKCJE:
+                started = time.perf_counter()
+                moves = engine.legal_moves()
+                spent += time.perf_counter() - started
+                calls += 1
+                moves_total += len(moves)
+                engine.apply_move(rng.choice(moves))
+            engine.next_phase()
+
+    print(f"\n🧭 legal_moves: {calls} wywołań w {spent:.2f} s")
+    print(f"   {calls / spent:,.0f} wywołań/s ({spent / calls * 1e6:.1f} µs), "
+          f"średnio {moves_total / calls:.1f} ruchów")
+
+class TimedPolicy:
+    """Strategia z pomiarem czasu `choose_move` (reszta jak w oryginale)"""
+
+    def __init__(self, policy: MovePolicy):
+        self.policy = policy
+        self.decisions = 0
+        self.spent = 0.0
+
+    def __getattr__(self, name):
+        return getattr(self.policy, name)
+
+    @property
+    def rng(self):
+        return self.policy.rng
+
+    @rng.setter
+    def rng(self, value):  # play_game ustawia generator z ziarna gry
+        self.policy.rng = value
+
+    def choose_move(self, engine: GameEngine):
+        started = time.perf_counter()
+        move = self.policy.choose_move(engine)
+        self.spent += time.perf_counter() - started
+        self.decisions += 1
+        return move
+
+    play_turn = MovePolicy.play_turn
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark silnika gry PRINCIPIA")
+    parser.add_argument('--games', type=int, default=2000)
+    parser.add_argument('--players', type=int, default=3, choices=[2, 3, 4])
+    parser.add_argument('--policy', default='scripted', choices=sorted(POLICIES))
+    parser.add_argument('--max-rounds', type=int, default=None,
+                        help="Limit rund (domyślnie ze scenariusza)")
+    parser.add_argument('--seed', type=int, default=None, help="Ziarno pierwszej gry (gra i: seed + i)")
+    parser.add_argument('--legal-moves', action='store_true', help="Zmierz też generator dozwolonych ruchów")
+    args = parser.parse_args()
+
+    game_data = GameData()
+    game_data.load_data()
+    engine = GameEngine(game_data)
+    engine.max_rounds = args.max_rounds or game_data.scenarios[0].max_rounds
+    policies = [POLICIES[args.policy]() for _ in range(args.players)]
+    timed = issubclass(POLICIES[args.policy], MovePolicy)
+    if timed:
+        policies = [TimedPolicy(policy) for policy in policies]
+
+    rounds = 0
+    reasons = Counter()
+    started = time.perf_counter()
+    for i in range(args.games):
+        rounds += play_game(engine, policies, seed=args.seed + i if args.seed is not None else None)
+        reasons[engine.end_condition] += 1
+    elapsed = time.perf_counter() - started
+
+    print(f"\n🎲 {args.games} gier ({args.players} graczy) w {elapsed:.2f} s")
+    print(f"   {args.games / elapsed:,.0f} gier/s, średnio {rounds / args.games:.1f} rund")
+    for condition, count in reasons.most_common():
+        print(f"   koniec '{condition}': {count}")
+    if timed:
+        decisions = sum(policy.decisions for policy in policies)
+        spent = sum(policy.spent for policy in policies)
+        print(f"   decyzje '{args.policy}': {decisions} po {spent / decisions * 1e6:.1f} µs "
+              f"(z legal_moves)")
+
+    if args.legal_moves:
+        legal_moves_rate(engine, args.players, args.games, args.seed or 0)
+
+if __name__ == '__main__':
+    main()
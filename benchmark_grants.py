@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Mikrobenchmark wymagań grantów.
+
+Porównuje skompilowane predykaty (`GrantCard.requirement`, budowane
+w `load_grants_from_csv`) z dawnym dopasowaniem napisów w
+`meets_grant_requirements` (małe litery, podciągi i `re.search` przy
+każdym wywołaniu, przegląd wszystkich Wielkich Projektów dla konsorcjów).
+Gracze pochodzą z gier w toku rozegranych strategią z `game_policies`,
+sprawdzane są wszystkie pary grant × gracz.
+
+Wypisuje też wymagania, dla których wyniki się różnią - tam dawne
+dopasowanie źle czytało tekst (np. "Max. Reputacja 1", "Min. 2 profesorów").
+
+Uruchomienie:
+    python benchmark_grants.py --states 200 --repeat 20
+"""
+
+import argparse
+import contextlib
+import io
+import re
+import time
+from collections import Counter
+
+from game_engine import GameEngine
+from game_model import GameData, ScientistType
+from game_policies import POLICIES, play_round
+
+def legacy_meets_grant_requirements(engine: GameEngine, player, grant) -> bool:
+    """Dawna heurystyczna walidacja wymagań z pola tekstowego (do porównania)"""
+    req = (grant.requirements or '').lower()
+    if not req or 'brak wymag' in req:
+        return True
+    if 'reputacja' in req:
+        m = re.search(r'reputacja\s*(\d+)', req)
+        if m and player.reputation < int(m.group(1)):
+            return False
+    if 'min. 1 doktorant' in req:
+        if not any(s.type == ScientistType.DOKTORANT for s in player.scientists):
+            return False
+    if 'min. 1 doktor' in req and 'doktorant' not in req:
+        if not any(s.type == ScientistType.DOKTOR for s in player.scientists):
+            return False
+    if 'min. 1 profesor' in req:
+        if not any(s.type == ScientistType.PROFESOR for s in player.scientists):
+            return False
+    if 'naukowiec fizyk' in req and not any('fiz' in s.field.lower() for s in player.scientists):
+        return False
+    if 'naukowiec biolog' in req and not any('bio' in s.field.lower() for s in player.scientists):
+        return False
+    if 'naukowiec chemik' in req and not any('chem' in s.field.lower() for s in player.scientists):
+        return False
+    if 'min. 2 naukowc' in req:
+        if len(player.scientists) < 2:
+            return False
+    if '2 różnych dziedzin' in req or '2 roznych dziedzin' in req:
+        if len(set(s.field for s in player.scientists)) < 2:
+            return False
+    if 'min. 1 konsorcjum' in req or 'min. 1 konsorcja' in req:
+        if not any(p.director == player or player in p.members for p in engine.game_data.large_projects):
+            return False
+    return True
+
+def game_states(game_data: GameData, count: int, players: int, policy: str):
+    """Kopie gier w toku (po 1-6 rundach) - różne zasoby, naukowcy i konsorcja"""
+    engine = GameEngine(game_data)
+    states = []
+    seed = 0
+    while len(states) < count:
+        engine.new_game(players, seed=seed)
+        policies = [POLICIES[policy]() for _ in range(players)]
+        for rounds in range(1 + seed % 6):
+            if engine.game_ended:
+                break
+            play_round(engine, policies)
+        states.append(engine.clone())
+        seed += 1
+    return states
+
+def time_checks(check, pairs, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for engine, player, grant in pairs:
+            check(engine, player, grant)
+    return time.perf_counter() - started
+
+def main():
+    parser = argparse.ArgumentParser(description="Mikrobenchmark wymagań grantów PRINCIPIA")
+    parser.add_argument('--states', type=int, default=200, help="Gier w toku (stanów graczy)")
+    parser.add_argument('--players', type=int, default=4, choices=[2, 3, 4])
+    parser.add_argument('--policy', default='consortium-builder', choices=sorted(POLICIES))
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    game_data = GameData()
+    with contextlib.redirect_stdout(io.StringIO()):
+        game_data.load_data()
+    states = game_states(game_data, args.states, args.players, args.policy)
+    pairs = [(engine, player, grant) for engine in states for player in engine.players
+             for grant in engine.game_data.grants]
+
+    legacy = time_checks(legacy_meets_grant_requirements, pairs, args.repeat)
+    compiled = time_checks(lambda engine, player, grant: grant.requirement(player), pairs, args.repeat)
+    checks = len(pairs) * args.repeat
+
+    print(f"\n📋 Wymagania grantów: {checks} sprawdzeń ({len(pairs)} par grant × gracz)")
+    print(f"   napisy (dawniej): {legacy / checks * 1e9:7.0f} ns")
+    print(f"   predykaty:        {compiled / checks * 1e9:7.0f} ns  (x{legacy / compiled:.1f})")
+    print(f"   nierozpoznane przy wczytaniu: {len(game_data.grant_requirement_problems)}")
+
+    differ = Counter()
+    for engine, player, grant in pairs:
+        if legacy_meets_grant_requirements(engine, player, grant) != grant.requirement(player):
+            differ[grant.requirements] += 1
+    if differ:
+        print("\n🔍 Inny wynik niż dawne dopasowanie (wymagania: liczba par):")
+        for text, count in differ.most_common():
+            print(f"   {text:<45} {count}")
+
+if __name__ == '__main__':
+    main()
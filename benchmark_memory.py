@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark pamięci obiektów stanu gry.
+
+1. Rozmiar instancji: klasy z `game_model` (`__slots__`) kontra te same
+   pola w zwykłej dataclass ze słownikiem atrybutów. `Player` nie ma
+   slotów, więc nie ma go w zestawieniu.
+2. Dane gry: wczytanie `GameData` z leniwymi mapami heksów kontra
+   mapy utworzone od razu dla wszystkich kart badań.
+3. Wiele równoległych gier: stan K rozgrywek w toku (kopie silnika
+   w połowie gry) w bajtach na grę - `GameEngine.clone()` współdzieli
+   karty niezmienne, `copy.deepcopy` kopiuje wszystko.
+
+Pomiar przez `tracemalloc` (bajty zaalokowane i nadal żywe).
+
+Uruchomienie:
+    python benchmark_memory.py --instances 10000 --games 200
+"""
+
+import argparse
+import contextlib
+import copy
+import dataclasses
+import io
+import tracemalloc
+
+from game_engine import GameEngine
+from game_model import (
+    ActionCard, ActionType, GameData, GrantCard, JournalCard, LargeProject, ResearchCard,
+    Scientist, ScientistType
+)
+from game_policies import POLICIES, play_game
+
+def measure(build):
+    """Bajty żywe po wywołaniu `build` (wynik trzymany do końca pomiaru)"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+def dict_twin(cls):
+    """Ta sama lista pól co `cls`, ale zwykła dataclass (z __dict__)"""
+    fields = []
+    for f in dataclasses.fields(cls):
+        spec = dataclasses.field(default=f.default, default_factory=f.default_factory, init=f.init)
+        fields.append((f.name, f.type, spec))
+    return dataclasses.make_dataclass(cls.__name__ + 'Dict', fields)
+
+SAMPLES = {
+    Scientist: lambda cls: cls('Dr X', ScientistType.DOKTOR, 'Fizyka', 2000, 2, 'Brak', 'Opis'),
+    ResearchCard: lambda cls: cls('Badanie', 'Fizyka', 'START(0,0)->(1,0)->END(2,0)', '2 PZ', 'Brak', 'Opis'),
+    GrantCard: lambda cls: cls('Grant', 'Brak', '2 publikacje', '8K', '+2K/rundę', 'Opis'),
+    JournalCard: lambda cls: cls('Nature', 10, 15, 'Reputacja 4+', 5, 'Brak', 'Opis'),
+    LargeProject: lambda cls: cls('Projekt', 'Brak', '5 PZ', '2 PZ', 'Opis'),
+    ActionCard: lambda cls: cls(ActionType.PUBLIKUJ, 2, 'Publikuj', []),
+}
+
+def instance_sizes(count: int):
+    print(f"\n📦 Rozmiar instancji ({count} obiektów, bajty na obiekt)")
+    print(f"   {'klasa':<14} {'__dict__':>9} {'slots':>9} {'oszczędność':>12}")
+    for cls, make in SAMPLES.items():
+        twin = dict_twin(cls)
+        plain = measure(lambda: [make(twin) for _ in range(count)]) / count
+        slotted = measure(lambda: [make(cls) for _ in range(count)]) / count
+        print(f"   {cls.__name__:<14} {plain:9.0f} {slotted:9.0f} {1 - slotted / plain:11.0%}")
+
+def load_quietly() -> GameData:
+    game_data = GameData()
+    with contextlib.redirect_stdout(io.StringIO()):
+        game_data.load_data()
+    return game_data
+
+def game_data_sizes():
+    lazy = measure(load_quietly)
+
+    def eager():
+        game_data = load_quietly()
+        for card in game_data.research_cards:
+            card.hex_research_map
+        return game_data
+    eager_size = measure(eager)
+
+    print("\n🗺️ Dane gry (GameData.load_data)")
+    print(f"   mapy heksów przy pierwszym użyciu: {lazy / 1024:8.1f} KiB")
+    print(f"   wszystkie mapy od razu:            {eager_size / 1024:8.1f} KiB")
+
+def running_games(count: int, players: int):
+    game_data = load_quietly()
+    engine = GameEngine(game_data)
+    engine.max_rounds = 4
+    play_game(engine, [POLICIES['scripted']() for _ in range(players)], seed=1)
+
+    # Stan gry w toku: silnik z własną kopią danych (jak w równoległych symulacjach)
+    deep = measure(lambda: [copy.deepcopy(engine) for _ in range(count)])
+    cloned = measure(lambda: [engine.clone() for _ in range(count)])
+    built = sum(1 for card in game_data.research_cards if card._hex_research_map is not None)
+    print(f"\n🎲 {count} gier w toku ({players} graczy, po {engine.current_round} rundach, "
+          f"mapy heksów: {built}/{len(game_data.research_cards)})")
+    print(f"   copy.deepcopy: {deep / count / 1024:8.1f} KiB na grę")
+    print(f"   clone():       {cloned / count / 1024:8.1f} KiB na grę")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pamięci stanu gry PRINCIPIA")
+    parser.add_argument('--instances', type=int, default=10000)
+    parser.add_argument('--games', type=int, default=200)
+    parser.add_argument('--players', type=int, default=3, choices=[2, 3, 4])
+    args = parser.parse_args()
+
+    instance_sizes(args.instances)
+    game_data_sizes()
+    running_games(args.games, args.players)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark rozgłaszania wiadomości przez serwer gry.
+
+Porównuje serializację osobno dla każdego odbiorcy (dawne zachowanie
+`_broadcast_message`) z jednokrotną serializacją do współdzielonego bufora.
+Klienci łączą się przez loopback, więc mierzony jest prawdziwy serwer.
+
+Opcja `--codec` porównuje rozmiar i czas kodowania/parsowania częstych
+wiadomości w JSON i w kodowaniu binarnym (bez sieci).
+
+Uruchomienie:
+    python benchmark_network.py --clients 64 --broadcasts 50 --backend asyncio
+    python benchmark_network.py --codec
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+
+from network_game import (
+    ENCODING_BINARY, ENCODING_JSON, AsyncGameServer, GameClient, MessageType,
+    NetworkMessage, create_game_server
+)
+
+def build_large_state(state_kb: int) -> dict:
+    """Stan gry o rozmiarze zbliżonym do pełnej synchronizacji"""
+    players = {}
+    for idx in range(4):
+        players[str(idx)] = {
+            'name': f'Gracz {idx + 1}',
+            'credits': 10 + idx,
+            'prestige_points': 5 * idx,
+            'hand': [f'Karta badań {i}' for i in range(8)],
+            'active_research': {
+                f'Badanie {r}': {'hexes_placed': r, 'path': [[q, -q] for q in range(r)]}
+                for r in range(3)
+            }
+        }
+    state = {'round': 3, 'players': players, 'markets': {'grants': [f'Grant {i}' for i in range(6)]}}
+
+    # Dziennik gry dopełnia stan do zadanego rozmiaru
+    log = []
+    size = len(NetworkMessage(MessageType.GAME_STATE, state).to_json())
+    while size < state_kb * 1024:
+        entry = f"Runda {len(log) % 9 + 1}: Gracz {len(log) % 4 + 1} położył heks na pozycji ({len(log) % 7},{-(len(log) % 5)})"
+        log.append(entry)
+        size += len(entry) + 4
+    state['log'] = log
+    return state
+
+class CountingClient(GameClient):
+    """Klient liczący odebrane rozgłoszenia"""
+
+    def __init__(self):
+        super().__init__()
+        self.received = 0
+        self.done = threading.Event()
+        self.expected = 0
+
+    def _process_server_message(self, message):
+        if message.type == MessageType.GAME_STATE and message.data.get('benchmark'):
+            self.received += 1
+            if self.received >= self.expected:
+                self.done.set()
+
+def run_on_server(server, func):
+    """Wykonuje funkcję w wątku, w którym serwer obsługuje połączenia"""
+    if isinstance(server, AsyncGameServer):
+        async def wrapper():
+            return func()
+        return asyncio.run_coroutine_threadsafe(wrapper(), server.loop).result()
+    return func()
+
+def broadcast_per_recipient(server, message):
+    """Dawne zachowanie: serializacja osobno dla każdego klienta"""
+    for client in list(server.clients.keys()):
+        server._send_to_client(client, message)
+
+def broadcast_serialize_once(server, message):
+    server._broadcast_message(message)
+
+def measure(server, clients, message, broadcasts, broadcast_func):
+    for client in clients:
+        client.received = 0
+        client.expected = broadcasts
+        client.done.clear()
+
+    def send_all():
+        start = time.perf_counter()
+        for _ in range(broadcasts):
+            broadcast_func(server, message)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    send_time = run_on_server(server, send_all)
+    for client in clients:
+        client.done.wait(timeout=60)
+    delivery_time = time.perf_counter() - start
+    return send_time, delivery_time
+
+def bench_codec(iterations: int):
+    """Rozmiar i czas kodowania/parsowania: JSON kontra binarnie"""
+    samples = {
+        'HEX_PLACEMENT': NetworkMessage(
+            MessageType.HEX_PLACEMENT, {'research': 'Fizyka kwantowa', 'q': 3, 'r': -2}, 'player_2'),
+        'PLAYER_ACTION hex_placement': NetworkMessage(
+            MessageType.PLAYER_ACTION,
+            {'action_type': 'hex_placement', 'action_data': {'research': 'Fizyka kwantowa', 'q': 3, 'r': -2}},
+            'player_2'),
+        'PLAYER_ACTION resource_update': NetworkMessage(
+            MessageType.PLAYER_ACTION,
+            {'action_type': 'resource_update', 'action_data': {
+                'player': 1, 'credits': 12, 'prestige_points': 5, 'research_points': 3, 'reputation': 4}},
+            'player_2'),
+        'HEARTBEAT': NetworkMessage(MessageType.HEARTBEAT, {'timestamp': time.time()}),
+    }
+
+    print(f"\n📦 Kodowanie wiadomości ({iterations} powtórzeń)")
+    for label, message in samples.items():
+        row = []
+        for encoding in (ENCODING_JSON, ENCODING_BINARY):
+            payload = message.to_payload(encoding)
+            start = time.perf_counter()
+            for _ in range(iterations):
+                message.to_payload(encoding)
+            encode_time = time.perf_counter() - start
+            start = time.perf_counter()
+            for _ in range(iterations):
+                NetworkMessage.from_payload(payload)
+            decode_time = time.perf_counter() - start
+            row.append(f"{encoding}: {len(payload):4d} B, "
+                       f"kod. {encode_time / iterations * 1e6:5.2f} µs, "
+                       f"pars. {decode_time / iterations * 1e6:5.2f} µs")
+        print(f"   {label:30s} " + " | ".join(row))
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark rozgłaszania (serializacja jednokrotna)")
+    parser.add_argument('--backend', default='threaded', choices=['threaded', 'asyncio'])
+    parser.add_argument('--port', type=int, default=18950)
+    parser.add_argument('--clients', type=int, default=64)
+    parser.add_argument('--broadcasts', type=int, default=50)
+    parser.add_argument('--state-kb', type=int, default=32)
+    parser.add_argument('--compress-threshold', type=int, default=None,
+                        help="włącza kompresję zlib wiadomości od tylu bajtów")
+    parser.add_argument('--codec', action='store_true', help="tylko porównanie kodowań (bez sieci)")
+    parser.add_argument('--iterations', type=int, default=50000)
+    args = parser.parse_args()
+
+    if args.codec:
+        bench_codec(args.iterations)
+        return
+
+    server = create_game_server(args.backend, port=args.port, outbound_limit=max(256, args.broadcasts * 2),
+                                compression_threshold=args.compress_threshold)
+    if not server.start(None):
+        return
+
+    clients = []
+    for idx in range(args.clients):
+        client = CountingClient()
+        if client.connect('localhost', args.port, f'Bot {idx + 1}', None):
+            clients.append(client)
+    time.sleep(0.5)
+
+    state = build_large_state(args.state_kb)
+    state['benchmark'] = True
+    message = NetworkMessage(type=MessageType.GAME_STATE, data=state)
+    frame_size = len(message.to_frame(ENCODING_BINARY, args.compress_threshold))
+
+    print(f"\n📊 Serwer: {args.backend}, klienci: {len(clients)}, rozgłoszenia: {args.broadcasts}, "
+          f"ramka: {frame_size / 1024:.1f} KB")
+
+    results = {}
+    for label, func in (("serializacja per odbiorca", broadcast_per_recipient),
+                        ("serializacja jednokrotna", broadcast_serialize_once)):
+        send_time, delivery_time = measure(server, clients, message, args.broadcasts, func)
+        results[label] = send_time
+        print(f"   {label:28s} wysyłka: {send_time * 1000:8.1f} ms "
+              f"({send_time / args.broadcasts * 1000:.2f} ms/rozgłoszenie), "
+              f"dostarczenie: {delivery_time * 1000:8.1f} ms")
+
+    old, new = results.values()
+    if new > 0:
+        print(f"   Przyspieszenie wysyłki: {old / new:.1f}x")
+
+    for message_type, entry in server.compression_stats.summary().items():
+        print(f"   🗜️ {message_type}: {entry['messages']} wiadomości, "
+              f"współczynnik {entry['ratio']:.3f}, CPU {entry['cpu_us_per_message']:.1f} µs/wiadomość")
+
+    for client in clients:
+        client.disconnect()
+    server.stop()
+
+if __name__ == "__main__":
+    main()
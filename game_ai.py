@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+"""
+Komputerowy przeciwnik - przeszukiwanie drzewa gry Monte Carlo (MCTS).
+
+`MCTSBot` wybiera ruch aktualnego gracza w fazie akcji na kopiach
+silnika (`GameEngine.clone`) i liście `legal_moves`. Każda iteracja:
+kopia stanu z nowym ziarnem losowań (rynek, kryzysy i granty kolejnych
+rund są za każdym razem inne), zejście drzewem po UCT między ruchami
+dozwolonymi w tej kopii, rozwinięcie jednego nowego ruchu, losowa
+rozgrywka do końca następnej rundy i ocena pozycji dla każdego gracza.
+Fazy grantów i porządkowa idą same (`advance`) - każdy bierze
+najlepiej płatny grant, którego wymagania spełnia.
+
+Budżet ruchu: czas (`time_limit`) i/albo liczba iteracji. Z `workers`
+przeszukiwanie jest zrównoleglone w korzeniu: każdy proces buduje
+własne drzewo z innym ziarnem, a wynikiem jest suma odwiedzin ruchów
+z korzeni. Procesy dostają bezwzględny termin, a `SearchJob.result`
+czeka najwyżej do `time_limit` i bierze drzewa, które zdążyły - ruch
+jest zawsze gotowy w limicie czasu, niezależnie od liczby graczy.
+
+Bot zna cały stan gry (także karty na rękach przeciwników).
+"""
+
+import math
+import os
+import pickle
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
+
+from game_engine import MOVE_END_ACTION, MOVE_PASS, GameEngine, Move, RuleViolation
+from game_model import GamePhase, GrantCard, Player
+from game_policies import MovePolicy, best_grant
+
+ROLLOUT_STEP_LIMIT = 400      # ruchów w jednej losowej rozgrywce
+ROLLOUT_PASS_CHANCE = 0.15    # szansa na pas/koniec akcji, gdy są inne ruchy
+RESULT_MARGIN = 0.05          # s zapasu przed terminem (ostatnia iteracja, wyniki z procesów)
+SCORE_SCALE = 3.0             # różnica wyniku (w PZ), przy której ocena to ~0.73
+
+def play_grant_turn(engine: GameEngine, grant: Optional[GrantCard]):
+    """Ruch w fazie grantów: wzięcie grantu albo oddanie kolejki"""
+    if grant is not None:
+        engine.take_grant(grant)
+    else:
+        engine.next_player()
+
+def advance(engine: GameEngine):
+    """Przeprowadza fazy bez decyzji bota aż do fazy akcji albo końca gry"""
+    while not engine.game_ended and engine.current_phase != GamePhase.AKCJE:
+        if engine.current_phase == GamePhase.GRANTY:
+            for _ in engine.players:
+                player = engine.current_player
+                play_grant_turn(engine, best_grant(engine, player) if player.current_grant is None else None)
+        engine.next_phase()
+
+def player_score(player: Player) -> float:
+    """Wartość pozycji gracza w PZ: punkty, zasoby i postęp aktywnych badań"""
+    progress = sum(card.hexes_placed / card.max_hexes for card in player.active_research if card.max_hexes)
+    return (player.prestige_points + 0.25 * player.research_points + player.credits / 8000
+            + 0.5 * player.reputation + 2 * progress + len(player.completed_research))
+
+def evaluate(engine: GameEngine) -> List[float]:
+    """Ocena stanu dla każdego miejsca przy stole, od 0 do 1.
+
+    Po końcu gry: zwycięzcy (najwięcej PZ) dzielą 1. W trakcie:
+    funkcja logistyczna przewagi nad najlepszym z przeciwników.
+    """
+    players = engine.players
+    if engine.game_ended:
+        best = max(p.prestige_points for p in players)
+        winners = sum(1 for p in players if p.prestige_points == best)
+        return [1.0 / winners if p.prestige_points == best else 0.0 for p in players]
+    scores = [player_score(p) for p in players]
+    values = []
+    for seat, score in enumerate(scores):
+        rival = max(s for other, s in enumerate(scores) if other != seat) if len(scores) > 1 else 0.0
+        values.append(1.0 / (1.0 + math.exp((rival - score) / SCORE_SCALE)))
+    return values
+
+def rollout(engine: GameEngine, rng: random.Random, extra_rounds: int = 1):
+    """Losowe dozwolone ruchy do końca rundy `current_round + extra_rounds` albo gry"""
+    last_round = engine.current_round + extra_rounds
+    for _ in range(ROLLOUT_STEP_LIMIT):
+        advance(engine)
+        if engine.game_ended or engine.current_round > last_round:
+            return
+        moves = engine.legal_moves()
+        if not moves:
+            return
+        if len(moves) > 1 and rng.random() >= ROLLOUT_PASS_CHANCE:
+            active = [m for m in moves if m.kind != MOVE_PASS and m.kind != MOVE_END_ACTION]
+            if active:
+                moves = active
+        try:
+            engine.apply_move(rng.choice(moves))
+        except RuleViolation:
+            engine.apply_move(Move(MOVE_PASS))
+
+class Node:
+    """Węzeł drzewa: ruch prowadzący do niego i statystyka gracza, który go wykonał"""
+
+    __slots__ = ('move', 'parent', 'seat', 'children', 'visits', 'value')
+
+    def __init__(self, move: Optional[Move] = None, parent: Optional['Node'] = None, seat: int = -1):
+        self.move = move
+        self.parent = parent
+        self.seat = seat
+        self.children: Dict[Move, 'Node'] = {}
+        self.visits = 0
+        self.value = 0.0
+
+    def select(self, moves: List[Move], exploration: float) -> 'Node':
+        """UCT między dziećmi, których ruchy są dozwolone w tej kopii stanu"""
+        log_visits = math.log(self.visits or 1)
+        best, best_score = None, -1.0
+        for move in moves:
+            child = self.children[move]
+            score = child.value / child.visits + exploration * math.sqrt(log_visits / child.visits)
+            if score > best_score:
+                best, best_score = child, score
+        return best
+
+def search(root_state: GameEngine, deadline: float, iterations: Optional[int], seed,
+           exploration: float = 1.0, rollout_rounds: int = 1) -> Dict[Move, Tuple[int, float]]:
+    """Jedno drzewo MCTS do terminu (time.time()) albo limitu iteracji; zwraca statystyki korzenia"""
+    rng = random.Random(seed)
+    root = Node()
+    done = 0
+    started = time.time()
+    while iterations is None or done < iterations:
+        # Nie zaczynaj iteracji, która (średnio) nie skończy się przed terminem
+        now = time.time()
+        average = (now - started) / done if done else 0.0
+        if now + average >= deadline:
+            break
+        state = root_state.clone()
+        state.rng.seed(rng.getrandbits(64))
+        node = root
+
+        # Selekcja i rozwinięcie
+        while not state.game_ended:
+            moves = state.legal_moves()
+            if not moves:
+                break
+            untried = [m for m in moves if m not in node.children]
+            seat = state.current_player_idx
+            if untried:
+                move = rng.choice(untried)
+                state.apply_move(move)
+                advance(state)
+                child = Node(move, node, seat)
+                node.children[move] = child
+                node = child
+                break
+            node = node.select(moves, exploration)
+            state.apply_move(node.move)
+            advance(state)
+
+        rollout(state, rng, rollout_rounds)
+        rewards = evaluate(state)
+
+        # Propagacja wstecz
+        while node.parent is not None:
+            node.visits += 1
+            node.value += rewards[node.seat]
+            node = node.parent
+        root.visits += 1
+        done += 1
+    return {move: (child.visits, child.value) for move, child in root.children.items()}
+
+def _search_worker(state_bytes: bytes, deadline: float, iterations: Optional[int], seed,
+                   exploration: float, rollout_rounds: int):
+    """Zadanie procesu roboczego: stan przychodzi zserializowany raz dla wszystkich procesów"""
+    return search(pickle.loads(state_bytes), deadline, iterations, seed, exploration, rollout_rounds)
+
+def _warm_up():
+    return os.getpid()
+
+def merge_root_stats(parts: List[dict]) -> Dict[Move, Tuple[int, float]]:
+    merged: Dict[Move, Tuple[int, float]] = {}
+    for stats in parts:
+        for move, (visits, value) in stats.items():
+            total_visits, total_value = merged.get(move, (0, 0.0))
+            merged[move] = (total_visits + visits, total_value + value)
+    return merged
+
+class SearchJob:
+    """Trwające przeszukiwanie; `result` zwraca ruch najpóźniej w terminie"""
+
+    def __init__(self, legal: List[Move], deadline: float, futures=None, stats=None):
+        self.legal = legal
+        self.deadline = deadline
+        self.futures = futures or []
+        self.stats = stats
+        self.iterations = 0
+
+    def done(self) -> bool:
+        return all(future.done() for future in self.futures) or time.time() >= self.deadline
+
+    def result(self) -> Move:
+        if self.stats is None:
+            finished, _ = wait(self.futures, timeout=max(0.0, self.deadline - time.time()))
+            parts = []
+            for future in finished:
+                try:
+                    parts.append(future.result())
+                except Exception as e:  # proces roboczy padł - reszta drzew wystarczy
+                    print(f"⚠️ MCTS: błąd procesu roboczego: {e}")
+            self.stats = merge_root_stats(parts)
+        self.iterations = sum(visits for visits, _ in self.stats.values())
+        visited = [(visits, value, move) for move, (visits, value) in self.stats.items() if move in self.legal]
+        if not visited:
+            # Nic nie zdążyło - pierwszy ruch, który nie jest pasem
+            return next((m for m in self.legal if m.kind != MOVE_PASS), self.legal[0])
+        return max(visited, key=lambda entry: (entry[0], entry[1]))[2]
+
+class MCTSBot(MovePolicy):
+    """Przeciwnik komputerowy MCTS z budżetem czasu/iteracji na ruch.
+
+    `workers=0` - przeszukiwanie w bieżącym procesie (symulacje, testy);
+    więcej - równolegle w korzeniu na tylu procesach (domyślnie rdzenie).
+    """
+
+    name = 'mcts'
+
+    def __init__(self, time_limit: float = 1.0, iterations: Optional[int] = None,
+                 workers: Optional[int] = None, exploration: float = 1.0, rollout_rounds: int = 1,
+                 rng: Optional[random.Random] = None):
+        self.time_limit = time_limit
+        self.iterations = iterations
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.exploration = exploration
+        self.rollout_rounds = rollout_rounds
+        self.rng = rng or random.Random()
+        self.pool = None
+        self.last_iterations = 0
+        if self.workers:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers)
+            # Procesy startują od razu, a nie przy pierwszym ruchu (limit czasu)
+            wait([self.pool.submit(_warm_up) for _ in range(self.workers)])
+
+    def start_search(self, engine: GameEngine) -> SearchJob:
+        """Rozpoczyna wybór ruchu aktualnego gracza (bez blokowania przy `workers`)"""
+        started = time.time()
+        legal = engine.legal_moves()
+        if not legal:
+            raise RuleViolation("Brak dozwolonych ruchów")
+        if len(legal) == 1:
+            return SearchJob(legal, started, stats={})
+        deadline = started + self.time_limit
+        state = engine.clone()
+
+        if not self.pool:
+            stats = search(state, deadline - RESULT_MARGIN, self.iterations, self.rng.getrandbits(64),
+                           self.exploration, self.rollout_rounds)
+            return SearchJob(legal, deadline, stats=stats)
+
+        state_bytes = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+        per_worker = -(-self.iterations // self.workers) if self.iterations else None
+        futures = [self.pool.submit(_search_worker, state_bytes, deadline - RESULT_MARGIN, per_worker,
+                                    self.rng.getrandbits(64), self.exploration, self.rollout_rounds)
+                   for _ in range(self.workers)]
+        return SearchJob(legal, deadline, futures=futures)
+
+    def choose_move(self, engine: GameEngine) -> Move:
+        job = self.start_search(engine)
+        move = job.result()
+        self.last_iterations = job.iterations
+        return move
+
+    def close(self):
+        if self.pool:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
@@ -0,0 +1,2035 @@
+# -*- coding: utf-8 -*-
+"""
+Silnik reguł gry PRINCIPIA - stan rozgrywki i zasady bez interfejsu.
+
+`GameEngine` nie korzysta z tkinter: komunikaty trafiają do wywołania
+zwrotnego `on_log`, koniec gry do `on_game_over`, a ruch niezgodny
+z zasadami zgłaszany jest wyjątkiem `RuleViolation`. Wszystkie losowania
+rozgrywki (talia, instytuty, kryzysy, rynek, granty) idą przez własny
+generator `rng` z zapisanym ziarnem `seed`, więc grę da się odtworzyć
+bit w bit i symulować równolegle bez wspólnego stanu. Interfejs
+(`PrincipiaGame`) jest tylko widokiem nad silnikiem - pokazuje okna
+dialogowe i odświeża ekran. Bez interfejsu silnik służy do symulacji,
+botów i serwera gry.
+
+`legal_moves` zwraca wszystkie dozwolone ruchy aktualnego gracza w fazie
+akcji jako `Move` (indeksy i współrzędne zamiast obiektów), a `flow_moves`
+ruchy przebiegu rundy i grantów. `apply_move` wykonuje ruch z tych list;
+ruchy z sieci i z interfejsu najpierw sprawdza `move_problem`
+(`apply_checked`).
+
+Efekty kart intryg, okazji i kryzysów (skompilowane z CSV w `game_model`)
+wykonuje tablica `EFFECT_HANDLERS` indeksowana parą (operacja, parametr).
+Blokady i modyfikatory trwające kilka rund trafiają do `active_effects`
+i wygasają na koniec rundy (`expire_effects`).
+"""
+
+import random
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from game_model import (
+    ActionCard, ActionType, ActiveEffect, ConsortiumCard, CrisisCard, DURATION_GAME, GameData, GamePhase,
+    GrantCard, IntrigueCard, IntrigueEffect, JournalCard, LargeProject, MAX_REPUTATION, OpportunityCard,
+    OpportunityEffect, Player, ResearchCard, Scientist, ScientistType, clone_state, compile_requirements,
+    compile_reward
+)
+from hex_map import HexPosition
+
+PLAYER_COLORS = ['red', 'blue', 'green', 'purple']
+STARTING_HAND_SIZE = 5
+HEX_TOKENS = 20
+PASS_BONUS = {5: 0, 4: 1000, 3: 3000, 2: 5000, 1: 8000}  # karty na ręku -> kredyty
+HIRE_ACTION_POINTS = {ScientistType.DOKTOR: 2, ScientistType.PROFESOR: 3}  # PA za naukowca z rynku (reszta: 1)
+CONSORTIUM_CONTRIBUTION = {'pb': 1, 'credits': 3000}  # wpłata do konsorcjum: 1 PB albo 3K
+
+# Warunki końca gry (check_end_game)
+END_PRESTIGE = 'prestige'
+END_RESEARCH = 'research'
+END_PROJECTS = 'projects'
+END_ROUND_LIMIT = 'round_limit'
+
+# Pola stanu rozgrywki (widok czyta i zapisuje je w silniku)
+STATE_FIELDS = (
+    'game_data', 'seed', 'rng', 'players', 'current_player_idx', 'current_round', 'current_phase',
+    'available_grants', 'available_journals', 'available_scientists', 'game_ended',
+    'end_condition', 'current_scenario', 'active_crises', 'crisis_deck', 'active_effects',
+    'current_action_card', 'remaining_action_points', 'basic_action_done',
+    'pending_hex_placements', 'hex_placement_mode', 'current_research_for_hex'
+)
+
+# Akcje dodatkowe kart akcji rozpoznawane po opisie: (rodzaj, słowa opisu).
+# Kolejność ma znaczenie - "zatrudnij doktoranta" zawiera "zatrudnij doktora",
+# a konsultacje komercyjne "aktywuj profesora".
+ADDITIONAL_ACTIONS = (
+    ('consulting', ('konsultacje',)),
+    ('activate_doktor', ('aktywuj', 'doktora')),
+    ('activate_profesor', ('aktywuj', 'profesora')),
+    ('start_research', ('rozpocznij', 'badanie')),
+    ('hire_doktorant', ('zatrudnij doktoranta',)),
+    ('hire_doktor', ('zatrudnij doktora',)),
+    ('hire_profesor', ('zatrudnij profesora',)),
+    ('take_3k', ('weź 3k',)),
+    ('contribute', ('wpłać do konsorcjum',)),
+    ('found_consortium', ('załóż konsorcjum',)),
+    ('emergency_loan', ('kredyt awaryjny',)),
+    ('refresh_market', ('odśwież rynek',)),
+    ('pr_campaign', ('kampania pr',)),
+    ('image', ('poprawa wizerunku',)),
+)
+# Rodzaje wymagające wyboru (param ruchu): karta z ręki, naukowiec z rynku, projekt
+CHOICE_ACTIONS = ('start_research', 'hire_doktor', 'hire_profesor', 'contribute', 'found_consortium')
+
+# Ruchy fazy akcji (legal_moves/apply_move). Argumenty to indeksy (karty, rynku,
+# projektu, miejsca przy stole) i współrzędne heksów, a nie obiekty - ten sam
+# ruch można zastosować do kopii gry (clone) i przesłać siecią.
+MOVE_PLAY_CARD = 'play_card'            # arg: indeks karty akcji gracza
+MOVE_ADDITIONAL = 'additional'          # arg: indeks akcji dodatkowej aktywnej karty, param: wybór
+MOVE_END_ACTION = 'end_action'
+MOVE_PASS = 'pass'
+MOVE_HIRE = 'hire'                      # arg: indeks naukowca na rynku (karta ZATRUDNIJ)
+MOVE_PUBLISH = 'publish'                # arg: indeks czasopisma na rynku (karta PUBLIKUJ)
+MOVE_PLACE_HEX = 'place_hex'            # arg: (q, r)
+MOVE_FINISH_HEX = 'finish_hex'          # brak dozwolonego pola - pozostałe heksy przepadają
+MOVE_INTRIGUE = 'intrigue'              # arg: indeks karty na ręku, param: miejsce celu albo None
+MOVE_OPPORTUNITY = 'opportunity'        # arg: indeks karty na ręku
+MOVE_JOIN = 'join'                      # arg: indeks projektu (wniosek o członkostwo)
+MOVE_APPROVE = 'approve'                # arg: indeks projektu, param: miejsce kandydata
+MOVE_REJECT = 'reject'                  # arg: indeks projektu, param: miejsce kandydata
+MOVE_COMPLETE_PROJECT = 'complete_project'  # arg: indeks projektu
+# Przebieg rundy i granty (flow_moves) - ruchy interfejsu hosta i botów
+# w fazie grantów; zdalny klient ich nie wysyła
+MOVE_NEXT_PHASE = 'next_phase'
+MOVE_NEXT_ROUND = 'next_round'          # pozostałe fazy rundy aż do początku następnej
+MOVE_TAKE_GRANT = 'take_grant'          # arg: indeks grantu na rynku albo None (oddanie kolejki)
+MOVE_SUBVENTION = 'subvention'
+FLOW_MOVES = (MOVE_NEXT_PHASE, MOVE_NEXT_ROUND, MOVE_TAKE_GRANT, MOVE_SUBVENTION)
+
+class Move(NamedTuple):
+    """Ruch gracza w fazie akcji (hashowalny, z prostych typów)"""
+    kind: str
+    arg: Any = None
+    param: Any = None
+
+    def to_dict(self) -> dict:
+        return {'kind': self.kind, 'arg': self.arg, 'param': self.param}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Move':
+        """Ruch z danych sieciowych/JSON (listy wracają do krotek)"""
+        def tuples(value):
+            return tuple(tuples(v) for v in value) if isinstance(value, list) else value
+        return cls(data.get('kind'), tuples(data.get('arg')), tuples(data.get('param')))
+
+class RuleViolation(Exception):
+    """Ruch niezgodny z zasadami (komunikat dla gracza)"""
+
+_action_kinds = {}
+
+def additional_action_kind(action_desc: str) -> Optional[str]:
+    """Rodzaj akcji dodatkowej z jej opisu (None - akcja bez reguły w silniku)"""
+    try:
+        return _action_kinds[action_desc]
+    except KeyError:
+        text = action_desc.lower()
+        kind = next((kind for kind, words in ADDITIONAL_ACTIONS if all(w in text for w in words)), None)
+        _action_kinds[action_desc] = kind
+        return kind
+
+def contains(items, obj) -> bool:
+    """Czy obiekt (ten sam, nie równy) jest na liście - bez porównywania pól dataclass"""
+    for item in items:
+        if item is obj:
+            return True
+    return False
+
+def is_index(value, items) -> bool:
+    """Czy argument ruchu jest poprawnym indeksem listy (liczba całkowita, nie bool)"""
+    return type(value) is int and 0 <= value < len(items)
+
+def institute_name(player: Player) -> str:
+    return player.institute.name.lower() if player.institute else ''
+
+def hire_cost(scientist: Scientist) -> int:
+    """Koszt zatrudnienia: dwie pensje (pensja w K albo w kredytach)"""
+    salary = scientist.salary if scientist.salary >= 100 else scientist.salary * 1000
+    return salary * 2
+
+def subvention_grant() -> GrantCard:
+    """Subwencja rządowa - grant spoza talii dla gracza bez dostępnych grantów"""
+    return GrantCard(
+        name="Subwencja Rządowa",
+        requirements="Brak wymagań",
+        goal="6 punktów aktywności w rundzie",
+        reward="10K",
+        round_bonus="",
+        description="Wsparcie państwowe, gdy brak dostępnych grantów"
+    )
+
+@lru_cache(maxsize=None)
+def journal_reputation_required(requirements: str) -> int:
+    """Minimalna reputacja z wymagań czasopisma ("Reputacja 3+")"""
+    if "Reputacja" not in requirements:
+        return 0
+    try:
+        rep_text = requirements.split("Reputacja")[1].strip()
+        return int(rep_text.split("+")[0].strip())
+    except ValueError:
+        return 0
+
+def intrigue_target(card: IntrigueCard) -> str:
+    """Kogo wskazuje gracz: 'opponent' (wybór przeciwnika), 'all' albo 'self'"""
+    if card.target == "opponent" or any(effect.target_type == "opponent" for effect in card.effects):
+        return 'opponent'
+    if card.target == "all" or any(effect.target_type != "self" for effect in card.effects):
+        return 'all'
+    return 'self'
+
+@lru_cache(maxsize=None)
+def target_condition(text: str):
+    """Warunek celu efektu ("Reputacja 5", "Min. 4 naukowców") - predykat wymagań grantów"""
+    return compile_requirements(text)[0]
+
+# Efekty kart: handler(silnik, karta, efekt, cel, źródło, mnożnik) -> nazwy kart dla 'reveal' albo None.
+# Cel None - blokada/modyfikator dla wszystkich graczy; źródło None - kryzys.
+
+TIMED_OPERATIONS = ('block', 'modify')
+FIELD_FILTERED = ('scientist_hexes', 'completion_credits', 'completion_pb')  # special_type = dziedzina
+STANFORD_DOUBLED = ('credits', 'research_points', 'reputation', 'action_points')
+AMOUNT_UNITS = {'reputation': 'Rep', 'research_points': 'PB', 'prestige_points': 'PZ',
+                'publications': 'publikacji', 'hex_tokens': 'heksów', 'action_points': 'PA'}
+
+def amount_text(parameter: str, value: int) -> str:
+    if parameter == 'credits':
+        return f"{value // 1000}K"
+    return f"{value} {AMOUNT_UNITS.get(parameter, parameter)}"
+
+def _add_resource(engine, card, effect, target, source, scale):
+    value = effect.value * scale
+    if effect.parameter == 'action_points':
+        engine.remaining_action_points += value
+    elif effect.parameter == 'reputation':
+        target.reputation = min(MAX_REPUTATION, target.reputation + value)
+    else:
+        setattr(target, effect.parameter, getattr(target, effect.parameter) + value)
+    engine.log_message(f"{target.name} zyskuje {amount_text(effect.parameter, value)}")
+
+def _subtract_resource(engine, card, effect, target, source, scale):
+    value = effect.value
+    if effect.special_type == 'per_project':
+        value *= sum(1 for project in engine.game_data.large_projects
+                     if project.is_completed and contains(project.members, target))
+    if value <= 0:
+        return
+    setattr(target, effect.parameter, max(0, getattr(target, effect.parameter) - value))
+    engine.log_message(f"{target.name} traci {amount_text(effect.parameter, value)}")
+
+def _lose_percent(engine, card, effect, target, source, scale):
+    lost = target.credits * effect.value // 100 // 1000 * 1000
+    target.credits -= lost
+    engine.log_message(f"{target.name} traci {effect.value}% kredytów ({lost // 1000}K)")
+
+def _draw_cards(engine, card, effect, target, source, scale):
+    deck = engine.game_data.main_deck
+    drawn = deck[:effect.value]
+    del deck[:effect.value]
+    target.hand_cards.extend(drawn)
+    engine.log_message(f"{target.name} dobiera {len(drawn)} kart")
+
+def _draw_research_card(engine, card, effect, target, source, scale):
+    deck = engine.game_data.main_deck
+    research = next((c for c in deck[:effect.value] if isinstance(c, ResearchCard)), None)
+    if research is not None:
+        deck.remove(research)
+        target.hand_cards.append(research)
+        engine.log_message(f"{target.name} bierze kartę badania: {research.name}")
+
+def _discard_cards(engine, card, effect, target, source, scale):
+    for _ in range(min(effect.value, len(target.hand_cards))):
+        discarded = target.hand_cards.pop(engine.rng.randrange(len(target.hand_cards)))
+        engine.log_message(f"{target.name} odrzuca kartę: {discarded.name}")
+
+def _steal_card(engine, card, effect, target, source, scale):
+    if target.hand_cards and source is not None:
+        stolen = target.hand_cards.pop(engine.rng.randrange(len(target.hand_cards)))
+        source.hand_cards.append(stolen)
+        engine.log_message(f"{source.name} zabiera kartę {stolen.name} graczowi {target.name}")
+
+def _steal_scientist(engine, card, effect, target, source, scale):
+    if target.scientists and source is not None:
+        stolen_scientist = target.scientists.pop()
+        source.scientists.append(stolen_scientist)
+        engine.log_message(f"{source.name} przejmuje naukowca {stolen_scientist.name} od {target.name}")
+
+def _subtract_scientist(engine, card, effect, target, source, scale):
+    for _ in range(effect.value):
+        if not target.scientists:
+            return
+        lost = max(target.scientists, key=lambda s: s.salary)  # najdroższy
+        target.scientists.remove(lost)
+        engine.log_message(f"{target.name} traci naukowca: {lost.name}")
+
+def _subtract_completed_research(engine, card, effect, target, source, scale):
+    for _ in range(min(effect.value, len(target.completed_research))):
+        lost = target.completed_research.pop()
+        engine.log_message(f"{target.name} traci ukończone badanie: {lost.name}")
+
+def _remove_grant(engine, card, effect, target, source, scale):
+    if target.current_grant:
+        grant_name = target.current_grant.name
+        target.current_grant = None
+        engine.log_message(f"{target.name} traci grant: {grant_name}")
+
+def _reveal_hand(engine, card, effect, target, source, scale):
+    return [hand_card.name for hand_card in target.hand_cards]
+
+def _copy_research_reward(engine, card, effect, target, source, scale):
+    if target.completed_research and source is not None:
+        research = target.completed_research[-1]
+        reward = compile_reward(research.basic_reward)
+        reward.apply(source)
+        engine.log_message(f"{source.name} kopiuje nagrodę za badanie {research.name}: {reward}")
+
+def _copy_opportunity_card(engine, card, effect, target, source, scale):
+    copied = next((c for c in target.hand_cards if isinstance(c, OpportunityCard)), None)
+    if copied is not None and source is not None:
+        engine.log_message(f"{source.name} kopiuje kartę okazji {copied.name} od {target.name}")
+        engine.apply_card_effects(copied, copied.effects, source)
+
+def _add_action_card(engine, card, effect, target, source, scale):
+    used = [action_card for action_card in target.action_cards if action_card.is_used]
+    for action_card in used[:effect.value]:
+        action_card.is_used = False
+        engine.log_message(f"{target.name} odzyskuje kartę akcji {action_card.action_type.value}")
+
+def _hire_free(engine, card, effect, target, source, scale):
+    for _ in range(effect.value):
+        if not engine.available_scientists:
+            return
+        scientist = max(engine.available_scientists, key=hire_cost)
+        engine.available_scientists.remove(scientist)
+        target.scientists.append(scientist)
+        engine.log_message(f"{target.name} zatrudnia za darmo: {scientist.name}")
+
+def _join_consortium(engine, card, effect, target, source, scale):
+    project = next((p for p in engine.game_data.large_projects if p.director and not p.is_completed
+                    and not contains(p.members, target)), None)
+    if project is not None:
+        if contains(project.pending_members, target):
+            project.pending_members.remove(target)
+        project.members.append(target)
+        target.consortia += 1
+        engine.log_message(f"{target.name} dołącza do konsorcjum {project.name} bez zgody kierownika")
+
+def _block_scientist(engine, card, effect, target, source, scale):
+    paid = [s for s in target.scientists if s.is_paid and s.type != ScientistType.DOKTORANT]
+    if paid:
+        blocked = max(paid, key=lambda s: s.salary)
+        blocked.is_paid = False  # wraca po wypłacie pensji
+        engine.log_message(f"{target.name}: {blocked.name} zablokowany do końca rundy")
+
+def _block_crisis(engine, card, effect, target, source, scale):
+    if engine.active_crises:
+        crisis = engine.active_crises[-1]
+        engine.remove_active_effects(lambda active: active.from_crisis and active.source == crisis.name)
+        engine.log_message(f"🛡️ Kryzys {crisis.name} zablokowany w tej rundzie")
+
+def _pay_or_lose(engine, card, effect, target, source, scale):
+    """Cel płaci `cost` (Szantaż: źródłu) albo ponosi karę - wybór automatyczny: płaci, jeśli stać"""
+    if target.credits >= effect.cost:
+        target.credits -= effect.cost
+        if effect.special_type == 'source' and source is not None:
+            source.credits += effect.cost
+        engine.log_message(f"{target.name} płaci {effect.cost // 1000}K")
+    elif effect.parameter == 'reputation':
+        _subtract_resource(engine, card, effect, target, source, scale)
+    elif effect.parameter == 'scientist':
+        _subtract_scientist(engine, card, effect, target, source, scale)
+    elif effect.parameter == 'action':
+        engine.add_active_effect(card, IntrigueEffect(effect.target_type, 'action', 'block', duration=DURATION_GAME,
+                                                      charges=1), target)
+
+def _add_timed(engine, card, effect, target, source, scale):
+    engine.add_active_effect(card, effect, target)
+
+EFFECT_HANDLERS: Dict[Tuple[str, str], Callable] = {
+    **{('add', parameter): _add_resource for parameter in (
+        'credits', 'reputation', 'research_points', 'prestige_points', 'hex_tokens', 'action_points')},
+    **{('subtract', parameter): _subtract_resource for parameter in (
+        'credits', 'reputation', 'research_points', 'prestige_points', 'publications')},
+    ('lose_percent', 'credits'): _lose_percent,
+    ('draw', 'card'): _draw_cards,
+    ('draw', 'research_card'): _draw_research_card,
+    ('discard', 'card'): _discard_cards,
+    ('steal', 'card'): _steal_card,
+    ('steal', 'scientist'): _steal_scientist,
+    ('subtract', 'scientist'): _subtract_scientist,
+    ('subtract', 'completed_research'): _subtract_completed_research,
+    ('remove', 'current_grant'): _remove_grant,
+    ('reveal', 'hand_cards'): _reveal_hand,
+    ('copy', 'research_reward'): _copy_research_reward,
+    ('copy', 'opportunity_card'): _copy_opportunity_card,
+    ('add', 'action_card'): _add_action_card,
+    ('hire', 'scientist'): _hire_free,
+    ('join', 'consortium'): _join_consortium,
+    ('block', 'scientist'): _block_scientist,
+    ('block', 'crisis'): _block_crisis,
+    **{('pay_or_lose', parameter): _pay_or_lose for parameter in ('reputation', 'scientist', 'action')},
+    **{('block', parameter): _add_timed for parameter in (
+        'grant', 'hire', 'hire_doktorant', 'publication', 'publication_pz', 'opportunity', 'consortium',
+        'research_reward', 'action')},
+    **{('modify', parameter): _add_timed for parameter in (
+        'scientist_hexes', 'publication_pz', 'publication_pb', 'publication_credits', 'grant_reward',
+        'grant_min_reputation', 'consortium_ap', 'action_credits', 'completion_credits', 'completion_pb',
+        'salary', 'round_credits', 'round_cards', 'research_start_credits')},
+}
+
+def _reputation_leaders(engine, source, chosen):
+    top = max(player.reputation for player in engine.players)
+    return [player for player in engine.players if player.reputation == top]
+
+def _next_player(engine, source, chosen):
+    if source is None:
+        return []
+    seat = next(seat for seat, player in enumerate(engine.players) if player is source)
+    return [engine.players[(seat + 1) % len(engine.players)]]
+
+def _reputation_others(engine, source, chosen):
+    leaders = {id(player) for player in _reputation_leaders(engine, source, chosen)}
+    return [player for player in engine.players if id(player) not in leaders]
+
+def _research_leader(engine, source, chosen):
+    leader = max(engine.players, key=lambda player: len(player.completed_research))
+    return [leader] if leader.completed_research else []
+
+# Cele efektów: typ celu -> (silnik, źródło, wybrany przeciwnik) -> gracze
+EFFECT_TARGETS: Dict[str, Callable] = {
+    'opponent': lambda engine, source, chosen: [chosen] if chosen is not None else [],
+    'all_opponents': lambda engine, source, chosen: [p for p in engine.players if p is not source],
+    'all_players': lambda engine, source, chosen: list(engine.players),
+    'self': lambda engine, source, chosen: [source] if source is not None else list(engine.players),
+    'next_player': _next_player,
+    'reputation_leader': _reputation_leaders,
+    'reputation_others': _reputation_others,
+    'research_leader': _research_leader,
+}
+
+class GameEngine:
+    """Stan i reguły jednej rozgrywki"""
+
+    def __init__(self, game_data: Optional[GameData] = None,
+                 on_log: Optional[Callable[[str], None]] = None,
+                 on_game_over: Optional[Callable[[str, list], None]] = None,
+                 on_crisis: Optional[Callable[[CrisisCard], None]] = None):
+        self.game_data = game_data if game_data is not None else GameData()
+        self.on_log = on_log
+        self.on_game_over = on_game_over
+        self.on_crisis = on_crisis
+        self.max_rounds = None  # limit rund (symulacje); None - gra do warunku końca
+        self.seed = None
+        self.rng = random.Random()
+        self.reset_state()
+
+    def reset_state(self):
+        """Stan początkowy rozgrywki"""
+        self.players: List[Player] = []
+        self.current_player_idx = 0
+        self.current_round = 1
+        self.current_phase = GamePhase.GRANTY
+        self.available_grants = []
+        self.available_journals = []
+        self.available_scientists = []
+
+        # Koniec gry
+        self.game_ended = False
+        self.end_reason = None
+        self.end_condition = None
+        self.results = []
+
+        # System scenariuszy
+        self.current_scenario = None
+        self.active_crises = []
+        self.crisis_deck = []
+        # Blokady i modyfikatory kart: (operacja, parametr) -> lista ActiveEffect
+        self.active_effects: Dict[Tuple[str, str], List[ActiveEffect]] = {}
+
+        # Aktualna aktywność
+        self.current_action_card = None
+        self.remaining_action_points = 0
+        self.basic_action_done = False  # PUBLIKUJ: jedna publikacja z rynku na kartę
+
+        # Układanie heksów
+        self.pending_hex_placements = 0
+        self.hex_placement_mode = False
+        self.current_research_for_hex = None
+
+    def clone(self) -> 'GameEngine':
+        """Szybka kopia rozgrywki (np. do przeszukiwania ruchów), bez wywołań zwrotnych.
+
+        Karty niezmienne są współdzielone; kopiowane są tylko pola zmieniane
+        w trakcie gry: zasoby i ręce graczy, ścieżki heksów, wkłady do
+        projektów, rynki, talie i stan generatora losowań.
+        """
+        memo = {}
+        copied = GameEngine.__new__(GameEngine)
+        copied.__dict__.update(self.__dict__)
+        copied.on_log = None
+        copied.on_game_over = None
+        copied.on_crisis = None
+        copied.rng = random.Random()
+        copied.rng.setstate(self.rng.getstate())
+
+        copied.game_data = self.game_data.clone(memo)
+        copied.players = [clone_state(player, memo) for player in self.players]
+        copied.available_grants = [clone_state(grant, memo) for grant in self.available_grants]
+        copied.available_journals = list(self.available_journals)
+        copied.available_scientists = [clone_state(scientist, memo) for scientist in self.available_scientists]
+        copied.active_crises = list(self.active_crises)
+        copied.crisis_deck = list(self.crisis_deck)
+        copied.active_effects = {key: [effect.clone(memo) for effect in effects]
+                                 for key, effects in self.active_effects.items()}
+        copied.current_action_card = clone_state(self.current_action_card, memo)
+        copied.current_research_for_hex = clone_state(self.current_research_for_hex, memo)
+        copied.results = list(self.results)
+        return copied
+
+    def log_message(self, message: str):
+        if self.on_log:
+            self.on_log(message)
+
+    @property
+    def current_player(self) -> Player:
+        return self.players[self.current_player_idx]
+
+    # Konfiguracja
+
+    def seed_game(self, seed: Optional[int] = None) -> int:
+        """Nowy generator losowań gry; bez ziarna losuje je z entropii systemu"""
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.log_message(f"🎲 Ziarno gry: {seed}")
+        return seed
+
+    def new_game(self, player_count=3, player_names=None, scenario=None, seed: Optional[int] = None):
+        """Nowa rozgrywka na wczytanych już danych - bez interfejsu i bez czytania CSV"""
+        self.seed_game(seed)
+        self.game_data.reset_game_state(self.rng)
+        self.reset_state()
+        self.current_scenario = scenario or (self.game_data.scenarios[0] if self.game_data.scenarios else None)
+        if self.current_scenario:
+            self.prepare_crisis_deck()
+        self.setup_players(player_count, player_names)
+        self.prepare_round()
+
+    def setup_players(self, player_count=3, player_names=None):
+        """Tworzy graczy: losowy instytut, karty akcji, karty startowe i doktorant"""
+        if player_names is None:
+            player_names = [f'Gracz {i+1}' for i in range(player_count)]
+
+        self.players = []
+        for i in range(player_count):
+            player = Player(name=player_names[i], color=PLAYER_COLORS[i])
+
+            # Przypisz losowy instytut
+            if self.game_data.institutes:
+                player.institute = self.rng.choice(self.game_data.institutes)
+
+                # Parsuj zasoby startowe
+                resources = player.institute.starting_resources.split(', ')
+                for resource in resources:
+                    if 'K' in resource:
+                        credit_val = self.game_data.safe_int_parse(resource.replace('K', '').strip())
+                        player.credits = credit_val * 1000
+                    elif 'PZ' in resource:
+                        pz_val = self.game_data.safe_int_parse(resource.replace('PZ', '').strip())
+                        player.prestige_points = pz_val
+
+                player.reputation = player.institute.starting_reputation
+
+            # Daj karty akcji
+            player.action_cards = self.game_data.create_action_cards()
+
+            # Daj startowe karty badań (maksymalnie 5)
+            if self.game_data.main_deck:
+                start_cards = min(STARTING_HAND_SIZE, len(self.game_data.main_deck))
+                player.hand_cards = self.game_data.main_deck[:start_cards]
+                # Usuń rozdane karty z talii
+                self.game_data.main_deck = self.game_data.main_deck[start_cards:]
+
+            # Daj każdemu graczowi jedną kartę konsorcjum na start
+            if self.game_data.consortium_cards:
+                player.hand_cards.append(ConsortiumCard())
+
+            # Daj startowego doktoranta
+            player.scientists.append(Scientist("Doktorant", ScientistType.DOKTORANT, "Uniwersalny", 0, 1, "Brak", "Młody naukowiec"))
+
+            self.players.append(player)
+
+    def prepare_crisis_deck(self):
+        """Przygotowuje talię kryzysów na podstawie wybranego scenariusza"""
+        if not self.current_scenario:
+            return
+
+        # Wybierz losowe kryzysy z puli scenariusza (rozszerzone albo podstawowe)
+        extended = self.current_scenario.extended_crises
+        available_crises = ([crisis for crisis in self.game_data.crisis_cards if crisis.extended == extended]
+                            or self.game_data.crisis_cards.copy())
+        self.rng.shuffle(available_crises)
+
+        # Dobierz odpowiednią liczbę kryzysów
+        self.crisis_deck = available_crises[:self.current_scenario.crisis_count]
+
+        self.log_message(f"Przygotowano {len(self.crisis_deck)} kryzysów na rundy {self.current_scenario.crisis_rounds}")
+
+    def check_for_crisis(self) -> Optional[CrisisCard]:
+        """Zapowiedź i odkrycie kryzysu wg harmonogramu scenariusza (na początku rundy)"""
+        scenario = self.current_scenario
+        if not scenario or not self.crisis_deck:
+            return None
+        if self.current_round in scenario.announcement_rounds:
+            upcoming = self.crisis_deck[0]
+            self.log_message(f"📣 Zapowiedź kryzysu: {upcoming.name}")
+            if upcoming.announcement_effects:
+                self.apply_crisis_effect(upcoming, upcoming.announcement_effects)
+        # Każda runda z harmonogramu odkrywa najwyżej jeden kryzys (także przy ponownym wywołaniu)
+        if (self.current_round in scenario.crisis_rounds
+                and scenario.crisis_rounds.index(self.current_round) == scenario.crisis_count - len(self.crisis_deck)):
+            crisis = self.crisis_deck.pop(0)
+            self.reveal_crisis(crisis)
+            return crisis
+        return None
+
+    def reveal_crisis(self, crisis: CrisisCard):
+        """Odkrywa kryzys i stosuje jego efekty"""
+        self.active_crises.append(crisis)
+        self.log_message(f"🚨 KRYZYS: {crisis.name} - {crisis.effect}")
+        self.apply_crisis_effect(crisis)
+        if self.on_crisis:
+            self.on_crisis(crisis)
+
+    def apply_crisis_effect(self, crisis: CrisisCard, effects: Optional[list] = None):
+        """Efekty kryzysu (albo jego zapowiedzi) dla graczy - bez gracza źródłowego"""
+        effects = crisis.effects if effects is None else effects
+        if not effects:
+            self.log_message(f"Efekt kryzysu: {crisis.effect}")
+        self.apply_card_effects(crisis, effects, None)
+
+    # Rundy i fazy
+
+    def prepare_round(self):
+        """Przygotowuje nową rundę"""
+        # Resetuj karty akcji graczy
+        for player in self.players:
+            for card in player.action_cards:
+                card.is_used = False
+            player.has_passed = False
+            # Reset rundowych punktów aktywności (do subwencji)
+            player.round_activity_points = 0
+
+        # Przygotuj granty na rundę
+        available_grant_count = min(6, len(self.game_data.grants))
+        self.available_grants = self.rng.sample(self.game_data.grants, available_grant_count)
+
+        # Przygotuj czasopisma
+        available_journal_count = min(4, len(self.game_data.journals))
+        self.available_journals = self.rng.sample(self.game_data.journals, available_journal_count)
+
+        # Przygotuj naukowców na rynek
+        available_scientist_count = min(4, len(self.game_data.scientists))
+        self.available_scientists = self.rng.sample(self.game_data.scientists, available_scientist_count)
+
+        self.current_phase = GamePhase.GRANTY
+        self.current_player_idx = 0
+        self.current_action_card = None
+        self.remaining_action_points = 0
+        self.log_message(f"Rozpoczęto rundę {self.current_round}")
+
+        self.check_for_crisis()
+        if self.active_effects:
+            self.apply_round_effects()
+
+    def apply_round_effects(self):
+        """Modyfikatory na początek rundy: dochód/opłata i dodatkowe karty"""
+        for player in self.players:
+            credits = self.effect_total('round_credits', player)
+            if credits:
+                player.credits = max(0, player.credits + credits)
+                self.log_message(f"{player.name}: {credits // 1000:+}K na początek rundy")
+            cards = self.effect_total('round_cards', player)
+            if cards > 0:
+                _draw_cards(self, None, IntrigueEffect('self', 'card', 'draw', cards), player, None, 1)
+
+    def next_phase(self):
+        """Przechodzi do następnej fazy gry"""
+        if self.current_phase == GamePhase.GRANTY:
+            self.current_phase = GamePhase.AKCJE
+            self.log_message("Przejście do fazy akcji")
+
+        elif self.current_phase == GamePhase.AKCJE:
+            self.current_phase = GamePhase.PORZADKOWA
+            self.log_message("Przejście do fazy porządkowej")
+
+        elif self.current_phase == GamePhase.PORZADKOWA:
+            self.end_round()
+
+    def finish_round(self):
+        """Przechodzi pozostałe fazy bieżącej rundy (pensje, granty, kryzysy nowej rundy)"""
+        current_round = self.current_round
+        while self.current_round == current_round and not self.game_ended:
+            self.next_phase()
+
+    def player_pass(self):
+        """Gracz pasuje w fazie akcji"""
+        if self.current_phase != GamePhase.AKCJE:
+            return
+        current_player = self.current_player
+        current_player.has_passed = True
+
+        # Bonus za pasowanie zależny od liczby kart na ręku
+        pass_bonus = PASS_BONUS.get(len(current_player.hand_cards), 0)
+        current_player.credits += pass_bonus
+
+        self.log_message(f"{current_player.name} pasuje (bonus: {pass_bonus//1000}K)")
+
+        # Zakończ aktualną akcję
+        self.current_action_card = None
+        self.remaining_action_points = 0
+
+        # Sprawdź czy wszyscy spasowali
+        if all(p.has_passed for p in self.players):
+            self.current_phase = GamePhase.PORZADKOWA
+            self.log_message("Wszyscy gracze spasowali - przejście do fazy porządkowej")
+        else:
+            self.next_player()
+
+    def end_current_action(self):
+        """Kończy aktualną akcję"""
+        if self.current_action_card:
+            self.log_message(f"Zakończono akcję {self.current_action_card.action_type.value}")
+            self.current_action_card = None
+            self.remaining_action_points = 0
+            self.next_player()
+
+    def next_player(self):
+        """Przechodzi do następnego gracza"""
+        self.current_player_idx = (self.current_player_idx + 1) % len(self.players)
+        # Jeśli wszyscy spasowali, pomiń
+        attempts = 0
+        while self.players[self.current_player_idx].has_passed and attempts < len(self.players):
+            self.current_player_idx = (self.current_player_idx + 1) % len(self.players)
+            attempts += 1
+        # Utrata tury (Szantaż): blokada zużywa się przy pominięciu gracza
+        player = self.players[self.current_player_idx]
+        if (self.active_effects and self.current_phase == GamePhase.AKCJE and not player.has_passed
+                and self.is_blocked('action', player, consume=True)):
+            self.log_message(f"{player.name} traci turę")
+            self.next_player()
+
+    # Blokady i modyfikatory kart
+
+    def add_active_effect(self, card, effect, player: Optional[Player]):
+        """Blokada/modyfikator od rundy bieżącej (+ opóźnienie); `player` None - wszyscy gracze"""
+        first_round = self.current_round + effect.delay
+        last_round = None if effect.duration == DURATION_GAME else first_round + max(1, effect.duration) - 1
+        active = ActiveEffect(
+            source=card.name if card is not None else '',
+            player=player,
+            operation=effect.operation,
+            parameter=effect.parameter,
+            value=effect.value,
+            special_type=effect.special_type if effect.parameter in FIELD_FILTERED else '',
+            first_round=first_round,
+            last_round=last_round,
+            charges=effect.charges,
+            from_crisis=isinstance(card, CrisisCard)
+        )
+        self.active_effects.setdefault((effect.operation, effect.parameter), []).append(active)
+        who = player.name if player is not None else "wszyscy"
+        until = "do końca gry" if last_round is None else f"rundy {first_round}-{last_round}"
+        self.log_message(f"⏳ {active.source}: {effect.operation} {effect.parameter} ({who}, {until})")
+
+    def _matching_effects(self, operation: str, parameter: str, player: Player, special_type: str,
+                          consume: bool) -> List[ActiveEffect]:
+        effects = self.active_effects.get((operation, parameter))
+        if not effects:
+            return []
+        matching = [effect for effect in effects if effect.applies(player, self.current_round, special_type)]
+        if consume:
+            for effect in matching:
+                if effect.charges:
+                    effect.charges -= 1
+                    if not effect.charges:
+                        effects.remove(effect)
+            if not effects:
+                # Pusty słownik efektów pozwala pominąć ich sprawdzanie (effect_total, is_blocked)
+                del self.active_effects[(operation, parameter)]
+        return matching
+
+    def effect_total(self, parameter: str, player: Player, special_type: str = '', consume: bool = False) -> int:
+        """Suma modyfikatorów parametru dla gracza; `consume` zużywa ładunki (np. "następna publikacja")"""
+        if not self.active_effects:
+            return 0
+        return sum(effect.value for effect in self._matching_effects('modify', parameter, player, special_type, consume))
+
+    def is_blocked(self, parameter: str, player: Player, consume: bool = False) -> bool:
+        if not self.active_effects:
+            return False
+        return bool(self._matching_effects('block', parameter, player, '', consume))
+
+    def remove_active_effects(self, predicate: Callable[[ActiveEffect], bool]):
+        for key in list(self.active_effects):
+            remaining = [effect for effect in self.active_effects[key] if not predicate(effect)]
+            if remaining:
+                self.active_effects[key] = remaining
+            else:
+                del self.active_effects[key]
+
+    def expire_effects(self):
+        """Koniec rundy: usuwa wygasłe i zużyte efekty oraz kryzysy bez działających efektów"""
+        current_round = self.current_round
+        self.remove_active_effects(lambda effect: effect.last_round is not None and effect.last_round <= current_round)
+        lasting = {effect.source for effects in self.active_effects.values() for effect in effects
+                   if effect.from_crisis}
+        self.active_crises = [crisis for crisis in self.active_crises if crisis.name in lasting]
+
+    def end_round(self):
+        """Kończy rundę i przechodzi do następnej"""
+        # Zapłać pensje
+        for player in self.players:
+            self.pay_salaries(player)
+
+        # Sprawdź cele grantów
+        for player in self.players:
+            self.check_grant_completion(player)
+
+        # Sprawdź warunki końca gry
+        if self.check_end_game():
+            return
+
+        # Rozliczenie subwencji rządowej (6 punktów aktywności w tej rundzie → 10K)
+        for player in self.players:
+            cg = player.current_grant
+            if cg and not cg.is_completed and 'subwencja' in (cg.name or '').lower():
+                if player.round_activity_points >= 6:
+                    cg.is_completed = True
+                    player.credits += 10000
+                    self.log_message(f"{player.name} zrealizował subwencję: +10K")
+
+        # Auto-ukończenie Wielkich Projektów (jeśli spełniono progi PB/K)
+        for project in self.game_data.large_projects:
+            if project.is_completed or not project.director:
+                continue
+            # Wymagania: PB i K
+            pb_req, k_req, _, _ = parse_project_requirements(project.requirements)
+            if project.contributed_pb >= pb_req and project.contributed_credits >= k_req:
+                self.pay_project_rewards(project)
+
+        self.expire_effects()
+        self.current_round += 1
+        self.prepare_round()
+
+    def pay_salaries(self, player: Player):
+        """Płaci pensje dla gracza"""
+        # Pensje w CSV podane w tysiącach (2/3 → 2K/3K)
+        total_salary = 0
+        for scientist in player.scientists:
+            if scientist.type != ScientistType.DOKTORANT:
+                total_salary += scientist.salary if scientist.salary >= 100 else scientist.salary * 1000
+
+        # Modyfikator pensji (kryzysy) - za każdego płatnego naukowca
+        salary_modifier = self.effect_total('salary', player)
+        if salary_modifier:
+            total_salary += salary_modifier * sum(1 for s in player.scientists if s.type != ScientistType.DOKTORANT)
+
+        # Kara za przeciążenie (więcej niż 3 naukowców)
+        scientist_count = len(player.scientists)
+        if scientist_count > 3:
+            total_salary += scientist_count * 1000
+            self.log_message(f"{player.name}: kara przeciążenia {scientist_count}K")
+
+        if player.credits >= total_salary:
+            player.credits -= total_salary
+            # Przywróć aktywność płatnych naukowców
+            for s in player.scientists:
+                if s.type != ScientistType.DOKTORANT:
+                    s.is_paid = True
+            self.log_message(f"{player.name} zapłacił {total_salary//1000}K pensji")
+        else:
+            # Nie może zapłacić - kara reputacji tylko za pierwszą niewypłatę
+            unpaid_count = len([s for s in player.scientists if not s.is_paid])
+            if unpaid_count == 0:  # Pierwsza niewypłata
+                player.reputation = max(0, player.reputation - 1)
+                self.log_message(f"{player.name}: niewypłata pensji, -1 Reputacja")
+
+            # Oznacz naukowców jako niewypłaconych
+            for scientist in player.scientists:
+                if scientist.type != ScientistType.DOKTORANT:
+                    scientist.is_paid = False
+
+    # Granty
+
+    def meets_grant_requirements(self, player: Player, grant: GrantCard) -> bool:
+        """Wymagania grantu - predykat skompilowany z tekstu przy wczytaniu kart (i blokady kart)"""
+        if self.active_effects and (self.is_blocked('grant', player)
+                                    or player.reputation < self.effect_total('grant_min_reputation', player)):
+            return False
+        return grant.requirement(player)
+
+    def is_in_consortium(self, player: Player) -> bool:
+        return player.consortia > 0
+
+    def take_grant(self, grant: GrantCard):
+        """Gracz bierze grant i oddaje ruch następnemu"""
+        current_player = self.current_player
+        if current_player.current_grant is not None:
+            raise RuleViolation("Masz już grant w tej rundzie!")
+        if not self.meets_grant_requirements(current_player, grant):
+            raise RuleViolation("Nie spełniasz wymagań tego grantu")
+
+        current_player.current_grant = grant
+        self.available_grants.remove(grant)
+        self.log_message(f"Wzięto grant: {grant.name}")
+
+        # Przejdź do następnego gracza
+        self.next_player()
+
+    def take_subvention(self):
+        """Przydziela subwencję rządową graczowi (cel: 6 AP w tej rundzie, nagroda: 10K)."""
+        current_player = self.current_player
+        if current_player.current_grant is not None:
+            raise RuleViolation("Masz już grant w tej rundzie!")
+        if any(self.meets_grant_requirements(current_player, grant)
+               for grant in self.available_grants):
+            raise RuleViolation("Subwencja tylko gdy nie spełniasz wymagań żadnego grantu")
+        current_player.current_grant = subvention_grant()
+        self.log_message(f"Przydzielono subwencję rządową graczowi {current_player.name}")
+
+    def check_grant_completion(self, player: Player):
+        """Sprawdza czy gracz ukończył cel grantu"""
+        if not player.current_grant or player.current_grant.is_completed:
+            return
+
+        goal = player.current_grant.goal.lower()
+        completed = False
+
+        if "publikacj" in goal:
+            required_pubs = 2
+            if player.publications >= required_pubs:
+                completed = True
+
+        elif "badanie" in goal:
+            if len(player.completed_research) >= 1:
+                completed = True
+
+        elif "konsorcjum" in goal:
+            # Sprawdź czy założył konsorcjum
+            completed = any(project.director == player for project in self.game_data.large_projects)
+
+        elif "aktywności" in goal:
+            # Punkty aktywności: zatrudnienie (2p), publikacja (3p), ukończenie badania (4p), konsorcjum (5p)
+            activity_points = 0
+            activity_points += len(player.scientists) * 2  # Zatrudnienie
+            activity_points += player.publications * 3  # Publikacje
+            activity_points += len(player.completed_research) * 4  # Badania
+
+            for project in self.game_data.large_projects:
+                if project.director == player:
+                    activity_points += 5
+
+            required_activity = self.game_data.safe_int_parse(goal.split()[0], 10)
+            if activity_points >= required_activity:
+                completed = True
+
+        if completed:
+            player.current_grant.is_completed = True
+            # Daj nagrodę
+            reward = compile_reward(player.current_grant.reward)
+            if reward.ops:
+                reward.apply(player)
+                modifier = self.effect_total('grant_reward', player) if reward.amount('credits') else 0
+                player.credits = max(0, player.credits + modifier)
+                self.log_message(f"{player.name} ukończył grant: {reward}")
+
+    # Koniec gry
+
+    def check_end_game(self) -> bool:
+        """Sprawdza warunki końca gry"""
+        for player in self.players:
+            # Warunek 1: 35 PZ
+            if player.prestige_points >= 35:
+                self.end_game(f"{player.name} osiągnął 35 PZ!", END_PRESTIGE)
+                return True
+
+            # Warunek 2: 6 ukończonych badań
+            if len(player.completed_research) >= 6:
+                self.end_game(f"{player.name} ukończył 6 badań!", END_RESEARCH)
+                return True
+
+        # Warunek 3: 3 Wielkie Projekty ukończone
+        completed_projects = len([p for p in self.game_data.large_projects if p.is_completed])
+        if completed_projects >= 3:
+            self.end_game("Ukończono 3 Wielkie Projekty!", END_PROJECTS)
+            return True
+
+        # Limit rund (tylko gdy ustawiony, np. w symulacjach)
+        if self.max_rounds is not None and self.current_round >= self.max_rounds:
+            self.end_game(f"Limit {self.max_rounds} rund", END_ROUND_LIMIT)
+            return True
+
+        return False
+
+    def end_game(self, reason: str, condition: Optional[str] = None):
+        """Kończy grę i liczy wyniki (nazwa, wynik, PZ, badania, publikacje)"""
+        self.game_ended = True
+        self.end_reason = reason
+        self.end_condition = condition
+        self.log_message(f"KONIEC GRY: {reason}")
+
+        results = []
+        for player in self.players:
+            total_score = player.prestige_points
+            results.append((player.name, total_score, player.prestige_points, len(player.completed_research), player.publications))
+        results.sort(key=lambda x: x[1], reverse=True)
+        self.results = results
+
+        if self.on_game_over:
+            self.on_game_over(reason, results)
+
+    # Faza akcji
+
+    def play_action_card(self, action_card: ActionCard):
+        """Gracz zagrywa kartę akcji i wykonuje akcję podstawową"""
+        if action_card.is_used:
+            raise RuleViolation("Ta karta została już użyta w tej rundzie!")
+
+        current_player = self.current_player
+
+        # Oznacz kartę jako użytą
+        action_card.is_used = True
+        self.current_action_card = action_card
+        self.remaining_action_points = action_card.action_points
+        self.basic_action_done = False
+
+        # Dodatkowa opłata za akcję (kryzysy)
+        action_credits = self.effect_total('action_credits', current_player)
+        if action_credits:
+            current_player.credits = max(0, current_player.credits + action_credits)
+
+        # Wykonaj akcję podstawową
+        self.execute_basic_action(action_card)
+
+        self.log_message(f"{current_player.name} zagrał kartę: {action_card.action_type.value}")
+
+    def execute_basic_action(self, action_card: ActionCard):
+        """Wykonuje akcję podstawową karty (publikację wybiera gracz osobno)"""
+        current_player = self.current_player
+
+        if action_card.action_type == ActionType.PROWADZ_BADANIA:
+            doktoranci = [s for s in current_player.scientists if s.type == ScientistType.DOKTORANT]
+            if doktoranci and doktoranci[0].is_paid and current_player.active_research:
+                self.add_hex_to_research(current_player, 1)
+                self.log_message(f"Aktywowano doktoranta (+1 heks)")
+            elif doktoranci and doktoranci[0].is_paid:
+                self.log_message(f"Doktorant gotowy - rozpocznij badanie aby go aktywować")
+            else:
+                self.log_message(f"Brak aktywnego doktoranta")
+
+        elif action_card.action_type == ActionType.ZATRUDNIJ:
+            current_player.credits += 1000
+            self.log_message(f"Otrzymano 1K")
+
+        elif action_card.action_type == ActionType.PUBLIKUJ:
+            self.log_message(f"Możesz opublikować w dostępnych czasopismach (akcja podstawowa)")
+
+        elif action_card.action_type == ActionType.FINANSUJ:
+            current_player.credits += 2000
+            self.log_message(f"Otrzymano 2K")
+
+        elif action_card.action_type == ActionType.ZARZADZAJ:
+            current_player.credits += 2000
+            self.log_message(f"Otrzymano 2K")
+
+    def refresh_market(self):
+        """Odświeża rynek"""
+        available_journal_count = min(4, len(self.game_data.journals))
+        self.available_journals = self.rng.sample(self.game_data.journals, available_journal_count)
+
+        available_scientist_count = min(4, len(self.game_data.scientists))
+        self.available_scientists = self.rng.sample(self.game_data.scientists, available_scientist_count)
+
+        self.log_message("Odświeżono rynek czasopism i naukowców")
+
+    def hire_problem(self, player: Player, doktorant: bool = False) -> Optional[str]:
+        """Blokada zatrudniania z kart (None - można zatrudniać)"""
+        if self.active_effects and (self.is_blocked('hire', player)
+                                    or (doktorant and self.is_blocked('hire_doktorant', player))):
+            return "Zatrudnianie jest zablokowane w tej rundzie"
+        return None
+
+    def hire_scientist_direct(self, scientist: Scientist):
+        """Zatrudnia naukowca z rynku (koszt: dwie pensje)"""
+        current_player = self.current_player
+        problem = self.hire_problem(current_player)
+        if problem:
+            raise RuleViolation(problem)
+
+        cost = hire_cost(scientist)
+        if current_player.credits < cost:
+            raise RuleViolation(f"Brak środków! Koszt: {cost//1000}K")
+
+        current_player.credits -= cost
+        current_player.scientists.append(scientist)
+        self.available_scientists.remove(scientist)
+        self.log_message(f"Zatrudniono: {scientist.name} za {cost//1000}K")
+
+    def hire_from_market(self, scientist: Scientist):
+        """Zatrudnia naukowca z rynku w ramach karty ZATRUDNIJ (PA zależne od typu)"""
+        card = self.current_action_card
+        if not (card and card.action_type == ActionType.ZATRUDNIJ):
+            raise RuleViolation("Musisz najpierw zagrać kartę ZATRUDNIJ PERSONEL!")
+        pa_cost = HIRE_ACTION_POINTS.get(scientist.type, 1)
+        if self.remaining_action_points < pa_cost:
+            raise RuleViolation(f"Brak punktów akcji! Wymagane: {pa_cost} PA")
+        self.hire_scientist_direct(scientist)
+        self.remaining_action_points -= pa_cost
+
+        current_player = self.current_player
+        current_player.activity_points += 2
+        current_player.round_activity_points += 6  # dotychczasowa punktacja rundy (3 × 2)
+
+    def hire_after_action(self, scientist: Scientist):
+        """Zatrudnia naukowca wybranego w akcji dodatkowej (PA już zapłacone)"""
+        if scientist not in self.available_scientists:
+            raise RuleViolation("Tego naukowca nie ma na rynku!")
+        self.hire_scientist_direct(scientist)
+        self.current_player.activity_points += 2
+
+    def hire_doktorant(self):
+        """Nowy doktorant bez pensji (akcja dodatkowa ZATRUDNIJ)"""
+        current_player = self.current_player
+        problem = self.hire_problem(current_player, doktorant=True)
+        if problem:
+            raise RuleViolation(problem)
+        current_player.scientists.append(
+            Scientist("Doktorant", ScientistType.DOKTORANT, "Uniwersalny", 0, 1, "Brak", "Młody naukowiec"))
+        current_player.activity_points += 2
+        self.log_message("Zatrudniono Doktorant (bez kosztów)")
+
+    def publication_problem(self, player: Player, journal: JournalCard) -> Optional[str]:
+        """Powód, dla którego gracz nie może publikować w czasopiśmie (None - może)"""
+        if self.active_effects and self.is_blocked('publication', player):
+            return "Publikacje są zablokowane w tej rundzie"
+        if player.research_points < journal.pb_cost:
+            return f"Brak punktów badań! Koszt: {journal.pb_cost} PB"
+
+        rep_required = journal_reputation_required(journal.requirements)
+        if player.reputation < rep_required:
+            return f"Niewystarczająca reputacja! Wymagana: {rep_required}"
+
+        # Dodatkowe progi reputacji vs nagroda PZ (globalne)
+        rep = player.reputation
+        if (rep <= 1 and journal.pz_reward >= 4) or (rep == 2 and journal.pz_reward >= 6):
+            return "Reputacja zbyt niska na publikację o tej wartości PZ"
+        return None
+
+    def publish_in_journal(self, journal: JournalCard, round_activity_points: int = 9):
+        """Publikuje artykuł aktualnego gracza w czasopiśmie"""
+        current_player = self.current_player
+
+        problem = self.publication_problem(current_player, journal)
+        if problem:
+            raise RuleViolation(problem)
+
+        # Publikuj
+        current_player.research_points -= journal.pb_cost
+        pz_gain = journal.pz_reward
+        institute_name = current_player.institute.name.lower() if current_player.institute else ''
+        # Cambridge: wszystkie publikacje +1 PZ
+        if 'cambridge' in institute_name:
+            pz_gain += 1
+        if self.active_effects:
+            if self.is_blocked('publication_pz', current_player, consume=True):
+                pz_gain = 0
+            pz_gain = max(0, pz_gain + self.effect_total('publication_pz', current_player, consume=True))
+            current_player.research_points += self.effect_total('publication_pb', current_player, consume=True)
+            current_player.credits += self.effect_total('publication_credits', current_player)
+        current_player.prestige_points += pz_gain
+        current_player.publications += 1
+        current_player.activity_points += 3  # Punkt aktywności za publikację
+        current_player.round_activity_points += round_activity_points  # publikacja bez karty: 3 × 3
+
+        # Harvard: publikacja IF 6+ → +1 reputacja
+        if 'harvard' in institute_name and journal.impact_factor >= 6:
+            current_player.reputation = min(MAX_REPUTATION, current_player.reputation + 1)
+
+        # Dodaj do historii publikacji (karta czasopisma jest niezmienna - bez kopii)
+        current_player.publication_history.append(journal)
+
+        self.log_message(f"Opublikowano w {journal.name} za {journal.pb_cost} PB, +{pz_gain} PZ")
+
+    def publish_from_market(self, journal: JournalCard):
+        """Publikacja z rynku w ramach karty PUBLIKUJ (akcja podstawowa - bez PA, jeden artykuł)"""
+        card = self.current_action_card
+        if not (card and card.action_type == ActionType.PUBLIKUJ):
+            raise RuleViolation("Musisz najpierw zagrać kartę PUBLIKUJ!")
+        if self.basic_action_done:
+            raise RuleViolation("Akcja podstawowa tej karty (1 artykuł) została już wykonana!")
+        if journal not in self.available_journals:
+            raise RuleViolation("Tego czasopisma nie ma na rynku!")
+        self.publish_in_journal(journal, round_activity_points=3)
+        self.basic_action_done = True
+
+    # Badania i heksy
+
+    def start_research(self, card: ResearchCard):
+        """Wykłada kartę badania z ręki aktualnego gracza"""
+        current_player = self.current_player
+        if card not in current_player.hand_cards:
+            raise RuleViolation("Tej karty nie ma na ręku!")
+        current_player.hand_cards.remove(card)
+        current_player.active_research.append(card)
+        card.is_active = True
+        start_credits = self.effect_total('research_start_credits', current_player)
+        if start_credits:
+            current_player.credits = max(0, current_player.credits + start_credits)
+
+        # Initialize research for hex placement
+        card.player_color = current_player.color
+        card.player_path = []
+        card.hexes_placed = 0
+
+        self.log_message(f"Rozpoczęto badanie: {card.name}")
+
+    def add_hex_to_research(self, player: Player, hex_count: int) -> ResearchCard:
+        """Włącza tryb układania heksów na pierwszym aktywnym badaniu gracza"""
+        if not player.active_research:
+            raise RuleViolation("Brak aktywnych badań. Najpierw rozpocznij badanie.")
+
+        if player.hex_tokens < hex_count:
+            raise RuleViolation("Brak wystarczającej liczby heksów!")
+
+        # Znajdź pierwsze aktywne badanie
+        research = player.active_research[0]
+
+        # Wprowadź tryb układania heksów
+        self.pending_hex_placements = hex_count
+        self.hex_placement_mode = True
+        self.current_research_for_hex = research
+
+        self.log_message(f"Układaj {hex_count} heks(ów) na mapie badania '{research.name}'. Kliknij na dozwolone pola.")
+        return research
+
+    def place_hex(self, position, research: ResearchCard) -> Optional[dict]:
+        """Kładzie heks aktualnego gracza; zwraca wynik z mapy albo None, gdy ruch niemożliwy"""
+        if not self.hex_placement_mode or research is not self.current_research_for_hex:
+            return None
+
+        current_player = self.current_player
+
+        # Mapa sama sprawdza, czy heks przylega do już położonych (can_place_hex)
+        result = research.hex_research_map.place_hex(position, current_player.color, research.player_path)
+        if not result['success']:
+            self.log_message("Nie można położyć heksa w tym miejscu! Heks musi przylegać do już położonych.")
+            return None
+
+        # Usuń heks z puli gracza
+        current_player.hex_tokens -= 1
+        self.pending_hex_placements -= 1
+
+        # Aktualizuj postęp badania
+        research.hexes_placed = len(research.player_path)
+
+        self.log_message(f"Położono heks na pozycji ({position.q},{position.r})")
+
+        # Sprawdź bonusy
+        if result['bonus']:
+            self.apply_hex_bonus(current_player, result['bonus'])
+            self.log_message(f"Bonus z heksa: {result['bonus']}")
+
+        # Sprawdź ukończenie badania
+        if result['completed']:
+            self.log_message(f"Badanie '{research.name}' zostało ukończone!")
+            self.complete_research(current_player, research)
+            self.finish_hex_placement()
+
+        # Sprawdź czy pozostały jeszcze heksy do położenia
+        elif self.pending_hex_placements <= 0:
+            self.finish_hex_placement()
+            self.log_message("Wszystkie heksy zostały położone.")
+
+        return result
+
+    def finish_hex_placement(self):
+        """Kończy układanie heksów (nieułożone przepadają)"""
+        self.hex_placement_mode = False
+        self.pending_hex_placements = 0
+        self.current_research_for_hex = None
+
+    def apply_hex_bonus(self, player: Player, bonus: str):
+        """Aplikuje bonus z heksa bonusowego"""
+        compile_reward(bonus).apply(player)
+
+    def complete_research(self, player: Player, research: ResearchCard):
+        """Kończy badanie"""
+        research.is_completed = True
+        player.active_research.remove(research)
+        player.completed_research.append(research)
+
+        # Reset hex map for this player
+        if research.hex_research_map:
+            research.hex_research_map.reset_player_progress(player.color)
+
+        # Clear player path
+        research.player_path = []
+
+        # Odzyskaj heksy - gracz zawsze wraca do 20 heksów
+        player.hex_tokens = HEX_TOKENS
+
+        # Daj nagrodę podstawową (Wojna Patentowa blokuje nagrodę)
+        if self.is_blocked('research_reward', player, consume=True):
+            self.log_message(f"{player.name}: nagroda za badanie zablokowana")
+        else:
+            self.apply_research_reward(player, research.basic_reward)
+
+            # Bonusy instytutów po ukończeniu badania
+            inst_name = (player.institute.name if player.institute else '').lower()
+            if 'max planck' in inst_name:
+                player.research_points += 1  # +1 PB za każde ukończone badanie
+            if 'cambridge' in inst_name:
+                player.credits += 2000       # +2K za badanie
+        if self.active_effects:
+            player.credits = max(0, player.credits + self.effect_total('completion_credits', player, research.field))
+            player.research_points += self.effect_total('completion_pb', player, research.field)
+
+        # Zwiększ punkty aktywności
+        player.activity_points += 4
+        player.round_activity_points += 4
+
+        self.log_message(f"Ukończono badanie: {research.name}")
+
+    def apply_research_reward(self, player: Player, reward: str):
+        """Aplikuje nagrodę za ukończone badanie"""
+        compile_reward(reward).apply(player)
+
+    # Akcje dodatkowe
+
+    def action_cost(self, action_desc: str, cost: int) -> int:
+        """Koszt akcji dodatkowej w PA (CERN: -1 PA dla akcji konsorcjum w ramach FINANSUJ)"""
+        card = self.current_action_card
+        if self.active_effects and 'konsorcj' in action_desc.lower():
+            cost += self.effect_total('consortium_ap', self.current_player)
+        if (card and card.action_type == ActionType.FINANSUJ and 'konsorcj' in action_desc.lower()
+                and 'cern' in institute_name(self.current_player)):
+            return max(0, cost - 1)
+        return cost
+
+    def scientist_hexes(self, player: Player, hexes: int, consume: bool = False) -> int:
+        """Heksy z aktywacji naukowca (MIT/Stanford: +1 przy badaniu fizycznym; modyfikatory kart, min. 1)"""
+        inst = institute_name(player)
+        if ('mit' in inst or 'stanford' in inst) and player.active_research:
+            if 'fiz' in (player.active_research[0].field or '').lower():
+                hexes += 1
+        if self.active_effects and player.active_research:
+            field_name = player.active_research[0].field
+            hexes = max(1, hexes + self.effect_total('scientist_hexes', player, field_name, consume))
+        return hexes
+
+    def use_scientist(self, scientist_type: ScientistType, hexes: int) -> ResearchCard:
+        """Aktywuje opłaconego naukowca danego typu - heksy na pierwsze aktywne badanie"""
+        current_player = self.current_player
+        if not any(s.type == scientist_type and s.is_paid for s in current_player.scientists):
+            raise RuleViolation(f"Brak dostępnego {scientist_type.value}!")
+        hexes = self.scientist_hexes(current_player, hexes)
+        research = self.add_hex_to_research(current_player, hexes)
+        self.scientist_hexes(current_player, hexes, consume=True)  # zużyj ładunki dopiero po udanej aktywacji
+        self.log_message(f"Aktywowano {scientist_type.value} (+{hexes} heks)")
+        return research
+
+    def commercial_consulting(self):
+        """Konsultacje komercyjne: opłacony profesor daje 4K"""
+        current_player = self.current_player
+        if not any(s.type == ScientistType.PROFESOR and s.is_paid for s in current_player.scientists):
+            raise RuleViolation("Brak dostępnego profesora!")
+        current_player.credits += 4000
+        self.log_message("Konsultacje komercyjne (+4K)")
+
+    def additional_action_problem(self, kind: Optional[str]) -> Optional[str]:
+        """Powód, dla którego akcji dodatkowej nie da się teraz wykonać (bez wyboru parametru)"""
+        player = self.current_player
+        if kind == 'activate_doktor' or kind == 'activate_profesor':
+            scientist_type = ScientistType.DOKTOR if kind == 'activate_doktor' else ScientistType.PROFESOR
+            if not any(s.type == scientist_type and s.is_paid for s in player.scientists):
+                return f"Brak dostępnego {scientist_type.value}!"
+            if not player.active_research:
+                return "Brak aktywnych badań. Najpierw rozpocznij badanie."
+            hexes = self.scientist_hexes(player, 2 if kind == 'activate_doktor' else 3)
+            if player.hex_tokens < hexes:
+                return "Brak wystarczającej liczby heksów!"
+        elif kind == 'start_research':
+            if not any(isinstance(card, ResearchCard) for card in player.hand_cards):
+                return "Brak kart badań na ręku!"
+        elif kind == 'hire_doktor' or kind == 'hire_profesor':
+            scientist_type = ScientistType.DOKTOR if kind == 'hire_doktor' else ScientistType.PROFESOR
+            if not any(s.type == scientist_type for s in self.available_scientists):
+                return f"Brak dostępnych naukowców typu {scientist_type.value} na rynku"
+            return self.hire_problem(player)
+        elif kind == 'hire_doktorant':
+            return self.hire_problem(player, doktorant=True)
+        elif kind == 'consulting':
+            if not any(s.type == ScientistType.PROFESOR and s.is_paid for s in player.scientists):
+                return "Brak dostępnego profesora!"
+        elif kind == 'contribute':
+            if not any(p.director and not p.is_completed for p in self.game_data.large_projects):
+                return "Brak dostępnych konsorcjów"
+        elif kind == 'found_consortium':
+            if not any(isinstance(card, ConsortiumCard) for card in player.hand_cards):
+                return "Musisz mieć Kartę Konsorcjum w ręce, aby założyć konsorcjum!"
+            if not any(not p.director for p in self.game_data.large_projects):
+                return "Brak dostępnych Wielkich Projektów do założenia konsorcjum"
+            return self.consortium_problem(player)
+        elif kind == 'pr_campaign':
+            if player.credits < 4000:
+                return "Brak środków! Koszt: 4K"
+        elif kind == 'image':
+            if player.research_points < 2:
+                return "Brak punktów badań! Koszt: 2 PB"
+        return None
+
+    def check_additional_action(self, index: int) -> Optional[str]:
+        """Rodzaj akcji dodatkowej nr `index` aktywnej karty, jeśli stać na nią gracza.
+
+        Nie pobiera PA - interfejs sprawdza tak akcję przed otwarciem okna
+        wyboru, a wykonuje ją ruch `MOVE_ADDITIONAL` z wyborem.
+        """
+        card = self.current_action_card
+        if card is None:
+            raise RuleViolation("Najpierw zagraj kartę akcji!")
+        if not 0 <= index < len(card.additional_actions):
+            raise RuleViolation("Nieznana akcja dodatkowa")
+        action_desc, cost = card.additional_actions[index]
+        if self.remaining_action_points < self.action_cost(action_desc, cost):
+            raise RuleViolation("Brak wystarczających punktów akcji!")
+
+        kind = additional_action_kind(action_desc)
+        if kind is None:
+            raise RuleViolation("Tej akcji dodatkowej gra jeszcze nie obsługuje")
+        problem = self.additional_action_problem(kind)
+        if problem:
+            raise RuleViolation(problem)
+        return kind
+
+    def perform_additional_action(self, index: int, choice=None) -> Optional[str]:
+        """Wykonuje akcję dodatkową nr `index` aktywnej karty i zwraca jej rodzaj.
+
+        `choice` to wybór jak w `Move.param` (indeks karty na ręku, naukowca na
+        rynku albo projektu; dla wpłaty do konsorcjum para (projekt, 'pb' |
+        'credits' | 'join')). Bez wyboru akcja wymagająca go tylko pobiera PA
+        i zwraca rodzaj - wybór robi interfejs i kończy akcję metodami
+        `start_research`, `hire_after_action`, `contribute_to_project`,
+        `request_membership` albo `found_consortium`.
+        """
+        kind = self.check_additional_action(index)
+        action_desc, cost = self.current_action_card.additional_actions[index]
+        cost = self.action_cost(action_desc, cost)
+        target = None
+        if choice is not None and kind in CHOICE_ACTIONS:
+            target = self.action_choice(kind, choice)
+        player = self.current_player
+        self.remaining_action_points -= cost
+
+        if kind == 'activate_doktor':
+            self.use_scientist(ScientistType.DOKTOR, 2)
+        elif kind == 'activate_profesor':
+            self.use_scientist(ScientistType.PROFESOR, 3)
+        elif kind == 'start_research' and target is not None:
+            self.start_research(target)
+        elif (kind == 'hire_doktor' or kind == 'hire_profesor') and target is not None:
+            self.hire_after_action(target)
+        elif kind == 'hire_doktorant':
+            self.hire_doktorant()
+        elif kind == 'take_3k':
+            player.credits += 3000
+            self.log_message("Otrzymano 3K")
+        elif kind == 'consulting':
+            self.commercial_consulting()
+        elif kind == 'contribute' and target is not None:
+            project, resource = target
+            if resource == 'join':
+                self.request_membership(project)
+            else:
+                self.contribute_to_project(project, resource)
+        elif kind == 'found_consortium' and target is not None:
+            self.found_consortium(target)
+        elif kind == 'emergency_loan':
+            player.credits += 5000
+            player.reputation = max(0, player.reputation - 1)
+            self.log_message("Kredyt awaryjny (+5K, -1 Rep)")
+        elif kind == 'refresh_market':
+            self.refresh_market()
+        elif kind == 'pr_campaign':
+            player.credits -= 4000
+            player.reputation = min(MAX_REPUTATION, player.reputation + 1)
+            self.log_message("Kampania PR (+1 Rep)")
+        elif kind == 'image':
+            player.research_points -= 2
+            player.reputation = min(MAX_REPUTATION, player.reputation + 1)
+            self.log_message("Poprawa wizerunku (+1 Rep)")
+
+        self.log_message(f"Wykonano: {action_desc}")
+        return kind
+
+    def action_choice(self, kind: str, choice):
+        """Obiekt wskazany wyborem akcji dodatkowej; RuleViolation, gdy wybór jest niedozwolony"""
+        player = self.current_player
+        try:
+            if kind == 'start_research':
+                card = player.hand_cards[choice]
+                if isinstance(card, ResearchCard):
+                    return card
+            elif kind == 'hire_doktor' or kind == 'hire_profesor':
+                scientist = self.available_scientists[choice]
+                scientist_type = ScientistType.DOKTOR if kind == 'hire_doktor' else ScientistType.PROFESOR
+                if scientist.type == scientist_type:
+                    if player.credits < hire_cost(scientist):
+                        raise RuleViolation(f"Brak środków! Koszt: {hire_cost(scientist)//1000}K")
+                    return scientist
+            elif kind == 'found_consortium':
+                project = self.game_data.large_projects[choice]
+                if not project.director:
+                    return project
+            elif kind == 'contribute':
+                project_idx, resource = choice
+                project = self.game_data.large_projects[project_idx]
+                if resource == 'join':
+                    problem = self.membership_problem(player, project)
+                else:
+                    problem = self.contribution_problem(player, project, resource)
+                if problem:
+                    raise RuleViolation(problem)
+                return project, resource
+        except (IndexError, TypeError, ValueError):
+            pass
+        raise RuleViolation("Niedozwolony wybór akcji")
+
+    # Konsorcja i Wielkie Projekty
+
+    def consortium_problem(self, player: Player) -> Optional[str]:
+        """Blokada konsorcjów z kart (None - można zakładać i dołączać)"""
+        if self.active_effects and self.is_blocked('consortium', player):
+            return "Konsorcja są zablokowane w tej rundzie"
+        return None
+
+    def found_consortium(self, project: LargeProject, consortium_card: Optional[ConsortiumCard] = None):
+        """Aktualny gracz zostaje kierownikiem projektu (zużywa Kartę Konsorcjum z ręki)"""
+        current_player = self.current_player
+        if project.director:
+            raise RuleViolation("Ten projekt ma już kierownika!")
+        problem = self.consortium_problem(current_player)
+        if problem:
+            raise RuleViolation(problem)
+        if consortium_card is None:
+            consortium_card = next((c for c in current_player.hand_cards if isinstance(c, ConsortiumCard)), None)
+        if consortium_card is None or consortium_card not in current_player.hand_cards:
+            raise RuleViolation("Musisz mieć Kartę Konsorcjum w ręce, aby założyć konsorcjum!")
+
+        current_player.hand_cards.remove(consortium_card)
+        project.director = current_player
+        project.members.append(current_player)
+        current_player.consortia += 1
+        current_player.led_consortia += 1
+        current_player.activity_points += 5
+        current_player.round_activity_points += 5
+        self.log_message(f"{current_player.name} założył konsorcjum: {project.name} (użyto Kartę Konsorcjum)")
+
+    def contribution_problem(self, player: Player, project: LargeProject, resource: str) -> Optional[str]:
+        if project.director is not player or project.is_completed:
+            return "Wpłacać może tylko kierownik trwającego projektu"
+        if resource == 'pb' and player.research_points < CONSORTIUM_CONTRIBUTION['pb']:
+            return f"Brak wystarczających punktów badawczych! Potrzebujesz {CONSORTIUM_CONTRIBUTION['pb']} PB"
+        if resource == 'credits' and player.credits < CONSORTIUM_CONTRIBUTION['credits']:
+            return f"Brak wystarczających środków! Potrzebujesz {CONSORTIUM_CONTRIBUTION['credits']//1000}K"
+        if resource not in CONSORTIUM_CONTRIBUTION:
+            return "Nieznany rodzaj wpłaty"
+        return None
+
+    def contribute_to_project(self, project: LargeProject, resource: str):
+        """Kierownik wpłaca 1 PB ('pb') albo 3K ('credits') do swojego konsorcjum"""
+        current_player = self.current_player
+        problem = self.contribution_problem(current_player, project, resource)
+        if problem:
+            raise RuleViolation(problem)
+        amount = CONSORTIUM_CONTRIBUTION[resource]
+        if resource == 'pb':
+            current_player.research_points -= amount
+            project.contributed_pb += amount
+            self.log_message(f"{current_player.name} wpłacił {amount} PB do konsorcjum: {project.name}")
+        else:
+            current_player.credits -= amount
+            project.contributed_credits += amount
+            self.log_message(f"{current_player.name} wpłacił {amount//1000}K do konsorcjum: {project.name}")
+
+    def membership_problem(self, player: Player, project: LargeProject) -> Optional[str]:
+        if not project.director or project.is_completed:
+            return "Ten projekt nie ma aktywnego konsorcjum"
+        if contains(project.members, player):
+            return "Jesteś już członkiem tego konsorcjum!"
+        if contains(project.pending_members, player):
+            return "Już złożyłeś wniosek o dołączenie do tego konsorcjum!"
+        return self.consortium_problem(player)
+
+    def request_membership(self, project: LargeProject):
+        """Aktualny gracz składa wniosek o członkostwo (decyduje kierownik)"""
+        current_player = self.current_player
+        problem = self.membership_problem(current_player, project)
+        if problem:
+            raise RuleViolation(problem)
+        project.pending_members.append(current_player)
+        self.log_message(f"{current_player.name} złożył wniosek o dołączenie do konsorcjum: {project.name}")
+
+    def approve_membership(self, project: LargeProject, applicant: Player) -> bool:
+        """Kierownik przyjmuje wniosek"""
+        if applicant not in project.pending_members:
+            return False
+        project.pending_members.remove(applicant)
+        project.members.append(applicant)
+        applicant.consortia += 1
+        self.log_message(f"{project.director.name} zaakceptował {applicant.name} do konsorcjum: {project.name}")
+        return True
+
+    def reject_membership(self, project: LargeProject, applicant: Player) -> bool:
+        """Kierownik odrzuca wniosek"""
+        if applicant not in project.pending_members:
+            return False
+        project.pending_members.remove(applicant)
+        self.log_message(f"{project.director.name} odrzucił wniosek {applicant.name} o członkostwo w konsorcjum: {project.name}")
+        return True
+
+    def can_complete_project(self, project: LargeProject) -> bool:
+        if project.is_completed or not project.director:
+            return False
+        pb_req, k_req, comp_req, needs_prof = parse_project_requirements(project.requirements)
+        if project.contributed_pb < pb_req or project.contributed_credits < k_req:
+            return False
+        director = project.director
+        if comp_req and len(director.completed_research) < comp_req:
+            return False
+        if needs_prof and not any(s.type == ScientistType.PROFESOR for s in director.scientists):
+            return False
+        return True
+
+    def complete_project(self, project: LargeProject):
+        """Kończy Wielki Projekt: nagrody kierownika i członków"""
+        if project.is_completed:
+            return
+        if not self.can_complete_project(project):
+            raise RuleViolation("Nie spelniono wszystkich wymagan projektu")
+        self.pay_project_rewards(project)
+
+    def pay_project_rewards(self, project: LargeProject):
+        """Nagrody ukończonego projektu: kierownik i członkowie (skompilowane przy wczytaniu)"""
+        director = project.director
+        director_reward = compile_reward(project.director_reward)
+        member_reward = compile_reward(project.member_reward)
+        director_reward.apply(director)
+        for member in project.members:
+            if member is not director:
+                member_reward.apply(member)
+        project.is_completed = True
+        self.log_message(f"Ukonczono projekt: {project.name}. Kierownik {director_reward}; "
+                         f"czlonkowie {member_reward}")
+
+    # Karty intryg i okazji
+
+    def effect_targets(self, effect, source: Optional[Player], chosen: Optional[Player] = None) -> list:
+        """Gracze, na których działa efekt; [None] - blokada/modyfikator wspólny dla wszystkich"""
+        if effect.operation in TIMED_OPERATIONS and effect.target_type == 'all_players' and not effect.condition:
+            return [None]
+        resolve = EFFECT_TARGETS.get(effect.target_type)
+        if resolve is None:
+            return []
+        targets = resolve(self, source, chosen)
+        if effect.condition:
+            requirement = target_condition(effect.condition)
+            targets = [player for player in targets if requirement(player)]
+        return targets
+
+    def apply_card_effects(self, card, effects, source: Optional[Player], chosen: Optional[Player] = None) -> list:
+        """Wykonuje efekty karty przez `EFFECT_HANDLERS`; zwraca odkryte ręce [(gracz, nazwy kart)]"""
+        revealed = []
+        for effect in effects:
+            for player in self.effect_targets(effect, source, chosen):
+                if isinstance(effect, OpportunityEffect):
+                    names = self.apply_opportunity_effect(effect, player, card)
+                else:
+                    names = self.apply_intrigue_effect(effect, player, source, card)
+                if names is not None:
+                    revealed.append((player, names))
+        return revealed
+
+    def use_intrigue_card(self, card: IntrigueCard, target: Optional[Player] = None) -> list:
+        """Zagrywa kartę intrygi z ręki aktualnego gracza.
+
+        `target` - wybrany przeciwnik (karty 'opponent'). Zwraca odkryte ręce
+        [(gracz, nazwy kart)] dla efektów 'reveal' - pokazuje je interfejs.
+        """
+        current_player = self.current_player
+        if card not in current_player.hand_cards:
+            raise RuleViolation("Tej karty nie ma na ręku!")
+        if intrigue_target(card) == 'opponent' and (target is None or target is current_player
+                                                     or target not in self.players):
+            raise RuleViolation("Wybierz przeciwnika jako cel karty")
+
+        current_player.hand_cards.remove(card)
+        revealed = self.apply_card_effects(card, card.effects, current_player, target)
+        self.log_message(f"{current_player.name} użył karty intrygi: {card.name}")
+        return revealed
+
+    def apply_intrigue_effect(self, effect: IntrigueEffect, target_player: Optional[Player],
+                              source_player: Optional[Player], card=None) -> Optional[list]:
+        """Stosuje pojedynczy efekt na graczu (dla 'reveal' zwraca nazwy kart z ręki).
+
+        `target_player` None - blokada/modyfikator dla wszystkich graczy,
+        `source_player` None - efekt kryzysu.
+        """
+        handler = EFFECT_HANDLERS.get((effect.operation, effect.parameter))
+        if handler is None:
+            self.log_message(f"Nieobsługiwany efekt karty: {effect.operation} {effect.parameter}")
+            return None
+        return handler(self, card, effect, target_player, source_player, 1)
+
+    def can_use_opportunity(self, card: OpportunityCard, player: Player) -> bool:
+        """Czy gracz spełnia warunki karty okazji"""
+        if self.active_effects and self.is_blocked('opportunity', player):
+            return False
+        condition = card.requirements.lower()
+
+        if condition == "brak":
+            return True
+        elif "min. 1 publikacja" in condition:
+            return player.publications >= 1
+        elif "aktywne badanie" in condition:
+            return len(player.active_research) > 0
+        elif "reputacja 3+" in condition:
+            return player.reputation >= 3
+        elif "ukończone badanie" in condition:
+            return len(player.completed_research) > 0
+        elif "min. 1 profesor" in condition:
+            return any(scientist.type == ScientistType.PROFESOR for scientist in player.scientists)
+        elif "badanie chemiczne lub fizyczne" in condition:
+            return any(research.field in ["Chemia", "Fizyka"] for research in player.active_research + player.completed_research)
+        else:
+            return True  # Domyślnie pozwól
+
+    def use_opportunity_card(self, card: OpportunityCard):
+        """Zagrywa kartę okazji z ręki aktualnego gracza"""
+        current_player = self.current_player
+        if card not in current_player.hand_cards:
+            raise RuleViolation("Tej karty nie ma na ręku!")
+        if not self.can_use_opportunity(card, current_player):
+            raise RuleViolation(f"Nie spełniasz warunków karty '{card.name}'. Wymagania: {card.requirements}")
+        current_player.hand_cards.remove(card)
+        self.apply_card_effects(card, card.effects, current_player)
+        self.log_message(f"{current_player.name} użył karty okazji: {card.name}")
+
+    def apply_opportunity_effect(self, effect: OpportunityEffect, target_player: Optional[Player],
+                                 card=None) -> Optional[list]:
+        """Stosuje pojedynczy efekt okazji na graczu (Stanford: podwójne zyski)"""
+        handler = EFFECT_HANDLERS.get((effect.operation, effect.parameter))
+        if handler is None:
+            self.log_message(f"Nieobsługiwany efekt karty: {effect.operation} {effect.parameter}")
+            return None
+        current_player = self.current_player
+        scale = 1
+        if (effect.operation == 'add' and effect.parameter in STANFORD_DOUBLED
+                and 'stanford' in institute_name(current_player)):
+            scale = 2
+        return handler(self, card, effect, target_player, current_player, scale)
+
+    # Dozwolone ruchy (boty, przeszukiwanie, walidacja po stronie serwera)
+
+    def legal_moves(self) -> List[Move]:
+        """Wszystkie dozwolone ruchy aktualnego gracza w fazie akcji.
+
+        Podczas układania heksów dozwolone są tylko pola mapy (albo
+        `MOVE_FINISH_HEX`, gdy żadnego nie ma). Poza tym: zagranie karty
+        akcji, akcje dodatkowe w granicach PA (z każdym możliwym wyborem),
+        zatrudnianie i publikacje z rynku, karty intryg i okazji, ruchy
+        konsorcjów, koniec akcji i pas. Akcje dodatkowe bez reguły
+        w silniku (zakup kart) nie są generowane.
+        """
+        if self.game_ended or self.current_phase != GamePhase.AKCJE or not self.players:
+            return []
+        player = self.players[self.current_player_idx]
+        if player.has_passed:
+            return []
+
+        if self.hex_placement_mode:
+            research = self.current_research_for_hex
+            moves = [Move(MOVE_PLACE_HEX, (pos.q, pos.r))
+                     for pos in research.hex_research_map.legal_positions(research.player_path)]
+            return moves if moves and player.hex_tokens > 0 else [Move(MOVE_FINISH_HEX)]
+
+        moves = []
+        append = moves.append
+        card = self.current_action_card
+        if card is None:
+            for idx, action_card in enumerate(player.action_cards):
+                if not action_card.is_used:
+                    append(Move(MOVE_PLAY_CARD, idx))
+        else:
+            points = self.remaining_action_points
+            for idx, (action_desc, cost) in enumerate(card.additional_actions):
+                if points < self.action_cost(action_desc, cost):
+                    continue
+                kind = additional_action_kind(action_desc)
+                if kind is None or self.additional_action_problem(kind):
+                    continue
+                if kind in CHOICE_ACTIONS:
+                    for choice in self._action_choices(kind, player):
+                        append(Move(MOVE_ADDITIONAL, idx, choice))
+                else:
+                    append(Move(MOVE_ADDITIONAL, idx))
+
+            if card.action_type == ActionType.ZATRUDNIJ and self.hire_problem(player) is None:
+                credits = player.credits
+                for idx, scientist in enumerate(self.available_scientists):
+                    if points >= HIRE_ACTION_POINTS.get(scientist.type, 1) and credits >= hire_cost(scientist):
+                        append(Move(MOVE_HIRE, idx))
+            elif card.action_type == ActionType.PUBLIKUJ and not self.basic_action_done:
+                for idx, journal in enumerate(self.available_journals):
+                    if self.publication_problem(player, journal) is None:
+                        append(Move(MOVE_PUBLISH, idx))
+
+        # Karty z ręki
+        for idx, hand_card in enumerate(player.hand_cards):
+            if isinstance(hand_card, IntrigueCard):
+                if intrigue_target(hand_card) == 'opponent':
+                    for seat, other in enumerate(self.players):
+                        if other is not player:
+                            append(Move(MOVE_INTRIGUE, idx, seat))
+                else:
+                    append(Move(MOVE_INTRIGUE, idx))
+            elif isinstance(hand_card, OpportunityCard) and self.can_use_opportunity(hand_card, player):
+                append(Move(MOVE_OPPORTUNITY, idx))
+
+        # Konsorcja (bez PA): wnioski, decyzje kierownika, ukończenie projektu
+        for idx, project in enumerate(self.game_data.large_projects):
+            if not project.director or project.is_completed:
+                continue
+            if project.director is player:
+                for applicant in project.pending_members:
+                    seat = next(seat for seat, other in enumerate(self.players) if other is applicant)
+                    append(Move(MOVE_APPROVE, idx, seat))
+                    append(Move(MOVE_REJECT, idx, seat))
+                if self.can_complete_project(project):
+                    append(Move(MOVE_COMPLETE_PROJECT, idx))
+            elif self.membership_problem(player, project) is None:
+                append(Move(MOVE_JOIN, idx))
+
+        if card is not None:
+            append(Move(MOVE_END_ACTION))
+        append(Move(MOVE_PASS))
+        return moves
+
+    def _action_choices(self, kind: str, player: Player) -> list:
+        """Możliwe wybory (Move.param) akcji dodatkowej"""
+        if kind == 'start_research':
+            return [idx for idx, card in enumerate(player.hand_cards) if isinstance(card, ResearchCard)]
+        if kind == 'hire_doktor' or kind == 'hire_profesor':
+            scientist_type = ScientistType.DOKTOR if kind == 'hire_doktor' else ScientistType.PROFESOR
+            return [idx for idx, s in enumerate(self.available_scientists)
+                    if s.type == scientist_type and player.credits >= hire_cost(s)]
+        if kind == 'found_consortium':
+            return [idx for idx, project in enumerate(self.game_data.large_projects) if not project.director]
+        choices = []  # contribute
+        for idx, project in enumerate(self.game_data.large_projects):
+            if project.director is player:
+                for resource in CONSORTIUM_CONTRIBUTION:
+                    if self.contribution_problem(player, project, resource) is None:
+                        choices.append((idx, resource))
+            elif self.membership_problem(player, project) is None:
+                choices.append((idx, 'join'))
+        return choices
+
+    def flow_moves(self) -> List[Move]:
+        """Dozwolone teraz ruchy przebiegu rundy i fazy grantów (`FLOW_MOVES`).
+
+        W fazie grantów gracz bez grantu może wziąć grant, którego wymagania
+        spełnia, a subwencję tylko gdy takiego grantu nie ma; każdy może oddać kolejkę (`MOVE_TAKE_GRANT`
+        bez grantu). Fazę i rundę można zakończyć, o ile nikt nie układa
+        heksów.
+        """
+        if self.game_ended or not self.players:
+            return []
+        moves = []
+        if self.current_phase == GamePhase.GRANTY:
+            player = self.current_player
+            if player.current_grant is None:
+                grant_moves = [Move(MOVE_TAKE_GRANT, idx)
+                               for idx, grant in enumerate(self.available_grants)
+                               if self.meets_grant_requirements(player, grant)]
+                moves.extend(grant_moves)
+                if not grant_moves:
+                    moves.append(Move(MOVE_SUBVENTION))
+            moves.append(Move(MOVE_TAKE_GRANT))
+        if not self.hex_placement_mode:
+            moves.append(Move(MOVE_NEXT_PHASE))
+            moves.append(Move(MOVE_NEXT_ROUND))
+        return moves
+
+    def is_legal(self, move: Move) -> bool:
+        return move in (self.flow_moves() if move.kind in FLOW_MOVES else self.legal_moves())
+
+    def move_problem(self, move: Move) -> Optional[str]:
+        """Powód, dla którego ruch jest teraz niedozwolony (None - można go wykonać).
+
+        Powód podaje reguła, która odrzuca ruch na kopii gry (np. brak
+        środków); ruch, który żadna reguła nie odrzuca, a którego nie ma
+        wśród dozwolonych, dostaje ogólny komunikat.
+        """
+        if self.is_legal(move):
+            return None
+        try:
+            self.clone().apply_move(move)
+        except RuleViolation as e:
+            return str(e)
+        return f"Niedozwolony ruch: {move.kind} {move.arg if move.arg is not None else ''}".strip()
+
+    def apply_checked(self, move: Move) -> Optional[dict]:
+        """Wykonuje ruch spoza silnika (sieć, interfejs) - niedozwolony kończy się RuleViolation"""
+        problem = self.move_problem(move)
+        if problem:
+            raise RuleViolation(problem)
+        return self.apply_move(move)
+
+    def move_shape_problem(self, move: Move) -> Optional[str]:
+        """Czy argumenty ruchu wskazują istniejące karty, pola rynku, projekty i miejsca"""
+        kind, arg, param = move
+        if not self.players:
+            return "Gra nie ma graczy"
+        player = self.current_player
+        if kind == MOVE_PLACE_HEX:
+            valid = (self.hex_placement_mode and isinstance(arg, tuple) and len(arg) == 2
+                     and all(type(value) is int for value in arg))
+        elif kind == MOVE_PLAY_CARD:
+            valid = is_index(arg, player.action_cards)
+        elif kind == MOVE_ADDITIONAL:
+            valid = type(arg) is int
+        elif kind == MOVE_HIRE:
+            valid = is_index(arg, self.available_scientists)
+        elif kind == MOVE_PUBLISH:
+            valid = is_index(arg, self.available_journals)
+        elif kind == MOVE_INTRIGUE:
+            valid = is_index(arg, player.hand_cards) and (param is None or is_index(param, self.players))
+        elif kind == MOVE_OPPORTUNITY:
+            valid = is_index(arg, player.hand_cards)
+        elif kind == MOVE_JOIN or kind == MOVE_COMPLETE_PROJECT:
+            valid = is_index(arg, self.game_data.large_projects)
+        elif kind == MOVE_APPROVE or kind == MOVE_REJECT:
+            valid = is_index(arg, self.game_data.large_projects) and is_index(param, self.players)
+        elif kind == MOVE_TAKE_GRANT:
+            valid = arg is None or is_index(arg, self.available_grants)
+        elif kind in (MOVE_FINISH_HEX, MOVE_END_ACTION, MOVE_PASS, MOVE_NEXT_PHASE, MOVE_NEXT_ROUND,
+                      MOVE_SUBVENTION):
+            valid = True
+        else:
+            return f"Nieznany ruch: {kind}"
+        return None if valid else f"Nieprawidłowy ruch: {kind}"
+
+    def apply_move(self, move: Move) -> Optional[dict]:
+        """Wykonuje ruch z `legal_moves` albo `flow_moves`.
+
+        Przed zmianą stanu sprawdza tylko kształt ruchu (`move_shape_problem`);
+        czy ruch jest teraz dozwolony, sprawdza `move_problem`. Dla heksa
+        zwraca wynik z mapy, dla intrygi odkryte ręce jako
+        {'revealed': [[miejsce, nazwy kart]]}.
+        """
+        problem = self.move_shape_problem(move)
+        if problem:
+            raise RuleViolation(problem)
+        kind, arg, param = move
+        if kind == MOVE_PLACE_HEX:
+            result = self.place_hex(HexPosition(*arg), self.current_research_for_hex)
+            if result is None:
+                raise RuleViolation("Nie można położyć heksa w tym miejscu!")
+            return result
+        elif kind == MOVE_FINISH_HEX:
+            self.finish_hex_placement()
+        elif kind == MOVE_PLAY_CARD:
+            self.play_action_card(self.current_player.action_cards[arg])
+        elif kind == MOVE_ADDITIONAL:
+            self.perform_additional_action(arg, param)
+        elif kind == MOVE_HIRE:
+            self.hire_from_market(self.available_scientists[arg])
+        elif kind == MOVE_PUBLISH:
+            self.publish_from_market(self.available_journals[arg])
+        elif kind == MOVE_END_ACTION:
+            self.end_current_action()
+        elif kind == MOVE_PASS:
+            self.player_pass()
+        elif kind == MOVE_INTRIGUE:
+            card = self.current_player.hand_cards[arg]
+            if not isinstance(card, IntrigueCard):
+                raise RuleViolation("To nie jest karta intrygi")
+            revealed = self.use_intrigue_card(card, self.players[param] if param is not None else None)
+            seats = {id(player): seat for seat, player in enumerate(self.players)}
+            return {'revealed': [[seats[id(player)], list(names)] for player, names in revealed or []]}
+        elif kind == MOVE_OPPORTUNITY:
+            card = self.current_player.hand_cards[arg]
+            if not isinstance(card, OpportunityCard):
+                raise RuleViolation("To nie jest karta okazji")
+            self.use_opportunity_card(card)
+        elif kind == MOVE_JOIN:
+            self.request_membership(self.game_data.large_projects[arg])
+        elif kind == MOVE_APPROVE or kind == MOVE_REJECT:
+            project = self.game_data.large_projects[arg]
+            if project.director is not self.current_player:
+                raise RuleViolation("Wnioski rozpatruje kierownik konsorcjum")
+            decide = self.approve_membership if kind == MOVE_APPROVE else self.reject_membership
+            if not decide(project, self.players[param]):
+                raise RuleViolation("Brak takiego wniosku")
+        elif kind == MOVE_COMPLETE_PROJECT:
+            project = self.game_data.large_projects[arg]
+            if project.director is not self.current_player:
+                raise RuleViolation("Projekt kończy kierownik konsorcjum")
+            self.complete_project(project)
+        elif kind == MOVE_NEXT_PHASE:
+            self.next_phase()
+        elif kind == MOVE_NEXT_ROUND:
+            self.finish_round()
+        else:  # MOVE_TAKE_GRANT, MOVE_SUBVENTION
+            if self.current_phase != GamePhase.GRANTY:
+                raise RuleViolation("Granty bierze się tylko w fazie grantów")
+            if kind == MOVE_SUBVENTION:
+                self.take_subvention()
+            elif arg is None:
+                self.next_player()
+            else:
+                self.take_grant(self.available_grants[arg])
+
+@lru_cache(maxsize=None)
+def parse_project_requirements(text: str):
+    """Wymagania Wielkiego Projektu: (PB, kredyty, ukończone badania, czy potrzebny profesor)"""
+    txt = text or ''
+    pb_req = 0
+    m = re.search(r"(\d+)\s*PB", txt, flags=re.I)
+    if m:
+        pb_req = int(m.group(1))
+    k_req = 0
+    m = re.search(r"(\d+)\s*K", txt, flags=re.I)
+    if m:
+        k_req = int(m.group(1)) * 1000
+    comp_req = 0
+    m = re.search(r"(\d+)\s*uko\w*czone badania", txt, flags=re.I)
+    if m:
+        comp_req = int(m.group(1))
+    needs_prof = ('profesor' in txt.lower())
+    return pb_req, k_req, comp_req, needs_prof
+
+def parse_project_reward(text: str):
+    """Nagroda Wielkiego Projektu: (PZ, jednorazowe kredyty)"""
+    reward = compile_reward(text)
+    return reward.amount('prestige_points'), reward.amount('credits')
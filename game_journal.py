@@ -0,0 +1,446 @@
+# -*- coding: utf-8 -*-
+"""
+Dziennik akcji hosta gry sieciowej (odtwarzanie po awarii).
+
+Host dopisuje każdą zaakceptowaną akcję do pliku `journal.log` (JSON,
+jedna linia na wpis) i co jakiś czas zapisuje zwarty `snapshot.json`.
+Zapisy są buforowane i utrwalane (fsync) grupowo - co `flush_interval`
+sekund albo co `flush_every` wpisów - przez osobny wątek, więc dziennik
+nigdy nie blokuje przetwarzania akcji.
+
+Po restarcie host wczytuje ostatni snapshot i odtwarza ogon dziennika.
+Każdy wpis ma rosnący numer `seq`, a snapshot - numer ostatniego wpisu,
+który już zawiera; awaria między zapisem snapshotu a obcięciem dziennika
+nie powoduje więc podwójnego odtworzenia akcji.
+"""
+
+import copy
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+JOURNAL_FILE = 'journal.log'
+SNAPSHOT_FILE = 'snapshot.json'
+JOURNAL_FLUSH_INTERVAL = 0.05   # s
+JOURNAL_FLUSH_EVERY = 32        # wpisów
+SNAPSHOT_EVERY = 256            # akcji między snapshotami
+JOURNAL_ROOT = 'saves'
+
+def host_journal_dir(port: int) -> str:
+    """Katalog dziennika gry hostowanej na danym porcie"""
+    return os.path.join(JOURNAL_ROOT, f'host_{port}')
+
+class ActionJournal:
+    """Dziennik z grupowym fsync i atomowymi snapshotami"""
+
+    def __init__(self, directory: str, flush_interval: float = JOURNAL_FLUSH_INTERVAL,
+                 flush_every: int = JOURNAL_FLUSH_EVERY, snapshot_every: int = SNAPSHOT_EVERY):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.flush_every = flush_every
+        self.snapshot_every = snapshot_every
+        os.makedirs(directory, exist_ok=True)
+
+        # Bufor: ('record', linia, seq) albo ('snapshot', dane, seq) w kolejności zgłoszeń
+        self._pending = []
+        self._first_pending_at = None
+        self._condition = threading.Condition()
+        self._closed = False
+        self._file = open(os.path.join(directory, JOURNAL_FILE), 'a', encoding='utf-8')
+        self.actions_since_snapshot = 0
+        self.seq = self._last_seq(directory)  # numer ostatniego wpisu - ciągły także po restarcie
+
+        # Statystyki
+        self.records = 0
+        self.groups = 0
+        self.snapshots = 0
+        self.fsync_time = 0.0
+
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def append(self, record: dict):
+        """Dopisuje wpis z kolejnym numerem `seq` (nie czeka na dysk)"""
+        with self._condition:
+            self.seq += 1
+            line = json.dumps(dict(record, seq=self.seq), ensure_ascii=False)
+            self._pending.append(('record', line, self.seq))
+            if self._first_pending_at is None:
+                self._first_pending_at = time.monotonic()
+            if record.get('kind') == 'action':
+                self.actions_since_snapshot += 1
+            if len(self._pending) >= self.flush_every:
+                self._condition.notify()
+
+    def snapshot_due(self) -> bool:
+        return self.actions_since_snapshot >= self.snapshot_every
+
+    def snapshot(self, state: dict, seq: int):
+        """Zgłasza snapshot zawierający wpisy do `seq` włącznie; te wpisy zostaną usunięte z dziennika"""
+        with self._condition:
+            self._pending.append(('snapshot', dict(state, seq=seq), seq))
+            self.actions_since_snapshot = 0
+            if self._first_pending_at is None:
+                self._first_pending_at = time.monotonic()
+            self._condition.notify()
+
+    def close(self):
+        """Utrwala zaległe wpisy i zatrzymuje wątek zapisu"""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        self._thread.join(timeout=5.0)
+        self._file.close()
+
+    def stats(self) -> dict:
+        return {
+            'records': self.records,
+            'groups': self.groups,
+            'snapshots': self.snapshots,
+            'records_per_group': round(self.records / self.groups, 1) if self.groups else 0.0,
+            'fsync_ms_per_group': round(self.fsync_time / self.groups * 1000, 3) if self.groups else 0.0
+        }
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if self._pending:
+                        waited = time.monotonic() - self._first_pending_at
+                        if len(self._pending) >= self.flush_every or waited >= self.flush_interval:
+                            break
+                        self._condition.wait(self.flush_interval - waited)
+                    else:
+                        self._condition.wait()
+                batch, self._pending = self._pending, []
+                self._first_pending_at = None
+                closed = self._closed
+
+            if batch:
+                try:
+                    self._write_batch(batch)
+                except Exception as e:
+                    print(f"❌ Błąd zapisu dziennika gry: {e}")
+            if closed:
+                break
+
+    def _write_batch(self, batch):
+        """Zapisuje grupę wpisów jednym fsync (snapshot zastępuje starszy dziennik)"""
+        last_snapshot = max((i for i, (kind, _, _) in enumerate(batch) if kind == 'snapshot'), default=None)
+        if last_snapshot is not None:
+            _, state, snapshot_seq = batch[last_snapshot]
+            self._write_snapshot(state)
+            # Wpisy do snapshot_seq są już w nim zawarte; późniejsze (np. sesja
+            # zgłoszona w trakcie budowania snapshotu) trafiają do nowego dziennika
+            batch = [entry for entry in batch if entry[0] == 'record' and entry[2] > snapshot_seq]
+            self._file.close()
+            self._file = open(os.path.join(self.directory, JOURNAL_FILE), 'w', encoding='utf-8')
+
+        lines = [line for kind, line, _ in batch if kind == 'record']
+        if lines:
+            self._file.write('\n'.join(lines) + '\n')
+        started = time.perf_counter()
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.fsync_time += time.perf_counter() - started
+        self.records += len(lines)
+        self.groups += 1
+
+    def _write_snapshot(self, state: dict):
+        path = os.path.join(self.directory, SNAPSHOT_FILE)
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+        self.snapshots += 1
+
+    @staticmethod
+    def _last_seq(directory: str) -> int:
+        snapshot, records = ActionJournal.load(directory)
+        seqs = [record.get('seq', 0) for record in records]
+        if snapshot is not None:
+            seqs.append(snapshot.get('seq', 0))
+        return max(seqs, default=0)
+
+    @staticmethod
+    def load(directory: str) -> Tuple[Optional[dict], List[dict]]:
+        """Wczytuje ostatni snapshot i wpisy dziennika po nim (urwana ostatnia linia jest pomijana).
+
+        Wpisy o `seq` nie większym niż w snapshocie są w nim już zawarte
+        (awaria przed obcięciem dziennika) i są pomijane.
+        """
+        snapshot = None
+        snapshot_path = os.path.join(directory, SNAPSHOT_FILE)
+        if os.path.exists(snapshot_path):
+            with open(snapshot_path, encoding='utf-8') as f:
+                snapshot = json.load(f)
+
+        records = []
+        journal_path = os.path.join(directory, JOURNAL_FILE)
+        if os.path.exists(journal_path):
+            with open(journal_path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        break
+        if snapshot is not None and 'seq' in snapshot:
+            records = [record for record in records if record.get('seq', 0) > snapshot['seq']]
+        return snapshot, records
+
+    @staticmethod
+    def exists(directory: str) -> bool:
+        snapshot, records = ActionJournal.load(directory) if os.path.isdir(directory) else (None, [])
+        return snapshot is not None or bool(records)
+
+    @staticmethod
+    def clear(directory: str):
+        for name in (JOURNAL_FILE, SNAPSHOT_FILE):
+            path = os.path.join(directory, name)
+            if os.path.exists(path):
+                os.remove(path)
+
+# Zwarty snapshot stanu gry: karty zapisywane po nazwie, odtwarzane z danych gry
+
+PLAYER_FIELDS = ('credits', 'prestige_points', 'research_points', 'reputation', 'hex_tokens',
+                 'publications', 'activity_points', 'round_activity_points', 'has_passed',
+                 'consortia', 'led_consortia')
+
+def _card_ref(card) -> Optional[dict]:
+    if card is None:
+        return None
+    return {'type': type(card).__name__, 'name': getattr(card, 'name', str(card))}
+
+ACTIVE_EFFECT_FIELDS = ('source', 'operation', 'parameter', 'value', 'special_type', 'first_round', 'last_round',
+                        'charges', 'from_crisis')
+
+PROJECT_FIELDS = ('contributed_pb', 'contributed_credits', 'is_completed')
+
+def _crisis_ref(crisis) -> list:
+    return [crisis.name, crisis.extended]  # nazwy kryzysów powtarzają się w talii rozszerzonej
+
+def snapshot_game(game) -> dict:
+    """Zapisuje stan gry jako słownik (do JSON)"""
+    seats = {id(player): seat for seat, player in enumerate(game.players)}
+    players = []
+    for player in game.players:
+        entry = {field: getattr(player, field) for field in PLAYER_FIELDS}
+        entry.update({
+            'name': player.name,
+            'color': player.color,
+            'institute': _card_ref(player.institute),
+            'hand_cards': [_card_ref(card) for card in player.hand_cards],
+            'active_research': [{
+                'card': _card_ref(research),
+                'path': [[pos.q, pos.r] for pos in research.player_path],
+            } for research in player.active_research],
+            'completed_research': [_card_ref(card) for card in player.completed_research],
+            'scientists': [_card_ref(scientist) for scientist in player.scientists],
+            'unpaid_scientists': [idx for idx, scientist in enumerate(player.scientists) if not scientist.is_paid],
+            'current_grant': _card_ref(player.current_grant),
+            'current_grant_completed': bool(player.current_grant and player.current_grant.is_completed),
+            'used_action_cards': [card.action_type.name for card in player.action_cards if card.is_used],
+        })
+        players.append(entry)
+
+    action_card = game.current_action_card
+    data = game.game_data
+    hex_research = None
+    if game.current_research_for_hex is not None:
+        owner = game.players[game.current_player_idx]
+        hex_research = next((idx for idx, research in enumerate(owner.active_research)
+                             if research is game.current_research_for_hex), None)
+    version, internal, gauss_next = game.rng.getstate()
+    return {
+        'seed': game.seed,
+        'rng_state': [version, list(internal), gauss_next],
+        'scenario': game.current_scenario.name if game.current_scenario else None,
+        'game_ended': game.game_ended,
+        'end_condition': game.end_condition,
+        'round': game.current_round,
+        'phase': game.current_phase.name,
+        'current_player_idx': game.current_player_idx,
+        'current_action_card': action_card.action_type.name if action_card else None,
+        'remaining_action_points': game.remaining_action_points,
+        'basic_action_done': game.basic_action_done,
+        'hex_placement_mode': game.hex_placement_mode,
+        'pending_hex_placements': game.pending_hex_placements,
+        'current_research_for_hex': hex_research,  # indeks w aktywnych badaniach bieżącego gracza
+        'players': players,
+        'available_grants': [_card_ref(card) for card in game.available_grants],
+        'available_journals': [_card_ref(card) for card in game.available_journals],
+        'available_scientists': [_card_ref(card) for card in game.available_scientists],
+        'main_deck': [_card_ref(card) for card in data.main_deck],  # kolejność talii, nie ziarno
+        'completed_grants': [grant.name for grant in data.grants if grant.is_completed],
+        'unpaid_scientists': [scientist.name for scientist in data.scientists if not scientist.is_paid],
+        'large_projects': [dict({field: getattr(project, field) for field in PROJECT_FIELDS},
+                                name=project.name,
+                                director=seats[id(project.director)] if project.director is not None else None,
+                                members=[seats[id(player)] for player in project.members],
+                                pending_members=[seats[id(player)] for player in project.pending_members])
+                           for project in data.large_projects],
+        'active_crises': [_crisis_ref(crisis) for crisis in game.active_crises],
+        'crisis_deck': [_crisis_ref(crisis) for crisis in game.crisis_deck],
+        'active_effects': [dict({field: getattr(effect, field) for field in ACTIVE_EFFECT_FIELDS},
+                                player=seats[id(effect.player)] if effect.player is not None else None)
+                           for effects in game.active_effects.values() for effect in effects],
+    }
+
+class _CardIndex:
+    """Wzorce kart po (typ, nazwa) - z danych gry i z kart rozdanych przy konfiguracji"""
+
+    def __init__(self, game):
+        self.cards: Dict[Tuple[str, str], Any] = {}
+        data = game.game_data
+        for cards in (data.research_cards, data.consortium_cards, data.intrigue_cards, data.opportunity_cards,
+                      data.grants, data.journals, data.scientists, data.institutes):
+            self._add(cards)
+        for player in game.players:
+            self._add(player.hand_cards)
+            self._add(player.scientists)
+        self.missing = []
+
+    def _add(self, cards):
+        for card in cards or []:
+            self.cards.setdefault((type(card).__name__, getattr(card, 'name', str(card))), card)
+
+    def get(self, ref: Optional[dict], fresh=False):
+        """Karta wg referencji; `fresh` - kopia z nową mapą heksów (karty badań)"""
+        if ref is None:
+            return None
+        card = self.cards.get((ref['type'], ref['name']))
+        if card is None:
+            self.missing.append(ref['name'])
+            return None
+        if not fresh:
+            return card
+        if not hasattr(card, 'GAME_STATE'):
+            return card  # karta niezmienna - współdzielona
+        card = copy.copy(card)
+        if hasattr(card, 'hex_research_map'):
+            card.hex_research_map = None  # własna mapa powstanie przy pierwszym użyciu
+            card.player_path = []
+            card.hexes_placed = 0
+        return card
+
+    def get_all(self, refs, fresh=False) -> list:
+        return [card for card in (self.get(ref, fresh) for ref in refs) if card is not None]
+
+def restore_game(game, snapshot: dict) -> List[str]:
+    """Nakłada snapshot na skonfigurowaną grę; zwraca nazwy nieodnalezionych kart"""
+    from game_engine import subvention_grant
+    from game_model import ActiveEffect
+    from hex_map import HexPosition
+
+    index = _CardIndex(game)
+    subvention = subvention_grant()
+    phases = {phase.name: phase for phase in type(game.current_phase)}
+
+    for player, entry in zip(game.players, snapshot['players']):
+        for field in PLAYER_FIELDS:
+            setattr(player, field, entry.get(field, getattr(player, field)))  # starsze snapshoty
+        player.institute = index.get(entry['institute']) or player.institute
+        player.hand_cards = index.get_all(entry['hand_cards'], fresh=True)
+        player.completed_research = index.get_all(entry['completed_research'], fresh=True)
+        player.scientists = index.get_all(entry['scientists'], fresh=True)
+        for idx in entry.get('unpaid_scientists', []):
+            player.scientists[idx].is_paid = False
+        grant_ref = entry['current_grant']
+        if grant_ref is not None and grant_ref['name'] == subvention.name:
+            player.current_grant = subvention_grant()  # spoza talii grantów
+        else:
+            player.current_grant = index.get(grant_ref)
+
+        player.active_research = []
+        for research_entry in entry['active_research']:
+            research = index.get(research_entry['card'], fresh=True)
+            if research is None:
+                continue
+            research.is_active = True
+            research.player_color = player.color
+            for q, r in research_entry['path']:
+                research.hex_research_map.place_hex(HexPosition(q, r), player.color, research.player_path)
+            research.hexes_placed = len(research.player_path)
+            player.active_research.append(research)
+
+        used = set(entry['used_action_cards'])
+        for card in player.action_cards:
+            card.is_used = card.action_type.name in used
+
+    if snapshot.get('rng_state'):
+        version, internal, gauss_next = snapshot['rng_state']
+        game.rng.setstate((version, tuple(internal), gauss_next))
+    game.seed = snapshot.get('seed', game.seed)
+    if snapshot.get('scenario') is not None:
+        scenarios = {scenario.name: scenario for scenario in game.game_data.scenarios}
+        if snapshot['scenario'] in scenarios:
+            game.current_scenario = scenarios[snapshot['scenario']]
+        else:
+            index.missing.append(snapshot['scenario'])
+    game.game_ended = snapshot.get('game_ended', False)
+    game.end_condition = snapshot.get('end_condition')
+    game.current_round = snapshot['round']
+    game.current_phase = phases[snapshot['phase']]
+    game.current_player_idx = snapshot['current_player_idx']
+    game.remaining_action_points = snapshot['remaining_action_points']
+    game.basic_action_done = snapshot.get('basic_action_done', False)
+    game.current_action_card = None
+    if snapshot['current_action_card']:
+        player = game.players[game.current_player_idx]
+        game.current_action_card = next(
+            (card for card in player.action_cards if card.action_type.name == snapshot['current_action_card']), None)
+    game.available_grants = index.get_all(snapshot['available_grants'])
+    game.available_journals = index.get_all(snapshot['available_journals'])
+    game.available_scientists = index.get_all(snapshot['available_scientists'])
+
+    data = game.game_data
+    if 'main_deck' in snapshot:
+        data.main_deck = index.get_all(snapshot['main_deck'], fresh=True)
+    if 'completed_grants' in snapshot:
+        completed = set(snapshot['completed_grants'])
+        for grant in data.grants:
+            grant.is_completed = grant.name in completed
+    # Po flagach talii - grant gracza bywa tą samą kartą
+    for player, entry in zip(game.players, snapshot['players']):
+        if player.current_grant is not None and 'current_grant_completed' in entry:
+            player.current_grant.is_completed = entry['current_grant_completed']
+    if 'unpaid_scientists' in snapshot:
+        unpaid = set(snapshot['unpaid_scientists'])
+        for scientist in data.scientists:
+            scientist.is_paid = scientist.name not in unpaid
+    projects = {project.name: project for project in data.large_projects}
+    for entry in snapshot.get('large_projects', []):
+        project = projects.get(entry['name'])
+        if project is None:
+            index.missing.append(entry['name'])
+            continue
+        for field in PROJECT_FIELDS:
+            setattr(project, field, entry[field])
+        project.director = game.players[entry['director']] if entry['director'] is not None else None
+        project.members = [game.players[seat] for seat in entry['members']]
+        project.pending_members = [game.players[seat] for seat in entry['pending_members']]
+
+    game.hex_placement_mode = snapshot.get('hex_placement_mode', False)
+    game.pending_hex_placements = snapshot.get('pending_hex_placements', 0)
+    game.current_research_for_hex = None
+    if snapshot.get('current_research_for_hex') is not None:
+        owner = game.players[game.current_player_idx]
+        game.current_research_for_hex = owner.active_research[snapshot['current_research_for_hex']]
+
+    crises = {tuple(_crisis_ref(crisis)): crisis for crisis in game.game_data.crisis_cards}
+    game.active_crises = [crises[tuple(ref)] for ref in snapshot.get('active_crises', []) if tuple(ref) in crises]
+    game.crisis_deck = [crises[tuple(ref)] for ref in snapshot.get('crisis_deck', []) if tuple(ref) in crises]
+    game.active_effects = {}
+    for entry in snapshot.get('active_effects', []):
+        seat = entry.get('player')
+        effect = ActiveEffect(player=game.players[seat] if seat is not None else None,
+                              **{field: entry[field] for field in ACTIVE_EFFECT_FIELDS})
+        game.active_effects.setdefault((effect.operation, effect.parameter), []).append(effect)
+    return index.missing
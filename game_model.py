@@ -0,0 +1,1538 @@
+# -*- coding: utf-8 -*-
+"""
+Model gry PRINCIPIA: karty, gracze i dane gry (bez interfejsu).
+
+Wspólny dla interfejsu tkinter (`principia_card_ui.py`), silnika reguł
+(`game_engine.py`) i modułów sieciowych.
+
+Karty i projekty są zwarte (`__slots__` - bez słownika atrybutów na
+instancję); gracz, których jest tylko kilku na grę, zostaje zwykłą
+dataclass. Karty, które w trakcie gry się nie zmieniają (czasopisma,
+instytuty, intrygi, okazje, kryzysy, scenariusze), są niezmienne
+(`frozen`) i współdzielone między rozgrywkami. Karty ze stanem
+rozgrywki wymieniają pola zmienne w `GAME_STATE` - reszta to definicja
+karty. Mapa heksów badania powstaje dopiero przy pierwszym użyciu.
+
+`clone_state` kopiuje obiekt ze stanem rozgrywki (gracz, karta ze stanem,
+projekt) raz na obiekt - `memo` (id -> kopia) zachowuje wspólne
+odwołania, np. tę samą kartę na ręku i w talii; karty niezmienne są
+współdzielone z oryginałem.
+"""
+
+import csv
+import random
+import re
+import sys
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from enum import Enum
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
+
+from hex_map import HexResearchMap
+
+MAX_REPUTATION = 5
+
+# __slots__ w dataclass od Pythona 3.10; starsze wersje działają bez nich
+SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+DEFINITION = dict(frozen=True, **SLOTS)
+
+_COPIERS = {}
+
+def _make_copier(cls):
+    """Funkcja kopiująca pola klasy (sloty albo słownik atrybutów)"""
+    slots = getattr(cls, '__slots__', None)
+    if slots is None:
+        def copier(obj):
+            copied = object.__new__(cls)
+            copied.__dict__.update(obj.__dict__)
+            return copied
+        return copier
+
+    def copier(obj):
+        copied = object.__new__(cls)
+        for name in slots:
+            setattr(copied, name, getattr(obj, name))
+        return copied
+    return copier
+
+def shallow_copy(obj):
+    """Płytka kopia obiektu stanu (kilka razy szybsza niż copy.copy)"""
+    copier = _COPIERS.get(obj.__class__)
+    if copier is None:
+        copier = _COPIERS[obj.__class__] = _make_copier(obj.__class__)
+    return copier(obj)
+
+def clone_state(obj, memo: dict):
+    """Kopia obiektu ze stanem gry (jedna na obiekt); obiekty niezmienne i None bez zmian"""
+    if obj is None or not hasattr(obj, 'clone'):
+        return obj
+    copied = memo.get(id(obj))
+    if copied is None:
+        copied = memo[id(obj)] = obj.clone(memo)
+    return copied
+
+# Enums i stałe
+class ActionType(Enum):
+    PROWADZ_BADANIA = "PROWADŹ BADANIA"
+    ZATRUDNIJ = "ZATRUDNIJ PERSONEL"
+    PUBLIKUJ = "PUBLIKUJ"
+    FINANSUJ = "FINANSUJ PROJEKT"
+    ZARZADZAJ = "ZARZĄDZAJ"
+
+class GamePhase(Enum):
+    GRANTY = "Faza Grantów"
+    AKCJE = "Faza Akcji"
+    PORZADKOWA = "Faza Porządkowa"
+
+class ScientistType(Enum):
+    DOKTORANT = "Doktorant"
+    DOKTOR = "Doktor"
+    PROFESOR = "Profesor"
+
+@dataclass(**SLOTS)
+class ActionCard:
+    """Klasa reprezentująca kartę akcji"""
+    GAME_STATE = ('is_used',)
+
+    action_type: ActionType
+    action_points: int
+    basic_action: str
+    additional_actions: List[Tuple[str, int]]  # (opis, koszt PA)
+    is_used: bool = False
+
+    def clone(self, memo: dict) -> 'ActionCard':
+        return shallow_copy(self)
+
+# Klasy danych (jak wcześniej)
+@dataclass(**SLOTS)
+class Scientist:
+    GAME_STATE = ('is_paid',)
+
+    name: str
+    type: ScientistType
+    field: str
+    salary: int
+    hex_bonus: int
+    special_bonus: str
+    description: str
+    is_paid: bool = True
+
+    def clone(self, memo: dict) -> 'Scientist':
+        return shallow_copy(self)
+
+@dataclass(**SLOTS)
+class ResearchCard:
+    GAME_STATE = ('hexes_placed', 'is_completed', 'is_active', 'player_path', 'player_color')
+
+    name: str
+    field: str
+    hex_map: str
+    basic_reward: str
+    bonus_reward: str
+    description: str
+    hexes_placed: int = 0
+    max_hexes: int = 5
+    is_completed: bool = False
+    is_active: bool = False
+    player_path: List = field(default_factory=list)  # Track player's hex path
+    player_color: str = ""  # Color of the player conducting this research
+    _hex_research_map: Optional['HexResearchMap'] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def hex_research_map(self) -> Optional['HexResearchMap']:
+        """Mapa heksagonalna - tworzona przy pierwszym użyciu (większość kart nie trafia na stół)"""
+        if self._hex_research_map is None and self.hex_map:
+            try:
+                self._hex_research_map = HexResearchMap(self.hex_map)
+            except Exception as e:
+                print(f"Błąd parsowania mapy heksagonalnej dla {self.name}: {e}")
+                # Stwórz prostą mapę fallback
+                self._hex_research_map = HexResearchMap("START(0,0)->(1,0)->(2,0)->END(3,0)")
+        return self._hex_research_map
+
+    @hex_research_map.setter
+    def hex_research_map(self, value: Optional['HexResearchMap']):
+        self._hex_research_map = value
+
+    def reset_progress(self):
+        """Stan sprzed rozgrywki (mapa czyszczona tylko jeśli już powstała)"""
+        self.hexes_placed = 0
+        self.is_completed = False
+        self.is_active = False
+        self.player_path = []
+        self.player_color = ""
+        if self._hex_research_map is not None:
+            self._hex_research_map.reset()
+
+    def clone(self, memo: dict) -> 'ResearchCard':
+        copied = shallow_copy(self)
+        copied.player_path = list(self.player_path)
+        if self._hex_research_map is not None:
+            copied._hex_research_map = self._hex_research_map.clone()
+        return copied
+
+@dataclass(**DEFINITION)
+class JournalCard:
+    name: str
+    impact_factor: int
+    pb_cost: int
+    requirements: str
+    pz_reward: int
+    special_bonus: str
+    description: str
+
+# Wymagania grantów: tekst z CSV kompilowany raz do drzewa predykatów
+# sprawdzanych na stanie gracza (bez napisów i wyrażeń regularnych w grze)
+
+class Requirement(ABC):
+    """Predykat wymagania: `requirement(player) -> bool`"""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def __call__(self, player: 'Player') -> bool:
+        """Czy gracz spełnia wymaganie"""
+
+class Always(Requirement):
+    __slots__ = ()
+
+    def __call__(self, player):
+        return True
+
+    def __repr__(self):
+        return 'Always()'
+
+class AllOf(Requirement):
+    __slots__ = ('parts',)
+
+    def __init__(self, parts):
+        self.parts = tuple(parts)
+
+    def __call__(self, player):
+        for part in self.parts:
+            if not part(player):
+                return False
+        return True
+
+    def __repr__(self):
+        return f"AllOf({', '.join(map(repr, self.parts))})"
+
+class AnyOf(AllOf):
+    __slots__ = ()
+
+    def __call__(self, player):
+        for part in self.parts:
+            if part(player):
+                return True
+        return False
+
+    def __repr__(self):
+        return f"AnyOf({', '.join(map(repr, self.parts))})"
+
+class AtLeast(Requirement):
+    """Pole liczbowe gracza >= próg (reputacja, kredyty, konsorcja)"""
+
+    __slots__ = ('attr', 'value')
+
+    def __init__(self, attr: str, value: int):
+        self.attr = attr
+        self.value = value
+
+    def __call__(self, player):
+        return getattr(player, self.attr) >= self.value
+
+    def __repr__(self):
+        return f"AtLeast({self.attr}, {self.value})"
+
+class AtMost(AtLeast):
+    __slots__ = ()
+
+    def __call__(self, player):
+        return getattr(player, self.attr) <= self.value
+
+    def __repr__(self):
+        return f"AtMost({self.attr}, {self.value})"
+
+class MinScientists(Requirement):
+    """Co najmniej `count` naukowców (danego typu i/lub dziedziny)"""
+
+    __slots__ = ('count', 'type', 'field')
+
+    def __init__(self, count: int, scientist_type: Optional['ScientistType'] = None, field_name: str = ''):
+        self.count = count
+        self.type = scientist_type
+        self.field = field_name
+
+    def __call__(self, player):
+        scientist_type, field_name = self.type, self.field
+        if scientist_type is None and not field_name:
+            return len(player.scientists) >= self.count
+        missing = self.count
+        for scientist in player.scientists:
+            if ((scientist_type is None or scientist.type is scientist_type)
+                    and (not field_name or scientist.field == field_name)):
+                missing -= 1
+                if not missing:
+                    return True
+        return missing <= 0
+
+    def __repr__(self):
+        return f"MinScientists({self.count}, {self.type and self.type.name}, {self.field!r})"
+
+class MinFields(Requirement):
+    """Naukowcy z co najmniej `count` różnych dziedzin"""
+
+    __slots__ = ('count',)
+
+    def __init__(self, count: int):
+        self.count = count
+
+    def __call__(self, player):
+        return len({scientist.field for scientist in player.scientists}) >= self.count
+
+    def __repr__(self):
+        return f"MinFields({self.count})"
+
+class MinCompleted(Requirement):
+    """Co najmniej `count` ukończonych badań"""
+
+    __slots__ = ('count',)
+
+    def __init__(self, count: int):
+        self.count = count
+
+    def __call__(self, player):
+        return len(player.completed_research) >= self.count
+
+    def __repr__(self):
+        return f"MinCompleted({self.count})"
+
+ALWAYS = Always()
+FIELD_NAMES = {'fizy': 'Fizyka', 'biol': 'Biologia', 'chem': 'Chemia'}  # fizyk/fizyki/... -> Scientist.field
+
+def _field_name(word: str) -> str:
+    return FIELD_NAMES[word[:4]]
+
+def _scientist_type(word: str) -> 'ScientistType':
+    if word.startswith('doktorant'):
+        return ScientistType.DOKTORANT
+    if word.startswith('doktor'):
+        return ScientistType.DOKTOR
+    return ScientistType.PROFESOR  # profesor, professor
+
+def _any_of(parts: list) -> Requirement:
+    return parts[0] if len(parts) == 1 else AnyOf(parts)
+
+_FIELD = r'(fizy\w*|biol\w*|chem\w*)'
+# (wzorzec, budowniczy predykatu z grup dopasowania) - tekst małymi literami, bez "min."
+REQUIREMENT_RULES = (
+    (r'(?:brak|brak wymagań)', lambda m: ALWAYS),
+    (r'reputacja (\d+)\+?', lambda m: AtLeast('reputation', int(m[1]))),
+    (r'max\. reputacja (\d+)', lambda m: AtMost('reputation', int(m[1]))),
+    (r'(\d+)k własnych środków', lambda m: AtLeast('credits', int(m[1]) * 1000)),
+    (r'(\d+) (doktorant\w*|doktor\w*|profes+or\w*)(?: ' + _FIELD + ')?',
+     lambda m: MinScientists(int(m[1]), _scientist_type(m[2]), _field_name(m[3]) if m[3] else '')),
+    (r'(\d+) naukow\w* ' + _FIELD + r'((?: lub ' + _FIELD + ')*)',
+     lambda m: _any_of([MinScientists(int(m[1]), field_name=_field_name(word))
+                        for word in [m[2]] + m[3].split(' lub ')[1:]])),
+    (r'(\d+) naukowc\w*', lambda m: MinScientists(int(m[1]))),
+    (r'(?:(\d+) naukowc\w* różnych dziedzin|naukowcy ze? (?:wszystkich )?(\d+) (?:różnych )?dziedzin'
+     r'|(\d+) różne dziedziny)', lambda m: MinFields(int(m[1] or m[2] or m[3]))),
+    (r'(\d+) (?:ukończon\w* bada\w*|bada\w* ukończon\w*)', lambda m: MinCompleted(int(m[1]))),
+    (r'(\d+) konsorcj\w*', lambda m: AtLeast('consortia', int(m[1]))),
+    (r'(\d+) konsorcj\w* własn\w*', lambda m: AtLeast('led_consortia', int(m[1]))),
+    (r'spec\. ' + _FIELD, lambda m: MinScientists(1, field_name=_field_name(m[1]))),
+)
+_COMPILED_RULES = tuple((re.compile(pattern), build) for pattern, build in REQUIREMENT_RULES)
+
+def compile_requirements(text: str) -> Tuple[Requirement, List[str]]:
+    """Tekst wymagań grantu -> (predykat, nierozpoznane fragmenty).
+
+    Fragmenty po przecinku/średniku muszą być spełnione wszystkie.
+    Nierozpoznany fragment nie blokuje grantu (jak dotąd), ale trafia
+    do listy problemów zgłaszanej przy wczytywaniu.
+    """
+    parts = []
+    problems = []
+    for fragment in re.split(r'[;,]', (text or '').strip().lower()):
+        fragment = ' '.join(fragment.split())
+        if not fragment:
+            continue
+        clause = fragment[len('min.'):].strip() if fragment.startswith('min.') else fragment
+        for pattern, build in _COMPILED_RULES:
+            match = pattern.fullmatch(clause)
+            if match:
+                parts.append(build(match))
+                break
+        else:
+            problems.append(fragment)
+    parts = [part for part in parts if part is not ALWAYS]
+    if not parts:
+        return ALWAYS, problems
+    return (parts[0] if len(parts) == 1 else AllOf(parts)), problems
+
+# Nagrody i bonusy (badania, heksy, granty, Wielkie Projekty): tekst kompilowany
+# raz do listy operacji (pole gracza, zmiana, górny limit)
+
+REWARD_LABELS = {'research_points': '+{} PB', 'prestige_points': '+{} PZ',
+                 'credits': '+{}K', 'reputation': '+{} Rep'}
+
+class Reward:
+    """Skompilowana nagroda: `apply(player)` dodaje zasoby z limitami"""
+
+    __slots__ = ('ops', 'problems')
+
+    def __init__(self, ops=(), problems=()):
+        self.ops = tuple(ops)             # (pole gracza, zmiana, limit albo None)
+        self.problems = tuple(problems)   # nierozpoznane fragmenty tekstu (pominięte)
+
+    def apply(self, player: 'Player'):
+        for attr, amount, cap in self.ops:
+            value = getattr(player, attr) + amount
+            setattr(player, attr, value if cap is None else min(cap, value))
+
+    def amount(self, attr: str) -> int:
+        return sum(amount for op_attr, amount, _ in self.ops if op_attr == attr)
+
+    def __str__(self):
+        return ', '.join(REWARD_LABELS[attr].format(amount // 1000 if attr == 'credits' else amount)
+                         for attr, amount, _ in self.ops) or 'brak'
+
+    def __repr__(self):
+        return f"Reward({list(self.ops)!r}, problems={list(self.problems)!r})"
+
+# (wzorzec, pole gracza, mnożnik, limit) - pojedyncza zmiana zasobu
+REWARD_RULES = (
+    (r'\+?(\d+) ?PB', 'research_points', 1, None),
+    (r'\+?(\d+) ?PZ', 'prestige_points', 1, None),
+    (r'\+?(\d+) ?K', 'credits', 1000, None),
+    (r'\+?(\d+) ?(?:Rep|punkt\w* [Rr]eputacji)', 'reputation', 1, MAX_REPUTATION),
+)
+_COMPILED_REWARD_RULES = tuple((re.compile(pattern), attr, scale, cap)
+                               for pattern, attr, scale, cap in REWARD_RULES)
+_REWARD_SPLIT = re.compile(r'\s*(?:,|\s\+\s)\s*(?![^()]*\))')  # przecinek / " + " poza nawiasami
+_NAMED_EFFECT = re.compile(r'[^()]*\((.*)\)')                      # "Diagnostyka (+4 PZ)"
+HEX_BONUS_PATTERN = re.compile(r'BONUS\(([^)]*)\)')                   # bonusy heksów w Mapa_Heksagonalna
+
+def _reward_ops(fragment: str) -> Optional[list]:
+    for pattern, attr, scale, cap in _COMPILED_REWARD_RULES:
+        match = pattern.fullmatch(fragment)
+        if match:
+            return [(attr, int(match[1]) * scale, cap)]
+    named = _NAMED_EFFECT.fullmatch(fragment)
+    if named:
+        inner = compile_reward(named[1])
+        if inner.ops and not inner.problems:
+            return list(inner.ops)
+    return None
+
+@lru_cache(maxsize=None)
+def compile_reward(text: str) -> Reward:
+    """Tekst nagrody -> `Reward` (raz na tekst; karty i heksy dzielą skompilowane nagrody).
+
+    Części oddzielone przecinkiem albo " + " to osobne zyski. Efekty
+    spoza zasobów ("+1 heks ...", "3K/rundę", zakończenie gry) trafiają
+    do `problems` i nie są stosowane.
+    """
+    ops = []
+    problems = []
+    for fragment in _REWARD_SPLIT.split((text or '').strip()):
+        if not fragment:
+            continue
+        fragment_ops = _reward_ops(fragment)
+        if fragment_ops is None:
+            problems.append(fragment)
+        else:
+            ops.extend(fragment_ops)
+    return Reward(ops, problems)
+
+@dataclass(**SLOTS)
+class GrantCard:
+    GAME_STATE = ('is_completed',)
+
+    name: str
+    requirements: str
+    goal: str
+    reward: str
+    round_bonus: str
+    description: str
+    is_completed: bool = False
+    _requirement: Optional[Requirement] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def requirement(self) -> Requirement:
+        """Skompilowane wymagania (przy wczytaniu CSV; inne karty - przy pierwszym użyciu)"""
+        if self._requirement is None:
+            self._requirement = compile_requirements(self.requirements)[0]
+        return self._requirement
+
+    def clone(self, memo: dict) -> 'GrantCard':
+        return shallow_copy(self)
+
+@dataclass(**DEFINITION)
+class InstituteCard:
+    name: str
+    starting_resources: str
+    starting_reputation: int
+    specialization_bonus: str
+    special_ability: str
+    description: str
+
+@dataclass(**DEFINITION)
+class ConsortiumCard:
+    """Karta konsorcjum - pozwala rozpocząć wielki projekt"""
+    name: str = "Karta Konsorcjum"
+    description: str = "Umożliwia rozpoczęcie Wielkiego Projektu"
+    card_type: str = "KONSORCJUM"
+
+@dataclass(**DEFINITION)
+class IntrigueEffect:
+    """Efekt karty intryg - metadane dla automatycznego wykonania"""
+    target_type: str     # "opponent", "all_opponents", "all_players", "self"
+    parameter: str       # "credits", "reputation", "prestige_points", "research_points", "hex_tokens", etc.
+    operation: str       # "subtract", "add", "set", "steal", "block", "copy", "reveal"
+    value: int = 0       # wartość liczbowa (jeśli dotyczy)
+    special_type: str = ""  # typ specjalny: "scientist", "research_hex", "publication", "grant", "consortium", "card"
+    duration: int = 1    # rundy działania blokady/modyfikatora (od bieżącej; DURATION_GAME - do końca gry)
+    condition: str = ""  # warunek celu (tekst wymagań, np. "Reputacja 5")
+    cost: int = 0        # 'pay_or_lose': kredyty, którymi cel unika kary
+    delay: int = 0       # blokada/modyfikator zaczyna działać za tyle rund
+    charges: int = 0     # blokada/modyfikator znika po tylu użyciach (0 - bez limitu)
+
+@dataclass(**DEFINITION)
+class OpportunityEffect:
+    """Efekt karty okazji - metadane dla automatycznego wykonania"""
+    parameter: str       # "credits", "reputation", "prestige_points", "research_points", "hex_tokens", "action_points"
+    operation: str       # "add", "multiply", "set"
+    value: int = 0       # wartość liczbowa
+    special_type: str = ""  # typ specjalny: "scientist", "research_hex", "publication", "grant", "consortium", "card"
+    duration: int = 1    # czas trwania efektu w rundach (1 = natychmiastowy)
+    condition: str = ""  # dodatkowy warunek np. "Min. 1 publikacja"
+    target_type: str = "self"
+    cost: int = 0
+    delay: int = 0
+    charges: int = 0
+
+@dataclass(**DEFINITION)
+class IntrigueCard:
+    """Karta intryg - pozwala oddziaływać na przeciwników"""
+    name: str
+    effect: str
+    target: str  # "opponent", "all", "self" (backward compatibility)
+    description: str
+    effects: List[IntrigueEffect] = field(default_factory=list)  # nowa struktura efektów
+    card_type: str = "INTRYGA"
+
+@dataclass(**DEFINITION)
+class OpportunityCard:
+    """Karta okazji - daje różne bonusy"""
+    name: str
+    bonus_type: str  # "credits", "research_points", "reputation", "hex", "action_points"
+    bonus_value: str
+    requirements: str
+    description: str
+    card_type: str = "OKAZJA"
+    effects: List[OpportunityEffect] = field(default_factory=list)  # nowa struktura efektów
+
+@dataclass(**DEFINITION)
+class CrisisCard:
+    """Karta kryzysu - globalny efekt natychmiastowy"""
+    name: str
+    effect: str
+    description: str
+    global_modifier: str  # Globalny modyfikator dla wszystkich graczy
+    card_type: str = "KRYZYS"
+    effects: List[IntrigueEffect] = field(default_factory=list)
+    announcement: str = ""  # zapowiedź (karty rozszerzone) - bonus w rundzie zapowiedzi
+    announcement_effects: List[IntrigueEffect] = field(default_factory=list)
+    extended: bool = False  # z karty_kryzysy_rozszerzone.csv
+
+@dataclass(**SLOTS)
+class ActiveEffect:
+    """Blokada albo modyfikator działający przez kilka rund (z intrygi, okazji lub kryzysu)"""
+    GAME_STATE = ('charges',)
+
+    source: str                  # nazwa karty
+    player: Optional['Player']   # None - wszyscy gracze
+    operation: str               # "block" / "modify"
+    parameter: str
+    value: int
+    special_type: str            # np. dziedzina badania dla "scientist_hexes"
+    first_round: int
+    last_round: Optional[int]    # None - do końca gry
+    charges: int = 0             # pozostałe użycia (0 - bez limitu)
+    from_crisis: bool = False
+
+    def applies(self, player: 'Player', current_round: int, special_type: str = '') -> bool:
+        return ((self.player is None or self.player is player) and current_round >= self.first_round
+                and (not self.special_type or self.special_type == special_type))
+
+    def clone(self, memo: dict) -> 'ActiveEffect':
+        copied = shallow_copy(self)
+        copied.player = clone_state(self.player, memo)
+        return copied
+
+# Efekty kart intryg, okazji i kryzysów: tekst z CSV kompilowany przy
+# wczytaniu do listy efektów (operacja, parametr) wykonywanych przez silnik
+
+DURATION_GAME = 0
+FIELD_ADJECTIVES = {'biologiczne': 'Biologia', 'fizyczne': 'Fizyka', 'chemiczne': 'Chemia'}
+_FOLD = str.maketrans('ąćęłńóśźż', 'acelnoszz', '\'"„”’')
+_FIELD_ADJ = r'(biologiczne|fizyczne|chemiczne)'
+
+def fold_text(text: str) -> str:
+    """Małe litery bez polskich znaków i cudzysłowów (karty rozszerzone są pisane bez ogonków)"""
+    return ' '.join(text.lower().translate(_FOLD).split())
+
+def _fx(target: str, operation: str, parameter: str, value: int = 0, **extra) -> dict:
+    return dict(target_type=target, operation=operation, parameter=parameter, value=value, **extra)
+
+def _k(value: str) -> int:
+    return int(value) * 1000
+
+# Zdania opisujące cały efekt: (wzorzec, budowniczy listy efektów). Cel "self"
+# w kryzysie oznacza każdego gracza.
+EFFECT_SENTENCE_RULES = (
+    (r'wybierz gracza.*', lambda m: []),  # wybór przeciwnika - cel kolejnych zdań
+    (r'(?:jego )?nastepne badanie wymaga \+(\d+) heks\w*(?: do ukonczenia)?',
+     lambda m: [_fx('opponent', 'modify', 'scientist_hexes', -int(m[1]), duration=DURATION_GAME, charges=1)]),
+    (r'otrzymujesz nagrode za zakonczenie tego badania',
+     lambda m: [_fx('opponent', 'copy', 'research_reward')]),
+    (r'nastepny gracz w kolejnosci musi przepuscic faze grantow(?: w tej rundzie)?',
+     lambda m: [_fx('next_player', 'block', 'grant', delay=1)]),
+    (r'jego nastepna publikacja nie daje punktow pz',
+     lambda m: [_fx('opponent', 'block', 'publication_pz', duration=DURATION_GAME, charges=1)]),
+    (r'sprawdz reke wybranego gracza i zabierz mu losowa karte',
+     lambda m: [_fx('opponent', 'reveal', 'hand_cards'), _fx('opponent', 'steal', 'card', 1)]),
+    (r'musi (ci )?(?:wydac|zaplacic) (\d+) ?k lub stracic (?:(\d+) punkt\w* reputacji|(nastepna ture))',
+     lambda m: [_fx('opponent', 'pay_or_lose', 'action' if m[4] else 'reputation', int(m[3] or 1),
+                    cost=_k(m[2]), special_type='source' if m[1] else '')]),
+    (r'blokuj nastepne ukonczone badanie wybranego gracza - nie moze otrzymac za nie nagrod',
+     lambda m: [_fx('opponent', 'block', 'research_reward', duration=DURATION_GAME, charges=1)]),
+    (r'wszyscy gracze musza odrzucic (\d+) karte z reki', lambda m: [_fx('all_players', 'discard', 'card', int(m[1]))]),
+    (r'(?:ty )?dobier(?:asz|z)(?: (\d+))? kart\w*(?: z talii mozliwosci)?', lambda m: [_fx('self', 'draw', 'card', int(m[1] or 1))]),
+    (r'sprawdz (\d+) karty z wierzchu talii projekty badawcze i wez jedna do reki',
+     lambda m: [_fx('self', 'draw', 'research_card', int(m[1]))]),
+    (r'jego naukowcy w nastepnej rundzie daja o (\d+) heks\w* mniej(?: kazdy)?',
+     lambda m: [_fx('opponent', 'modify', 'scientist_hexes', -int(m[1]), delay=1)]),
+    (r'jego nastepne (\d+) publikacje daja o (\d+) pz mniej(?: kazda)?',
+     lambda m: [_fx('opponent', 'modify', 'publication_pz', -int(m[2]), duration=DURATION_GAME, charges=int(m[1]))]),
+    (r'dolacz do konsorcjum innego gracza bez placenia kosztow wstepu', lambda m: [_fx('self', 'join', 'consortium')]),
+    (r'zablokuj jednego z jego naukowcow do konca rundy.*', lambda m: [_fx('opponent', 'block', 'scientist')]),
+    (r'zablokuj wybrana karte kryzysu - nie ma ona efektu w tej rundzie', lambda m: [_fx('self', 'block', 'crisis')]),
+    (r'(?:w tej rundzie )?nie mozna zatrudniac(?: w tej rundzie)?', lambda m: [_fx('self', 'block', 'hire')]),
+    (r'nie mozna zatrudniac doktorantow w tej rundzie', lambda m: [_fx('self', 'block', 'hire_doktorant')]),
+    (r'badania ' + _FIELD_ADJ + r' (wymagaja|daja) \+(\d+) heks\w*(?: w tej rundzie)?',
+     lambda m: [_fx('self', 'modify', 'scientist_hexes', int(m[3]) * (1 if m[2] == 'daja' else -1),
+                    special_type=FIELD_ADJECTIVES[m[1]])]),
+    (r'(?:w nastepnej rundzie )?(?:wszystkie )?granty(?: w nastepnej rundzie)? daja (?:o )?(\d+) ?k mniej(?: w nastepnej rundzie)?',
+     lambda m: [_fx('self', 'modify', 'grant_reward', -_k(m[1]), delay=1)]),
+    (r'granty rzadowe (?:sa )?niedostepne w nastepnej rundzie', lambda m: [_fx('self', 'block', 'grant', delay=1)]),
+    (r'(?:konsorcja kosztuja|zalozenie konsorcjum kosztuje|wspolpraca w konsorcjach kosztuje) \+(\d+) pa'
+     r'(?: do zalozenia)?(?: w tej rundzie)?', lambda m: [_fx('self', 'modify', 'consortium_ap', int(m[1]))]),
+    (r'(?:wszyscy placa \+(\d+) ?k za kazda akcje|wszystkie akcje kosztuja dodatkowo \+(\d+) ?k)(?: w tej rundzie)?',
+     lambda m: [_fx('self', 'modify', 'action_credits', -_k(m[1] or m[2]))]),
+    (r'(?:wszystkie )?publikacje daja o (\d+) pz mniej(?: w tej rundzie)?',
+     lambda m: [_fx('self', 'modify', 'publication_pz', -int(m[1]))]),
+    (r'publikacje w tej rundzie nie daja pz, tylko (\d+) ?k kazda',
+     lambda m: [_fx('self', 'block', 'publication_pz'), _fx('self', 'modify', 'publication_credits', _k(m[1]))]),
+    (r'kazdy(?: gracz)? musi odrzucic (\d+) naukowca \(do wyboru\) lub zaplacic (\d+) ?k(?: za ewakuacje)?',
+     lambda m: [_fx('self', 'pay_or_lose', 'scientist', int(m[1]), cost=_k(m[2]))]),
+    (r'(?:reputacja ponizej (\d+) blokuje granty|gracze z reputacja <(\d+) nie moga brac grantow(?: w tej rundzie)?)',
+     lambda m: [_fx('self', 'modify', 'grant_min_reputation', int(m[1] or m[2]))]),
+    (r'(?:wszyscy placa \+(\d+) ?k za kazde ukonczone badanie|za kazde ukonczone badanie placisz dodatkowo \+(\d+) ?k)',
+     lambda m: [_fx('self', 'modify', 'completion_credits', -_k(m[1] or m[2]))]),
+    (r'(?:wszyscy traca (\d+) ?k na poczatku kazdej rundy|na poczatku kazdej rundy do konca gry wszyscy traca (\d+) ?k)'
+     r'(?: do konca gry)?',
+     lambda m: [_fx('self', 'modify', 'round_credits', -_k(m[1] or m[2]), duration=DURATION_GAME)]),
+    (r'pensje wszystkich naukowcow \+(\d+) ?k( \(do konca gry\))?',
+     lambda m: [_fx('self', 'modify', 'salary', _k(m[1]), duration=DURATION_GAME if m[2] else 1)]),
+    (r'istniejacy personel wymaga \+(\d+) ?k pensji', lambda m: [_fx('self', 'modify', 'salary', _k(m[1]))]),
+    (r'gracz z najwieksza liczba ukonczonych badan traci jedno(?: z nich)?(?: \(do wyboru\))?',
+     lambda m: [_fx('research_leader', 'subtract', 'completed_research', 1)]),
+    (r'(?:bezpieczenstwo \+(\d+) ?k/runde dla wszystkich|wszyscy placa \+(\d+) ?k/runde przez (\d+) rundy)',
+     lambda m: [_fx('self', 'modify', 'round_credits', -_k(m[1] or m[2]), duration=int(m[3] or 1))]),
+    (r'rozpoczecie nowych badan kosztuje \+(\d+) ?k', lambda m: [_fx('self', 'modify', 'research_start_credits', -_k(m[1]))]),
+    (r'konsorcja nie moga byc zakladane w tej rundzie', lambda m: [_fx('self', 'block', 'consortium')]),
+    (r'nie mozna grac kart mozliwosci w tej rundzie', lambda m: [_fx('self', 'block', 'opportunity')]),
+    (r'w tej rundzie badania ' + _FIELD_ADJ + r' otrzymuja \+(\d+) pb po ukonczeniu',
+     lambda m: [_fx('self', 'modify', 'completion_pb', int(m[2]), special_type=FIELD_ADJECTIVES[m[1]])]),
+    (r'za kazde ukonczone w tej rundzie badanie ' + _FIELD_ADJ + r' otrzymujesz \+(\d+) ?k',
+     lambda m: [_fx('self', 'modify', 'completion_credits', _k(m[2]), special_type=FIELD_ADJECTIVES[m[1]])]),
+    (r'pierwsza publikacja w tej rundzie daje dodatkowo \+(\d+) pb',
+     lambda m: [_fx('self', 'modify', 'publication_pb', int(m[1]), charges=1)]),
+    (r'gracz z najwyzsza reputacja traci (\d+) punkt\w* reputacji,? (?:a )?(?:pozostali|wszyscy inni) traca (\d+)',
+     lambda m: [_fx('reputation_leader', 'subtract', 'reputation', int(m[1])),
+                _fx('reputation_others', 'subtract', 'reputation', int(m[2]))]),
+    (r'(?:wszyscy inni|pozostali) traca (\d+) punkt\w*', lambda m: [_fx('reputation_others', 'subtract', 'reputation', int(m[1]))]),
+    (r'na koniec rundy wszyscy traca (\d+) punkt\w* reputacji', lambda m: [_fx('all_players', 'subtract', 'reputation', int(m[1]))]),
+)
+
+# Zdania "kto zyskuje/traci: lista": (wzorzec podmiotu, cel, znak, warunek celu z grupy)
+EFFECT_SUBJECT_RULES = (
+    (r'(?:ty )?(?:otrzymujesz|zyskujesz|odzyskujesz|dziedziczysz)(?: natychmiast)?', 'self', 1, None),
+    (r'wszyscy gracze oprocz ciebie traca', 'all_opponents', -1, None),
+    (r'(?:wszyscy(?: gracze)?|kazdy(?: gracz)?) (?:traca|traci)', 'all_players', -1, None),
+    (r'(?:wszyscy|kazdy)(?: gracz)? (?:natychmiast )?otrzymuj\w*(?: jednorazowo)?', 'all_players', 1, None),
+    (r'gracz z najwyzsza reputacja traci', 'reputation_leader', -1, None),
+    (r'gracze z reputacja (?:powyzej |>)(\d+) traca', 'all_players', -1, lambda m: f"Reputacja {int(m[1]) + 1}"),
+    (r'kazdy gracz z (?:wiecej niz |>)(\d+) naukowcami traci', 'all_players', -1,
+     lambda m: f"Min. {int(m[1]) + 1} naukowców"),
+    (r'jesli masz reputacje <=(\d+), natychmiast', 'self', 1, lambda m: f"Max. Reputacja {m[1]}"),
+)
+
+# Pojedyncze pozycje listy: (wzorzec, budowniczy(dopasowanie, cel, znak))
+EFFECT_FRAGMENT_RULES = (
+    (r'(\d+)% swoich kredytow(?: \(zaokraglij w dol\))?', lambda m, t, sign: [_fx(t, 'lose_percent', 'credits', int(m[1]))]),
+    (r'polowe swoich kredytow(?: \(zaokraglij w dol\))?', lambda m, t, sign: [_fx(t, 'lose_percent', 'credits', 50)]),
+    (r'(\d+) losow\w* kart\w* z reki', lambda m, t, sign: [_fx(t, 'discard', 'card', int(m[1]))]),
+    (r'(\d+)(?: naukowca)? \(najdrozszego\)|(\d+) naukowca',
+     lambda m, t, sign: [_fx(t, 'subtract', 'scientist', int(m[1] or m[2]))]),
+    (r'(\d+) ?k za kazdy ukonczony projekt konsorcjum',
+     lambda m, t, sign: [_fx(t, 'subtract', 'credits', _k(m[1]), special_type='per_project')]),
+    (r'stal\w* dochod \+(\d+) ?k na runde do konca gry',
+     lambda m, t, sign: [_fx(t, 'modify', 'round_credits', _k(m[1]), duration=DURATION_GAME, delay=1)]),
+    (r'\+(\d+) ?k za kazde (?:przyszle )?ukonczone badanie',
+     lambda m, t, sign: [_fx(t, 'modify', 'completion_credits', _k(m[1]), duration=DURATION_GAME)]),
+    (r'.*\(\+(\d+) heks\w* przy wszystkich badaniach\)',
+     lambda m, t, sign: [_fx(t, 'modify', 'scientist_hexes', int(m[1]), duration=DURATION_GAME)]),
+    (r'mozesz dobierac \+(\d+) karte co runde do konca gry',
+     lambda m, t, sign: [_fx(t, 'modify', 'round_cards', int(m[1]), duration=DURATION_GAME, delay=1)]),
+    (r'mozesz natychmiast zagrac dodatkowa karte akcji', lambda m, t, sign: [_fx(t, 'add', 'action_card', 1)]),
+    (r'mozesz natychmiast zatrudnic naukowca za darmo', lambda m, t, sign: [_fx(t, 'hire', 'scientist', 1)]),
+    (r'prywatne laboratorium wartosci (\d+) ?k', lambda m, t, sign: [_fx(t, 'add', 'credits', _k(m[1]))]),
+    (r'biblioteke dajaca \+(\d+) ?pb przy kazdej publikacji do konca gry',
+     lambda m, t, sign: [_fx(t, 'modify', 'publication_pb', int(m[1]), duration=DURATION_GAME)]),
+)
+
+_COMPILED_SENTENCE_RULES = tuple((re.compile(pattern), build) for pattern, build in EFFECT_SENTENCE_RULES)
+_COMPILED_SUBJECT_RULES = tuple((re.compile(pattern + r' (.+)'), target, sign, condition)
+                                for pattern, target, sign, condition in EFFECT_SUBJECT_RULES)
+_COMPILED_FRAGMENT_RULES = tuple((re.compile(pattern), build) for pattern, build in EFFECT_FRAGMENT_RULES)
+_SENTENCE_SPLIT = re.compile(r'(?<=[.;])\s+(?![^()]*\))|;\s*|,\s+ale\s+')
+_FRAGMENT_SPLIT = re.compile(r'\s+(?:i|oraz)\s+(?![^()]*\))|,\s+(?![^()]*\))')
+_TRAILING_NOTE = re.compile(r'\s*\([^()]*\)$')
+# Zasób z listy: "8 PZ", "+2 punkty Reputacji", "6K z reklam" (bez "za/na/co/przy/po" - to warunki)
+_RESOURCE = re.compile(r'(\+?\d+ (?:PB|PZ|K|Rep))(?: (?!za\b|na\b|co\b|przy\b|po\b)[a-z]+)*')
+
+def _resource_ops(fragment: str) -> Optional[list]:
+    text = re.sub(r'(\d+) ?(pb|pz|k)\b', lambda m: f"{m[1]} {m[2].upper()}", fragment)
+    text = re.sub(r'(\d+) (?:punkt\w* )?reputacj\w*', r'\1 Rep', text)
+    match = _RESOURCE.fullmatch(text)
+    if not match:
+        return None
+    return [(attr, amount) for attr, amount, _ in compile_reward(match[1]).ops] or None
+
+def _match_rules(text: str, rules, *args) -> Optional[list]:
+    """Pierwsza pasująca reguła; druga próba bez końcowego komentarza w nawiasie"""
+    for candidate in (text, _TRAILING_NOTE.sub('', text)):
+        for pattern, build in rules:
+            match = pattern.fullmatch(candidate)
+            if match:
+                return build(match, *args)
+    return None
+
+def _fragment_effects(fragment: str, target: str, sign: int) -> Optional[list]:
+    effects = _match_rules(fragment, _COMPILED_FRAGMENT_RULES, target, sign)
+    if effects is not None:
+        return effects
+    for candidate in (fragment, _TRAILING_NOTE.sub('', fragment)):
+        ops = _resource_ops(candidate)
+        if ops:
+            return [_fx(target, 'add' if sign > 0 else 'subtract', attr, amount) for attr, amount in ops]
+    return None
+
+def compile_card_effects(text: str, effect_class=None, self_target: str = 'self') -> Tuple[list, List[str]]:
+    """Tekst efektu karty -> (lista efektów, nierozpoznane zdania/fragmenty).
+
+    `self_target` - kogo dotyczy "Ty"/zdanie bez podmiotu ("all_players"
+    dla kryzysów). Nierozpoznane części są pomijane i trafiają do listy
+    problemów zgłaszanej przy wczytywaniu.
+    """
+    effect_class = effect_class or IntrigueEffect
+    effects = []
+    problems = []
+    for sentence in _SENTENCE_SPLIT.split(text or ''):
+        folded = fold_text(sentence).strip(' .')
+        if not folded:
+            continue
+        found = _match_rules(folded, _COMPILED_SENTENCE_RULES)
+        if found is None:
+            for pattern, target, sign, condition in _COMPILED_SUBJECT_RULES:
+                match = pattern.fullmatch(folded)
+                if not match:
+                    continue
+                found = []
+                for fragment in _FRAGMENT_SPLIT.split(match[match.lastindex]):
+                    fragment_effects = _fragment_effects(fragment, target, sign)
+                    if fragment_effects is None:
+                        problems.append(fragment)
+                        continue
+                    for effect in fragment_effects:
+                        if condition:
+                            effect['condition'] = condition(match)
+                    found.extend(fragment_effects)
+                break
+        if found is None:
+            problems.append(folded)
+            continue
+        effects.extend(found)
+    for effect in effects:
+        if effect['target_type'] == 'self':
+            effect['target_type'] = self_target
+    return [effect_class(**effect) for effect in effects], problems
+
+@dataclass(**DEFINITION)
+class ScenarioCard:
+    """Karta scenariusza - definiuje warunki gry"""
+    name: str
+    story_element: str  # Element fabularny
+    global_modifiers: str  # Globalne modyfikatory rozgrywki
+    max_rounds: int  # Maksymalna ilość rund
+    victory_conditions: str  # Warunki zwycięstwa
+    crisis_count: int  # Ile kart kryzysów dobierać
+    crisis_rounds: List[int] = field(default_factory=list)  # W których rundach odkrywać kryzysy
+    description: str = ""
+    announcement_rounds: List[int] = field(default_factory=list)  # Rundy zapowiedzi (bonus kart rozszerzonych)
+    extended_crises: bool = False  # kryzysy z karty_kryzysy_rozszerzone.csv
+
+@dataclass(**SLOTS)
+class LargeProject:
+    GAME_STATE = ('contributed_pb', 'contributed_credits', 'director', 'members', 'pending_members', 'is_completed')
+
+    name: str
+    requirements: str
+    director_reward: str
+    member_reward: str
+    description: str
+    cost_pb: int = 20  # Koszt w punktach badawczych
+    cost_credits: int = 50  # Koszt w kredytach (w tysiącach)
+    contributed_pb: int = 0
+    contributed_credits: int = 0
+    director: Optional['Player'] = None
+    members: List['Player'] = field(default_factory=list)
+    pending_members: List['Player'] = field(default_factory=list)  # Gracze oczekujący na akceptację
+    is_completed: bool = False
+
+    def clone(self, memo: dict) -> 'LargeProject':
+        copied = shallow_copy(self)
+        copied.director = clone_state(self.director, memo)
+        copied.members = [clone_state(player, memo) for player in self.members]
+        copied.pending_members = [clone_state(player, memo) for player in self.pending_members]
+        return copied
+
+@dataclass
+class Player:
+    name: str
+    color: str
+    institute: Optional[InstituteCard] = None
+    credits: int = 0
+    prestige_points: int = 0
+    research_points: int = 0
+    reputation: int = 3
+    scientists: List[Scientist] = field(default_factory=list)
+    active_research: List[ResearchCard] = field(default_factory=list)
+    completed_research: List[ResearchCard] = field(default_factory=list)
+    hand_cards: List[Union[ResearchCard, ConsortiumCard, IntrigueCard, OpportunityCard]] = field(default_factory=list)
+    current_grant: Optional[GrantCard] = None
+    hex_tokens: int = 20
+    action_cards: List[ActionCard] = field(default_factory=list)
+    publications: int = 0
+    activity_points: int = 0
+    round_activity_points: int = 0
+    has_passed: bool = False
+    publication_history: List[JournalCard] = field(default_factory=list)  # Historia publikacji
+    consortia: int = 0        # konsorcja, w których gracz jest (także jako kierownik)
+    led_consortia: int = 0    # konsorcja kierowane przez gracza
+
+    def clone(self, memo: dict) -> 'Player':
+        copied = shallow_copy(self)
+        copied.scientists = [clone_state(scientist, memo) for scientist in self.scientists]
+        copied.active_research = [clone_state(card, memo) for card in self.active_research]
+        copied.completed_research = [clone_state(card, memo) for card in self.completed_research]
+        copied.hand_cards = [clone_state(card, memo) for card in self.hand_cards]
+        copied.current_grant = clone_state(self.current_grant, memo)
+        copied.action_cards = [clone_state(card, memo) for card in self.action_cards]
+        copied.publication_history = list(self.publication_history)
+        return copied
+
+class GameData:
+    """Klasa do zarządzania danymi gry"""
+    def __init__(self):
+        self.scientists = []
+        self.research_cards = []
+        self.journals = []
+        self.grants = []
+        self.grant_requirement_problems = []
+        self.reward_problems = []
+        self.card_effect_problems = []  # (karta, nierozpoznane zdanie efektu)
+        self.institutes = []
+        self.large_projects = []
+        self.consortium_cards = []
+        self.intrigue_cards = []
+        self.opportunity_cards = []
+        self.main_deck = []  # Zmieszana talia wszystkich kart ręki
+        self.scenarios = []
+        self.crisis_cards = []
+        self.active_scenario = None
+        self.crisis_deck = []  # Talia kryzysów dla aktualnego scenariusza
+        self.current_round = 1
+        self.revealed_crises = []  # Aktywne kryzysy na planszy
+
+    def clone(self, memo: dict) -> 'GameData':
+        """Kopia na potrzeby kopii rozgrywki: karty ze stanem kopiowane, reszta współdzielona"""
+        copied = object.__new__(GameData)
+        copied.__dict__.update(self.__dict__)
+        for name in ('research_cards', 'grants', 'scientists', 'large_projects', 'main_deck'):
+            setattr(copied, name, [clone_state(card, memo) for card in getattr(self, name)])
+        copied.crisis_deck = list(self.crisis_deck)
+        copied.revealed_crises = list(self.revealed_crises)
+        return copied
+
+    def safe_int_parse(self, value: str, default: int = 0) -> int:
+        """Bezpiecznie parsuje int"""
+        try:
+            if isinstance(value, str):
+                clean_value = ''.join(c for c in value if c.isdigit())
+                return int(clean_value) if clean_value else default
+            return int(value)
+        except (ValueError, TypeError):
+            return default
+
+    def load_data(self):
+        """Główna metoda ładowania danych gry"""
+        try:
+            # Próbuj załadować dane z CSV
+            # (w przyszłości można tutaj dodać ładowanie z plików CSV)
+
+            # Na razie używamy danych fallback
+            self.load_fallback_data()
+
+        except Exception as e:
+            print(f"Błąd ładowania danych: {e}")
+            self.load_fallback_data()
+
+    def create_action_cards(self) -> List[ActionCard]:
+        """Tworzy standardowy zestaw 5 kart akcji"""
+        return [
+            ActionCard(
+                action_type=ActionType.PROWADZ_BADANIA,
+                action_points=3,
+                basic_action="Aktywuj 1 doktoranta → +1 heks na badanie",
+                additional_actions=[
+                    ("Aktywuj doktora → +2 heksy na badanie", 2),
+                    ("Aktywuj profesora → +3 heksy na badanie", 2),
+                    ("Rozpocznij nowe badanie → wyłóż kartę z ręki", 1)
+                ]
+            ),
+            ActionCard(
+                action_type=ActionType.ZATRUDNIJ,
+                action_points=3,
+                basic_action="Weź 1K z banku",
+                additional_actions=[
+                    ("Zatrudnij doktora z rynku → pensja 2K/rundę", 2),
+                    ("Zatrudnij profesora z rynku → pensja 3K/rundę", 3),
+                    ("Zatrudnij doktoranta → brak pensji", 1),
+                    ("Kup kartę 'Projekty Badawcze' → 2 PB", 1),
+                    ("Kup kartę 'Możliwości' → 1 PB", 1)
+                ]
+            ),
+            ActionCard(
+                action_type=ActionType.PUBLIKUJ,
+                action_points=2,
+                basic_action="Opublikuj 1 artykuł",
+                additional_actions=[
+                    ("Weź 3K z banku", 1),
+                    ("Kup kartę 'Możliwości' → 1 PB", 1),
+                    ("Konsultacje komercyjne → aktywuj profesora za 4K", 1)
+                ]
+            ),
+            ActionCard(
+                action_type=ActionType.FINANSUJ,
+                action_points=3,
+                basic_action="Weź 2K z banku",
+                additional_actions=[
+                    ("Wpłać do konsorcjum → 1 PB lub 3K na wybrany projekt", 1),
+                    ("Załóż konsorcjum → zagraj kartę konsorcjum z ręki", 1),
+                    ("Kredyt awaryjny → +5K, ale -1 Reputacja", 2)
+                ]
+            ),
+            ActionCard(
+                action_type=ActionType.ZARZADZAJ,
+                action_points=2,
+                basic_action="Weź 2K z banku",
+                additional_actions=[
+                    ("Odśwież rynek → czasopisma lub badania", 2),
+                    ("Kampania PR → wydaj 4K za +1 Reputacja", 1),
+                    ("Poprawa wizerunku → wydaj 2 PB za +1 Reputacja", 1)
+                ]
+            )
+        ]
+
+    def compile_card_reward(self, card_name: str, text: str) -> Reward:
+        """Kompiluje nagrodę karty przy wczytaniu i zgłasza pominięte fragmenty"""
+        reward = compile_reward(text)
+        for problem in reward.problems:
+            self.reward_problems.append((card_name, problem))
+            print(f"Nierozpoznana nagroda {card_name}: '{problem}' (pominięta)")
+        return reward
+
+    def load_research_from_csv(self):
+        """Wczytuje karty badań z pliku CSV"""
+        self.research_cards = []
+        with open('karty_badan.csv', 'r', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            for row in reader:
+                card = ResearchCard(
+                    name=row['Nazwa'],
+                    field=row['Dziedzina'],
+                    hex_map=row['Mapa_Heksagonalna'],
+                    basic_reward=row['Nagroda_Podstawowa'],
+                    bonus_reward=row['Nagroda_Dodatkowa'],
+                    description=row['Opis']
+                )
+                self.compile_card_reward(card.name, card.basic_reward)
+                for bonus in HEX_BONUS_PATTERN.findall(card.hex_map):
+                    self.compile_card_reward(card.name, bonus)
+                self.research_cards.append(card)
+
+    def load_scientists_from_csv(self):
+        """Wczytuje naukowców z pliku CSV"""
+        self.scientists = []
+        with open('karty_naukowcy.csv', 'r', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            for row in reader:
+                scientist_type = ScientistType.DOKTORANT if 'doktorant' in row['Typ'].lower() else \
+                               ScientistType.DOKTOR if 'doktor' in row['Typ'].lower() else \
+                               ScientistType.PROFESOR
+
+                scientist = Scientist(
+                    name=row['Imię i Nazwisko'],
+                    type=scientist_type,
+                    field=row['Dziedzina'],
+                    salary=self.safe_int_parse(row['Pensja']),
+                    hex_bonus=self.safe_int_parse(row['Bonus Heksów']),
+                    special_bonus=row['Specjalny Bonus'],
+                    description=row['Opis']
+                )
+                self.scientists.append(scientist)
+
+    def load_journals_from_csv(self):
+        """Wczytuje czasopisma z pliku CSV"""
+        self.journals = []
+        with open('karty_czasopisma.csv', 'r', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            for row in reader:
+                journal = JournalCard(
+                    name=row['Nazwa'],
+                    impact_factor=self.safe_int_parse(row['Impact_Factor']),
+                    pb_cost=self.safe_int_parse(row['Koszt_PB']),
+                    requirements=row['Wymagania'],
+                    pz_reward=self.safe_int_parse(row['Nagroda_PZ']),
+                    special_bonus=row['Specjalny_Bonus'],
+                    description=row['Opis']
+                )
+                self.journals.append(journal)
+
+    def load_grants_from_csv(self):
+        """Wczytuje granty z pliku CSV"""
+        self.grants = []
+        self.grant_requirement_problems = []  # (grant, nierozpoznany fragment wymagań)
+        with open('karty_granty.csv', 'r', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            for row in reader:
+                grant = GrantCard(
+                    name=row['Nazwa'],
+                    requirements=row['Wymagania'],
+                    goal=row['Cel'],
+                    reward=row['Nagroda'],
+                    round_bonus=row['Runda_Bonus'],
+                    description=row['Opis']
+                )
+                # Wymagania kompilowane raz - w grze sprawdzany jest tylko predykat
+                grant._requirement, problems = compile_requirements(grant.requirements)
+                for problem in problems:
+                    self.grant_requirement_problems.append((grant.name, problem))
+                    print(f"Nierozpoznane wymagania grantu {grant.name}: '{problem}' (grant bez tego warunku)")
+                self.compile_card_reward(grant.name, grant.reward)
+                self.grants.append(grant)
+
+    def load_large_projects_from_csv(self):
+        """Wczytuje wielkie projekty z pliku CSV"""
+        self.large_projects = []
+        with open('karty_wielkie_projekty.csv', 'r', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            for row in reader:
+                project = LargeProject(
+                    name=row['Nazwa'],
+                    requirements=row['Wymagania'],
+                    director_reward=row['Nagroda_Kierownika'],
+                    member_reward=row['Nagroda_Członków'],
+                    description=row['Opis']
+                )
+                self.compile_card_reward(project.name, project.director_reward)
+                self.compile_card_reward(project.name, project.member_reward)
+                self.large_projects.append(project)
+
+    def load_scenarios_from_csv(self):
+        """Wczytuje scenariusze z pliku CSV"""
+        self.scenarios = []
+        try:
+            with open('karty_scenariusze.csv', 'r', encoding='utf-8') as file:
+                reader = csv.DictReader(file)
+                for row in reader:
+                    # Rundy z harmonogramu, np. "Zapowiedzi: R2,R6; Kryzysy: R4,R8" albo "Kryzys: R5"
+                    schedule = row['Harmonogram_Kryzysow']
+                    crisis_part = re.search(r'Kryzys[y]?:([^;.]*)', schedule)
+                    announcement_part = re.search(r'Zapowiedzi:([^;.]*)', schedule)
+                    crisis_rounds = [int(r) for r in re.findall(r'R(\d+)', crisis_part[1] if crisis_part else '')] or [3, 5, 7]
+                    announcement_rounds = [int(r) for r in
+                                           re.findall(r'R(\d+)', announcement_part[1] if announcement_part else '')]
+                    crisis_count = len(crisis_rounds)
+                    max_rounds = self.safe_int_parse(row['Limit_Rund'], 8)
+
+                    scenario = ScenarioCard(
+                        name=row['Tytul'],
+                        story_element=row['Opis_Fabularny'],
+                        global_modifiers=row['Modyfikatory_Rundy'],
+                        max_rounds=max_rounds,
+                        victory_conditions=row['Warunki_Zwyciestwa'],
+                        crisis_count=crisis_count,
+                        crisis_rounds=crisis_rounds,
+                        description=f"Scenariusz: {row['Tytul']}",
+                        announcement_rounds=announcement_rounds,
+                        extended_crises='rozszerzone' in schedule
+                    )
+                    self.scenarios.append(scenario)
+        except FileNotFoundError:
+            print("Nie znaleziono pliku karty_scenariusze.csv")
+        except Exception as e:
+            print(f"Błąd wczytywania scenariuszy: {e}")
+
+    def compile_card_text(self, card_name: str, text: str, effect_class=IntrigueEffect,
+                          self_target: str = 'self') -> list:
+        """Kompiluje tekst efektu karty; nierozpoznane zdania trafiają do `card_effect_problems`"""
+        effects, problems = compile_card_effects(text, effect_class, self_target)
+        for problem in problems:
+            self.card_effect_problems.append((card_name, problem))
+        return effects
+
+    def card_rows(self, file):
+        """Wiersze CSV kart; cudzysłowy w tekście escapowane jako \\" (karty rozszerzone).
+
+        Wiersz z nadmiarowymi kolumnami (klucz None) jest źle podzielony -
+        trafia do `card_effect_problems` i jest pomijany.
+        """
+        for row in csv.DictReader(file, escapechar='\\'):
+            if None in row:
+                self.card_effect_problems.append((row.get('Nazwa') or '?',
+                                                  f"nadmiarowe kolumny w CSV: {row[None]}"))
+                continue
+            yield row
+
+    def report_card_effect_problems(self, first: int):
+        """Podsumowanie nierozpoznanych zdań kart od pozycji `first` (opisy fabularne też tu trafiają)"""
+        problems = self.card_effect_problems[first:]
+        if problems:
+            cards = len({name for name, _ in problems})
+            print(f"Nierozpoznane zdania efektów: {len(problems)} na {cards} kartach (pominięte, "
+                  f"lista w GameData.card_effect_problems)")
+
+    def load_intrigues_from_csv(self):
+        """Wczytuje karty intryg z pliku CSV (efekty kompilowane z tekstu)"""
+        self.intrigue_cards = []
+        with open('karty_intrygi.csv', 'r', encoding='utf-8') as file:
+            for row in self.card_rows(file):
+                effects = self.compile_card_text(row['Nazwa'], row['Efekt'])
+                targets = {effect.target_type for effect in effects}
+                if 'opponent' in targets:
+                    target = 'opponent'
+                elif targets - {'self'}:
+                    target = 'all'
+                else:
+                    target = 'self'
+                self.intrigue_cards.append(IntrigueCard(
+                    name=row['Nazwa'],
+                    effect=row['Efekt'],
+                    target=target,
+                    description=row['Opis'],
+                    effects=effects
+                ))
+
+    def load_opportunities_from_csv(self):
+        """Wczytuje karty okazji z pliku CSV (efekty kompilowane z tekstu)"""
+        self.opportunity_cards = []
+        with open('karty_okazje.csv', 'r', encoding='utf-8') as file:
+            for row in self.card_rows(file):
+                effects = self.compile_card_text(row['Nazwa'], row['Efekt'], OpportunityEffect)
+                self.opportunity_cards.append(OpportunityCard(
+                    name=row['Nazwa'],
+                    bonus_type=effects[0].parameter if effects else '',
+                    bonus_value=row['Efekt'],
+                    requirements="Brak",
+                    description=row['Opis'],
+                    effects=effects
+                ))
+
+    def load_crises_from_csv(self):
+        """Wczytuje karty kryzysów: podstawowe i rozszerzone (z zapowiedzią)"""
+        self.crisis_cards = []
+        with open('karty_kryzysy.csv', 'r', encoding='utf-8') as file:
+            for row in self.card_rows(file):
+                self.crisis_cards.append(CrisisCard(
+                    name=row['Nazwa'],
+                    effect=row['Efekt'],
+                    description=row['Opis'],
+                    global_modifier=row['Efekt'],
+                    effects=self.compile_card_text(row['Nazwa'], row['Efekt'], self_target='all_players')
+                ))
+        try:
+            with open('karty_kryzysy_rozszerzone.csv', 'r', encoding='utf-8') as file:
+                for row in self.card_rows(file):
+                    self.crisis_cards.append(CrisisCard(
+                        name=row['Nazwa'],
+                        effect=row['Kryzys_Kary'],
+                        description=row['Kryzys_Opis'],
+                        global_modifier=row['Kryzys_Kary'],
+                        effects=self.compile_card_text(row['Nazwa'], row['Kryzys_Kary'], self_target='all_players'),
+                        announcement=row['Zapowiedz_Bonus'],
+                        announcement_effects=self.compile_card_text(row['Nazwa'], row['Zapowiedz_Bonus'],
+                                                                    self_target='all_players'),
+                        extended=True
+                    ))
+        except FileNotFoundError:
+            print("Nie znaleziono pliku karty_kryzysy_rozszerzone.csv")
+
+    def load_data(self, rng: Optional[random.Random] = None):
+        """Wczytuje dane gry; `rng` - generator gry do tasowania talii"""
+        try:
+            # Wczytaj wszystkie dane z CSV
+            self.load_research_from_csv()
+            print("Wczytano karty badań z CSV")
+
+            self.load_scientists_from_csv()
+            print("Wczytano naukowców z CSV")
+
+            self.load_journals_from_csv()
+            print("Wczytano czasopisma z CSV")
+
+            self.load_grants_from_csv()
+            print("Wczytano granty z CSV")
+
+            self.load_large_projects_from_csv()
+            print("Wczytano wielkie projekty z CSV")
+
+            self.load_scenarios_from_csv()
+            print("Wczytano scenariusze z CSV")
+
+            self.card_effect_problems = []
+            self.load_intrigues_from_csv()
+            self.load_opportunities_from_csv()
+            self.load_crises_from_csv()
+            print("Wczytano karty intryg, okazji i kryzysów z CSV")
+            self.report_card_effect_problems(0)
+
+            # Dla pozostałych danych użyj przykładowych (na razie)
+            self.load_fallback_data(rng)
+
+        except Exception as e:
+            print(f"Błąd wczytywania CSV: {e}, używam danych przykładowych")
+            self.load_fallback_data(rng)
+
+    def load_fallback_data(self, rng: Optional[random.Random] = None):
+        # Stwórz przykładowych naukowców tylko jeśli nie zostali wczytani z CSV
+        if not hasattr(self, 'scientists') or not self.scientists:
+            self.scientists = [
+                Scientist("Dr Jan Kowalski", ScientistType.DOKTOR, "Fizyka", 2000, 2, "+1PB przy publikacji", "Fizyk teoretyczny"),
+                Scientist("Prof. Anna Nowak", ScientistType.PROFESOR, "Fizyka", 3000, 3, "+2K za badanie", "Ekspert w fizyce kwantowej"),
+                Scientist("Dr Maria Wiśniewska", ScientistType.DOKTOR, "Biologia", 2000, 2, "+1PB przy publikacji", "Biolog molekularny"),
+                Scientist("Prof. Piotr Zieliński", ScientistType.PROFESOR, "Chemia", 3000, 3, "+1 heks przy badaniach", "Chemik organiczny"),
+                Scientist("Dr Tomasz Nowicki", ScientistType.DOKTOR, "Fizyka", 2000, 2, "Konsorcja -1 PA", "Specjalista detektorów"),
+                Scientist("Prof. Ewa Kowalska", ScientistType.PROFESOR, "Biologia", 3000, 3, "+3K za badanie", "Genetyk")
+            ]
+
+        # NIE nadpisuj research_cards - zostaw te z CSV
+        # Jeśli research_cards nie zostały wczytane, stwórz przykładowe
+        try:
+            if not hasattr(self, 'research_cards') or not self.research_cards:
+                self.research_cards = [
+                    ResearchCard("Bozon Higgsa", "Fizyka", "simple", "4 PB, 2 PZ", "Publikacja w Nature", "Poszukiwanie cząstki Boga", max_hexes=6),
+                    ResearchCard("Algorytm Deep Learning", "Fizyka", "simple", "3 PB, 2 PZ", "+1K za publikację", "Sztuczna inteligencja", max_hexes=4),
+                    ResearchCard("Synteza Organiczna", "Chemia", "simple", "2 PB, 3 PZ", "Dostęp do grantów", "Nowe związki chemiczne", max_hexes=5),
+                    ResearchCard("Terapia Genowa", "Biologia", "simple", "5 PB, 4 PZ", "10K natychmiast", "Leczenie genów", max_hexes=7),
+                    ResearchCard("Teoria Strun", "Fizyka", "simple", "6 PB, 3 PZ", "Dostęp do Uniwersum", "Unifikacja sił", max_hexes=8),
+                    ResearchCard("Superprzewodnik", "Fizyka", "simple", "2 PB, 2 PZ", "+3K za badanie", "Zerowa rezystancja", max_hexes=4),
+                    ResearchCard("Fuzja Jądrowa", "Fizyka", "simple", "5 PB, 4 PZ", "10K + energia", "Reaktor fuzji", max_hexes=6),
+                    ResearchCard("Nanomateriały", "Chemia", "simple", "4 PB, 3 PZ", "Specjalne właściwości", "Rewolucyjne materiały", max_hexes=5)
+                ]
+
+                # Stwórz czasopisma tylko jeśli nie zostały wczytane z CSV
+                if not hasattr(self, 'journals') or not self.journals:
+                    self.journals = [
+                        JournalCard("Nature", 10, 15, "Reputacja 4+", 5, "Prestiż międzynarodowy", "Najlepsze czasopismo świata"),
+                        JournalCard("Science", 9, 14, "Reputacja 4+", 5, "Dostęp do konferencji", "Amerykański odpowiednik Nature"),
+                        JournalCard("Physical Review", 8, 12, "1 badanie fizyczne", 4, "Współpraca fizyczna", "Czasopismo fizyczne"),
+                        JournalCard("Cell", 8, 12, "1 badanie biologiczne", 4, "Przełom medyczny", "Czasopismo biologiczne"),
+                        JournalCard("Journal of Chemistry", 7, 10, "1 badanie chemiczne", 4, "Innowacje chemiczne", "Czasopismo chemiczne"),
+                        JournalCard("Local Journal", 3, 5, "Brak", 2, "Brak", "Lokalne czasopismo"),
+                        JournalCard("Research Today", 4, 6, "Brak", 2, "Dostęp do sieci", "Ogólne czasopismo"),
+                        JournalCard("Innovation Weekly", 5, 8, "1 publikacja", 3, "Networking", "Czasopismo innowacji")
+                    ]
+
+                # Stwórz granty tylko jeśli nie zostały wczytane z CSV
+                if not hasattr(self, 'grants') or not self.grants:
+                    self.grants = [
+                        GrantCard("Grant Startup", "Brak wymagań", "10 punktów aktywności", "8K", "+2K/rundę", "Grant dla początkujących"),
+                        GrantCard("Grant Badawczy", "Min. 1 doktor", "2 publikacje", "12K", "+2K/rundę", "Standardowy grant badawczy"),
+                        GrantCard("Grant Fizyczny", "Spec. Fizyka", "1 badanie fizyczne", "14K", "+2K/rundę", "Grant dla fizyków"),
+                        GrantCard("Grant Biologiczny", "Spec. Biologia", "1 badanie biologiczne", "14K", "+2K/rundę", "Grant dla biologów"),
+                        GrantCard("Grant Chemiczny", "Spec. Chemia", "1 badanie chemiczne", "14K", "+2K/rundę", "Grant dla chemików"),
+                        GrantCard("Grant Prestiżowy", "Reputacja 4+", "Publikacja w Nature", "18K", "+2K/rundę", "Elitarny grant"),
+                        GrantCard("Grant Współpracy", "Brak", "Załóż konsorcjum", "15K", "+2K/rundę", "Grant na współpracę"),
+                        GrantCard("Grant Kryzysowy", "Brak", "Utrzymaj pensje", "10K", "+2K/rundę", "Grant awaryjny"),
+                        GrantCard("Grant Technologiczny", "Min. 1 profesor", "2 ukończone badania", "16K", "+2K/rundę", "Grant technologiczny"),
+                        GrantCard("Grant Interdyscyplinarny", "2 różne dziedziny", "1 badanie z każdej dziedziny", "24K", "+2K/rundę", "Grant interdyscyplinarny")
+                    ]
+
+            # Stwórz instytuty (zawsze)
+            self.institutes = [
+                InstituteCard("MIT", "8K, 2 PZ", 3, "+1 heks przy fizyce", "4. naukowiec bez kary", "Czołowa uczelnia techniczna"),
+                InstituteCard("CERN", "6K, 4 PZ", 3, "Konsorcja -1 PA", "Granty konsorcjów zawsze dostępne", "Największe lab fizyki"),
+                InstituteCard("Max Planck", "7K, 3 PZ", 3, "+1 PB za badanie", "Limit ręki +2", "Niemiecki instytut badawczy"),
+                InstituteCard("Harvard University", "10K, 1 PZ", 3, "+1 Rep za publikację IF 6+", "5. naukowiec bez kary", "Prestiżowa uczelnia"),
+                InstituteCard("Cambridge", "7K, 3 PZ", 4, "+2K za badanie", "Wszystkie publikacje +1 PZ", "Brytyjska tradycja"),
+                InstituteCard("Stanford", "9K, 2 PZ", 3, "+1 heks fizyka", "Karty Okazji podwójne bonusy", "Dolina Krzemowa")
+            ]
+
+            # Stwórz Wielkie Projekty tylko jeśli nie zostały wczytane z CSV
+            if not hasattr(self, 'large_projects') or not self.large_projects:
+                self.large_projects = [
+                LargeProject(
+                        name="FUZJA JĄDROWA",
+                        requirements="22 PB + 20K + 2 ukończone badania fizyczne",
+                        director_reward="+10 PZ + wszystkie akcje kosztują -1 PA",
+                        member_reward="+4 PZ każdy",
+                        description="Reaktor fuzji jądrowej - przełom energetyczny"
+                    ),
+                    LargeProject(
+                        name="SUPERPRZEWODNIK",
+                        requirements="18 PB + 25K + 2 ukończone badania fizyczne",
+                        director_reward="+8 PZ + karta Superprzewodnik",
+                        member_reward="+3 PZ każdy",
+                        description="Materiał o zerowej rezystancji"
+                    ),
+                    LargeProject(
+                        name="TERAPIA GENOWA",
+                        requirements="15 PB + 30K + 1 profesor + 1 badanie biologiczne",
+                        director_reward="+6 PZ + karta Terapia genowa",
+                        member_reward="+2 PZ + 5K każdy",
+                        description="Uniwersalna terapia genowa"
+                    ),
+                    LargeProject(
+                        name="EKSPLORACJA MARSA",
+                        requirements="20 PB + 35K + 3 ukończone badania",
+                        director_reward="+7 PZ + dostęp do Mars Journal",
+                        member_reward="+3 PZ + 1 dodatkowa karta",
+                        description="Pierwsza stała baza na Marsie"
+                    ),
+                    LargeProject(
+                        name="NANOMATERIAĹY",
+                        requirements="16 PB + 15K + 2 badania chemiczne + 1 fizyczne",
+                        director_reward="+5 PZ + granty chemiczne +3K",
+                        member_reward="+2 PZ + ochrona przed kryzysem",
+                        description="Rewolucyjne nanomateriały"
+                )
+            ]
+
+            print("Dane gry załadowane pomyślnie!")
+
+        except Exception as e:
+            print(f"Błąd podczas wczytywania danych: {e}")
+
+        # Stwórz karty konsorcjów (15 sztuk) - zawsze
+        if not hasattr(self, 'consortium_cards') or not self.consortium_cards:
+            self.consortium_cards = [ConsortiumCard() for _ in range(15)]
+
+        # Stwórz karty intryg (20 sztuk) - zawsze
+        if not hasattr(self, 'intrigue_cards') or not self.intrigue_cards:
+            self.intrigue_cards = [
+                IntrigueCard("Sabotaż", "Przeciwnik traci 1 heks z badania", "opponent", "Zakłócenie prac badawczych przeciwnika",
+                    [IntrigueEffect("opponent", "scientist_hexes", "modify", -1, duration=DURATION_GAME, charges=1)]),
+
+                IntrigueCard("Szpiegostwo", "Skopiuj kartę badania przeciwnika", "opponent", "Kradzież pomysłów naukowych",
+                    [IntrigueEffect("opponent", "research_reward", "copy")]),
+
+                IntrigueCard("Skandal", "Przeciwnik traci 1 punkt reputacji", "opponent", "Ujawnienie kompromitujących faktów",
+                    [IntrigueEffect("opponent", "reputation", "subtract", 1)]),
+
+                IntrigueCard("Poaching", "Przejmij naukowca od przeciwnika", "opponent", "Przeteapranie cennego pracownika",
+                    [IntrigueEffect("opponent", "scientist", "steal", 1, "scientist")]),
+
+                IntrigueCard("Blokada grantu", "Zablokuj grant przeciwnika na 1 rundę", "opponent", "Lobbowanie przeciw konkurencji",
+                    [IntrigueEffect("opponent", "grant", "block", delay=1)]),
+
+                IntrigueCard("Przejęcie publikacji", "Przejmij pierwszeństwo publikacji", "opponent", "Szybsza publikacja tego samego tematu",
+                    [IntrigueEffect("opponent", "publication_pz", "block", duration=DURATION_GAME, charges=1)]),
+
+                IntrigueCard("Audit finansowy", "Przeciwnik traci 3K", "opponent", "Nieprzewidziane koszty kontroli",
+                    [IntrigueEffect("opponent", "credits", "subtract", 3000)]),
+
+                IntrigueCard("Atak hakera", "Przeciwnik traci 2 PB", "opponent", "Cyberatak na systemy badawcze",
+                    [IntrigueEffect("opponent", "research_points", "subtract", 2)]),
+
+                IntrigueCard("Kryzys wizerunkowy", "Wszystkich przeciwników -1 reputacja", "all", "Skandal dotyczący całej branży",
+                    [IntrigueEffect("all_opponents", "reputation", "subtract", 1)]),
+
+                IntrigueCard("Międzynarodowy bojkot", "Wszyscy tracą dostęp do konsorcjów na rundę", "all", "Polityczny kryzys naukowy",
+                    [IntrigueEffect("all_players", "consortium", "block")]),
+
+                IntrigueCard("Kradzież IP", "Skopiuj kartę okazji przeciwnika", "opponent", "Przemysłowe szpiegostwo",
+                    [IntrigueEffect("opponent", "opportunity_card", "copy", 1, "opportunity_card")]),
+
+                IntrigueCard("Podkupstwo", "Przejmij członkostwo w konsorcjum", "opponent", "Nieczyste zagrania finansowe",
+                    [IntrigueEffect("self", "consortium", "join")]),
+
+                IntrigueCard("Dezinformacja", "Przeciwnik nie może publikować przez rundę", "opponent", "Fałszywe doniesienia o wynikach",
+                    [IntrigueEffect("opponent", "publication", "block")]),
+
+                IntrigueCard("Przeciek", "Ujawnij rękę przeciwnika", "opponent", "Wyciek poufnych informacji",
+                    [IntrigueEffect("opponent", "hand_cards", "reveal", 0, "cards")]),
+
+                IntrigueCard("Awaria sprzętu", "Przeciwnik traci 2 heksy z aktywnego badania", "opponent", "Sabotaż laboratorium",
+                    [IntrigueEffect("opponent", "scientist_hexes", "modify", -2, duration=DURATION_GAME, charges=1)]),
+
+                IntrigueCard("Strajk pracowników", "Przeciwnik traci akcję na rundę", "opponent", "Niepokoje społeczne w instytucie",
+                    [IntrigueEffect("opponent", "action", "block", duration=DURATION_GAME, charges=1)]),
+
+                IntrigueCard("Epidemia", "Wszyscy tracą po 1 naukowcu", "all", "Choroba dziesiątkuje kadry naukowe",
+                    [IntrigueEffect("all_players", "scientist", "subtract", 1, "scientist")]),
+
+                IntrigueCard("Kryzys energetyczny", "Wszyscy tracą 2K", "all", "Rosnące koszty energii",
+                    [IntrigueEffect("all_players", "credits", "subtract", 2000)]),
+
+                IntrigueCard("Oszustwo naukowe", "Przeciwnik traci jedną publikację", "opponent", "Ujawnienie fałszowanych danych",
+                    [IntrigueEffect("opponent", "publications", "subtract", 1)]),
+
+                IntrigueCard("Afera korupcyjna", "Przeciwnik traci aktualny grant", "opponent", "Skandal finansowy w instytucie",
+                    [IntrigueEffect("opponent", "current_grant", "remove", 1, "grant")])
+            ]
+
+        # Stwórz karty okazji (10 sztuk) - zawsze
+        if not hasattr(self, 'opportunity_cards') or not self.opportunity_cards:
+            self.opportunity_cards = [
+                OpportunityCard("Niespodziana dotacja", "credits", "5K", "Brak", "Rządowe wsparcie dla nauki", "OKAZJA", [
+                    OpportunityEffect("credits", "add", 5000, condition="Brak")
+                ]),
+                OpportunityCard("Odkrycie w laboratorium", "research_points", "3PB", "Brak", "Przypadkowe odkrycie podczas rutynowych badań", "OKAZJA", [
+                    OpportunityEffect("research_points", "add", 3, condition="Brak")
+                ]),
+                OpportunityCard("Nagroda naukowa", "reputation", "2", "Min. 1 publikacja", "Prestiżowe wyróżnienie za osiągnięcia", "OKAZJA", [
+                    OpportunityEffect("reputation", "add", 2, condition="Min. 1 publikacja")
+                ]),
+                OpportunityCard("Dodatkowe finansowanie", "credits", "7K", "Aktywne badanie", "Dofinansowanie trwającego projektu", "OKAZJA", [
+                    OpportunityEffect("credits", "add", 7000, condition="Aktywne badanie")
+                ]),
+                OpportunityCard("Przełom metodologiczny", "hex_tokens", "2", "Aktywne badanie", "Nowa metoda przyspiesza badania", "OKAZJA", [
+                    OpportunityEffect("hex_tokens", "add", 2, condition="Aktywne badanie")
+                ]),
+                OpportunityCard("Współpraca międzynarodowa", "action_points", "2", "Reputacja 3+", "Dodatkowe możliwości działania", "OKAZJA", [
+                    OpportunityEffect("action_points", "add", 2, condition="Reputacja 3+")
+                ]),
+                OpportunityCard("Patent komercyjny", "credits", "10K", "Ukończone badanie", "Sprzedaż praw do wynalazku", "OKAZJA", [
+                    OpportunityEffect("credits", "add", 10000, condition="Ukończone badanie")
+                ]),
+                OpportunityCard("Visiting professor", "research_points", "5PB", "Min. 1 profesor", "Wizyta wybitnego naukowca", "OKAZJA", [
+                    OpportunityEffect("research_points", "add", 5, condition="Min. 1 profesor")
+                ]),
+                OpportunityCard("Technologiczny venture", "credits", "8K", "Badanie chemiczne lub fizyczne", "Inwestycja w start-up", "OKAZJA", [
+                    OpportunityEffect("credits", "add", 8000, condition="Badanie chemiczne lub fizyczne")
+                ]),
+                OpportunityCard("Szczęśliwy przypadek", "research_points", "4PB", "Brak", "Nieoczekiwane odkrycie", "OKAZJA", [
+                    OpportunityEffect("research_points", "add", 4, condition="Brak")
+                ])
+            ]
+
+        # Stwórz scenariusze fallback tylko jeśli nie wczytano z CSV
+        if not hasattr(self, 'scenarios') or not self.scenarios:
+            print("Używam domyślnego scenariusza fallback")
+            self.scenarios = [
+                ScenarioCard(
+                    name="Podstawowy Scenariusz",
+                    story_element="Standardowa rozgrywka naukowa bez specjalnych modyfikatorów.",
+                    global_modifiers="Brak modyfikatorów",
+                    max_rounds=8,
+                    victory_conditions="100 PZ",
+                    crisis_count=2,
+                    crisis_rounds=[4, 7],
+                    description="Domyślny scenariusz używany gdy CSV nie jest dostępny."
+                )
+            ]
+
+        # Stwórz karty kryzysów - zawsze
+        if not hasattr(self, 'crisis_cards') or not self.crisis_cards:
+            self.crisis_cards = [
+                CrisisCard("Krach Finansowy", "Wszyscy gracze tracą 50% kredytów",
+                          "Globalny kryzys ekonomiczny wpływa na finansowanie nauki", "Kredyty: -50%"),
+                CrisisCard("Cyberatak", "Wszyscy gracze tracą 2 PB",
+                          "Hakerzy zaatakowali systemy badawcze na całym świecie", "Badania: -2 PB"),
+                CrisisCard("Pandemia", "Wszyscy gracze tracą 1 naukowca (losowo)",
+                          "Choroba dziesiątkuje kadry naukowe", "Personel: -1 naukowiec"),
+                CrisisCard("Protest Społeczny", "Wszyscy gracze: -1 Reputacja",
+                          "Społeczeństwo protestuje przeciwko niektórym badaniom", "Reputacja: -1"),
+                CrisisCard("Kryzys Energetyczny", "Wszystkie akcje kosztują +1 PA",
+                          "Niedobory energii spowalniają wszystkie działania", "Akcje: +1 PA"),
+                CrisisCard("Regulacje Prawne", "Nowe badania kosztują +2K",
+                          "Nowe przepisy zwiększają koszty rozpoczynania badań", "Badania: +2K koszt"),
+                CrisisCard("Strajk Pracowników", "Pensje naukowców podwojone na 2 rundy",
+                          "Naukowcy domagają się wyższych pensji", "Pensje: x2 przez 2 rundy"),
+                CrisisCard("Katastrofa Naturalna", "Wszyscy gracze tracą 1 aktywne badanie",
+                          "Klęska żywiołowa niszczy laboratoria", "Badania: -1 aktywne"),
+                CrisisCard("Skandal Korupcyjny", "Gracz z najwyższą reputacją traci 2 punkty",
+                          "Ujawniono aferę w największej instytucji", "Lider: -2 Reputacja"),
+                CrisisCard("Wojna Handlowa", "Konsorcja międzynarodowe: +3K koszt dołączenia",
+                          "Konflikty geopolityczne utrudniają współpracę", "Konsorcja: +3K"),
+                CrisisCard("Kryzys Zaufania", "Publikacje: -1 PZ przez 2 rundy",
+                          "Społeczeństwo traci zaufanie do nauki", "Publikacje: -1 PZ"),
+                CrisisCard("Niedobór Materiałów", "Wszystkie zakupy kosztują +1K",
+                          "Problemy z łańcuchem dostaw zwiększają koszty", "Zakupy: +1K"),
+                CrisisCard("Exodus Talentów", "Każdy gracz może stracić 1 profesora (50% szans)",
+                          "Najlepsi naukowcy emigrują za granicę", "Profesorowie: 50% utraty"),
+                CrisisCard("Kryzys Polityczny", "Granty rządowe niedostępne przez 2 rundy",
+                          "Niestabilność polityczna wstrzymuje finansowanie", "Granty: STOP na 2 rundy"),
+                CrisisCard("Awaria Internetu", "Współpraca międzynarodowa niemożliwa przez rundę",
+                          "Globalna awaria sieci paraliżuje komunikację", "Konsorcja: STOP na rundę")
+            ]
+
+        # Zmieszaj główną talię (badania + konsorcja + intrygi + okazje) - zawsze
+        self.build_main_deck(rng)
+
+    def build_main_deck(self, rng: Optional[random.Random] = None):
+        """Tasuje główną talię kart ręki (generatorem gry, jeśli podany)"""
+        self.main_deck = (
+            self.research_cards.copy() +
+            self.consortium_cards.copy() +
+            self.intrigue_cards.copy() +
+            self.opportunity_cards.copy()
+        )
+        (rng or random).shuffle(self.main_deck)
+
+    def reset_game_state(self, rng: Optional[random.Random] = None):
+        """Przywraca karty do stanu sprzed rozgrywki (bez ponownego wczytywania CSV)"""
+        for card in self.research_cards:
+            card.reset_progress()
+        for grant in self.grants:
+            grant.is_completed = False
+        for scientist in self.scientists:
+            scientist.is_paid = True
+        for project in self.large_projects:
+            project.contributed_pb = 0
+            project.contributed_credits = 0
+            project.director = None
+            project.members = []
+            project.pending_members = []
+            project.is_completed = False
+        self.crisis_deck = []
+        self.revealed_crises = []
+        self.current_round = 1
+        self.build_main_deck(rng)
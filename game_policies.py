@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+"""
+Strategie graczy dla silnika gry (symulacje i benchmarki).
+
+Strategia wybiera grant w fazie grantów i wykonuje jeden ruch w fazie
+akcji (zagranie karty z akcją podstawową i jej skutki albo pas).
+`play_game` rozgrywa pełną grę, przydzielając strategie miejscom przy
+stole. Strategie losują własnym generatorem wyprowadzonym z ziarna gry,
+więc ta sama para (ziarno, strategie) daje zawsze tę samą partię.
+
+Strategie heurystyczne (`MovePolicy`: greedy-pz, research-rusher,
+publisher, consortium-builder, random-legal) wybierają ruch z
+`GameEngine.legal_moves` oceną bez przeszukiwania - z zasobów gracza,
+rynków i postępu aktywnych badań - w mikrosekundach na decyzję. Ten sam
+interfejs (`choose_grant`, `choose_move`, `play_turn`) mają boty przy
+pustych miejscach w `PrincipiaGame` i `game_ai.MCTSBot`.
+"""
+
+import random
+from typing import List, Optional
+
+from game_engine import (
+    MOVE_ADDITIONAL, MOVE_APPROVE, MOVE_COMPLETE_PROJECT, MOVE_END_ACTION, MOVE_HIRE, MOVE_INTRIGUE,
+    MOVE_JOIN, MOVE_OPPORTUNITY, MOVE_PASS, MOVE_PLACE_HEX, MOVE_PLAY_CARD, MOVE_PUBLISH, GameEngine, Move,
+    additional_action_kind, hire_cost
+)
+from game_model import (
+    ActionType, GamePhase, GrantCard, Player, ResearchCard, Scientist, ScientistType, compile_reward
+)
+
+def hex_distance(a, b) -> int:
+    return (abs(a.q - b.q) + abs(a.q + a.r - b.q - b.r) + abs(a.r - b.r)) // 2
+
+def legal_hex_positions(research: ResearchCard) -> list:
+    return research.hex_research_map.legal_positions(research.player_path)
+
+def grant_reward(engine: GameEngine, grant: GrantCard) -> int:
+    return compile_reward(grant.reward).amount('credits') // 1000
+
+def best_grant(engine: GameEngine, player: Player) -> Optional[GrantCard]:
+    """Dostępny grant o najwyższej nagrodzie, którego wymagania gracz spełnia"""
+    grants = [g for g in engine.available_grants if engine.meets_grant_requirements(player, g)]
+    return max(grants, key=lambda g: grant_reward(engine, g)) if grants else None
+
+def scientist_value(scientist: Scientist) -> float:
+    """Heksy na aktywację (profesor więcej) minus koszt zatrudnienia"""
+    hexes = 3 if scientist.type == ScientistType.PROFESOR else 2 if scientist.type == ScientistType.DOKTOR else 1
+    return hexes + scientist.hex_bonus - hire_cost(scientist) / 4000
+
+class ScriptedPolicy:
+    """Karty po kolei; badanie najkrótszą drogą, najlepsze czasopismo, najtańszy naukowiec"""
+
+    name = 'scripted'
+
+    def __init__(self, rng: Optional[random.Random] = None):
+        self.rng = rng or random
+
+    def choose_grant(self, engine: GameEngine, player: Player) -> Optional[GrantCard]:
+        return next((g for g in engine.available_grants if engine.meets_grant_requirements(player, g)), None)
+
+    def choose_research(self, engine: GameEngine, player: Player) -> Optional[ResearchCard]:
+        if player.active_research:
+            return None
+        return next((card for card in player.hand_cards if isinstance(card, ResearchCard)), None)
+
+    def choose_action_card(self, engine: GameEngine, player: Player):
+        # Karty w kolejności z talii: badania, zatrudnianie, publikacje, finanse
+        return next((card for card in player.action_cards if not card.is_used), None)
+
+    def choose_hex(self, research: ResearchCard, legal: list):
+        end = research.hex_research_map.end_position
+        return min(legal, key=lambda pos: hex_distance(pos, end))
+
+    def journal_order(self, engine: GameEngine) -> list:
+        return sorted(engine.available_journals, key=lambda j: -j.pz_reward)
+
+    def scientist_order(self, engine: GameEngine) -> list:
+        return sorted(engine.available_scientists, key=lambda s: s.salary)
+
+    def play_turn(self, engine: GameEngine):
+        """Jeden ruch aktualnego gracza w fazie akcji"""
+        player = engine.current_player
+        card = self.choose_action_card(engine, player)
+        if card is None:
+            engine.player_pass()
+            return
+
+        research = self.choose_research(engine, player)
+        if research:
+            engine.start_research(research)
+
+        engine.play_action_card(card)
+        self.place_hexes(engine)
+
+        # Pierwsze czasopismo / naukowiec, na które gracza stać
+        if card.action_type == ActionType.PUBLIKUJ:
+            journal = next((journal for journal in self.journal_order(engine)
+                            if engine.publication_problem(player, journal) is None), None)
+            if journal is not None:
+                engine.publish_in_journal(journal)
+        elif card.action_type == ActionType.ZATRUDNIJ:
+            scientists = self.scientist_order(engine)
+            scientist = next((scientist for scientist in scientists if player.credits >= hire_cost(scientist)), None)
+            if scientist is not None and engine.hire_problem(player) is None:
+                engine.hire_scientist_direct(scientist)
+
+        engine.end_current_action()
+
+    def place_hexes(self, engine: GameEngine):
+        while engine.hex_placement_mode:
+            research = engine.current_research_for_hex
+            legal = legal_hex_positions(research)
+            if not legal:
+                engine.finish_hex_placement()
+                return
+            engine.place_hex(self.choose_hex(research, legal), research)
+
+class RandomPolicy(ScriptedPolicy):
+    """Losowe (dozwolone) wybory"""
+
+    name = 'random'
+
+    def choose_grant(self, engine, player):
+        grants = [g for g in engine.available_grants if engine.meets_grant_requirements(player, g)]
+        return self.rng.choice(grants) if grants else None
+
+    def choose_research(self, engine, player):
+        cards = [card for card in player.hand_cards if isinstance(card, ResearchCard)]
+        if cards and (not player.active_research or self.rng.random() < 0.2):
+            return self.rng.choice(cards)
+        return None
+
+    def choose_action_card(self, engine, player):
+        cards = [card for card in player.action_cards if not card.is_used]
+        if not cards or self.rng.random() < 0.1:
+            return None
+        return self.rng.choice(cards)
+
+    def choose_hex(self, research, legal):
+        return self.rng.choice(legal)
+
+    def journal_order(self, engine):
+        return self.rng.sample(engine.available_journals, len(engine.available_journals))
+
+    def scientist_order(self, engine):
+        return self.rng.sample(engine.available_scientists, len(engine.available_scientists))
+
+class MovePolicy:
+    """Najwyżej oceniony ruch z `legal_moves` (ocena: `score`, remis - pierwszy na liście).
+
+    Wagi celów ustawiają podklasy; ocena jednego ruchu to kilka odczytów
+    stanu, bez kopiowania silnika.
+    """
+
+    name = 'move'
+    research = 1.0      # badania i heksy
+    publish = 1.0       # publikacje (PZ z czasopism)
+    hire = 1.0          # zatrudnianie naukowców
+    consortium = 1.0    # konsorcja i Wielkie Projekty
+    money = 1.0         # kredyty
+
+    def __init__(self, rng: Optional[random.Random] = None):
+        self.rng = rng or random
+
+    def choose_grant(self, engine: GameEngine, player: Player) -> Optional[GrantCard]:
+        return best_grant(engine, player)
+
+    def choose_move(self, engine: GameEngine) -> Move:
+        player = engine.current_player
+        return max(engine.legal_moves(), key=lambda move: self.score(engine, player, move))
+
+    def play_turn(self, engine: GameEngine):
+        """Ruchy aktualnego gracza do końca jego tury (koniec akcji albo pas)"""
+        seat = engine.current_player_idx
+        while (not engine.game_ended and engine.current_phase == GamePhase.AKCJE
+               and engine.current_player_idx == seat):
+            engine.apply_move(self.choose_move(engine))
+
+    def score(self, engine: GameEngine, player: Player, move: Move) -> float:
+        kind, arg, param = move
+        if kind == MOVE_PLACE_HEX:
+            # Najkrótsza droga do końca badania
+            end = engine.current_research_for_hex.hex_research_map.end_position
+            q, r = arg
+            return -(abs(q - end.q) + abs(q + r - end.q - end.r) + abs(r - end.r)) / 2
+        if kind == MOVE_PLAY_CARD:
+            return self.card_value(engine, player, player.action_cards[arg].action_type)
+        if kind == MOVE_ADDITIONAL:
+            action_desc, _ = engine.current_action_card.additional_actions[arg]
+            return self.action_value(engine, player, additional_action_kind(action_desc), param)
+        if kind == MOVE_HIRE:
+            return self.hire * scientist_value(engine.available_scientists[arg])
+        if kind == MOVE_PUBLISH:
+            return self.publish * engine.available_journals[arg].pz_reward
+        if kind == MOVE_COMPLETE_PROJECT:
+            return 10.0 * self.consortium
+        if kind == MOVE_JOIN:
+            return self.consortium - 0.5
+        if kind == MOVE_APPROVE:
+            return 0.5
+        if kind == MOVE_INTRIGUE:
+            # Intryga w prowadzącego przeciwnika
+            return 0.5 + (0.01 * engine.players[param].prestige_points if param is not None else 0.0)
+        if kind == MOVE_OPPORTUNITY:
+            return 1.0
+        if kind == MOVE_PASS:
+            return -1.0
+        return 0.0  # koniec akcji, koniec układania heksów, odrzucenie wniosku
+
+    def card_value(self, engine: GameEngine, player: Player, action_type: ActionType) -> float:
+        """Wartość zagrania karty akcji (akcja podstawowa i to, co otwiera)"""
+        if action_type == ActionType.PROWADZ_BADANIA:
+            if player.active_research:
+                return 2.0 * self.research
+            has_card = any(isinstance(card, ResearchCard) for card in player.hand_cards)
+            return self.research if has_card else 0.2
+        if action_type == ActionType.PUBLIKUJ:
+            rewards = [j.pz_reward for j in engine.available_journals if engine.publication_problem(player, j) is None]
+            return self.publish * max(rewards) / 2 if rewards else 0.1
+        if action_type == ActionType.ZATRUDNIJ:
+            affordable = any(player.credits >= hire_cost(s) for s in engine.available_scientists)
+            return self.hire * (1.5 if affordable else 0.5) + 0.1 * self.money
+        if action_type == ActionType.FINANSUJ:
+            open_projects = any(not p.is_completed for p in engine.game_data.large_projects)
+            return self.money + (0.5 * self.consortium if open_projects else 0.0)
+        return self.money  # ZARZADZAJ
+
+    def action_value(self, engine: GameEngine, player: Player, kind: Optional[str], param) -> float:
+        """Wartość akcji dodatkowej (z wyborem `param` jak w `Move.param`)"""
+        if kind == 'activate_doktor':
+            return 2.0 * self.research
+        if kind == 'activate_profesor':
+            return 3.0 * self.research
+        if kind == 'start_research':
+            card = player.hand_cards[param]
+            return self.research * (3.0 if not player.active_research else 1.0) - 0.1 * card.max_hexes
+        if kind == 'hire_doktorant':
+            return self.hire
+        if kind == 'hire_doktor' or kind == 'hire_profesor':
+            return self.hire * scientist_value(engine.available_scientists[param])
+        if kind == 'take_3k':
+            return 1.5 * self.money
+        if kind == 'consulting':
+            return self.money
+        if kind == 'contribute':
+            resource = param[1]
+            if resource == 'join':
+                return self.consortium
+            cost = 0.3 * (self.publish if resource == 'pb' else self.money)
+            return self.consortium - cost
+        if kind == 'found_consortium':
+            return 2.0 * self.consortium
+        if kind == 'emergency_loan':
+            return self.money if player.credits < 3000 else -1.0
+        if kind == 'pr_campaign':
+            return 0.5 * self.publish if player.reputation < 5 else -1.0
+        if kind == 'image':
+            return 0.3 * self.publish if player.reputation < 5 else -1.0
+        return -0.5  # odświeżenie rynku
+
+class GreedyPZPolicy(MovePolicy):
+    """Natychmiastowe PZ: najlepsze dostępne publikacje, potem badania"""
+
+    name = 'greedy-pz'
+    research = 2.0
+    publish = 3.0
+    consortium = 1.5
+    money = 0.5
+
+class ResearchRusherPolicy(MovePolicy):
+    """Jak najwięcej badań: naukowcy do aktywacji i najkrótsze badania"""
+
+    name = 'research-rusher'
+    research = 4.0
+    hire = 2.0
+    consortium = 0.3
+    money = 0.5
+
+class PublisherPolicy(MovePolicy):
+    """Publikacje: reputacja i punkty badań na czasopisma z wysokim PZ"""
+
+    name = 'publisher'
+    research = 1.5
+    publish = 4.0
+    hire = 0.5
+    consortium = 0.3
+
+class ConsortiumBuilderPolicy(MovePolicy):
+    """Konsorcja i Wielkie Projekty, finansowane z kredytów"""
+
+    name = 'consortium-builder'
+    hire = 0.5
+    consortium = 4.0
+    money = 2.0
+
+class RandomLegalPolicy(MovePolicy):
+    """Losowy dozwolony ruch (pas i koniec akcji rzadziej, gdy jest coś innego)"""
+
+    name = 'random-legal'
+    pass_chance = 0.15
+
+    def choose_grant(self, engine, player):
+        grants = [g for g in engine.available_grants if engine.meets_grant_requirements(player, g)]
+        return self.rng.choice(grants) if grants else None
+
+    def choose_move(self, engine):
+        moves = engine.legal_moves()
+        if len(moves) > 1 and self.rng.random() >= self.pass_chance:
+            active = [m for m in moves if m.kind != MOVE_PASS and m.kind != MOVE_END_ACTION]
+            if active:
+                moves = active
+        return self.rng.choice(moves)
+
+POLICIES = {policy.name: policy for policy in (
+    ScriptedPolicy, RandomPolicy, GreedyPZPolicy, ResearchRusherPolicy, PublisherPolicy,
+    ConsortiumBuilderPolicy, RandomLegalPolicy
+)}
+
+def play_game(engine: GameEngine, policies: List[ScriptedPolicy], scenario=None,
+              seed: Optional[int] = None) -> int:
+    """Pełna gra - jedna strategia na miejsce przy stole; zwraca numer ostatniej rundy"""
+    engine.new_game(len(policies), scenario=scenario, seed=seed)
+    for seat, policy in enumerate(policies):
+        policy.rng = random.Random(f"{engine.seed}:{seat}")
+    while not engine.game_ended:
+        play_round(engine, policies)
+    return engine.current_round
+
+def play_round(engine: GameEngine, policies: List[ScriptedPolicy]):
+    """Jedna runda: granty, akcje do spasowania wszystkich i faza porządkowa"""
+    # Faza grantów: każdy gracz po kolei
+    for _ in engine.players:
+        player = engine.current_player
+        grant = None
+        if player.current_grant is None:
+            grant = policies[engine.current_player_idx].choose_grant(engine, player)
+        if grant:
+            engine.take_grant(grant)
+        else:
+            engine.next_player()
+    engine.next_phase()
+
+    while engine.current_phase == GamePhase.AKCJE:
+        policies[engine.current_player_idx].play_turn(engine)
+    engine.next_phase()
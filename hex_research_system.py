@@ -1,201 +1,18 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-System heksagonalnych badań dla gry Principia
+System heksagonalnych badań dla gry Principia - widget mapy (tkinter).
+
+Model mapy (`HexPosition`, `HexTile`, `HexResearchMap`) jest w `hex_map.py`.
 """
 
 import tkinter as tk
 from tkinter import ttk
 import math
-from typing import List, Tuple, Dict, Optional
-from dataclasses import dataclass
-
-@dataclass
-class HexPosition:
-    q: int  # Współrzędna q w systemie heksagonalnym
-    r: int  # Współrzędna r w systemie heksagonalnym
-
-    def __eq__(self, other):
-        return isinstance(other, HexPosition) and self.q == other.q and self.r == other.r
-
-    def __hash__(self):
-        return hash((self.q, self.r))
-
-@dataclass
-class HexTile:
-    position: HexPosition
-    tile_type: str  # 'start', 'end', 'bonus', 'normal'
-    bonus_reward: Optional[str] = None
-    is_occupied: bool = False
-    player_color: Optional[str] = None
-
-class HexResearchMap:
-    """Klasa reprezentująca mapę heksagonalną badania"""
-
-    def __init__(self, map_string: str):
-        self.tiles: Dict[HexPosition, HexTile] = {}
-        self.start_position: Optional[HexPosition] = None
-        self.end_position: Optional[HexPosition] = None
-        self.bonus_tiles: List[HexTile] = []
-        self.player_path: List[HexPosition] = []
-
-        self.parse_map_string(map_string)
-
-    def parse_map_string(self, map_string: str):
-        """Parsuje string mapy do struktury heksagonalnej"""
-        try:
-            # Przykład: "START(0,0)->[(1,0)->(2,0)->(3,0)END | (1,1)->(2,1)BONUS(+2PB)]"
-
-            # Znajdź start
-            if 'START(' in map_string:
-                start_part = map_string.split('START(')[1].split(')')[0]
-                q, r = map(int, start_part.split(','))
-                self.start_position = HexPosition(q, r)
-                self.tiles[self.start_position] = HexTile(self.start_position, 'start')
-
-            # Znajdź wszystkie pozycje w nawiasach
-            positions = []
-            i = 0
-            while i < len(map_string):
-                if map_string[i] == '(':
-                    j = i + 1
-                    while j < len(map_string) and map_string[j] != ')':
-                        j += 1
-                    if j < len(map_string):
-                        coord_str = map_string[i+1:j]
-                        if ',' in coord_str:
-                            try:
-                                q, r = map(int, coord_str.split(','))
-                                positions.append(HexPosition(q, r))
-                            except ValueError:
-                                pass
-                    i = j + 1
-                else:
-                    i += 1
-
-            # Dodaj wszystkie pozycje jako zwykłe tiles
-            for pos in positions:
-                if pos not in self.tiles:
-                    self.tiles[pos] = HexTile(pos, 'normal')
-
-            # Znajdź end
-            if 'END' in map_string:
-                # Znajdź pozycję przed END
-                parts = map_string.split('END')
-                if len(parts) > 0:
-                    before_end = parts[0]
-                    # Znajdź ostatnią pozycję
-                    last_pos_match = None
-                    for pos in reversed(positions):
-                        if f"({pos.q},{pos.r})" in before_end:
-                            last_pos_match = pos
-                            break
-
-                    if last_pos_match:
-                        self.end_position = last_pos_match
-                        if last_pos_match in self.tiles:
-                            self.tiles[last_pos_match].tile_type = 'end'
-
-            # Znajdź bonusy
-            if 'BONUS(' in map_string:
-                bonus_parts = map_string.split('BONUS(')
-                for i in range(1, len(bonus_parts)):
-                    bonus_value = bonus_parts[i].split(')')[0]
-                    # Znajdź pozycję bonusu - szukaj wstecz
-                    before_bonus = bonus_parts[i-1]
-                    bonus_pos = None
-                    for pos in reversed(positions):
-                        if f"({pos.q},{pos.r})" in before_bonus:
-                            bonus_pos = pos
-                            break
-
-                    if bonus_pos and bonus_pos in self.tiles:
-                        self.tiles[bonus_pos].tile_type = 'bonus'
-                        self.tiles[bonus_pos].bonus_reward = bonus_value
-                        self.bonus_tiles.append(self.tiles[bonus_pos])
-
-        except Exception as e:
-            print(f"Błąd parsowania mapy: {e}")
-            # Stwórz prostą mapę fallback
-            self.create_simple_fallback_map()
-
-    def create_simple_fallback_map(self):
-        """Tworzy prostą mapę w przypadku błędu parsowania"""
-        self.start_position = HexPosition(0, 0)
-        self.end_position = HexPosition(2, 0)
-
-        self.tiles = {
-            HexPosition(0, 0): HexTile(HexPosition(0, 0), 'start'),
-            HexPosition(1, 0): HexTile(HexPosition(1, 0), 'normal'),
-            HexPosition(2, 0): HexTile(HexPosition(2, 0), 'end'),
-            HexPosition(1, 1): HexTile(HexPosition(1, 1), 'bonus', '+1PB')
-        }
-        self.bonus_tiles = [self.tiles[HexPosition(1, 1)]]
-
-    def can_place_hex(self, position: HexPosition, player_path: List[HexPosition]) -> bool:
-        """Sprawdza czy można położyć heks na danej pozycji"""
-        if position not in self.tiles:
-            return False
-
-        if self.tiles[position].is_occupied:
-            return False
-
-        # Pierwszy heks musi być na start
-        if not player_path:
-            return position == self.start_position
-
-        # Kolejne heksy muszą przylegać do już położonych
-        return self.is_adjacent_to_path(position, player_path)
-
-    def is_adjacent_to_path(self, position: HexPosition, player_path: List[HexPosition]) -> bool:
-        """Sprawdza czy pozycja przylega do ścieżki gracza"""
-        for path_pos in player_path:
-            if self.are_adjacent(position, path_pos):
-                return True
-        return False
-
-    def are_adjacent(self, pos1: HexPosition, pos2: HexPosition) -> bool:
-        """Sprawdza czy dwie pozycje są sąsiednie w siatce heksagonalnej"""
-        directions = [
-            (1, 0), (1, -1), (0, -1),
-            (-1, 0), (-1, 1), (0, 1)
-        ]
-
-        for dq, dr in directions:
-            if pos1.q + dq == pos2.q and pos1.r + dr == pos2.r:
-                return True
-        return False
-
-    def place_hex(self, position: HexPosition, player_color: str, player_path: List[HexPosition]) -> Dict:
-        """Umieszcza heks gracza na mapie"""
-        result = {'success': False, 'bonus': None, 'completed': False}
-
-        if self.can_place_hex(position, player_path):
-            self.tiles[position].is_occupied = True
-            self.tiles[position].player_color = player_color
-            player_path.append(position)
-            result['success'] = True
-
-            # Sprawdź bonus
-            if self.tiles[position].tile_type == 'bonus':
-                result['bonus'] = self.tiles[position].bonus_reward
-
-            # Sprawdź ukończenie
-            if position == self.end_position:
-                result['completed'] = True
-
-        return result
-
-    def is_completed(self, player_path: List[HexPosition]) -> bool:
-        """Sprawdza czy badanie zostało ukończone"""
-        return self.end_position in player_path
-
-    def reset_player_progress(self, player_color: str):
-        """Resetuje postęp gracza (po ukończeniu badania)"""
-        for tile in self.tiles.values():
-            if tile.player_color == player_color:
-                tile.is_occupied = False
-                tile.player_color = None
+from typing import Tuple
+
+from hex_map import HexPosition, HexTile, HexResearchMap  # noqa: F401 - importowane stąd przez interfejs
+
 
 class HexMapWidget(tk.Frame):
     """Widget do wyświetlania i interakcji z mapą heksagonalną - responsive i skalowany"""
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test obciążeniowy serwera gry na loopbacku.
+
+Serwer działa w osobnym procesie (żeby jego czas CPU był mierzony osobno),
+a N symulowanych klientów łączy się z nim jako wątki albo procesy. Każdy
+klient wysyła heartbeaty i gra akcje PLAY_CARD i HEX_PLACEMENT z zadaną
+częstotliwością. Na koniec raport: wiadomości/s, opóźnienie rozgłoszenia
+p50/p99, bajty/s i czas CPU serwera.
+
+Progi `--max-p99-ms` i `--min-throughput` pozwalają użyć testu jako bramki
+przy zmianach serwera (kod wyjścia 1 przy przekroczeniu). `--reap-check`
+sprawdza zamiast tego, czy serwer wątkowy rozłącza klienta, który nie
+odpowiada na pingi, i czy kończy się wątek obsługi tego połączenia.
+
+Uruchomienie:
+    python loadtest_network.py --clients 32 --rate 5 --duration 10
+    python loadtest_network.py --backend asyncio --clients 200 --processes 4 --max-p99-ms 50
+    python loadtest_network.py --reap-check
+"""
+
+import argparse
+import multiprocessing
+import random
+import socket
+import sys
+import threading
+import time
+
+from network_game import (
+    ENCODING_BINARY, ENCODING_JSON, SERVER_BACKENDS, FrameDecoder, GameClient, MessageType,
+    NetworkMessage, RECV_BUFFER_SIZE, create_game_server
+)
+
+RESEARCH_NAMES = ['Fizyka kwantowa', 'Genetyka', 'Neurobiologia', 'Sztuczna inteligencja']
+CARD_NAMES = ['Grant badawczy', 'Konferencja', 'Współpraca', 'Publikacja']
+
+def percentile(samples, fraction):
+    """Percentyl z posortowanej listy (None dla pustej)"""
+    if not samples:
+        return None
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+class LoadClient(GameClient):
+    """Symulowany gracz liczący ruch i opóźnienia rozgłoszeń"""
+
+    def __init__(self, rate: float, heartbeat_interval: float):
+        super().__init__()
+        self.auto_reconnect = False
+        self.rate = rate
+        self.heartbeat_interval = heartbeat_interval
+        self.sent = 0
+        self.received = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latencies = []
+        self.rng = random.Random()
+
+    def _receive_messages(self):
+        """Jak w GameClient, ale z liczeniem bajtów i opóźnień"""
+        sock = self.socket
+        decoder = FrameDecoder()
+        while self.connected:
+            try:
+                data = sock.recv(RECV_BUFFER_SIZE)
+                if not data:
+                    break
+                now = time.time()
+                self.bytes_received += len(data)
+                for payload in decoder.feed(data):
+                    message = NetworkMessage.from_payload(payload)
+                    self.received += 1
+                    if message.type == MessageType.PLAYER_ACTION:
+                        sent_at = message.data.get('action_data', {}).get('sent_at')
+                        if sent_at:
+                            self.latencies.append(now - sent_at)
+                    else:
+                        self._process_server_message(message)
+            except Exception:
+                break
+        self.connected = False
+
+    def _send_message(self, message: NetworkMessage):
+        frame = message.to_frame(self.encoding, self.compression_threshold)
+        try:
+            with self.send_lock:
+                self.socket.sendall(frame)
+            self.sent += 1
+            self.bytes_sent += len(frame)
+        except OSError:
+            self.connected = False
+
+    def random_action(self):
+        """PLAY_CARD albo HEX_PLACEMENT (znacznik czasu do pomiaru opóźnienia)"""
+        if self.rng.random() < 0.5:
+            return MessageType.PLAY_CARD.value, {
+                'card': self.rng.choice(CARD_NAMES), 'sent_at': time.time()}
+        return MessageType.HEX_PLACEMENT.value, {
+            'research': self.rng.choice(RESEARCH_NAMES),
+            'q': self.rng.randint(-3, 3), 'r': self.rng.randint(-3, 3), 'sent_at': time.time()}
+
+    def play(self, start_at: float, duration: float):
+        """Wysyła akcje i heartbeaty do upływu czasu testu"""
+        interval = 1.0 / self.rate if self.rate > 0 else None
+        # Rozłożenie startów, żeby klienci nie wysyłali w tej samej chwili
+        next_action = start_at + (self.rng.random() * interval if interval else 0)
+        next_heartbeat = start_at + self.rng.random() * self.heartbeat_interval
+        end_at = start_at + duration
+
+        while self.connected:
+            now = time.time()
+            if now >= end_at:
+                break
+            if now >= next_heartbeat:
+                self._send_message(NetworkMessage(
+                    type=MessageType.HEARTBEAT, data={'timestamp': now}, player_id=self.player_id))
+                next_heartbeat += self.heartbeat_interval
+            if interval and now >= next_action:
+                self.send_action(*self.random_action())
+                next_action += interval
+            wake = min(next_heartbeat, next_action if interval else end_at, end_at)
+            time.sleep(max(0.0, wake - time.time()))
+
+    def result(self) -> dict:
+        return {
+            'connected': self.player_id is not None,
+            'sent': self.sent,
+            'received': self.received,
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+            'latencies': self.latencies
+        }
+
+def run_clients(config: dict, count: int, first_index: int, start_at: float) -> list:
+    """Łączy `count` klientów (wątki) i gra do końca testu"""
+    clients = []
+    for idx in range(count):
+        client = LoadClient(config['rate'], config['heartbeat'])
+        encodings = [config['encoding']] if config['encoding'] else [ENCODING_BINARY, ENCODING_JSON]
+        if client.connect('127.0.0.1', config['port'], f"Bot {first_index + idx + 1}", None,
+                          encodings=encodings):
+            clients.append(client)
+
+    threads = [threading.Thread(target=client.play, args=(start_at, config['duration']), daemon=True)
+               for client in clients]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Dokończ odbiór rozgłoszeń, które są jeszcze w drodze
+    time.sleep(config['drain'])
+    results = [client.result() for client in clients]
+    for client in clients:
+        client.disconnect()
+    return results
+
+def client_process(config, count, first_index, start_at, results_queue):
+    results_queue.put(run_clients(config, count, first_index, start_at))
+
+def server_process(config, ready, stop, results_queue):
+    """Serwer w osobnym procesie - raportuje swój czas CPU"""
+    server = create_game_server(config['backend'], host='127.0.0.1', port=config['port'],
+                                compression_threshold=config['compress_threshold'])
+    if not server.start(None):
+        ready.set()
+        results_queue.put(None)
+        return
+    cpu_start = time.process_time()
+    ready.set()
+    stop.wait()
+    cpu_time = time.process_time() - cpu_start
+    dropped = sum(entry['dropped'] for entry in server.outbound_stats().values())
+    commands = server.command_stats()
+    server.stop()
+    results_queue.put({'cpu_time': cpu_time, 'dropped': dropped, 'commands': commands})
+
+def summarize(results: list, server_stats: dict, duration: float) -> dict:
+    latencies = sorted(latency for result in results for latency in result['latencies'])
+    total = lambda key: sum(result[key] for result in results)
+    return {
+        'clients': sum(1 for result in results if result['connected']),
+        'sent_per_s': total('sent') / duration,
+        'received_per_s': total('received') / duration,
+        'bytes_in_per_s': total('bytes_sent') / duration,
+        'bytes_out_per_s': total('bytes_received') / duration,
+        'latency_p50_ms': percentile(latencies, 0.50) * 1000 if latencies else None,
+        'latency_p99_ms': percentile(latencies, 0.99) * 1000 if latencies else None,
+        'latency_samples': len(latencies),
+        'server_cpu_s': server_stats['cpu_time'],
+        'server_cpu_pct': server_stats['cpu_time'] / duration * 100,
+        'dropped_frames': server_stats['dropped'],
+        'commands': server_stats['commands']
+    }
+
+def ms_text(value):
+    return f"{value:.2f} ms" if value is not None else "-"
+
+def print_report(config: dict, summary: dict):
+    print(f"\n📊 Test obciążeniowy: serwer {config['backend']}, klienci {summary['clients']}/{config['clients']}, "
+          f"{config['rate']} akcji/s na klienta, {config['duration']:.0f} s")
+    print(f"   Wiadomości:   {summary['sent_per_s']:10.1f} /s do serwera, "
+          f"{summary['received_per_s']:10.1f} /s do klientów")
+    print(f"   Przepływność: {summary['bytes_in_per_s'] / 1024:10.1f} KB/s do serwera, "
+          f"{summary['bytes_out_per_s'] / 1024:10.1f} KB/s do klientów")
+    print(f"   Opóźnienie rozgłoszenia: p50 {ms_text(summary['latency_p50_ms'])}, "
+          f"p99 {ms_text(summary['latency_p99_ms'])} ({summary['latency_samples']} próbek)")
+    print(f"   CPU serwera:  {summary['server_cpu_s']:.2f} s ({summary['server_cpu_pct']:.1f}% jednego rdzenia)")
+    commands = summary['commands']
+    print(f"   Kolejka akcji: {commands['processed']} zastosowanych, "
+          f"czekanie p50 {ms_text(commands['wait_p50_ms'])} / p99 {ms_text(commands['wait_p99_ms'])}, "
+          f"stosowanie p99 {ms_text(commands['apply_p99_ms'])}")
+    if summary['dropped_frames']:
+        print(f"   ⚠️ Odrzucone ramki w kolejkach wychodzących: {summary['dropped_frames']}")
+
+def check_gates(args, summary: dict) -> list:
+    failures = []
+    if summary['clients'] < args.clients:
+        failures.append(f"połączyło się tylko {summary['clients']} z {args.clients} klientów")
+    p99 = summary['latency_p99_ms']
+    if args.max_p99_ms is not None and (p99 is None or p99 > args.max_p99_ms):
+        failures.append(f"p99 opóźnienia {ms_text(p99)} > {args.max_p99_ms} ms")
+    if args.min_throughput is not None and summary['received_per_s'] < args.min_throughput:
+        failures.append(f"przepływność {summary['received_per_s']:.0f} msg/s < {args.min_throughput}")
+    return failures
+
+def check_reaping(port: int) -> list:
+    """Milczące połączenie: serwer wątkowy je rozłącza, wątek obsługi się kończy, klient dostaje FIN"""
+    server = create_game_server('threaded', host='127.0.0.1', port=port,
+                                heartbeat_interval=0.2, max_missed_heartbeats=2)
+    if not server.start(None):
+        return ["nie udało się uruchomić serwera"]
+    failures = []
+    try:
+        with socket.create_connection(('127.0.0.1', port)) as sock:
+            sock.sendall(NetworkMessage(type=MessageType.CONNECT,
+                                        data={'player_name': 'Milczący'}).to_frame(ENCODING_JSON))
+            host, client_port = sock.getsockname()[:2]
+            name = f"klient {host}:{client_port}"
+            deadline = time.monotonic() + 2.0
+            handler = None
+            while handler is None and time.monotonic() < deadline:
+                handler = next((thread for thread in threading.enumerate() if thread.name == name), None)
+                time.sleep(0.01)
+            if handler is None:
+                return [f"brak wątku obsługi połączenia {name}"]
+
+            # Klient nie odpowiada na pingi - po kilku odstępach serwer go rozłącza
+            handler.join(timeout=5.0)
+            if handler.is_alive():
+                failures.append("wątek obsługi rozłączonego klienta nadal czeka na dane")
+            sock.settimeout(1.0)
+            try:
+                while sock.recv(RECV_BUFFER_SIZE):
+                    pass
+            except socket.timeout:
+                failures.append("klient nie dostał zamknięcia połączenia (FIN)")
+            except OSError:
+                pass
+    finally:
+        server.stop()
+    if not failures:
+        print("✅ Milczący klient rozłączony, wątek obsługi zakończony")
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(description="Test obciążeniowy serwera gry (loopback)")
+    parser.add_argument('--backend', default='threaded', choices=sorted(SERVER_BACKENDS))
+    parser.add_argument('--port', type=int, default=18960)
+    parser.add_argument('--clients', type=int, default=16)
+    parser.add_argument('--processes', type=int, default=0,
+                        help="liczba procesów z klientami (0 = wątki w jednym procesie)")
+    parser.add_argument('--rate', type=float, default=2.0, help="akcje na sekundę na klienta")
+    parser.add_argument('--heartbeat', type=float, default=1.0, help="odstęp heartbeatów klienta (s)")
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--drain', type=float, default=1.0, help="czas na odbiór zaległych rozgłoszeń (s)")
+    parser.add_argument('--encoding', choices=[ENCODING_JSON, ENCODING_BINARY], default=None,
+                        help="wymuszone kodowanie (domyślnie uzgadniane)")
+    parser.add_argument('--compress-threshold', type=int, default=None)
+    parser.add_argument('--max-p99-ms', type=float, default=None, help="bramka: maks. p99 opóźnienia")
+    parser.add_argument('--min-throughput', type=float, default=None,
+                        help="bramka: min. wiadomości/s do klientów")
+    parser.add_argument('--reap-check', action='store_true',
+                        help="tylko sprawdzenie rozłączania milczącego klienta (serwer wątkowy)")
+    args = parser.parse_args()
+
+    if args.reap_check:
+        failures = check_reaping(args.port)
+        for failure in failures:
+            print(f"❌ Bramka: {failure}")
+        return 1 if failures else 0
+
+    config = {
+        'backend': args.backend, 'port': args.port, 'clients': args.clients, 'rate': args.rate,
+        'heartbeat': args.heartbeat, 'duration': args.duration, 'drain': args.drain,
+        'encoding': args.encoding, 'compress_threshold': args.compress_threshold
+    }
+
+    ready = multiprocessing.Event()
+    stop = multiprocessing.Event()
+    server_results = multiprocessing.Queue()
+    server = multiprocessing.Process(target=server_process, args=(config, ready, stop, server_results))
+    server.start()
+    ready.wait()
+
+    # Czas na połączenie wszystkich klientów przed startem
+    start_at = time.time() + 1.0 + args.clients * 0.005
+    if args.processes > 0:
+        client_results = multiprocessing.Queue()
+        per_process = [args.clients // args.processes + (1 if i < args.clients % args.processes else 0)
+                       for i in range(args.processes)]
+        workers = []
+        first_index = 0
+        for count in per_process:
+            worker = multiprocessing.Process(target=client_process,
+                                             args=(config, count, first_index, start_at, client_results))
+            worker.start()
+            workers.append(worker)
+            first_index += count
+        results = []
+        for _ in workers:
+            results.extend(client_results.get())
+        for worker in workers:
+            worker.join()
+    else:
+        results = run_clients(config, args.clients, 0, start_at)
+
+    stop.set()
+    server_stats = server_results.get()
+    server.join()
+    if server_stats is None:
+        print("❌ Nie udało się uruchomić serwera")
+        return 1
+
+    summary = summarize(results, server_stats, args.duration)
+    print_report(config, summary)
+
+    failures = check_gates(args, summary)
+    for failure in failures:
+        print(f"❌ Bramka: {failure}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
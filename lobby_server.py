@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Serwer lobby PRINCIPIA - wiele niezależnych stołów za jednym gniazdem.
+
+Serwer działa bez interfejsu (np. na turniejach). Klient podaje `table_id`
+w wiadomości CONNECT, a kolejne PLAYER_ACTION / SYNC_REQUEST / GAME_STATE
+trafiają wyłącznie do jego stołu. Każdy stół ma własną ograniczoną kolejkę,
+historię i budżet czasu procesora, więc zapchany stół nie zagłodzi innych.
+
+Stoły tylko przekazują wiadomości: lobby nie prowadzi silnika gry (brak
+GameEngine i kolejki poleceń), a stan gry przy stole to ostatni GAME_STATE
+przysłany przez gospodarza stołu.
+
+Uruchomienie:
+    python lobby_server.py --port 8888 --max-tables 64
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from network_game import AsyncGameServer, MessageType, NetworkMessage
+
+@dataclass
+class TableLimits:
+    """Limity zasobów pojedynczego stołu"""
+    max_players: int = 4
+    max_spectators: int = 16
+    max_pending: int = 128          # wiadomości czekające na obsłużenie
+    max_history: int = 256          # zapamiętane ostatnie akcje
+    max_state_bytes: int = 256 * 1024   # maks. rozmiar zapisanego stanu gry
+    cpu_budget: float = 0.25        # sekundy obsługi na sekundę (ułamek rdzenia)
+
+class GameTable:
+    """Stan jednego stołu - odizolowany od pozostałych"""
+
+    def __init__(self, table_id: str, limits: TableLimits):
+        self.table_id = table_id
+        self.limits = limits
+        self.clients = {}  # połączenie -> player_info
+        self.history = deque(maxlen=limits.max_history)
+        self.snapshot: Optional[dict] = None
+        self.inbox = asyncio.Queue(maxsize=limits.max_pending)
+        self.worker = None
+        self.next_seat = 1
+        self.created_at = time.time()
+
+        # Statystyki i okno budżetu CPU
+        self.processed = 0
+        self.dropped = 0
+        self.busy_reported = False  # błąd przeciążenia wysyłany raz na epizod
+        self.cpu_time = 0.0
+        self._window_start = time.perf_counter()
+        self._window_used = 0.0
+
+    def count_role(self, role: str) -> int:
+        return sum(1 for info in self.clients.values() if info['role'] == role)
+
+    def stats(self) -> dict:
+        return {
+            'table_id': self.table_id,
+            'players': self.count_role('player'),
+            'spectators': self.count_role('spectator'),
+            'pending': self.inbox.qsize(),
+            'processed': self.processed,
+            'dropped': self.dropped,
+            'cpu_time': round(self.cpu_time, 4),
+            'history': len(self.history),
+        }
+
+class LobbyServer(AsyncGameServer):
+    """Serwer hostujący wiele stołów w jednym procesie (tylko przekazuje akcje)"""
+
+    # Mniejszy limit ramki niż w grze 1:1 - ogranicza pamięć na połączenie
+    max_frame_size = 256 * 1024
+    # Akcje stołu rozgłaszają workery stołów - wspólna kolejka poleceń nie jest potrzebna
+    applies_actions = False
+
+    def __init__(self, host='0.0.0.0', port=8888, max_tables=64, limits: TableLimits = None, backlog=512, **kwargs):
+        super().__init__(host, port, backlog=backlog, **kwargs)
+        self.max_tables = max_tables
+        self.limits = limits or TableLimits()
+        self.tables: Dict[str, GameTable] = {}
+
+    def _process_message(self, client, message: NetworkMessage):
+        """Przetwarza wiadomość - kieruje ją do stołu klienta"""
+        if message.type == MessageType.HEARTBEAT:
+            self._handle_heartbeat(client, message)
+        elif message.type == MessageType.CONNECT:
+            self._handle_connect(client, message)
+        elif message.type in (MessageType.PLAYER_ACTION, MessageType.SYNC_REQUEST, MessageType.GAME_STATE):
+            table = self._table_for(client)
+            if table is None:
+                self._send_error(client, 'not_seated', "Najpierw dołącz do stołu")
+                return
+            requested = message.data.get('table_id')
+            if requested is not None and str(requested) != table.table_id:
+                self._send_error(client, 'wrong_table', f"Nie siedzisz przy stole {requested}")
+                return
+            try:
+                table.inbox.put_nowait((client, message))
+            except asyncio.QueueFull:
+                table.dropped += 1
+                if not table.busy_reported:
+                    table.busy_reported = True
+                    self._send_error(client, 'table_busy', "Stół jest przeciążony, spróbuj ponownie")
+
+    def _table_for(self, client) -> Optional[GameTable]:
+        info = self.clients.get(client)
+        if not info:
+            return None
+        return self.tables.get(info['table_id'])
+
+    def _handle_connect(self, client, message):
+        """Sadza gracza przy wskazanym stole (tworzy stół w razie potrzeby)"""
+        table_id = str(message.data.get('table_id') or '').strip()
+        if not table_id:
+            self._send_error(client, 'missing_table', "Brak identyfikatora stołu")
+            return
+        if client in self.clients:
+            self._send_error(client, 'already_seated', "Połączenie jest już przypisane do stołu")
+            return
+
+        table = self.tables.get(table_id)
+        if table is None:
+            if len(self.tables) >= self.max_tables:
+                self._send_error(client, 'lobby_full', "Osiągnięto limit stołów")
+                return
+            table = GameTable(table_id, self.limits)
+            table.worker = self.loop.create_task(self._table_worker(table))
+            self.tables[table_id] = table
+            print(f"🪑 Utworzono stół {table_id}")
+
+        role = self._client_role(client, message)
+        limit = table.limits.max_players if role == 'player' else table.limits.max_spectators
+        if table.count_role(role) >= limit:
+            self._send_error(client, 'table_full', f"Stół {table_id} jest pełny")
+            if not table.clients:
+                self._close_table(table)
+            return
+
+        player_id = f"{role}_{table.next_seat}"
+        table.next_seat += 1
+        player_name = message.data.get('player_name', f'Gracz_{len(table.clients)+1}')
+        info = {
+            'player_id': player_id,
+            'player_name': player_name,
+            'table_id': table_id,
+            'role': role,
+            'is_host': role == 'player' and table.count_role('player') == 0,
+            'connected_at': time.time()
+        }
+        info.update(self._negotiate_wire(message))
+        table.clients[client] = info
+        self.clients[client] = info
+
+        print(f"✅ Gracz {player_name} dołączył do stołu {table_id}")
+
+        self._send_to_client(client, NetworkMessage(
+            type=MessageType.CONNECT,
+            data={'status': 'connected', 'player_id': player_id, **self._wire_ack(info),
+                  'table_id': table_id, 'is_host': info['is_host']}
+        ))
+        self._send_table_state(table, client)
+        self._broadcast_table_players(table)
+
+    async def _table_worker(self, table: GameTable):
+        """Obsługuje kolejkę stołu w granicach jego budżetu CPU"""
+        while True:
+            client, message = await table.inbox.get()
+
+            now = time.perf_counter()
+            if now - table._window_start >= 1.0:
+                table._window_start = now
+                table._window_used = 0.0
+            elif table._window_used >= table.limits.cpu_budget:
+                # Budżet wyczerpany - stół czeka do końca okna
+                await asyncio.sleep(1.0 - (now - table._window_start))
+                table._window_start = time.perf_counter()
+                table._window_used = 0.0
+
+            start = time.perf_counter()
+            try:
+                if client in table.clients:
+                    self._dispatch_table_message(table, client, message)
+            except Exception as e:
+                print(f"❌ Błąd obsługi wiadomości na stole {table.table_id}: {e}")
+            elapsed = time.perf_counter() - start
+            table._window_used += elapsed
+            table.cpu_time += elapsed
+            table.processed += 1
+            if table.inbox.empty():
+                table.busy_reported = False
+
+            # Oddaj pętlę innym stołom po każdej wiadomości
+            await asyncio.sleep(0)
+
+    def _dispatch_table_message(self, table: GameTable, client, message: NetworkMessage):
+        info = table.clients[client]
+        if message.type == MessageType.PLAYER_ACTION:
+            if info['role'] == 'spectator':
+                self._send_error(client, 'spectator', "Obserwator nie może wykonywać akcji")
+                return
+            message.player_id = info['player_id']
+            message.data['table_id'] = table.table_id
+            table.history.append({
+                'player_id': info['player_id'],
+                'data': message.data,
+                'timestamp': message.timestamp or time.time()
+            })
+            self._broadcast_to_table(table, message, exclude=client)
+        elif message.type == MessageType.SYNC_REQUEST:
+            self._send_table_state(table, client)
+        elif message.type == MessageType.GAME_STATE:
+            # Stan publikuje tylko gospodarz stołu
+            if not info.get('is_host'):
+                self._send_error(client, 'not_host', "Tylko gospodarz stołu może publikować stan gry")
+                return
+            if len(json.dumps(message.data)) > table.limits.max_state_bytes:
+                self._send_error(client, 'state_too_large', "Stan gry przekracza limit stołu")
+                return
+            table.snapshot = message.data
+            self._broadcast_to_table(table, message, exclude=client)
+
+    def _send_table_state(self, table: GameTable, client):
+        """Wysyła stan stołu (ostatni stan gospodarza + ostatnie akcje)"""
+        self._send_to_client(client, NetworkMessage(
+            type=MessageType.GAME_STATE,
+            data={
+                'table_id': table.table_id,
+                'state': table.snapshot,
+                'recent_actions': list(table.history),
+                'players': self._table_players(table)
+            }
+        ))
+
+    def _table_players(self, table: GameTable):
+        return [
+            {
+                'player_id': info['player_id'],
+                'player_name': info['player_name'],
+                'role': info['role'],
+                'is_host': info['is_host']
+            } for info in table.clients.values()
+        ]
+
+    def _broadcast_table_players(self, table: GameTable):
+        self._broadcast_to_table(table, NetworkMessage(
+            type=MessageType.PLAYER_LIST,
+            data={'table_id': table.table_id, 'players': self._table_players(table)}
+        ))
+
+    def _broadcast_to_table(self, table: GameTable, message: NetworkMessage, exclude=None):
+        self._fan_out(list(table.clients.keys()), message, exclude)
+
+    def _disconnect_client(self, client):
+        """Rozłącza klienta i zwalnia jego miejsce przy stole"""
+        info = self.clients.pop(client, None)
+        if info:
+            table = self.tables.get(info['table_id'])
+            if table:
+                table.clients.pop(client, None)
+                print(f"👋 Gracz {info['player_name']} opuścił stół {table.table_id}")
+                if not table.clients:
+                    self._close_table(table)
+                else:
+                    if info.get('is_host'):
+                        for other in table.clients.values():
+                            if other['role'] == 'player':
+                                other['is_host'] = True
+                                break
+                    self._broadcast_table_players(table)
+
+        self._close_connection(client)
+
+    def _close_table(self, table: GameTable):
+        if table.worker:
+            table.worker.cancel()
+        self.tables.pop(table.table_id, None)
+        print(f"🧹 Zamknięto pusty stół {table.table_id}")
+
+    def get_stats(self) -> dict:
+        """Statystyki lobby i poszczególnych stołów"""
+        return {
+            'tables': len(self.tables),
+            'clients': len(self.clients),
+            'per_table': [table.stats() for table in list(self.tables.values())]
+        }
+
+async def serve(args):
+    limits = TableLimits(
+        max_players=args.max_players,
+        max_spectators=args.max_spectators,
+        max_pending=args.max_pending,
+        max_history=args.max_history,
+        cpu_budget=args.cpu_budget
+    )
+    lobby = LobbyServer(args.host, args.port, max_tables=args.max_tables, limits=limits,
+                        compression_threshold=args.compress_threshold)
+    if not await lobby.start_serving(None):
+        return
+
+    try:
+        while True:
+            await asyncio.sleep(args.stats_interval or 3600)
+            if args.stats_interval:
+                stats = lobby.get_stats()
+                print(f"📊 Stoły: {stats['tables']}, gracze: {stats['clients']}")
+                for table in stats['per_table']:
+                    print(f"   {table}")
+                for message_type, entry in lobby.compression_stats.summary().items():
+                    print(f"   🗜️ {message_type}: {entry}")
+    finally:
+        lobby._shutdown()
+
+def main():
+    parser = argparse.ArgumentParser(description="Serwer lobby PRINCIPIA (wiele stołów)")
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=8888)
+    parser.add_argument('--max-tables', type=int, default=64)
+    parser.add_argument('--max-players', type=int, default=4)
+    parser.add_argument('--max-spectators', type=int, default=16)
+    parser.add_argument('--max-pending', type=int, default=128)
+    parser.add_argument('--max-history', type=int, default=256)
+    parser.add_argument('--cpu-budget', type=float, default=0.25,
+                        help="sekundy obsługi na sekundę dla jednego stołu")
+    parser.add_argument('--compress-threshold', type=int, default=None,
+                        help="kompresuj wiadomości od tylu bajtów (domyślnie bez kompresji)")
+    parser.add_argument('--stats-interval', type=float, default=0,
+                        help="co ile sekund wypisywać statystyki (0 = wyłączone)")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        print("🛑 Serwer lobby zatrzymany")
+
+if __name__ == "__main__":
+    main()
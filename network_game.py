@@ -1,16 +1,30 @@
+import asyncio
 import socket
 import json
+import queue
+import secrets
+import struct
 import threading
 import time
+import traceback
+import zlib
+from collections import deque
 from enum import Enum
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 from dataclasses import dataclass
 
+from game_engine import (
+    FLOW_MOVES, MOVE_ADDITIONAL, MOVE_PLACE_HEX, MOVE_PLAY_CARD, PLAYER_COLORS, Move, RuleViolation,
+    additional_action_kind
+)
+from game_journal import restore_game, snapshot_game
+
 class MessageType(Enum):
     # Połączenie
     CONNECT = "connect"
     DISCONNECT = "disconnect"
     PLAYER_LIST = "player_list"
+    ERROR = "error"
 
     # Stan gry
     GAME_STATE = "game_state"
@@ -25,22 +39,139 @@ class MessageType(Enum):
     # Synchronizacja
     SYNC_REQUEST = "sync_request"
     SYNC_RESPONSE = "sync_response"
+    STATE_ACK = "state_ack"
     HEARTBEAT = "heartbeat"
 
+# Ramkowanie strumienia TCP: każda wiadomość poprzedzona 4-bajtową długością (big-endian).
+# Najstarszy bit długości oznacza ładunek skompresowany zlib.
+FRAME_HEADER = struct.Struct('!I')
+FRAME_COMPRESSED_FLAG = 0x80000000
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+RECV_BUFFER_SIZE = 65536
+COMPRESSION_LEVEL = 6
+ZLIB = 'zlib'
+
+class FrameError(ValueError):
+    """Błąd protokołu ramkowania (np. zbyt duża ramka)"""
+
+class MessageError(ValueError):
+    """Ładunek ramki nie jest poprawną wiadomością (uszkodzony JSON albo kod binarny)"""
+
+def encode_frame(payload: bytes, compressed: bool = False) -> bytes:
+    """Dokleja nagłówek długości (i flagę kompresji) do ładunku wiadomości"""
+    if len(payload) > MAX_FRAME_SIZE:
+        raise FrameError(f"Ramka za duża: {len(payload)} B")
+    header = len(payload) | FRAME_COMPRESSED_FLAG if compressed else len(payload)
+    return FRAME_HEADER.pack(header) + payload
+
+def compress_payload(payload: bytes, threshold: Optional[int]):
+    """Kompresuje ładunek od progu rozmiaru; zwraca (dane, czy_skompresowane)"""
+    if threshold is None or len(payload) < threshold:
+        return payload, False
+    compressed = zlib.compress(payload, COMPRESSION_LEVEL)
+    if len(compressed) >= len(payload):
+        return payload, False
+    return compressed, True
+
+def decompress_payload(data: bytes, max_size: int = MAX_FRAME_SIZE) -> bytes:
+    """Rozpakowuje ładunek, pilnując limitu rozmiaru po rozpakowaniu"""
+    decompressor = zlib.decompressobj()
+    try:
+        payload = decompressor.decompress(data, max_size)
+    except zlib.error as e:
+        raise FrameError(f"Uszkodzona skompresowana ramka: {e}")
+    if decompressor.unconsumed_tail:
+        raise FrameError(f"Ramka po rozpakowaniu przekracza {max_size} B")
+    return payload
+
+class CompressionStats:
+    """Skuteczność i koszt kompresji w podziale na typ wiadomości"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.by_type = {}  # typ -> [wiadomości, bajty przed, bajty po, czas CPU]
+
+    def record(self, message_type, raw_size: int, compressed_size: int, cpu_time: float):
+        with self.lock:
+            entry = self.by_type.setdefault(message_type, [0, 0, 0, 0.0])
+            entry[0] += 1
+            entry[1] += raw_size
+            entry[2] += compressed_size
+            entry[3] += cpu_time
+
+    def summary(self) -> Dict[str, dict]:
+        with self.lock:
+            return {
+                getattr(message_type, 'value', message_type): {
+                    'messages': count,
+                    'raw_bytes': raw,
+                    'compressed_bytes': compressed,
+                    'ratio': round(compressed / raw, 3) if raw else 1.0,
+                    'cpu_us_per_message': round(cpu / count * 1e6, 1) if count else 0.0
+                } for message_type, (count, raw, compressed, cpu) in self.by_type.items()
+            }
+
+class FrameDecoder:
+    """Przyrostowy dekoder ramek dla jednego połączenia.
+
+    Obsługuje zarówno ramki rozcięte na kilka odczytów, jak i kilka ramek
+    sklejonych w jednym odczycie. Bufor jest przycinany raz na wywołanie
+    `feed`, więc koszt jest liniowy względem liczby odebranych bajtów.
+    """
+
+    def __init__(self, max_frame_size: int = MAX_FRAME_SIZE):
+        self.max_frame_size = max_frame_size
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """Dodaje odebrane bajty i zwraca listę kompletnych ładunków"""
+        self._buffer += data
+        frames = []
+        offset = 0
+        header_size = FRAME_HEADER.size
+        buffer_len = len(self._buffer)
+
+        while buffer_len - offset >= header_size:
+            (header,) = FRAME_HEADER.unpack_from(self._buffer, offset)
+            length = header & ~FRAME_COMPRESSED_FLAG
+            if length > self.max_frame_size:
+                raise FrameError(f"Ramka za duża: {length} B")
+            end = offset + header_size + length
+            if end > buffer_len:
+                break
+            payload = bytes(self._buffer[offset + header_size:end])
+            if header & FRAME_COMPRESSED_FLAG:
+                payload = decompress_payload(payload, self.max_frame_size)
+            frames.append(payload)
+            offset = end
+
+        if offset:
+            del self._buffer[:offset]
+        return frames
+
+    @property
+    def pending_bytes(self) -> int:
+        """Liczba bajtów czekających na dokończenie ramki"""
+        return len(self._buffer)
+
 @dataclass
 class NetworkMessage:
     type: MessageType
     data: Dict[str, Any]
     player_id: Optional[str] = None
     timestamp: float = 0.0
+    seq: Optional[int] = None  # numer rozgłoszenia (do odtworzenia po wznowieniu sesji)
 
     def to_json(self) -> str:
-        return json.dumps({
+        message = {
             'type': self.type.value,
             'data': self.data,
             'player_id': self.player_id,
             'timestamp': self.timestamp or time.time()
-        })
+        }
+        if self.seq is not None:
+            message['seq'] = self.seq
+        return json.dumps(message)
 
     @classmethod
     def from_json(cls, json_str: str) -> 'NetworkMessage':
@@ -49,178 +180,1433 @@ class NetworkMessage:
             type=MessageType(data['type']),
             data=data['data'],
             player_id=data.get('player_id'),
-            timestamp=data.get('timestamp', time.time())
+            timestamp=data.get('timestamp', time.time()),
+            seq=data.get('seq')
         )
 
-class GameServer:
-    """Serwer gry dla sesji wieloosobowej"""
+    def to_payload(self, encoding: str = 'json') -> bytes:
+        """Serializuje wiadomość w wybranym kodowaniu (json / binary)"""
+        if encoding == ENCODING_BINARY:
+            return encode_binary(self)
+        return self.to_json().encode('utf-8')
 
-    def __init__(self, host='localhost', port=8888):
-        self.host = host
-        self.port = port
-        self.socket = None
-        self.clients = {}  # client_socket -> player_info
-        self.running = False
-        self.game_instance = None
+    def to_frame(self, encoding: str = 'json', compress_threshold: Optional[int] = None) -> bytes:
+        """Serializuje wiadomość do ramki gotowej do wysłania"""
+        return encode_frame(*compress_payload(self.to_payload(encoding), compress_threshold))
 
-    def start(self, game_instance):
-        """Uruchamia serwer gry"""
-        self.game_instance = game_instance
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    @classmethod
+    def from_payload(cls, payload: bytes) -> 'NetworkMessage':
+        """Odtwarza wiadomość z ładunku ramki (kodowanie rozpoznawane po pierwszym bajcie).
 
+        Każdy błąd dekodowania zgłaszany jest jako MessageError.
+        """
         try:
-            self.socket.bind((self.host, self.port))
-            self.socket.listen(5)
-            self.running = True
-
-            print(f"🎮 Serwer gry uruchomiony na {self.host}:{self.port}")
+            if payload[:1] == BINARY_MAGIC:
+                message = decode_binary(payload)
+            else:
+                message = cls.from_json(payload.decode('utf-8'))
+        except (struct.error, IndexError, UnicodeDecodeError, KeyError, TypeError, ValueError) as e:
+            raise MessageError(f"Nieprawidłowa wiadomość: {e}") from e
+        if not isinstance(message.data, dict):
+            raise MessageError("Nieprawidłowa wiadomość: dane nie są słownikiem")
+        return message
+
+# Kodowanie binarne (negocjowane przy CONNECT, JSON zawsze działa jako zapas).
+# Ładunek: magiczny bajt, kod typu, id schematu, znacznik czasu, player_id,
+# a dalej pola schematu spakowane struct-em albo zwarty JSON (schemat 0).
+ENCODING_JSON = 'json'
+ENCODING_BINARY = 'binary'
+SUPPORTED_ENCODINGS = (ENCODING_BINARY, ENCODING_JSON)
+
+BINARY_MAGIC = b'\xb1'
+BINARY_HEADER = struct.Struct('!cBBdI')  # ... znacznik czasu, seq (0 = brak)
+NO_PLAYER_ID = 255
+
+# Stałe kody typów - nie zmieniać istniejących, nowe dopisywać na końcu
+MESSAGE_TYPE_CODES = {
+    MessageType.CONNECT: 1,
+    MessageType.DISCONNECT: 2,
+    MessageType.PLAYER_LIST: 3,
+    MessageType.ERROR: 4,
+    MessageType.GAME_STATE: 5,
+    MessageType.PHASE_CHANGE: 6,
+    MessageType.PLAYER_ACTION: 7,
+    MessageType.PLAY_CARD: 8,
+    MessageType.HEX_PLACEMENT: 9,
+    MessageType.RESEARCH_START: 10,
+    MessageType.SYNC_REQUEST: 11,
+    MessageType.SYNC_RESPONSE: 12,
+    MessageType.HEARTBEAT: 13,
+    MessageType.STATE_ACK: 14,
+}
+MESSAGE_TYPES_BY_CODE = {code: message_type for message_type, code in MESSAGE_TYPE_CODES.items()}
+
+_FIELD_FORMATS = {'i16': struct.Struct('!h'), 'i32': struct.Struct('!i'), 'f64': struct.Struct('!d')}
+_FIELD_RANGES = {'i16': (-2**15, 2**15 - 1), 'i32': (-2**31, 2**31 - 1)}
+
+def _read_str(payload: bytes, offset: int, length: int):
+    """Napis UTF-8 o danej długości; zwraca (napis, nowy offset)"""
+    end = offset + length
+    if end > len(payload):
+        raise ValueError("Urwane pole tekstowe")
+    return payload[offset:end].decode('utf-8'), end
+
+class PackedSchema:
+    """Stały układ pól dla częstych ładunków (np. położenie heksa).
+
+    Dla PLAYER_ACTION pakowane jest `action_data` akcji o danym `action_type`.
+    """
+
+    def __init__(self, schema_id: int, message_type: MessageType, fields, action_type: str = None):
+        self.schema_id = schema_id
+        self.message_type = message_type
+        self.action_type = action_type
+        self.fields = fields  # [(nazwa, rodzaj)], rodzaj: str / i16 / i32 / f64
+        self.names = {name for name, _ in fields}
+
+    def _values(self, data):
+        if self.action_type is None:
+            return data
+        if set(data) != {'action_type', 'action_data'} or data['action_type'] != self.action_type:
+            return None
+        return data['action_data']
+
+    def matches(self, data) -> bool:
+        values = self._values(data)
+        if not isinstance(values, dict) or set(values) != self.names:
+            return False
+        for name, kind in self.fields:
+            value = values[name]
+            if kind == 'str':
+                if not isinstance(value, str) or len(value.encode('utf-8')) > 255:
+                    return False
+            elif kind == 'f64':
+                if not isinstance(value, (int, float)) or isinstance(value, bool):
+                    return False
+            else:
+                low, high = _FIELD_RANGES[kind]
+                if not isinstance(value, int) or isinstance(value, bool) or not low <= value <= high:
+                    return False
+        return True
+
+    def pack(self, data) -> bytes:
+        values = self._values(data)
+        parts = []
+        for name, kind in self.fields:
+            if kind == 'str':
+                raw = values[name].encode('utf-8')
+                parts.append(bytes((len(raw),)) + raw)
+            else:
+                parts.append(_FIELD_FORMATS[kind].pack(values[name]))
+        return b''.join(parts)
+
+    def unpack(self, payload: bytes, offset: int) -> dict:
+        values = {}
+        for name, kind in self.fields:
+            if kind == 'str':
+                values[name], offset = _read_str(payload, offset + 1, payload[offset])
+            else:
+                fmt = _FIELD_FORMATS[kind]
+                (values[name],) = fmt.unpack_from(payload, offset)
+                offset += fmt.size
+        if self.action_type is None:
+            return values
+        return {'action_type': self.action_type, 'action_data': values}
+
+HEX_PLACEMENT_FIELDS = [('research', 'str'), ('q', 'i16'), ('r', 'i16')]
+RESOURCE_UPDATE_FIELDS = [('player', 'i16'), ('credits', 'i32'), ('prestige_points', 'i32'),
+                          ('research_points', 'i32'), ('reputation', 'i16')]
+
+BINARY_SCHEMAS = {schema.schema_id: schema for schema in (
+    PackedSchema(1, MessageType.HEX_PLACEMENT, HEX_PLACEMENT_FIELDS),
+    PackedSchema(2, MessageType.PLAYER_ACTION, HEX_PLACEMENT_FIELDS, action_type='hex_placement'),
+    PackedSchema(3, MessageType.PLAYER_ACTION, RESOURCE_UPDATE_FIELDS, action_type='resource_update'),
+    PackedSchema(4, MessageType.HEARTBEAT, [('timestamp', 'f64')]),
+    PackedSchema(5, MessageType.HEARTBEAT, []),
+    PackedSchema(6, MessageType.HEARTBEAT, [('ping', 'i32')]),
+    PackedSchema(7, MessageType.HEARTBEAT, [('pong', 'i32')]),
+)}
+_SCHEMAS_BY_TYPE: Dict[MessageType, list] = {}
+for _schema in BINARY_SCHEMAS.values():
+    _SCHEMAS_BY_TYPE.setdefault(_schema.message_type, []).append(_schema)
+
+def encode_binary(message: NetworkMessage) -> bytes:
+    """Koduje wiadomość binarnie (schemat spakowany albo zwarty JSON)"""
+    schema_id = 0
+    body = None
+    for schema in _SCHEMAS_BY_TYPE.get(message.type, ()):
+        if schema.matches(message.data):
+            schema_id = schema.schema_id
+            body = schema.pack(message.data)
+            break
+    if body is None:
+        body = json.dumps(message.data, separators=(',', ':')).encode('utf-8')
+
+    if message.player_id is None:
+        player = bytes((NO_PLAYER_ID,))
+    else:
+        # Przycięcie na granicy znaku - urwany znak UTF-8 nie dałby się zdekodować
+        raw = message.player_id.encode('utf-8')[:NO_PLAYER_ID - 1].decode('utf-8', 'ignore').encode('utf-8')
+        player = bytes((len(raw),)) + raw
+    header = BINARY_HEADER.pack(BINARY_MAGIC, MESSAGE_TYPE_CODES[message.type], schema_id,
+                                message.timestamp or time.time(), message.seq or 0)
+    return header + player + body
+
+def decode_binary(payload: bytes) -> NetworkMessage:
+    """Dekoduje ładunek zakodowany przez `encode_binary`"""
+    _, type_code, schema_id, timestamp, seq = BINARY_HEADER.unpack_from(payload, 0)
+    offset = BINARY_HEADER.size
+    length = payload[offset]
+    offset += 1
+    player_id = None
+    if length != NO_PLAYER_ID:
+        player_id, offset = _read_str(payload, offset, length)
+
+    if type_code not in MESSAGE_TYPES_BY_CODE:
+        raise ValueError(f"Nieznany kod typu wiadomości: {type_code}")
+    if schema_id == 0:
+        data = json.loads(payload[offset:].decode('utf-8'))
+    elif schema_id in BINARY_SCHEMAS:
+        data = BINARY_SCHEMAS[schema_id].unpack(payload, offset)
+    else:
+        raise ValueError(f"Nieznany schemat wiadomości: {schema_id}")
+
+    return NetworkMessage(
+        type=MESSAGE_TYPES_BY_CODE[type_code],
+        data=data,
+        player_id=player_id,
+        timestamp=timestamp,
+        seq=seq or None
+    )
+
+def negotiate_encoding(offered) -> str:
+    """Wybiera najlepsze kodowanie z oferty klienta (domyślnie JSON)"""
+    if isinstance(offered, (list, tuple)):
+        for encoding in SUPPORTED_ENCODINGS:
+            if encoding in offered:
+                return encoding
+    return ENCODING_JSON
+
+# Wersjonowana synchronizacja stanu: ścieżka to lista kluczy w zagnieżdżonych
+# słownikach, operacja to ['set', ścieżka, wartość] albo ['del', ścieżka].
+# Listy są porównywane i wysyłane w całości.
+
+_MISSING = object()
+
+def diff_state(old: dict, new: dict, path: tuple = ()) -> List[list]:
+    """Zwraca operacje przekształcające stan `old` w `new`"""
+    ops = []
+    for key in old:
+        if key not in new:
+            ops.append(['del', list(path + (key,))])
+    for key, value in new.items():
+        old_value = old.get(key, _MISSING)
+        if isinstance(value, dict) and isinstance(old_value, dict):
+            ops.extend(diff_state(old_value, value, path + (key,)))
+        elif old_value != value:
+            ops.append(['set', list(path + (key,)), value])
+    return ops
+
+def apply_state_ops(state: dict, ops: List[list]) -> dict:
+    """Nakłada operacje delty na stan (w miejscu)"""
+    for op in ops:
+        keys = op[1]
+        node = state
+        for key in keys[:-1]:
+            child = node.get(key)
+            if not isinstance(child, dict):
+                child = node[key] = {}
+            node = child
+        if op[0] == 'set':
+            node[keys[-1]] = op[2]
+        else:
+            node.pop(keys[-1], None)
+    return state
+
+class StateTracker:
+    """Stan gry z rosnącym numerem wersji i historią ostatnich delt.
+
+    Delty z kilku wersji są składane w jedną, więc klient, który potwierdził
+    starszą wersję, dostaje tylko zmienione pola. Pełny stan jest potrzebny
+    dopiero gdy jego wersja wypadła z historii.
+    """
+
+    def __init__(self, max_history: int = 64):
+        self.version = 0
+        self.state = {}
+        self.deltas = deque(maxlen=max_history)  # (wersja, operacje)
+        self.lock = threading.Lock()
+
+    def update(self, new_state: dict) -> bool:
+        """Zapisuje nowy stan; zwraca True jeśli coś się zmieniło"""
+        with self.lock:
+            ops = diff_state(self.state, new_state)
+            if not ops:
+                return False
+            self.version += 1
+            self.deltas.append((self.version, ops))
+            self.state = new_state
+            return True
 
-            # Uruchom wątek nasłuchujący połączeń
-            accept_thread = threading.Thread(target=self._accept_connections)
-            accept_thread.daemon = True
-            accept_thread.start()
+    def delta_since(self, version: Optional[int]) -> Optional[List[list]]:
+        """Złożona delta od `version` do bieżącej wersji (None = luka)"""
+        with self.lock:
+            if version is None or version > self.version:
+                return None
+            if version == self.version:
+                return []
+            oldest_base = self.deltas[0][0] - 1 if self.deltas else self.version
+            if version < oldest_base:
+                return None
+
+            composed = {}
+            for delta_version, ops in self.deltas:
+                if delta_version <= version:
+                    continue
+                for op in ops:
+                    path = tuple(op[1])
+                    # Nowsza operacja zastępuje starsze na tej ścieżce i pod nią
+                    for existing in [p for p in composed if p[:len(path)] == path]:
+                        del composed[existing]
+                    composed[path] = op
+            return list(composed.values())
+
+    def snapshot(self):
+        with self.lock:
+            return self.version, self.state
+
+# Kolejki wychodzące: każde połączenie ma własnego pisarza, więc wolny klient
+# nie blokuje rozgłaszania do pozostałych. Polityka przy przepełnieniu zależy
+# od roli klienta.
+OUTBOUND_QUEUE_LIMIT = 256
+SENDMSG_MAX_BUFFERS = 1024  # IOV_MAX - bufory jednego wywołania sendmsg
+BACKPRESSURE_DROP_OLDEST = 'drop_oldest'
+BACKPRESSURE_DISCONNECT = 'disconnect'
+DEFAULT_BACKPRESSURE = {
+    'player': BACKPRESSURE_DISCONNECT,
+    'spectator': BACKPRESSURE_DROP_OLDEST,
+}
+
+class OutboundQueue:
+    """Ograniczona kolejka ramek wychodzących jednego połączenia"""
+
+    def __init__(self, limit: int = OUTBOUND_QUEUE_LIMIT, policy: str = BACKPRESSURE_DISCONNECT):
+        self.frames = deque()
+        self.limit = limit
+        self.policy = policy
+        self.dropped = 0
+
+    def push(self, frame) -> bool:
+        """Dodaje ramkę; False oznacza przepełnienie przy polityce rozłączania"""
+        if len(self.frames) >= self.limit:
+            if self.policy != BACKPRESSURE_DROP_OLDEST:
+                return False
+            self.frames.popleft()
+            self.dropped += 1
+        self.frames.append(frame)
+        return True
+
+    def take_all(self) -> list:
+        """Zdejmuje wszystkie ramki (bez sklejania - wysyła je writelines / sendmsg)"""
+        frames = list(self.frames)
+        self.frames.clear()
+        return frames
+
+def send_buffers(sock, buffers: list):
+    """Wysyła bufory po kolei wywołaniami sendmsg, bez kopiowania do jednego bufora.
+
+    Bez sendmsg (Windows) każda ramka idzie osobnym sendall.
+    """
+    if not hasattr(sock, 'sendmsg'):
+        for buffer in buffers:
+            sock.sendall(buffer)
+        return
+    views = [memoryview(buffer) for buffer in buffers if len(buffer)]
+    idx = 0
+    while idx < len(views):
+        sent = sock.sendmsg(views[idx:idx + SENDMSG_MAX_BUFFERS])
+        # Wysłanie częściowe: pomiń wysłane bufory, z ostatniego zostaje reszta
+        while sent:
+            size = len(views[idx])
+            if sent < size:
+                views[idx] = views[idx][sent:]
+                break
+            sent -= size
+            idx += 1
+
+class ThreadedClientWriter:
+    """Wątek wysyłający ramki z kolejki do gniazda klienta"""
+
+    def __init__(self, client_socket, queue: OutboundQueue, on_error):
+        self.socket = client_socket
+        self.queue = queue
+        self.on_error = on_error
+        self.closed = False
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self._run)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def send(self, frame) -> bool:
+        with self.condition:
+            if self.closed:
+                return True
+            if not self.queue.push(frame):
+                return False
+            self.condition.notify()
+            return True
 
+    def _run(self):
+        while True:
+            with self.condition:
+                while not self.queue.frames and not self.closed:
+                    self.condition.wait()
+                if self.closed:
+                    return
+                frames = self.queue.take_all()
+            try:
+                send_buffers(self.socket, frames)
+            except Exception as e:
+                if not self.closed:
+                    print(f"❌ Błąd wysyłania do klienta: {e}")
+                    self.on_error()
+                return
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.queue.frames.clear()
+            self.condition.notify_all()
+
+class AsyncClientWriter:
+    """Zadanie asyncio wysyłające ramki z kolejki do strumienia klienta"""
+
+    def __init__(self, stream_writer, queue: OutboundQueue, on_error):
+        self.writer = stream_writer
+        self.queue = queue
+        self.on_error = on_error
+        self.closed = False
+        self.ready = asyncio.Event()
+        self.task = asyncio.get_running_loop().create_task(self._run())
+
+    def send(self, frame) -> bool:
+        if self.closed:
             return True
+        if not self.queue.push(frame):
+            return False
+        self.ready.set()
+        return True
 
+    async def _run(self):
+        try:
+            while not self.closed:
+                await self.ready.wait()
+                self.ready.clear()
+                while self.queue.frames and not self.closed:
+                    self.writer.writelines(self.queue.take_all())
+                    await self.writer.drain()
+        except asyncio.CancelledError:
+            pass
         except Exception as e:
-            print(f"❌ Błąd uruchamiania serwera: {e}")
-            return False
+            if not self.closed:
+                print(f"❌ Błąd wysyłania do klienta: {e}")
+                self.on_error()
+
+    def close(self):
+        self.closed = True
+        self.queue.frames.clear()
+        if self.task is not asyncio.current_task():
+            self.task.cancel()
+
+# Sesje graczy: po zerwaniu połączenia miejsce przy stole czeka SESSION_TIMEOUT
+# sekund, a ostatnie REPLAY_BUFFER_SIZE rozgłoszeń można odtworzyć po wznowieniu.
+SESSION_TIMEOUT = 120.0
+REPLAY_BUFFER_SIZE = 512
+# Miejsca przy stole przed rozdaniem graczy (miejsce 0 zajmuje host)
+MAX_SEATS = len(PLAYER_COLORS)
+HOST_PLAYER_ID = 'player_0'
 
-    def _accept_connections(self):
-        """Nasłuchuje nowych połączeń"""
-        while self.running:
-            try:
-                client_socket, address = self.socket.accept()
-                print(f"🔗 Nowe połączenie: {address}")
+@dataclass
+class PlayerSession:
+    """Miejsce gracza, które przetrwa zerwanie połączenia"""
+    token: str
+    info: Dict[str, Any]
+    connection: Any = None
+    disconnected_at: Optional[float] = None
+
+# Ping serwera: co HEARTBEAT_INTERVAL sekund, rozłączenie po N pingach bez odpowiedzi
+HEARTBEAT_INTERVAL = 5.0
+MAX_MISSED_HEARTBEATS = 3
+RTT_EWMA_ALPHA = 0.2
+RTT_WINDOW = 100
+
+class HeartbeatState:
+    """Ping i czas odpowiedzi (RTT) jednego połączenia: ostatni, EWMA i p95.
+
+    Pamięta wszystkie pingi bez odpowiedzi (seq -> czas wysłania), więc
+    spóźniony pong starszego pingu też daje pomiar RTT.
+    """
 
-                # Uruchom wątek obsługi klienta
-                client_thread = threading.Thread(
-                    target=self._handle_client,
-                    args=(client_socket, address)
-                )
-                client_thread.daemon = True
-                client_thread.start()
+    def __init__(self):
+        self.outstanding: Dict[int, float] = {}
+        self.last_seq = None
+        self.missed = 0
+        self.last_rtt = None
+        self.ewma_rtt = None
+        self.samples = deque(maxlen=RTT_WINDOW)
+
+    def awaiting_reply(self) -> bool:
+        """Czy ostatni ping wciąż czeka na odpowiedź"""
+        return self.last_seq in self.outstanding
+
+    def on_ping(self, seq: int, now: float, max_age: float):
+        """Zapamiętuje wysłany ping; pingi starsze niż `max_age` s są porzucane"""
+        self.outstanding = {sent_seq: sent_at for sent_seq, sent_at in self.outstanding.items()
+                            if now - sent_at <= max_age}
+        self.outstanding[seq] = now
+        self.last_seq = seq
+
+    def on_pong(self, seq, now: float):
+        self.missed = 0
+        sent_at = self.outstanding.pop(seq, None) if isinstance(seq, int) else None
+        if sent_at is None:
+            return  # nieznany albo porzucony ping
+        rtt = now - sent_at
+        self.last_rtt = rtt
+        self.ewma_rtt = rtt if self.ewma_rtt is None else RTT_EWMA_ALPHA * rtt + (1 - RTT_EWMA_ALPHA) * self.ewma_rtt
+        self.samples.append(rtt)
+
+    def p95(self) -> Optional[float]:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[max(0, int(len(ordered) * 0.95 + 0.5) - 1)]
+
+# Polecenia graczy: jedna kolejka na grę, opróżniana przez jeden wątek piszący.
+# Tylko ten wątek zmienia stan gry - także ruchy z interfejsu hosta (gracz przy
+# hoście, boty, okna wyboru), więc akcje są stosowane po kolei w kolejności
+# odbioru. Czytający stan spoza wątku (widok hosta, stan dla klientów,
+# snapshot) biorą blokadę kolejki `GameCommandQueue.lock`.
+COMMAND_QUEUE_LIMIT = 1024
+COMMAND_LATENCY_WINDOW = 1000
+
+class ActionRejected(Exception):
+    """Akcja niezgodna z aktualnym stanem gry"""
 
-            except Exception as e:
-                if self.running:
-                    print(f"❌ Błąd przyjmowania połączenia: {e}")
+@dataclass
+class PlayerCommand:
+    """Akcja gracza czekająca w kolejce poleceń"""
+    client: Any
+    player_id: str
+    seat: Optional[int]
+    message: NetworkMessage
+    received_at: float
+    local: bool = False  # ruch z interfejsu hosta (apply_local_move)
+
+def _current_player(game, seat):
+    """Gracz przy danym miejscu - o ile teraz jest jego ruch w fazie akcji"""
+    players = getattr(game, 'players', None) or []
+    if seat is None or not 0 <= seat < len(players):
+        raise ActionRejected("Brak miejsca przy stole dla tego gracza")
+    if seat in (getattr(game, 'bots', None) or {}):
+        raise ActionRejected("To miejsce zajmuje gracz komputerowy")
+    if getattr(getattr(game, 'current_phase', None), 'name', None) != 'AKCJE':
+        raise ActionRejected("Akcje można wykonywać tylko w fazie akcji")
+    if getattr(game, 'current_player_idx', None) != seat:
+        raise ActionRejected("To nie jest ruch tego gracza")
+    player = players[seat]
+    if player.has_passed:
+        raise ActionRejected("Gracz już spasował")
+    return player
+
+def _find_by_name(cards, name):
+    for card in cards:
+        if getattr(card, 'name', None) == name:
+            return card
+    return None
+
+def _index_of(items, obj) -> int:
+    return next(idx for idx, item in enumerate(items) if item is obj)
+
+def _checked_move(engine, move: Move):
+    """Ruch sprawdzony listą dozwolonych ruchów silnika gry i przez niego wykonany"""
+    try:
+        return engine.apply_checked(move)
+    except RuleViolation as e:
+        raise ActionRejected(str(e))
+
+def _engine_move(game, seat, move: Move):
+    """Ruch zdalnego gracza w fazie akcji (przebieg rundy i granty prowadzi host)"""
+    _current_player(game, seat)
+    if move.kind in FLOW_MOVES:
+        raise ActionRejected("Fazy, rundy i granty prowadzi host")
+    return _checked_move(game.engine, move)
+
+def apply_play_card(game, seat, data) -> dict:
+    """Zagranie karty akcji (efekt podstawowy wykonuje gra po stronie hosta)"""
+    player = _current_player(game, seat)
+    if getattr(game, 'current_action_card', None) is not None:
+        raise ActionRejected("Poprzednia akcja nie została zakończona")
+    card_type = data.get('card')
+    # Karta wskazana nazwą typu (np. PUBLIKUJ) albo jego wartością
+    card = next((card for card in player.action_cards
+                 if card_type in (getattr(card.action_type, 'name', None), getattr(card.action_type, 'value', None))
+                 and not card.is_used), None)
+    if card is None:
+        raise ActionRejected(f"Brak niewykorzystanej karty akcji: {card_type}")
+
+    if getattr(game, 'engine', None) is not None:
+        # Silnik wykonuje też akcję podstawową karty
+        _engine_move(game, seat, Move(MOVE_PLAY_CARD, _index_of(player.action_cards, card)))
+        return {'card': card_type, 'action_points': card.action_points}
+
+    card.is_used = True
+    game.current_action_card = card
+    game.remaining_action_points = card.action_points
+    return {'card': card_type, 'action_points': card.action_points}
+
+def apply_research_start(game, seat, data) -> dict:
+    """Rozpoczęcie badania z karty na ręku"""
+    player = _current_player(game, seat)
+    card = _find_by_name(player.hand_cards, data.get('research'))
+    if card is None or not hasattr(card, 'hex_research_map'):
+        raise ActionRejected(f"Brak karty badania na ręku: {data.get('research')}")
+
+    if getattr(game, 'engine', None) is not None:
+        # Według zasad badanie rozpoczyna akcja dodatkowa aktywnej karty (koszt w PA)
+        actions = game.current_action_card.additional_actions if game.current_action_card else []
+        index = next((idx for idx, (desc, _) in enumerate(actions)
+                      if additional_action_kind(desc) == 'start_research'), None)
+        if index is None:
+            raise ActionRejected("Badanie rozpoczyna akcja dodatkowa karty PROWADŹ BADANIA")
+        _engine_move(game, seat, Move(MOVE_ADDITIONAL, index, _index_of(player.hand_cards, card)))
+        return {'research': card.name}
+
+    player.hand_cards.remove(card)
+    player.active_research.append(card)
+    card.is_active = True
+    card.player_color = player.color
+    card.player_path = []
+    card.hexes_placed = 0
+    return {'research': card.name}
+
+def apply_hex_placement(game, seat, data) -> dict:
+    """Położenie heksa na mapie aktywnego badania"""
+    from hex_map import HexPosition
+
+    player = _current_player(game, seat)
+    research = _find_by_name(player.active_research, data.get('research'))
+    if research is None or research.hex_research_map is None:
+        raise ActionRejected(f"Brak aktywnego badania: {data.get('research')}")
+    if player.hex_tokens <= 0:
+        raise ActionRejected("Brak heksów w puli gracza")
+    try:
+        position = HexPosition(int(data['q']), int(data['r']))
+    except (KeyError, TypeError, ValueError):
+        raise ActionRejected("Nieprawidłowa pozycja heksa")
+
+    if getattr(game, 'engine', None) is not None:
+        # Heksy tylko w trybie układania (po aktywacji naukowca) na bieżącym badaniu
+        if research is not game.engine.current_research_for_hex:
+            raise ActionRejected(f"Teraz nie układasz heksów na badaniu: {research.name}")
+        result = _engine_move(game, seat, Move(MOVE_PLACE_HEX, (position.q, position.r)))
+        return {'research': research.name, 'q': position.q, 'r': position.r,
+                'bonus': result.get('bonus'), 'completed': bool(result.get('completed'))}
+    if not research.hex_research_map.can_place_hex(position, research.player_path):
+        raise ActionRejected(f"Nie można położyć heksa na ({position.q},{position.r})")
+
+    result = research.hex_research_map.place_hex(position, player.color, research.player_path)
+    if not result.get('success'):
+        raise ActionRejected(f"Nie można położyć heksa na ({position.q},{position.r})")
+    player.hex_tokens -= 1
+    research.hexes_placed = len(research.player_path)
+    return {'research': research.name, 'q': position.q, 'r': position.r,
+            'bonus': result.get('bonus'), 'completed': bool(result.get('completed'))}
+
+def apply_engine_move(game, seat, data) -> dict:
+    """Dowolny ruch fazy akcji jako {'kind', 'arg', 'param'} (game_engine.Move)"""
+    if getattr(game, 'engine', None) is None:
+        raise ActionRejected("Ruchy wymagają silnika gry po stronie hosta")
+    move = Move.from_dict(data)
+    result = _engine_move(game, seat, move)
+    reply = {'move': move.to_dict()}
+    if move.kind == MOVE_PLACE_HEX:
+        reply.update({'bonus': result.get('bonus'), 'completed': bool(result.get('completed'))})
+    return reply
+
+def apply_local_move(game, seat, data) -> dict:
+    """Ruch z interfejsu hosta: gracz przy hoście, bot albo okno wyboru.
+
+    Sprawdzany jak ruch zdalny (`legal_moves`, a przebieg rundy i granty
+    `flow_moves`), ale tylko gracza, który nadal ma ruch - inaczej ruch
+    jest nieaktualny.
+    """
+    engine = getattr(game, 'engine', None)
+    if engine is None:
+        raise ActionRejected("Ruchy wymagają silnika gry po stronie hosta")
+    move = Move.from_dict(data)
+    if seat != engine.current_player_idx:
+        raise ActionRejected("Ruch nieaktualny - teraz gra ktoś inny")
+    result = _checked_move(engine, move)
+    reply = {'move': move.to_dict()}
+    if move.kind == MOVE_PLACE_HEX:
+        reply.update({'bonus': result.get('bonus'), 'completed': bool(result.get('completed'))})
+    elif result:
+        reply.update(result)
+    return reply
+
+# action_type -> funkcja(gra, miejsce, dane) sprawdzająca i stosująca akcję;
+# zwraca opis zmiany albo rzuca ActionRejected. Gra z silnikiem (`game.engine`)
+# sprawdza akcje jego listą dozwolonych ruchów (GameEngine.legal_moves).
+ACTION_HANDLERS: Dict[str, Callable[[Any, Optional[int], dict], dict]] = {
+    'play_card': apply_play_card,
+    'research_start': apply_research_start,
+    'hex_placement': apply_hex_placement,
+    'move': apply_engine_move,
+}
+# Ruchy z interfejsu hosta (PlayerCommand.local) - nie przychodzą z sieci
+LOCAL_ACTION_HANDLERS: Dict[str, Callable[[Any, Optional[int], dict], dict]] = {
+    'move': apply_local_move,
+}
+# Pola wyniku widoczne tylko dla wykonującego ruch (nie idą w rozgłoszeniu)
+PRIVATE_RESULT_KEYS = ('revealed',)
+
+class GameCommandQueue:
+    """Kolejka poleceń jednej gry z pojedynczym wątkiem piszącym.
+
+    `on_applied(command, result)` i `on_rejected(command, reason)` są
+    wywoływane w wątku piszącym, pod blokadą `lock` - tak jak zmiana stanu.
+    Bez instancji gry akcje są tylko przekazywane dalej (result None).
+    """
+
+    def __init__(self, on_applied, on_rejected, handlers: Dict[str, Callable] = None,
+                 limit: int = COMMAND_QUEUE_LIMIT):
+        self.game_instance = None
+        self.handlers = dict(ACTION_HANDLERS if handlers is None else handlers)
+        self.local_handlers = dict(LOCAL_ACTION_HANDLERS)
+        self.lock = threading.RLock()
+        self.on_applied = on_applied
+        self.on_rejected = on_rejected
+        self.inbox = queue.Queue(maxsize=limit)
+        self.thread = None
+        self.processed = 0
+        self.rejected = 0
+        self.overflowed = 0
+        self.apply_times = deque(maxlen=COMMAND_LATENCY_WINDOW)
+        self.wait_times = deque(maxlen=COMMAND_LATENCY_WINDOW)
 
-    def _handle_client(self, client_socket, address):
-        """Obsługuje komunikację z pojedynczym klientem"""
+    def start(self, game_instance):
+        self.game_instance = game_instance
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run)
+            self.thread.daemon = True
+            self.thread.start()
+
+    def stop(self):
+        if self.thread is not None:
+            self.inbox.put(None)
+            self.thread.join(timeout=2.0)
+            self.thread = None
+
+    def submit(self, command: PlayerCommand) -> bool:
+        """Dodaje polecenie; False gdy kolejka jest pełna"""
         try:
-            while self.running:
-                data = client_socket.recv(4096).decode('utf-8')
-                if not data:
-                    break
+            self.inbox.put_nowait(command)
+            return True
+        except queue.Full:
+            self.overflowed += 1
+            return False
 
-                try:
-                    message = NetworkMessage.from_json(data)
-                    self._process_message(client_socket, message)
-                except json.JSONDecodeError:
-                    print(f"⚠️ Nieprawidłowa wiadomość od {address}")
+    def _run(self):
+        while True:
+            command = self.inbox.get()
+            if command is None:
+                break
+            self._execute(command)
 
+    def _execute(self, command: PlayerCommand):
+        with self.lock:
+            self._execute_locked(command)
+
+    def _execute_locked(self, command: PlayerCommand):
+        started = time.perf_counter()
+        self.wait_times.append(started - command.received_at)
+        try:
+            result = self.apply(command)
+        except ActionRejected as e:
+            self.rejected += 1
+            self.apply_times.append(time.perf_counter() - started)
+            self.on_rejected(command, str(e))
+            return
         except Exception as e:
-            print(f"❌ Błąd obsługi klienta {address}: {e}")
-        finally:
-            self._disconnect_client(client_socket)
+            # Błąd w regułach, nie niedozwolony ruch - ślad trafia do konsoli hosta
+            print(f"❌ Błąd stosowania akcji {command.message.data.get('action_type')}: {e}")
+            traceback.print_exc()
+            self.rejected += 1
+            self.on_rejected(command, "Błąd serwera przy stosowaniu akcji")
+            return
+        self.processed += 1
+        self.apply_times.append(time.perf_counter() - started)
+        self.on_applied(command, result)
+
+    def apply(self, command: PlayerCommand) -> Optional[dict]:
+        """Sprawdza i stosuje akcję do stanu gry"""
+        if self.game_instance is None:
+            return None
+        action_type = command.message.data.get('action_type')
+        handler = self.handler_for(action_type, command.local)
+        if handler is None:
+            raise ActionRejected(f"Nieznana akcja: {action_type}")
+        return handler(self.game_instance, command.seat, command.message.data.get('action_data') or {})
+
+    def handler_for(self, action_type: str, local: bool = False) -> Optional[Callable]:
+        return (self.local_handlers if local else self.handlers).get(action_type)
+
+    def stats(self) -> dict:
+        """Liczniki i opóźnienia (ms): stosowanie akcji i czekanie w kolejce"""
+        def percentiles(samples):
+            ordered = sorted(samples)
+            if not ordered:
+                return None, None
+            pick = lambda fraction: round(ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] * 1000, 3)
+            return pick(0.50), pick(0.99)
+
+        apply_p50, apply_p99 = percentiles(self.apply_times)
+        wait_p50, wait_p99 = percentiles(self.wait_times)
+        return {
+            'processed': self.processed,
+            'rejected': self.rejected,
+            'overflowed': self.overflowed,
+            'pending': self.inbox.qsize(),
+            'apply_p50_ms': apply_p50,
+            'apply_p99_ms': apply_p99,
+            'wait_p50_ms': wait_p50,
+            'wait_p99_ms': wait_p99
+        }
 
-    def _process_message(self, client_socket, message: NetworkMessage):
+# Most między wątkami sieciowymi a pętlą tkinter: wątki tylko wrzucają zdarzenia,
+# a główna pętla co INBOX_TICK_MS opróżnia skrzynkę i odświeża UI co najwyżej raz.
+INBOX_TICK_MS = 50
+INBOX_ACTION = 'action'
+INBOX_STATE = 'state'
+INBOX_PLAYERS = 'players'
+INBOX_ERROR = 'error'
+# Wynik ruchu z interfejsu hosta: (polecenie, wynik, powód odrzucenia albo None)
+INBOX_DONE = 'done'
+# Zdarzenia silnika hosta - silnik zmienia wątek poleceń, a okna pokazuje pętla tkinter
+INBOX_LOG = 'log'
+INBOX_CRISIS = 'crisis'
+INBOX_GAME_OVER = 'game_over'
+
+class NetworkInbox:
+    """Skrzynka zdarzeń sieciowych odbierana w wątku interfejsu"""
+
+    def __init__(self):
+        self._events = deque()
+        self._lock = threading.Lock()
+        self.pushed = 0
+        self.coalesced = 0
+
+    def push(self, kind: str, payload: Any = None):
+        """Wywoływane z wątków sieciowych"""
+        with self._lock:
+            self._events.append((kind, payload))
+            self.pushed += 1
+
+    def drain(self) -> List[tuple]:
+        """Zdejmuje wszystkie zdarzenia; kolejne aktualizacje stanu łączy w jedną (ostatnią)"""
+        with self._lock:
+            events, self._events = self._events, deque()
+
+        drained = []
+        for kind, payload in events:
+            if kind == INBOX_STATE and drained and drained[-1][0] == INBOX_STATE:
+                drained[-1] = (kind, payload)
+                self.coalesced += 1
+            else:
+                drained.append((kind, payload))
+        return drained
+
+def game_inbox(game_instance) -> Optional[NetworkInbox]:
+    """Skrzynka zdarzeń instancji gry (None gdy gra jej nie ma, np. bez UI)"""
+    return getattr(game_instance, 'network_inbox', None)
+
+class BaseGameServer:
+    """Wspólna logika protokołu serwera gry, niezależna od transportu.
+
+    Podklasy dostarczają `start`, `stop`, pisarza połączenia (`writers`)
+    i `_close_connection`; obsługa wiadomości jest wspólna.
+    """
+
+    max_frame_size = MAX_FRAME_SIZE
+    # Serwer stosuje akcje do gry (kolejka poleceń); False - tylko je przekazuje
+    applies_actions = True
+
+    def __init__(self, host='localhost', port=8888, outbound_limit=OUTBOUND_QUEUE_LIMIT, backpressure=None,
+                 compression_threshold: Optional[int] = None, heartbeat_interval: Optional[float] = HEARTBEAT_INTERVAL,
+                 max_missed_heartbeats: int = MAX_MISSED_HEARTBEATS, session_timeout: float = SESSION_TIMEOUT,
+                 replay_buffer_size: int = REPLAY_BUFFER_SIZE, journal=None):
+        self.host = host
+        self.port = port
+        self.clients = {}  # połączenie -> player_info
+        self.writers = {}  # połączenie -> pisarz z kolejką wychodzącą
+        self.running = False
+        self.game_instance = None
+        self.state_tracker = StateTracker()
+        self.outbound_limit = outbound_limit
+        self.backpressure = dict(DEFAULT_BACKPRESSURE, **(backpressure or {}))
+        # Kompresja zlib dla ładunków >= progu (None = wyłączona)
+        self.compression_threshold = compression_threshold
+        self.compression_stats = CompressionStats()
+        # Ping serwera i wykrywanie martwych połączeń (None = wyłączone)
+        self.heartbeat_interval = heartbeat_interval
+        self.max_missed_heartbeats = max_missed_heartbeats
+        self.heartbeats = {}  # połączenie -> HeartbeatState
+        self._ping_seq = 0
+        # Sesje i bufor rozgłoszeń do odtworzenia po ponownym połączeniu
+        self.sessions: Dict[str, PlayerSession] = {}
+        self.seats: Dict[int, str] = {}  # zajęte miejsce przy stole -> token sesji
+        # Tabele sesji i miejsc zmieniają wątki klientów i wątek pingów
+        self.sessions_lock = threading.RLock()
+        self.session_timeout = session_timeout
+        self.replay_buffer = deque(maxlen=replay_buffer_size)  # (seq, wiadomość, pominięty player_id)
+        self.replay_lock = threading.Lock()
+        self._broadcast_seq = 0
+        self._next_player_number = 1
+        # Akcje graczy stosuje jeden wątek piszący (serwer autorytatywny)
+        self.commands = GameCommandQueue(self._on_action_applied, self._on_action_rejected)
+        # Dziennik akcji do odtworzenia gry po awarii hosta (game_journal.ActionJournal)
+        self.journal = journal
+
+    def _process_message(self, client, message: NetworkMessage):
         """Przetwarza wiadomość od klienta"""
         if message.type == MessageType.CONNECT:
-            self._handle_connect(client_socket, message)
+            self._handle_connect(client, message)
+        elif message.type == MessageType.DISCONNECT:
+            self._handle_leave(client)
         elif message.type == MessageType.PLAYER_ACTION:
-            self._handle_player_action(client_socket, message)
+            self._handle_player_action(client, message)
         elif message.type == MessageType.SYNC_REQUEST:
-            self._handle_sync_request(client_socket)
+            self._handle_sync_request(client, message)
+        elif message.type == MessageType.STATE_ACK:
+            self._handle_state_ack(client, message)
         elif message.type == MessageType.HEARTBEAT:
-            self._handle_heartbeat(client_socket)
+            self._handle_heartbeat(client, message)
+
+    def _client_role(self, client, message) -> str:
+        """Ustala rolę klienta (gracz/obserwator) i politykę jego kolejki"""
+        role = message.data.get('role', 'player')
+        if role not in self.backpressure:
+            role = 'player'
+        writer = self.writers.get(client)
+        if writer:
+            writer.queue.policy = self.backpressure[role]
+        return role
+
+    def _negotiate_wire(self, message) -> dict:
+        """Uzgadnia kodowanie i kompresję na podstawie oferty klienta"""
+        compression = message.data.get('compression') or []
+        return {
+            'encoding': negotiate_encoding(message.data.get('encodings')),
+            'compress': self.compression_threshold is not None and ZLIB in compression
+        }
+
+    def _wire_ack(self, info) -> dict:
+        """Pola potwierdzenia CONNECT opisujące uzgodniony format"""
+        return {
+            'encoding': info['encoding'],
+            'compression_threshold': self.compression_threshold if info['compress'] else None
+        }
+
+    def _handle_connect(self, client, message):
+        """Obsługuje połączenie nowego gracza (albo wznowienie sesji)"""
+        self._expire_sessions()
+        with self.sessions_lock:
+            session = self.sessions.get(message.data.get('session_token'))
+        if session is not None:
+            self._resume_session(client, session, message)
+            return
 
-    def _handle_connect(self, client_socket, message):
-        """Obsługuje połączenie nowego gracza"""
         player_name = message.data.get('player_name', f'Gracz_{len(self.clients)+1}')
-        player_id = f"player_{len(self.clients)+1}"
 
-        self.clients[client_socket] = {
-            'player_id': player_id,
+        token = secrets.token_hex(16)
+        role = self._client_role(client, message)
+        info = {
+            'player_id': None,
             'player_name': player_name,
+            'role': role,
+            'seat': None,
+            'session_token': token,
             'connected_at': time.time()
         }
+        info.update(self._negotiate_wire(message))
+        with self.sessions_lock:
+            # Numer nadawany z licznika - po rozłączeniu innego gracza id się nie powtarza
+            player_id = info['player_id'] = f"player_{self._next_player_number}"
+            self._next_player_number += 1
+            # Miejsce z tabeli wolnych - zwolnione przez innego gracza trafia do kolejnego
+            if role == 'player':
+                info['seat'] = self._take_seat(token)
+            self.sessions[token] = PlayerSession(token=token, info=info, connection=client)
+        self.clients[client] = info
+        if role == 'player' and info['seat'] is None:
+            print(f"⚠️ Brak wolnego miejsca przy stole dla gracza {player_name}")
+        if self.journal:
+            self.journal.append({'kind': 'session', 'token': token, 'player_id': player_id,
+                                 'player_name': player_name, 'role': role, 'seat': info['seat']})
 
         print(f"✅ Gracz {player_name} dołączył do gry")
 
         # Pošlij potwierdzenie
         response = NetworkMessage(
             type=MessageType.CONNECT,
-            data={'status': 'connected', 'player_id': player_id}
+            data={'status': 'connected', 'player_id': player_id, 'session_token': token,
+                  'seq': self._broadcast_seq, **self._wire_ack(info)}
         )
-        self._send_to_client(client_socket, response)
+        self._send_to_client(client, response)
 
         # Wyślij aktualny stan gry
-        self._send_game_state(client_socket)
+        self._send_game_state(client)
 
         # Powiadom innych graczy
         self._broadcast_player_list()
 
-    def _handle_player_action(self, client_socket, message):
-        """Obsługuje akcję gracza"""
-        if client_socket not in self.clients:
-            return
+    def _take_seat(self, token: str) -> Optional[int]:
+        """Zajmuje najniższe wolne miejsce zdalnego gracza (bez hosta i botów); None - stół pełny"""
+        game = self.game_instance
+        limit = len(getattr(game, 'players', None) or []) or MAX_SEATS
+        bots = getattr(game, 'bots', None) or {}
+        with self.sessions_lock:
+            for seat in range(1, limit):
+                if seat not in self.seats and seat not in bots:
+                    self.seats[seat] = token
+                    return seat
+        return None
+
+    def _release_seat(self, session: PlayerSession):
+        with self.sessions_lock:
+            seat = session.info.get('seat')
+            if seat is not None and self.seats.get(seat) == session.token:
+                del self.seats[seat]
+
+    def _resume_session(self, client, session: PlayerSession, message):
+        """Przywraca graczowi jego miejsce i wysyła tylko pominięte wiadomości"""
+        if session.connection is not None and session.connection is not client:
+            # Stare połączenie jeszcze nie wygasło - zastępujemy je
+            old = session.connection
+            self.clients.pop(old, None)
+            self._close_connection(old)
+
+        info = session.info
+        info['role'] = self._client_role(client, message)
+        info.update(self._negotiate_wire(message))
+        info['connected_at'] = time.time()
+        info.pop('leaving', None)
+        session.connection = client
+        session.disconnected_at = None
+        self.clients[client] = info
+
+        print(f"🔄 Gracz {info['player_name']} wznowił sesję")
+
+        self._send_to_client(client, NetworkMessage(
+            type=MessageType.CONNECT,
+            data={'status': 'resumed', 'player_id': info['player_id'], 'session_token': session.token,
+                  'seq': self._broadcast_seq, **self._wire_ack(info)}
+        ))
+
+        missed = self._messages_since(message.data.get('last_seq'), info['player_id'])
+        if missed is None:
+            # Luka większa niż bufor - pełna synchronizacja
+            self._send_game_state(client)
+        else:
+            for missed_message in missed:
+                self._send_to_client(client, missed_message)
+            self._send_state_update(client, info.get('acked_version'))
 
-        # Przekaż akcję do głównej instancji gry
-        if self.game_instance:
-            # TODO: Implementować przekazywanie akcji do gry
-            pass
+        self._broadcast_player_list()
+
+    def _messages_since(self, last_seq, player_id) -> Optional[List[NetworkMessage]]:
+        """Rozgłoszenia po `last_seq` skierowane do gracza (None = luka w buforze)"""
+        if not isinstance(last_seq, int):
+            return None
+        with self.replay_lock:
+            if last_seq > self._broadcast_seq:
+                return None
+            if self.replay_buffer and last_seq < self.replay_buffer[0][0] - 1:
+                return None
+            if not self.replay_buffer and last_seq < self._broadcast_seq:
+                return None
+            return [message for seq, message, excluded in self.replay_buffer
+                    if seq > last_seq and excluded != player_id]
+
+    def _handle_leave(self, client):
+        """Gracz opuszcza grę celowo - sesja nie będzie czekać na powrót"""
+        info = self.clients.get(client)
+        if info:
+            info['leaving'] = True
+            self._disconnect_client(client)
+
+    def _expire_sessions(self):
+        """Zwalnia miejsca graczy, którzy nie wrócili w czasie SESSION_TIMEOUT"""
+        now = time.monotonic()
+        with self.sessions_lock:
+            expired = [self.sessions.pop(token) for token, session in list(self.sessions.items())
+                       if session.connection is None and now - session.disconnected_at > self.session_timeout]
+            for session in expired:
+                self._release_seat(session)
+        for session in expired:
+            print(f"⌛ Miejsce gracza {session.info['player_name']} zwolnione")
+        if expired:
+            self._broadcast_player_list()
 
-        # Rozgłoś akcję do innych graczy
-        self._broadcast_message(message, exclude=client_socket)
+    def _handle_player_action(self, client, message):
+        """Kolejkuje akcję gracza do sprawdzenia i zastosowania przez wątek piszący"""
+        info = self.clients.get(client)
+        if not info or info.get('role') == 'spectator':
+            return
+
+        command = PlayerCommand(client=client, player_id=info['player_id'], seat=info.get('seat'),
+                                message=message, received_at=time.perf_counter())
+        if not self.commands.submit(command):
+            self._send_error(client, 'server_busy', "Serwer nie nadąża z akcjami - spróbuj ponownie")
+
+    def _on_action_applied(self, command: PlayerCommand, result: Optional[dict]):
+        """Wątek piszący: rozgłasza zastosowaną akcję i zmianę stanu"""
+        message = command.message
+        message.player_id = command.player_id
+        if result is None:
+            # Bez instancji gry serwer tylko przekazuje akcję pozostałym
+            self._broadcast_message(message, exclude=command.client)
+            return
 
-    def _handle_sync_request(self, client_socket):
-        """Obsługuje żądanie synchronizacji stanu gry"""
-        self._send_game_state(client_socket)
+        # Odkryte karty widzi tylko wykonujący ruch - reszta dostaje wynik bez nich
+        message.data['result'] = {key: value for key, value in result.items() if key not in PRIVATE_RESULT_KEYS}
+        if self.journal:
+            self.journal.append({'kind': 'action', 'player_id': command.player_id, 'seat': command.seat,
+                                 'action_type': message.data.get('action_type'),
+                                 'action_data': message.data.get('action_data'), 'local': command.local})
+            if self.journal.snapshot_due():
+                self.checkpoint()
+        self._broadcast_message(message)
+        if self._refresh_state():
+            self._call_soon(self._push_state_updates)
+
+        # Interfejs hosta odświeży się w swojej pętli (nie z tego wątku)
+        inbox = game_inbox(self.game_instance)
+        if inbox:
+            if command.local:
+                inbox.push(INBOX_DONE, (command, result, None))
+            else:
+                inbox.push(INBOX_ACTION, message)
+
+    def submit_local_move(self, move: Move, seat: Optional[int]) -> bool:
+        """Kolejkuje ruch z interfejsu hosta; wynik wraca przez skrzynkę (INBOX_DONE).
+
+        False gdy kolejka poleceń jest pełna.
+        """
+        message = NetworkMessage(type=MessageType.PLAYER_ACTION,
+                                 data={'action_type': 'move', 'action_data': move.to_dict()})
+        return self.commands.submit(PlayerCommand(client=None, player_id=HOST_PLAYER_ID, seat=seat, message=message,
+                                                  received_at=time.perf_counter(), local=True))
+
+    def checkpoint(self):
+        """Zgłasza do dziennika zwarty snapshot gry i sesji (zapis w tle)"""
+        if not self.journal or not self.game_instance:
+            return
+        try:
+            with self.commands.lock:
+                # Wpisy akcji powstają pod tą samą blokadą, więc seq odpowiada stanowi
+                state = snapshot_game(self.game_instance)
+                seq = self.journal.seq
+        except Exception as e:
+            print(f"❌ Błąd tworzenia snapshotu gry: {e}")
+            return
+        with self.sessions_lock:
+            sessions = list(self.sessions.values())
+            next_player_number = self._next_player_number
+        self.journal.snapshot({
+            'game': state,
+            'sessions': [{'token': session.token, 'player_id': session.info['player_id'],
+                          'player_name': session.info['player_name'], 'role': session.info['role'],
+                          'seat': session.info.get('seat')} for session in sessions],
+            'next_player_number': next_player_number,
+            'broadcast_seq': self._broadcast_seq,
+            'saved_at': time.time()
+        }, seq)
+
+    def restore_from_journal(self, snapshot: Optional[dict], records: List[dict]) -> List[str]:
+        """Odbudowuje grę po restarcie: snapshot + odtworzenie ogona dziennika.
+
+        Sesje graczy wracają jako rozłączone, więc klienci mogą je wznowić
+        swoimi tokenami. Zwraca nazwy kart, których nie udało się odtworzyć.
+        """
+        missing = []
+        now = time.monotonic()
+
+        def add_session(entry):
+            info = {'player_id': entry['player_id'], 'player_name': entry['player_name'],
+                    'role': entry['role'], 'seat': entry['seat'], 'session_token': entry['token'],
+                    'connected_at': None}
+            with self.sessions_lock:
+                self.sessions[entry['token']] = PlayerSession(token=entry['token'], info=info,
+                                                              connection=None, disconnected_at=now)
+                if entry['seat'] is not None:
+                    self.seats[entry['seat']] = entry['token']
+                number = int(entry['player_id'].split('_')[1])
+                self._next_player_number = max(self._next_player_number, number + 1)
+
+        if snapshot:
+            if self.game_instance and snapshot.get('game'):
+                with self.commands.lock:
+                    missing = restore_game(self.game_instance, snapshot['game'])
+            for entry in snapshot.get('sessions', []):
+                add_session(entry)
+            self._next_player_number = max(self._next_player_number, snapshot.get('next_player_number', 1))
+            self._broadcast_seq = snapshot.get('broadcast_seq', 0)
+
+        replayed = 0
+        for record in records:
+            if record.get('kind') == 'session':
+                add_session(record)
+            elif record.get('kind') == 'action' and self.game_instance:
+                handler = self.commands.handler_for(record['action_type'], record.get('local', False))
+                if handler is None:
+                    continue
+                try:
+                    with self.commands.lock:
+                        handler(self.game_instance, record['seat'], record['action_data'] or {})
+                    replayed += 1
+                except ActionRejected as e:
+                    print(f"⚠️ Pominięto akcję z dziennika ({record['action_type']}): {e}")
+
+        print(f"♻️ Odtworzono grę z dziennika: {len(self.sessions)} sesji, {replayed} akcji po snapshocie")
+        # Nowy snapshot - dziennik zaczyna od odtworzonego stanu
+        self.checkpoint()
+        return missing
+
+    def _on_action_rejected(self, command: PlayerCommand, reason: str):
+        """Wątek piszący: informuje gracza o odrzuceniu akcji.
+
+        Akcja przerwana błędem serwera mogła już zmienić stan gry - wtedy
+        klienci dostają tę zmianę, a dziennik nowy snapshot, żeby nie
+        rozjechały się z hostem.
+        """
+        if self._refresh_state():
+            self.checkpoint()
+            self._call_soon(self._push_state_updates)
+        if command.local:
+            inbox = game_inbox(self.game_instance)
+            if inbox:
+                inbox.push(INBOX_DONE, (command, None, reason))
+            return
+        self._call_soon(self._send_error, command.client, 'invalid_action', reason,
+                        {'action_type': command.message.data.get('action_type')})
+
+    def _send_error(self, client, reason, text, extra: dict = None):
+        self._send_to_client(client, NetworkMessage(
+            type=MessageType.ERROR,
+            data={'reason': reason, 'message': text, **(extra or {})}
+        ))
+
+    def _call_soon(self, func, *args):
+        """Wykonuje funkcję w wątku obsługującym połączenia (tu: od razu)"""
+        func(*args)
+
+    def command_stats(self) -> dict:
+        return self.commands.stats()
+
+    def _handle_sync_request(self, client, message=None):
+        """Obsługuje żądanie synchronizacji stanu gry.
+
+        Klient może podać posiadaną wersję - wtedy dostaje tylko deltę.
+        """
+        known_version = message.data.get('version') if message else None
+        self._send_state_update(client, known_version)
+
+    def _handle_state_ack(self, client, message):
+        """Zapamiętuje wersję stanu potwierdzoną przez klienta"""
+        info = self.clients.get(client)
+        version = message.data.get('version')
+        if info is not None and isinstance(version, int) and version <= self.state_tracker.version:
+            info['acked_version'] = version
+
+    def _handle_heartbeat(self, client, message=None):
+        """Obsługuje ping od klienta albo odpowiedź na ping serwera"""
+        if message and 'pong' in message.data:
+            state = self.heartbeats.get(client)
+            if state:
+                state.on_pong(message.data['pong'], time.monotonic())
+            return
 
-    def _handle_heartbeat(self, client_socket):
-        """Obsługuje ping od klienta"""
         response = NetworkMessage(
             type=MessageType.HEARTBEAT,
             data={'timestamp': time.time()}
         )
-        self._send_to_client(client_socket, response)
+        self._send_to_client(client, response)
+
+    def _heartbeat_tick(self):
+        """Wysyła pingi i rozłącza połączenia, które przestały odpowiadać"""
+        self._expire_sessions()
+        now = time.monotonic()
+        for client in list(self.writers.keys()):
+            state = self.heartbeats.setdefault(client, HeartbeatState())
+            if state.awaiting_reply():
+                state.missed += 1
+                if state.missed >= self.max_missed_heartbeats:
+                    info = self.clients.get(client, {})
+                    print(f"💀 {info.get('player_name', 'Połączenie')} nie odpowiada na ping - rozłączam")
+                    self._disconnect_client(client)
+                    continue
+
+            self._ping_seq += 1
+            state.on_ping(self._ping_seq, now, self.heartbeat_interval * self.max_missed_heartbeats)
+            self._send_to_client(client, NetworkMessage(
+                type=MessageType.HEARTBEAT,
+                data={'ping': self._ping_seq}
+            ))
+
+    def get_connection_stats(self) -> List[dict]:
+        """RTT i pominięte pingi podłączonych graczy (w milisekundach)"""
+        ms = lambda value: round(value * 1000, 1) if value is not None else None
+        stats = []
+        for client, info in list(self.clients.items()):
+            state = self.heartbeats.get(client) or HeartbeatState()
+            stats.append({
+                'player_id': info['player_id'],
+                'player_name': info['player_name'],
+                'rtt_ms': ms(state.last_rtt),
+                'rtt_ewma_ms': ms(state.ewma_rtt),
+                'rtt_p95_ms': ms(state.p95()),
+                'missed': state.missed
+            })
+        return stats
+
+    def _build_game_state(self) -> dict:
+        """Buduje pełny stan gry (gracze i listy kart jako słowniki/nazwy)"""
+        game = self.game_instance
+        names = lambda cards: [getattr(card, 'name', str(card)) for card in cards or []]
+
+        players = {}
+        for idx, p in enumerate(game.players):
+            players[str(idx)] = {
+                'name': p.name,
+                'color': p.color,
+                'credits': p.credits,
+                'prestige_points': p.prestige_points,
+                'research_points': getattr(p, 'research_points', 0),
+                'reputation': p.reputation,
+                'hex_tokens': getattr(p, 'hex_tokens', 0),
+                'publications': getattr(p, 'publications', 0),
+                'has_passed': getattr(p, 'has_passed', False),
+                'institute': getattr(getattr(p, 'institute', None), 'name', None),
+                'current_grant': getattr(getattr(p, 'current_grant', None), 'name', None),
+                'hand': names(getattr(p, 'hand_cards', [])),
+                'scientists': names(getattr(p, 'scientists', [])),
+                'completed_research': names(getattr(p, 'completed_research', [])),
+                'active_research': {
+                    research.name: {
+                        'hexes_placed': research.hexes_placed,
+                        'path': [[pos.q, pos.r] for pos in research.player_path]
+                    } for research in getattr(p, 'active_research', [])
+                }
+            }
+
+        game_data = getattr(game, 'game_data', None)
+        large_projects = {
+            project.name: {
+                'contributed_pb': project.contributed_pb,
+                'contributed_credits': project.contributed_credits,
+                'director': getattr(project.director, 'name', None),
+                'members': names(project.members),
+                'is_completed': project.is_completed
+            } for project in getattr(game_data, 'large_projects', [])
+        }
+
+        return {
+            'current_phase': game.current_phase.value,
+            'current_player': game.current_player_idx,
+            'round': game.current_round,
+            'game_ended': getattr(game, 'game_ended', False),
+            'players': players,
+            'markets': {
+                'grants': names(getattr(game, 'available_grants', [])),
+                'journals': names(getattr(game, 'available_journals', [])),
+                'scientists': names(getattr(game, 'available_scientists', []))
+            },
+            'large_projects': large_projects
+        }
+
+    def _refresh_state(self) -> bool:
+        """Przelicza stan gry i podbija wersję jeśli coś się zmieniło"""
+        if not self.game_instance:
+            return False
+        try:
+            with self.commands.lock:
+                return self.state_tracker.update(self._build_game_state())
+        except Exception as e:
+            print(f"❌ Błąd budowania stanu gry: {e}")
+            return False
 
-    def _send_game_state(self, client_socket):
-        """Wysyła aktualny stan gry do klienta"""
+    def _send_game_state(self, client):
+        """Wysyła pełny stan gry do klienta"""
         if not self.game_instance:
             return
+        self._refresh_state()
+        version, state = self.state_tracker.snapshot()
 
-        # TODO: Serializować stan gry
-        game_state = {
-            'current_phase': self.game_instance.current_phase.value,
-            'current_player': self.game_instance.current_player_idx,
-            'round': self.game_instance.current_round,
-            'players': [
-                {
-                    'name': p.name,
-                    'color': p.color,
-                    'credits': p.credits,
-                    'prestige_points': p.prestige_points,
-                    'reputation': p.reputation
-                } for p in self.game_instance.players
-            ]
-        }
+        message = NetworkMessage(
+            type=MessageType.GAME_STATE,
+            data={'version': version, 'full': True, 'state': state}
+        )
+        self._send_to_client(client, message)
+
+    def _send_state_update(self, client, known_version):
+        """Wysyła deltę od znanej wersji albo pełny stan przy luce"""
+        if not self.game_instance:
+            return
+        ops = self.state_tracker.delta_since(known_version)
+        if ops is None:
+            self._send_game_state(client)
+            return
+        if not ops:
+            return
 
         message = NetworkMessage(
             type=MessageType.GAME_STATE,
-            data=game_state
+            data={
+                'version': self.state_tracker.version,
+                'base_version': known_version,
+                'full': False,
+                'ops': ops
+            }
         )
-        self._send_to_client(client_socket, message)
+        self._send_to_client(client, message)
+
+    def publish_state(self):
+        """Rozsyła zmiany stanu gry po akcji na serwerze.
+
+        Klienci potwierdzający wersje (STATE_ACK) dostają delty, pozostali
+        pełny stan.
+        """
+        if not self._refresh_state():
+            return
+        self._push_state_updates()
+
+    def _push_state_updates(self):
+        """Wysyła bieżącą wersję stanu klientom (delta albo pełny stan)"""
+        for client, info in list(self.clients.items()):
+            self._send_state_update(client, info.get('acked_version'))
 
     def _broadcast_player_list(self):
-        """Rozgłasza listę graczy do wszystkich klientów"""
+        """Rozgłasza listę graczy (także tych, którzy czekają na powrót)"""
+        with self.sessions_lock:
+            sessions = list(self.sessions.values())
         players = [
             {
-                'player_id': info['player_id'],
-                'player_name': info['player_name']
-            } for info in self.clients.values()
+                'player_id': session.info['player_id'],
+                'player_name': session.info['player_name'],
+                'connected': session.connection is not None
+            } for session in sessions
         ]
 
         message = NetworkMessage(
@@ -230,29 +1616,219 @@ class GameServer:
         self._broadcast_message(message)
 
     def _broadcast_message(self, message: NetworkMessage, exclude=None):
-        """Rozgłasza wiadomość do wszystkich klientów"""
-        for client_socket in list(self.clients.keys()):
-            if client_socket != exclude:
-                self._send_to_client(client_socket, message)
-
-    def _send_to_client(self, client_socket, message: NetworkMessage):
-        """Wysyła wiadomość do konkretnego klienta"""
+        """Rozgłasza wiadomość do wszystkich klientów.
+
+        Rozgłoszenie dostaje kolejny numer i trafia do bufora odtworzeń,
+        z którego wznawiający sesję klient dostaje to, co go ominęło.
+        """
+        with self.replay_lock:
+            self._broadcast_seq += 1
+            message.seq = self._broadcast_seq
+            excluded = self.clients.get(exclude, {}).get('player_id') if exclude is not None else None
+            self.replay_buffer.append((message.seq, message, excluded))
+        self._fan_out(list(self.clients.keys()), message, exclude)
+
+    def _fan_out(self, clients, message: NetworkMessage, exclude=None):
+        """Wysyła wiadomość do listy klientów.
+
+        Wiadomość jest serializowana (i kompresowana) raz na format, a wszystkie
+        kolejki dostają ten sam niezmienny bufor.
+        """
+        frames = {}
+        for client in clients:
+            if client == exclude:
+                continue
+            wire = self._client_wire(client)
+            if wire not in frames:
+                frames[wire] = self._encode_frame(message, *wire)
+            if frames[wire] is not None:
+                self._send_frame(client, frames[wire])
+
+    def _client_wire(self, client):
+        """(kodowanie, kompresja) uzgodnione z klientem"""
+        info = self.clients.get(client)
+        if not info:
+            return ENCODING_JSON, False
+        return info.get('encoding', ENCODING_JSON), info.get('compress', False)
+
+    def _encode_frame(self, message: NetworkMessage, encoding: str = ENCODING_JSON,
+                      compress: bool = False) -> Optional[memoryview]:
+        """Serializuje wiadomość do współdzielonej ramki"""
         try:
-            client_socket.send(message.to_json().encode('utf-8'))
+            payload = message.to_payload(encoding)
+            if not compress or self.compression_threshold is None or len(payload) < self.compression_threshold:
+                return memoryview(encode_frame(payload))
+
+            start = time.perf_counter()
+            body, compressed = compress_payload(payload, self.compression_threshold)
+            self.compression_stats.record(message.type, len(payload), len(body), time.perf_counter() - start)
+            return memoryview(encode_frame(body, compressed))
         except Exception as e:
-            print(f"❌ Błąd wysyłania do klienta: {e}")
-            self._disconnect_client(client_socket)
+            print(f"❌ Błąd serializacji wiadomości: {e}")
+            return None
 
-    def _disconnect_client(self, client_socket):
-        """Rozłącza klienta"""
-        if client_socket in self.clients:
-            player_info = self.clients[client_socket]
+    def _send_to_client(self, client, message: NetworkMessage):
+        """Wstawia wiadomość do kolejki wychodzącej klienta (nie blokuje)"""
+        if client not in self.writers:
+            return
+        frame = self._encode_frame(message, *self._client_wire(client))
+        if frame is not None:
+            self._send_frame(client, frame)
+
+    def _send_frame(self, client, frame):
+        """Wstawia gotową ramkę do kolejki wychodzącej klienta"""
+        writer = self.writers.get(client)
+        if writer is None:
+            return
+        if not writer.send(frame):
+            info = self.clients.get(client, {})
+            print(f"⚠️ Klient {info.get('player_name', '?')} nie nadąża z odbiorem - rozłączam")
+            self._disconnect_client(client)
+
+    def _close_connection(self, client):
+        """Zamyka połączenie na poziomie transportu"""
+        self.heartbeats.pop(client, None)
+        writer = self.writers.pop(client, None)
+        if writer:
+            writer.close()
+
+    def outbound_stats(self) -> Dict[str, dict]:
+        """Zajętość kolejek wychodzących i liczba odrzuconych ramek"""
+        stats = {}
+        for client, writer in list(self.writers.items()):
+            info = self.clients.get(client)
+            if info:
+                stats[info['player_id']] = {
+                    'queued': len(writer.queue.frames),
+                    'dropped': writer.queue.dropped,
+                    'policy': writer.queue.policy
+                }
+        return stats
+
+    def _disconnect_client(self, client):
+        """Rozłącza klienta; jego sesja czeka na wznowienie (chyba że wyszedł)"""
+        player_info = self.clients.pop(client, None)
+        if player_info:
+            with self.sessions_lock:
+                session = self.sessions.get(player_info.get('session_token'))
+                if session and session.connection is client:
+                    if player_info.get('leaving'):
+                        self.sessions.pop(session.token, None)
+                        self._release_seat(session)
+                    else:
+                        session.connection = None
+                        session.disconnected_at = time.monotonic()
             print(f"👋 Gracz {player_info['player_name']} rozłączył się")
-            del self.clients[client_socket]
 
             # Powiadom innych graczy
             self._broadcast_player_list()
 
+        self._close_connection(client)
+
+class GameServer(BaseGameServer):
+    """Serwer gry dla sesji wieloosobowej (wątek na połączenie)"""
+
+    def __init__(self, host='localhost', port=8888, **kwargs):
+        super().__init__(host, port, **kwargs)
+        self.socket = None
+        self._stopped = threading.Event()
+
+    def start(self, game_instance):
+        """Uruchamia serwer gry"""
+        self.game_instance = game_instance
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+
+        try:
+            self.socket.bind((self.host, self.port))
+            self.socket.listen(5)
+            self.running = True
+
+            print(f"🎮 Serwer gry uruchomiony na {self.host}:{self.port}")
+            if self.applies_actions:
+                self.commands.start(game_instance)
+
+            # Uruchom wątek nasłuchujący połączeń
+            accept_thread = threading.Thread(target=self._accept_connections)
+            accept_thread.daemon = True
+            accept_thread.start()
+
+            if self.heartbeat_interval:
+                heartbeat_thread = threading.Thread(target=self._heartbeat_loop)
+                heartbeat_thread.daemon = True
+                heartbeat_thread.start()
+
+            return True
+
+        except Exception as e:
+            print(f"❌ Błąd uruchamiania serwera: {e}")
+            return False
+
+    def _accept_connections(self):
+        """Nasłuchuje nowych połączeń"""
+        while self.running:
+            try:
+                client_socket, address = self.socket.accept()
+                print(f"🔗 Nowe połączenie: {address}")
+
+                # Uruchom wątek obsługi klienta
+                client_thread = threading.Thread(
+                    target=self._handle_client,
+                    args=(client_socket, address),
+                    name=f"klient {address[0]}:{address[1]}"
+                )
+                client_thread.daemon = True
+                client_thread.start()
+
+            except Exception as e:
+                if self.running:
+                    print(f"❌ Błąd przyjmowania połączenia: {e}")
+
+    def _heartbeat_loop(self):
+        """Okresowo pinguje klientów"""
+        while self.running and not self._stopped.wait(self.heartbeat_interval):
+            try:
+                self._heartbeat_tick()
+            except Exception as e:
+                print(f"❌ Błąd pingowania klientów: {e}")
+
+    def _handle_client(self, client_socket, address):
+        """Obsługuje komunikację z pojedynczym klientem"""
+        decoder = FrameDecoder(self.max_frame_size)
+        self.writers[client_socket] = ThreadedClientWriter(
+            client_socket, OutboundQueue(self.outbound_limit),
+            lambda: self._disconnect_client(client_socket)
+        )
+        try:
+            # Połączenie mogło zostać zamknięte przez serwer (np. po DISCONNECT)
+            while self.running and client_socket in self.writers:
+                data = client_socket.recv(RECV_BUFFER_SIZE)
+                if not data:
+                    break
+
+                for payload in decoder.feed(data):
+                    try:
+                        message = NetworkMessage.from_payload(payload)
+                    except MessageError as e:
+                        print(f"⚠️ Nieprawidłowa wiadomość od {address}: {e}")
+                        continue
+                    self._process_message(client_socket, message)
+
+        except FrameError as e:
+            print(f"❌ Błąd protokołu od {address}: {e}")
+        except Exception as e:
+            print(f"❌ Błąd obsługi klienta {address}: {e}")
+        finally:
+            self._disconnect_client(client_socket)
+
+    def _close_connection(self, client_socket):
+        """Zamyka gniazdo klienta"""
+        super()._close_connection(client_socket)
+        # shutdown budzi wątek obsługi zablokowany w recv (np. gdy rozłącza heartbeat)
+        try:
+            client_socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
         try:
             client_socket.close()
         except:
@@ -261,6 +1837,10 @@ class GameServer:
     def stop(self):
         """Zatrzymuje serwer"""
         self.running = False
+        self._stopped.set()
+        self.commands.stop()
+        if self.journal:
+            self.journal.close()
 
         # Rozłącz wszystkich klientów
         for client_socket in list(self.clients.keys()):
@@ -272,6 +1852,184 @@ class GameServer:
 
         print("🛑 Serwer gry zatrzymany")
 
+class AsyncGameServer(BaseGameServer):
+    """Serwer gry oparty o asyncio - wszystkie połączenia w jednej pętli zdarzeń.
+
+    Zamiast wątku na klienta każde połączenie to jedna korutyna czytająca
+    ze strumienia, więc koszt połączenia to głównie bufor dekodera.
+    Pętla działa w osobnym wątku, żeby nie blokować tkintera.
+    """
+
+    def __init__(self, host='localhost', port=8888, backlog=512, **kwargs):
+        super().__init__(host, port, **kwargs)
+        self.backlog = backlog
+        self.loop = None
+        self._server = None
+        self._loop_thread = None
+        self._heartbeat_task = None
+
+    def start(self, game_instance):
+        """Uruchamia pętlę zdarzeń serwera w tle"""
+        started = threading.Event()
+        result = {'ok': False}
+
+        def run_loop():
+            self.loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self.loop)
+            try:
+                result['ok'] = self.loop.run_until_complete(self.start_serving(game_instance))
+            finally:
+                started.set()
+            if result['ok']:
+                self.loop.run_forever()
+                # Dokończ obsługę połączeń przerwanych przez stop()
+                pending = asyncio.all_tasks(self.loop)
+                for task in pending:
+                    task.cancel()
+                self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            self.loop.close()
+
+        self._loop_thread = threading.Thread(target=run_loop)
+        self._loop_thread.daemon = True
+        self._loop_thread.start()
+        started.wait()
+        return result['ok']
+
+    async def start_serving(self, game_instance):
+        """Otwiera gniazdo nasłuchujące w bieżącej pętli zdarzeń"""
+        self.game_instance = game_instance
+        self.loop = asyncio.get_running_loop()
+        try:
+            self._server = await asyncio.start_server(
+                self._handle_connection, self.host, self.port,
+                backlog=self.backlog, reuse_address=True
+            )
+            self.running = True
+            if self.heartbeat_interval:
+                self._heartbeat_task = self.loop.create_task(self._heartbeat_loop())
+            print(f"🎮 Serwer gry (asyncio) uruchomiony na {self.host}:{self.port}")
+            if self.applies_actions:
+                self.commands.start(game_instance)
+            return True
+        except Exception as e:
+            print(f"❌ Błąd uruchamiania serwera: {e}")
+            return False
+
+    async def _heartbeat_loop(self):
+        """Okresowo pinguje klientów"""
+        while self.running:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                self._heartbeat_tick()
+            except Exception as e:
+                print(f"❌ Błąd pingowania klientów: {e}")
+
+    async def _handle_connection(self, reader, writer):
+        """Obsługuje komunikację z pojedynczym klientem"""
+        address = writer.get_extra_info('peername')
+        print(f"🔗 Nowe połączenie: {address}")
+        decoder = FrameDecoder(self.max_frame_size)
+        self.writers[writer] = AsyncClientWriter(
+            writer, OutboundQueue(self.outbound_limit),
+            lambda: self._disconnect_client(writer)
+        )
+        try:
+            while self.running:
+                data = await reader.read(RECV_BUFFER_SIZE)
+                if not data:
+                    break
+
+                for payload in decoder.feed(data):
+                    try:
+                        message = NetworkMessage.from_payload(payload)
+                    except MessageError as e:
+                        print(f"⚠️ Nieprawidłowa wiadomość od {address}: {e}")
+                        continue
+                    self._process_message(writer, message)
+
+        except FrameError as e:
+            print(f"❌ Błąd protokołu od {address}: {e}")
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        except Exception as e:
+            print(f"❌ Błąd obsługi klienta {address}: {e}")
+        finally:
+            self._disconnect_client(writer)
+
+    def _in_loop_thread(self):
+        """Czy wywołanie pochodzi z wątku pętli zdarzeń"""
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
+    def _broadcast_message(self, message: NetworkMessage, exclude=None):
+        """Rozgłasza wiadomość - bezpieczne także z wątku interfejsu"""
+        if self.loop and not self._in_loop_thread():
+            self.loop.call_soon_threadsafe(super()._broadcast_message, message, exclude)
+            return
+        super()._broadcast_message(message, exclude)
+
+    def _call_soon(self, func, *args):
+        """Wykonuje funkcję w wątku pętli zdarzeń (np. z wątku poleceń)"""
+        if self.loop and not self._in_loop_thread():
+            self.loop.call_soon_threadsafe(func, *args)
+            return
+        func(*args)
+
+    def publish_state(self):
+        """Rozsyła zmiany stanu - bezpieczne także z wątku interfejsu"""
+        if self.loop and not self._in_loop_thread():
+            self.loop.call_soon_threadsafe(super().publish_state)
+            return
+        super().publish_state()
+
+    def _close_connection(self, writer):
+        """Zamyka strumień klienta"""
+        super()._close_connection(writer)
+        try:
+            writer.close()
+        except Exception:
+            pass
+
+    def _shutdown(self):
+        """Rozłącza klientów i zatrzymuje pętlę (w wątku pętli)"""
+        self.running = False
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+        for writer in list(self.clients.keys()):
+            self._disconnect_client(writer)
+        if self._server:
+            self._server.close()
+        if self._loop_thread:
+            self.loop.stop()
+
+    def stop(self):
+        """Zatrzymuje serwer"""
+        if self.loop and self.loop.is_running() and not self._in_loop_thread():
+            self.loop.call_soon_threadsafe(self._shutdown)
+            if self._loop_thread:
+                self._loop_thread.join(timeout=5)
+        else:
+            self._shutdown()
+        self.commands.stop()
+        if self.journal:
+            self.journal.close()
+
+        print("🛑 Serwer gry zatrzymany")
+
+# Dostępne implementacje serwera (wybór przy hostowaniu gry)
+SERVER_BACKENDS = {
+    'threaded': GameServer,
+    'asyncio': AsyncGameServer,
+}
+
+def create_game_server(backend='threaded', host='localhost', port=8888, **kwargs):
+    """Tworzy serwer gry wybranego typu"""
+    if backend not in SERVER_BACKENDS:
+        raise ValueError(f"Nieznany typ serwera: {backend}")
+    return SERVER_BACKENDS[backend](host=host, port=port, **kwargs)
+
 class GameClient:
     """Klient do łączenia się z grą sieciową"""
 
@@ -279,12 +2037,28 @@ class GameClient:
         self.socket = None
         self.connected = False
         self.player_id = None
+        self.game_state = {}
+        self.state_version = None
+        self.encoding = ENCODING_JSON
+        self.compression_threshold = None
         self.game_instance = None
         self.receive_thread = None
-
-    def connect(self, host, port, player_name, game_instance):
-        """Łączy się z serwerem gry"""
+        self.send_lock = threading.Lock()
+        # Wznawianie sesji po zerwaniu połączenia
+        self.session_token = None
+        self.last_seq = None
+        self.auto_reconnect = True
+        self._connect_args = None
+        self._closing = False
+
+    def connect(self, host, port, player_name, game_instance, table_id=None, role='player',
+                encodings=SUPPORTED_ENCODINGS, compression=True):
+        """Łączy się z serwerem gry (table_id - stół na serwerze lobby,
+        role - 'player' albo 'spectator', encodings - obsługiwane kodowania,
+        compression - czy przyjmujemy ramki skompresowane zlib)"""
         self.game_instance = game_instance
+        self._connect_args = (host, port, player_name, table_id, role, tuple(encodings), compression)
+        self._closing = False
 
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -294,9 +2068,17 @@ class GameClient:
             print(f"🔗 Połączono z serwerem {host}:{port}")
 
             # Wyślij żądanie połączenia
+            connect_data = {'player_name': player_name, 'role': role, 'encodings': list(encodings),
+                            'compression': [ZLIB] if compression else []}
+            if table_id is not None:
+                connect_data['table_id'] = table_id
+            if self.session_token:
+                # Wznowienie: serwer odtworzy rozgłoszenia po last_seq
+                connect_data['session_token'] = self.session_token
+                connect_data['last_seq'] = self.last_seq
             connect_message = NetworkMessage(
                 type=MessageType.CONNECT,
-                data={'player_name': player_name}
+                data=connect_data
             )
             self._send_message(connect_message)
 
@@ -313,27 +2095,71 @@ class GameClient:
 
     def _receive_messages(self):
         """Nasłuchuje wiadomości od serwera"""
-        while self.connected:
+        sock = self.socket
+        decoder = FrameDecoder()
+        while self.connected and self.socket is sock:
             try:
-                data = self.socket.recv(4096).decode('utf-8')
+                data = sock.recv(RECV_BUFFER_SIZE)
                 if not data:
                     break
 
-                message = NetworkMessage.from_json(data)
-                self._process_server_message(message)
+                for payload in decoder.feed(data):
+                    try:
+                        message = NetworkMessage.from_payload(payload)
+                    except MessageError as e:
+                        print(f"⚠️ Nieprawidłowa wiadomość od serwera: {e}")
+                        continue
+                    if message.seq is not None:
+                        self.last_seq = max(self.last_seq or 0, message.seq)
+                    self._process_server_message(message)
 
             except Exception as e:
                 if self.connected:
                     print(f"❌ Błąd odbioru wiadomości: {e}")
                 break
 
+        if self.socket is not sock:
+            return  # połączenie zostało już zastąpione nowym
         self.connected = False
+        if not self._closing and self.auto_reconnect and self.session_token:
+            self.reconnect()
+
+    def reconnect(self, attempts=5, delay=1.0):
+        """Ponownie łączy się z serwerem, wznawiając sesję (z rosnącym odstępem prób)"""
+        if not self._connect_args:
+            return False
+        host, port, player_name, table_id, role, encodings, compression = self._connect_args
+        old_socket = self.socket
+        if old_socket:
+            try:
+                old_socket.close()
+            except OSError:
+                pass
+
+        for attempt in range(attempts):
+            if self._closing:
+                return False
+            print(f"🔄 Ponowne łączenie ({attempt + 1}/{attempts})...")
+            if self.connect(host, port, player_name, self.game_instance, table_id=table_id, role=role,
+                            encodings=encodings, compression=compression):
+                return True
+            if attempt + 1 < attempts:
+                time.sleep(delay * (2 ** attempt))
+        return False
 
     def _process_server_message(self, message: NetworkMessage):
         """Przetwarza wiadomość od serwera"""
         if message.type == MessageType.CONNECT:
             self.player_id = message.data.get('player_id')
-            print(f"✅ Połączono jako {self.player_id}")
+            self.encoding = negotiate_encoding([message.data.get('encoding')])
+            self.compression_threshold = message.data.get('compression_threshold')
+            if message.data.get('session_token'):
+                self.session_token = message.data['session_token']
+            if message.data.get('status') == 'resumed':
+                print(f"🔄 Wznowiono sesję jako {self.player_id}")
+            else:
+                self.last_seq = message.data.get('seq', self.last_seq)
+                print(f"✅ Połączono jako {self.player_id}")
 
         elif message.type == MessageType.GAME_STATE:
             self._handle_game_state_update(message.data)
@@ -343,18 +2169,56 @@ class GameClient:
 
         elif message.type == MessageType.PLAYER_LIST:
             print(f"👥 Gracze online: {len(message.data['players'])}")
+            self._notify_game(INBOX_PLAYERS, message.data['players'])
+
+        elif message.type == MessageType.ERROR:
+            print(f"⚠️ Serwer: {message.data.get('message')}")
+            self._notify_game(INBOX_ERROR, message.data)
+
+        elif message.type == MessageType.HEARTBEAT and 'ping' in message.data:
+            self._send_message(NetworkMessage(
+                type=MessageType.HEARTBEAT,
+                data={'pong': message.data['ping']},
+                player_id=self.player_id
+            ))
 
     def _handle_game_state_update(self, game_state):
-        """Obsługuje aktualizację stanu gry"""
-        if self.game_instance:
-            # TODO: Zaktualizować UI na podstawie stanu gry
-            pass
+        """Obsługuje aktualizację stanu gry (pełny stan albo delta)"""
+        if 'version' in game_state:
+            if game_state.get('full'):
+                self.game_state = game_state['state']
+                self.state_version = game_state['version']
+            elif self.state_version is None or self.state_version < game_state['base_version']:
+                # Luka w wersjach - poproś o synchronizację od posiadanej wersji
+                self._send_message(NetworkMessage(
+                    type=MessageType.SYNC_REQUEST,
+                    data={'version': self.state_version},
+                    player_id=self.player_id
+                ))
+                return
+            elif game_state['version'] > self.state_version:
+                apply_state_ops(self.game_state, game_state['ops'])
+                self.state_version = game_state['version']
+
+            self._send_message(NetworkMessage(
+                type=MessageType.STATE_ACK,
+                data={'version': self.state_version},
+                player_id=self.player_id
+            ))
+        else:
+            self.game_state = game_state
+
+        self._notify_game(INBOX_STATE, self.game_state)
 
     def _handle_player_action(self, message):
         """Obsługuje akcję innego gracza"""
-        if self.game_instance:
-            # TODO: Przekazać akcję do głównej instancji gry
-            pass
+        self._notify_game(INBOX_ACTION, message)
+
+    def _notify_game(self, kind, payload):
+        """Przekazuje zdarzenie do pętli interfejsu (ten wątek nie dotyka tkinter)"""
+        inbox = game_inbox(self.game_instance)
+        if inbox:
+            inbox.push(kind, payload)
 
     def send_action(self, action_type, action_data):
         """Wysyła akcję gracza do serwera"""
@@ -371,13 +2235,25 @@ class GameClient:
     def _send_message(self, message: NetworkMessage):
         """Wysyła wiadomość do serwera"""
         try:
-            self.socket.send(message.to_json().encode('utf-8'))
+            frame = message.to_frame(self.encoding, self.compression_threshold)
+            with self.send_lock:
+                self.socket.sendall(frame)
         except Exception as e:
             print(f"❌ Błąd wysyłania wiadomości: {e}")
-            self.disconnect()
+            if self._closing:
+                return
+            if self.auto_reconnect and self.session_token:
+                # Wątek odbioru zauważy zamknięcie i wznowi sesję
+                try:
+                    self.socket.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+            else:
+                self.disconnect()
 
     def disconnect(self):
         """Rozłącza się z serwerem"""
+        self._closing = True
         self.connected = False
 
         if self.socket:
@@ -388,6 +2264,7 @@ class GameClient:
                     player_id=self.player_id
                 )
                 self._send_message(disconnect_message)
+                self.socket.shutdown(socket.SHUT_RDWR)
                 self.socket.close()
             except:
                 pass
@@ -6,15 +6,36 @@ PRINCIPIA - Ulepszona wersja z wyraĹşnymi kartami akcji
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
-import csv
-import random
 import math
+import random
 import socket as socket_lib
-from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Tuple, Union
-from enum import Enum
+import contextlib
 from hex_research_system import HexResearchMap, HexMapWidget, HexPosition
-from network_game import GameServer, GameClient, NetworkMessage, MessageType
+from game_model import (
+    ActionType, GamePhase, ScientistType, ActionCard, Scientist, ResearchCard, GrantCard,
+    IntrigueCard, OpportunityCard, CrisisCard, Player, GameData, clone_state
+)
+from game_engine import (
+    GameEngine, RuleViolation, STATE_FIELDS, CHOICE_ACTIONS, Move, MOVE_PASS, MOVE_JOIN, MOVE_APPROVE,
+    MOVE_REJECT, MOVE_ADDITIONAL, MOVE_PLAY_CARD, MOVE_END_ACTION, MOVE_HIRE, MOVE_PUBLISH, MOVE_PLACE_HEX,
+    MOVE_INTRIGUE, MOVE_OPPORTUNITY, MOVE_COMPLETE_PROJECT, MOVE_NEXT_PHASE, MOVE_NEXT_ROUND,
+    MOVE_TAKE_GRANT, MOVE_SUBVENTION, intrigue_target, parse_project_requirements, parse_project_reward
+)
+from network_game import (
+    GameClient, SERVER_BACKENDS, create_game_server,
+    NetworkInbox, INBOX_TICK_MS, INBOX_ACTION, INBOX_STATE, INBOX_PLAYERS, INBOX_ERROR,
+    INBOX_LOG, INBOX_CRISIS, INBOX_GAME_OVER, INBOX_DONE
+)
+from game_journal import ActionJournal, host_journal_dir
+from game_ai import MCTSBot
+from game_policies import POLICIES, MovePolicy
+
+BOT_TICK_MS = 100        # co ile UI sprawdza, czy bot skoĹ„czyĹ‚ przeszukiwanie
+BOT_TIME_LIMIT = 1.0     # s na ruch gracza komputerowego MCTS
+HUMAN_SEAT = "CzĹ‚owiek"
+# Gracze komputerowi do wyboru: MCTS i szybkie strategie heurystyczne
+BOT_CHOICES = [MCTSBot.name] + [name for name, policy in POLICIES.items() if issubclass(policy, MovePolicy)]
 
 # Modern Design System
 class ModernTheme:
@@ -121,208 +142,6 @@ class ModernTheme:
 
         return base_style
 
-# Enums i staĹ‚e
-class ActionType(Enum):
-    PROWADZ_BADANIA = "PROWADĹą BADANIA"
-    ZATRUDNIJ = "ZATRUDNIJ PERSONEL"
-    PUBLIKUJ = "PUBLIKUJ"
-    FINANSUJ = "FINANSUJ PROJEKT"
-    ZARZADZAJ = "ZARZÄ„DZAJ"
-
-class GamePhase(Enum):
-    GRANTY = "Faza GrantĂłw"
-    AKCJE = "Faza Akcji"
-    PORZADKOWA = "Faza PorzÄ…dkowa"
-
-class ScientistType(Enum):
-    DOKTORANT = "Doktorant"
-    DOKTOR = "Doktor"
-    PROFESOR = "Profesor"
-
-@dataclass
-class ActionCard:
-    """Klasa reprezentujÄ…ca kartÄ™ akcji"""
-    action_type: ActionType
-    action_points: int
-    basic_action: str
-    additional_actions: List[Tuple[str, int]]  # (opis, koszt PA)
-    is_used: bool = False
-
-# Klasy danych (jak wczeĹ›niej)
-@dataclass
-class Scientist:
-    name: str
-    type: ScientistType
-    field: str
-    salary: int
-    hex_bonus: int
-    special_bonus: str
-    description: str
-    is_paid: bool = True
-
-@dataclass
-class ResearchCard:
-    name: str
-    field: str
-    hex_map: str
-    basic_reward: str
-    bonus_reward: str
-    description: str
-    hexes_placed: int = 0
-    max_hexes: int = 5
-    is_completed: bool = False
-    is_active: bool = False
-    hex_research_map: Optional['HexResearchMap'] = None
-    player_path: List = field(default_factory=list)  # Track player's hex path
-    player_color: str = ""  # Color of the player conducting this research
-
-    def __post_init__(self):
-        """Inicjalizuje mapÄ™ heksagonalnÄ… po utworzeniu obiektu"""
-        if self.hex_map and not self.hex_research_map:
-            try:
-                self.hex_research_map = HexResearchMap(self.hex_map)
-            except Exception as e:
-                print(f"BĹ‚Ä…d parsowania mapy heksagonalnej dla {self.name}: {e}")
-                # StwĂłrz prostÄ… mapÄ™ fallback
-                self.hex_research_map = HexResearchMap("START(0,0)->(1,0)->(2,0)->END(3,0)")
-
-@dataclass
-class JournalCard:
-    name: str
-    impact_factor: int
-    pb_cost: int
-    requirements: str
-    pz_reward: int
-    special_bonus: str
-    description: str
-
-@dataclass
-class GrantCard:
-    name: str
-    requirements: str
-    goal: str
-    reward: str
-    round_bonus: str
-    description: str
-    is_completed: bool = False
-
-@dataclass
-class InstituteCard:
-    name: str
-    starting_resources: str
-    starting_reputation: int
-    specialization_bonus: str
-    special_ability: str
-    description: str
-
-@dataclass
-class ConsortiumCard:
-    """Karta konsorcjum - pozwala rozpoczÄ…Ä‡ wielki projekt"""
-    name: str = "Karta Konsorcjum"
-    description: str = "UmoĹĽliwia rozpoczÄ™cie Wielkiego Projektu"
-    card_type: str = "KONSORCJUM"
-
-@dataclass
-class IntrigueEffect:
-    """Efekt karty intryg - metadane dla automatycznego wykonania"""
-    target_type: str     # "opponent", "all_opponents", "all_players", "self"
-    parameter: str       # "credits", "reputation", "prestige_points", "research_points", "hex_tokens", etc.
-    operation: str       # "subtract", "add", "set", "steal", "block", "copy", "reveal"
-    value: int = 0       # wartoĹ›Ä‡ liczbowa (jeĹ›li dotyczy)
-    special_type: str = ""  # typ specjalny: "scientist", "research_hex", "publication", "grant", "consortium", "card"
-    duration: int = 1    # czas trwania efektu w rundach (1 = natychmiastowy)
-    condition: str = ""  # dodatkowy warunek
-
-@dataclass
-class OpportunityEffect:
-    """Efekt karty okazji - metadane dla automatycznego wykonania"""
-    parameter: str       # "credits", "reputation", "prestige_points", "research_points", "hex_tokens", "action_points"
-    operation: str       # "add", "multiply", "set"
-    value: int = 0       # wartoĹ›Ä‡ liczbowa
-    special_type: str = ""  # typ specjalny: "scientist", "research_hex", "publication", "grant", "consortium", "card"
-    duration: int = 1    # czas trwania efektu w rundach (1 = natychmiastowy)
-    condition: str = ""  # dodatkowy warunek np. "Min. 1 publikacja"
-
-@dataclass
-class IntrigueCard:
-    """Karta intryg - pozwala oddziaĹ‚ywaÄ‡ na przeciwnikĂłw"""
-    name: str
-    effect: str
-    target: str  # "opponent", "all", "self" (backward compatibility)
-    description: str
-    effects: List[IntrigueEffect] = field(default_factory=list)  # nowa struktura efektĂłw
-    card_type: str = "INTRYGA"
-
-@dataclass
-class OpportunityCard:
-    """Karta okazji - daje rĂłĹĽne bonusy"""
-    name: str
-    bonus_type: str  # "credits", "research_points", "reputation", "hex", "action_points"
-    bonus_value: str
-    requirements: str
-    description: str
-    card_type: str = "OKAZJA"
-    effects: List[OpportunityEffect] = field(default_factory=list)  # nowa struktura efektĂłw
-
-@dataclass
-class CrisisCard:
-    """Karta kryzysu - globalny efekt natychmiastowy"""
-    name: str
-    effect: str
-    description: str
-    global_modifier: str  # Globalny modyfikator dla wszystkich graczy
-    card_type: str = "KRYZYS"
-
-@dataclass
-class ScenarioCard:
-    """Karta scenariusza - definiuje warunki gry"""
-    name: str
-    story_element: str  # Element fabularny
-    global_modifiers: str  # Globalne modyfikatory rozgrywki
-    max_rounds: int  # Maksymalna iloĹ›Ä‡ rund
-    victory_conditions: str  # Warunki zwyciÄ™stwa
-    crisis_count: int  # Ile kart kryzysĂłw dobieraÄ‡
-    crisis_rounds: List[int] = field(default_factory=list)  # W ktĂłrych rundach odkrywaÄ‡ kryzysy
-    description: str = ""
-
-@dataclass
-class LargeProject:
-    name: str
-    requirements: str
-    director_reward: str
-    member_reward: str
-    description: str
-    cost_pb: int = 20  # Koszt w punktach badawczych
-    cost_credits: int = 50  # Koszt w kredytach (w tysiÄ…cach)
-    contributed_pb: int = 0
-    contributed_credits: int = 0
-    director: Optional['Player'] = None
-    members: List['Player'] = field(default_factory=list)
-    pending_members: List['Player'] = field(default_factory=list)  # Gracze oczekujÄ…cy na akceptacjÄ™
-    is_completed: bool = False
-
-@dataclass
-class Player:
-    name: str
-    color: str
-    institute: Optional[InstituteCard] = None
-    credits: int = 0
-    prestige_points: int = 0
-    research_points: int = 0
-    reputation: int = 3
-    scientists: List[Scientist] = field(default_factory=list)
-    active_research: List[ResearchCard] = field(default_factory=list)
-    completed_research: List[ResearchCard] = field(default_factory=list)
-    hand_cards: List[Union[ResearchCard, ConsortiumCard, IntrigueCard, OpportunityCard]] = field(default_factory=list)
-    current_grant: Optional[GrantCard] = None
-    hex_tokens: int = 20
-    action_cards: List[ActionCard] = field(default_factory=list)
-    publications: int = 0
-    activity_points: int = 0
-    round_activity_points: int = 0
-    has_passed: bool = False
-    publication_history: List[JournalCard] = field(default_factory=list)  # Historia publikacji
-
 class ActionCardWidget(tk.Frame):
     """Widget reprezentujÄ…cy kartÄ™ akcji"""
 
@@ -404,521 +223,6 @@ class ActionCardWidget(tk.Frame):
             widget.destroy()
         self.setup_ui()
 
-class GameData:
-    """Klasa do zarzÄ…dzania danymi gry"""
-    def __init__(self):
-        self.scientists = []
-        self.research_cards = []
-        self.journals = []
-        self.grants = []
-        self.institutes = []
-        self.large_projects = []
-        self.consortium_cards = []
-        self.intrigue_cards = []
-        self.opportunity_cards = []
-        self.main_deck = []  # Zmieszana talia wszystkich kart rÄ™ki
-        self.scenarios = []
-        self.crisis_cards = []
-        self.active_scenario = None
-        self.crisis_deck = []  # Talia kryzysĂłw dla aktualnego scenariusza
-        self.current_round = 1
-        self.revealed_crises = []  # Aktywne kryzysy na planszy
-
-    def safe_int_parse(self, value: str, default: int = 0) -> int:
-        """Bezpiecznie parsuje int"""
-        try:
-            if isinstance(value, str):
-                clean_value = ''.join(c for c in value if c.isdigit())
-                return int(clean_value) if clean_value else default
-            return int(value)
-        except (ValueError, TypeError):
-            return default
-
-    def load_data(self):
-        """GĹ‚Ăłwna metoda Ĺ‚adowania danych gry"""
-        try:
-            # PrĂłbuj zaĹ‚adowaÄ‡ dane z CSV
-            # (w przyszĹ‚oĹ›ci moĹĽna tutaj dodaÄ‡ Ĺ‚adowanie z plikĂłw CSV)
-
-            # Na razie uĹĽywamy danych fallback
-            self.load_fallback_data()
-
-        except Exception as e:
-            print(f"BĹ‚Ä…d Ĺ‚adowania danych: {e}")
-            self.load_fallback_data()
-
-    def create_action_cards(self) -> List[ActionCard]:
-        """Tworzy standardowy zestaw 5 kart akcji"""
-        return [
-            ActionCard(
-                action_type=ActionType.PROWADZ_BADANIA,
-                action_points=3,
-                basic_action="Aktywuj 1 doktoranta â†’ +1 heks na badanie",
-                additional_actions=[
-                    ("Aktywuj doktora â†’ +2 heksy na badanie", 2),
-                    ("Aktywuj profesora â†’ +3 heksy na badanie", 2),
-                    ("Rozpocznij nowe badanie â†’ wyĹ‚ĂłĹĽ kartÄ™ z rÄ™ki", 1)
-                ]
-            ),
-            ActionCard(
-                action_type=ActionType.ZATRUDNIJ,
-                action_points=3,
-                basic_action="WeĹş 1K z banku",
-                additional_actions=[
-                    ("Zatrudnij doktora z rynku â†’ pensja 2K/rundÄ™", 2),
-                    ("Zatrudnij profesora z rynku â†’ pensja 3K/rundÄ™", 3),
-                    ("Zatrudnij doktoranta â†’ brak pensji", 1),
-                    ("Kup kartÄ™ 'Projekty Badawcze' â†’ 2 PB", 1),
-                    ("Kup kartÄ™ 'MoĹĽliwoĹ›ci' â†’ 1 PB", 1)
-                ]
-            ),
-            ActionCard(
-                action_type=ActionType.PUBLIKUJ,
-                action_points=2,
-                basic_action="Opublikuj 1 artykuĹ‚",
-                additional_actions=[
-                    ("WeĹş 3K z banku", 1),
-                    ("Kup kartÄ™ 'MoĹĽliwoĹ›ci' â†’ 1 PB", 1),
-                    ("Konsultacje komercyjne â†’ aktywuj profesora za 4K", 1)
-                ]
-            ),
-            ActionCard(
-                action_type=ActionType.FINANSUJ,
-                action_points=3,
-                basic_action="WeĹş 2K z banku",
-                additional_actions=[
-                    ("WpĹ‚aÄ‡ do konsorcjum â†’ 1 PB lub 3K na wybrany projekt", 1),
-                    ("ZaĹ‚ĂłĹĽ konsorcjum â†’ zagraj kartÄ™ konsorcjum z rÄ™ki", 1),
-                    ("Kredyt awaryjny â†’ +5K, ale -1 Reputacja", 2)
-                ]
-            ),
-            ActionCard(
-                action_type=ActionType.ZARZADZAJ,
-                action_points=2,
-                basic_action="WeĹş 2K z banku",
-                additional_actions=[
-                    ("OdĹ›wieĹĽ rynek â†’ czasopisma lub badania", 2),
-                    ("Kampania PR â†’ wydaj 4K za +1 Reputacja", 1),
-                    ("Poprawa wizerunku â†’ wydaj 2 PB za +1 Reputacja", 1)
-                ]
-            )
-        ]
-
-    def load_research_from_csv(self):
-        """Wczytuje karty badaĹ„ z pliku CSV"""
-        self.research_cards = []
-        with open('karty_badan.csv', 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                card = ResearchCard(
-                    name=row['Nazwa'],
-                    field=row['Dziedzina'],
-                    hex_map=row['Mapa_Heksagonalna'],
-                    basic_reward=row['Nagroda_Podstawowa'],
-                    bonus_reward=row['Nagroda_Dodatkowa'],
-                    description=row['Opis']
-                )
-                self.research_cards.append(card)
-
-    def load_scientists_from_csv(self):
-        """Wczytuje naukowcĂłw z pliku CSV"""
-        self.scientists = []
-        with open('karty_naukowcy.csv', 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                scientist_type = ScientistType.DOKTORANT if 'doktorant' in row['Typ'].lower() else \
-                               ScientistType.DOKTOR if 'doktor' in row['Typ'].lower() else \
-                               ScientistType.PROFESOR
-
-                scientist = Scientist(
-                    name=row['ImiÄ™ i Nazwisko'],
-                    type=scientist_type,
-                    field=row['Dziedzina'],
-                    salary=self.safe_int_parse(row['Pensja']),
-                    hex_bonus=self.safe_int_parse(row['Bonus HeksĂłw']),
-                    special_bonus=row['Specjalny Bonus'],
-                    description=row['Opis']
-                )
-                self.scientists.append(scientist)
-
-    def load_journals_from_csv(self):
-        """Wczytuje czasopisma z pliku CSV"""
-        self.journals = []
-        with open('karty_czasopisma.csv', 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                journal = JournalCard(
-                    name=row['Nazwa'],
-                    impact_factor=self.safe_int_parse(row['Impact_Factor']),
-                    pb_cost=self.safe_int_parse(row['Koszt_PB']),
-                    requirements=row['Wymagania'],
-                    pz_reward=self.safe_int_parse(row['Nagroda_PZ']),
-                    special_bonus=row['Specjalny_Bonus'],
-                    description=row['Opis']
-                )
-                self.journals.append(journal)
-
-    def load_grants_from_csv(self):
-        """Wczytuje granty z pliku CSV"""
-        self.grants = []
-        with open('karty_granty.csv', 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                grant = GrantCard(
-                    name=row['Nazwa'],
-                    requirements=row['Wymagania'],
-                    goal=row['Cel'],
-                    reward=row['Nagroda'],
-                    round_bonus=row['Runda_Bonus'],
-                    description=row['Opis']
-                )
-                self.grants.append(grant)
-
-    def load_large_projects_from_csv(self):
-        """Wczytuje wielkie projekty z pliku CSV"""
-        self.large_projects = []
-        with open('karty_wielkie_projekty.csv', 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                project = LargeProject(
-                    name=row['Nazwa'],
-                    requirements=row['Wymagania'],
-                    director_reward=row['Nagroda_Kierownika'],
-                    member_reward=row['Nagroda_CzĹ‚onkĂłw'],
-                    description=row['Opis']
-                )
-                self.large_projects.append(project)
-
-    def load_scenarios_from_csv(self):
-        """Wczytuje scenariusze z pliku CSV"""
-        self.scenarios = []
-        try:
-            with open('karty_scenariusze.csv', 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    # Parse crisis rounds from description or default values
-                    crisis_rounds = [3, 5, 7]  # Default pattern
-                    crisis_count = 3  # Default count
-                    max_rounds = 8  # Default rounds
-
-                    scenario = ScenarioCard(
-                        name=row['Nazwa'],
-                        story_element=row['Opis_Motywacyjny'],
-                        global_modifiers=row['Modyfikator_Punktacji'],
-                        max_rounds=max_rounds,
-                        victory_conditions=row['Warunek_KoĹ„ca'],
-                        crisis_count=crisis_count,
-                        crisis_rounds=crisis_rounds,
-                        description=f"Scenariusz: {row['Nazwa']}"
-                    )
-                    self.scenarios.append(scenario)
-        except FileNotFoundError:
-            print("Nie znaleziono pliku karty_scenariusze.csv")
-        except Exception as e:
-            print(f"BĹ‚Ä…d wczytywania scenariuszy: {e}")
-
-    def load_data(self):
-        """Wczytuje dane gry"""
-        try:
-            # Wczytaj wszystkie dane z CSV
-            self.load_research_from_csv()
-            print("Wczytano karty badaĹ„ z CSV")
-
-            self.load_scientists_from_csv()
-            print("Wczytano naukowcĂłw z CSV")
-
-            self.load_journals_from_csv()
-            print("Wczytano czasopisma z CSV")
-
-            self.load_grants_from_csv()
-            print("Wczytano granty z CSV")
-
-            self.load_large_projects_from_csv()
-            print("Wczytano wielkie projekty z CSV")
-
-            self.load_scenarios_from_csv()
-            print("Wczytano scenariusze z CSV")
-
-            # Dla pozostaĹ‚ych danych uĹĽyj przykĹ‚adowych (na razie)
-            self.load_fallback_data()
-
-        except Exception as e:
-            print(f"BĹ‚Ä…d wczytywania CSV: {e}, uĹĽywam danych przykĹ‚adowych")
-            self.load_fallback_data()
-
-    def load_fallback_data(self):
-        # StwĂłrz przykĹ‚adowych naukowcĂłw tylko jeĹ›li nie zostali wczytani z CSV
-        if not hasattr(self, 'scientists') or not self.scientists:
-            self.scientists = [
-                Scientist("Dr Jan Kowalski", ScientistType.DOKTOR, "Fizyka", 2000, 2, "+1PB przy publikacji", "Fizyk teoretyczny"),
-                Scientist("Prof. Anna Nowak", ScientistType.PROFESOR, "Fizyka", 3000, 3, "+2K za badanie", "Ekspert w fizyce kwantowej"),
-                Scientist("Dr Maria WiĹ›niewska", ScientistType.DOKTOR, "Biologia", 2000, 2, "+1PB przy publikacji", "Biolog molekularny"),
-                Scientist("Prof. Piotr ZieliĹ„ski", ScientistType.PROFESOR, "Chemia", 3000, 3, "+1 heks przy badaniach", "Chemik organiczny"),
-                Scientist("Dr Tomasz Nowicki", ScientistType.DOKTOR, "Fizyka", 2000, 2, "Konsorcja -1 PA", "Specjalista detektorĂłw"),
-                Scientist("Prof. Ewa Kowalska", ScientistType.PROFESOR, "Biologia", 3000, 3, "+3K za badanie", "Genetyk")
-            ]
-
-        # NIE nadpisuj research_cards - zostaw te z CSV
-        # JeĹ›li research_cards nie zostaĹ‚y wczytane, stwĂłrz przykĹ‚adowe
-        try:
-            if not hasattr(self, 'research_cards') or not self.research_cards:
-                self.research_cards = [
-                    ResearchCard("Bozon Higgsa", "Fizyka", "simple", "4 PB, 2 PZ", "Publikacja w Nature", "Poszukiwanie czÄ…stki Boga", max_hexes=6),
-                    ResearchCard("Algorytm Deep Learning", "Fizyka", "simple", "3 PB, 2 PZ", "+1K za publikacjÄ™", "Sztuczna inteligencja", max_hexes=4),
-                    ResearchCard("Synteza Organiczna", "Chemia", "simple", "2 PB, 3 PZ", "DostÄ™p do grantĂłw", "Nowe zwiÄ…zki chemiczne", max_hexes=5),
-                    ResearchCard("Terapia Genowa", "Biologia", "simple", "5 PB, 4 PZ", "10K natychmiast", "Leczenie genĂłw", max_hexes=7),
-                    ResearchCard("Teoria Strun", "Fizyka", "simple", "6 PB, 3 PZ", "DostÄ™p do Uniwersum", "Unifikacja siĹ‚", max_hexes=8),
-                    ResearchCard("Superprzewodnik", "Fizyka", "simple", "2 PB, 2 PZ", "+3K za badanie", "Zerowa rezystancja", max_hexes=4),
-                    ResearchCard("Fuzja JÄ…drowa", "Fizyka", "simple", "5 PB, 4 PZ", "10K + energia", "Reaktor fuzji", max_hexes=6),
-                    ResearchCard("NanomateriaĹ‚y", "Chemia", "simple", "4 PB, 3 PZ", "Specjalne wĹ‚aĹ›ciwoĹ›ci", "Rewolucyjne materiaĹ‚y", max_hexes=5)
-                ]
-
-                # StwĂłrz czasopisma tylko jeĹ›li nie zostaĹ‚y wczytane z CSV
-                if not hasattr(self, 'journals') or not self.journals:
-                    self.journals = [
-                        JournalCard("Nature", 10, 15, "Reputacja 4+", 5, "PrestiĹĽ miÄ™dzynarodowy", "Najlepsze czasopismo Ĺ›wiata"),
-                        JournalCard("Science", 9, 14, "Reputacja 4+", 5, "DostÄ™p do konferencji", "AmerykaĹ„ski odpowiednik Nature"),
-                        JournalCard("Physical Review", 8, 12, "1 badanie fizyczne", 4, "WspĂłĹ‚praca fizyczna", "Czasopismo fizyczne"),
-                        JournalCard("Cell", 8, 12, "1 badanie biologiczne", 4, "PrzeĹ‚om medyczny", "Czasopismo biologiczne"),
-                        JournalCard("Journal of Chemistry", 7, 10, "1 badanie chemiczne", 4, "Innowacje chemiczne", "Czasopismo chemiczne"),
-                        JournalCard("Local Journal", 3, 5, "Brak", 2, "Brak", "Lokalne czasopismo"),
-                        JournalCard("Research Today", 4, 6, "Brak", 2, "DostÄ™p do sieci", "OgĂłlne czasopismo"),
-                        JournalCard("Innovation Weekly", 5, 8, "1 publikacja", 3, "Networking", "Czasopismo innowacji")
-                    ]
-
-                # StwĂłrz granty tylko jeĹ›li nie zostaĹ‚y wczytane z CSV
-                if not hasattr(self, 'grants') or not self.grants:
-                    self.grants = [
-                        GrantCard("Grant Startup", "Brak wymagaĹ„", "10 punktĂłw aktywnoĹ›ci", "8K", "+2K/rundÄ™", "Grant dla poczÄ…tkujÄ…cych"),
-                        GrantCard("Grant Badawczy", "Min. 1 doktor", "2 publikacje", "12K", "+2K/rundÄ™", "Standardowy grant badawczy"),
-                        GrantCard("Grant Fizyczny", "Spec. Fizyka", "1 badanie fizyczne", "14K", "+2K/rundÄ™", "Grant dla fizykĂłw"),
-                        GrantCard("Grant Biologiczny", "Spec. Biologia", "1 badanie biologiczne", "14K", "+2K/rundÄ™", "Grant dla biologĂłw"),
-                        GrantCard("Grant Chemiczny", "Spec. Chemia", "1 badanie chemiczne", "14K", "+2K/rundÄ™", "Grant dla chemikĂłw"),
-                        GrantCard("Grant PrestiĹĽowy", "Reputacja 4+", "Publikacja w Nature", "18K", "+2K/rundÄ™", "Elitarny grant"),
-                        GrantCard("Grant WspĂłĹ‚pracy", "Brak", "ZaĹ‚ĂłĹĽ konsorcjum", "15K", "+2K/rundÄ™", "Grant na wspĂłĹ‚pracÄ™"),
-                        GrantCard("Grant Kryzysowy", "Brak", "Utrzymaj pensje", "10K", "+2K/rundÄ™", "Grant awaryjny"),
-                        GrantCard("Grant Technologiczny", "Min. 1 profesor", "2 ukoĹ„czone badania", "16K", "+2K/rundÄ™", "Grant technologiczny"),
-                        GrantCard("Grant Interdyscyplinarny", "2 rĂłĹĽne dziedziny", "1 badanie z kaĹĽdej dziedziny", "24K", "+2K/rundÄ™", "Grant interdyscyplinarny")
-                    ]
-
-            # StwĂłrz instytuty (zawsze)
-            self.institutes = [
-                InstituteCard("MIT", "8K, 2 PZ", 3, "+1 heks przy fizyce", "4. naukowiec bez kary", "CzoĹ‚owa uczelnia techniczna"),
-                InstituteCard("CERN", "6K, 4 PZ", 3, "Konsorcja -1 PA", "Granty konsorcjĂłw zawsze dostÄ™pne", "NajwiÄ™ksze lab fizyki"),
-                InstituteCard("Max Planck", "7K, 3 PZ", 3, "+1 PB za badanie", "Limit rÄ™ki +2", "Niemiecki instytut badawczy"),
-                InstituteCard("Harvard University", "10K, 1 PZ", 3, "+1 Rep za publikacjÄ™ IF 6+", "5. naukowiec bez kary", "PrestiĹĽowa uczelnia"),
-                InstituteCard("Cambridge", "7K, 3 PZ", 4, "+2K za badanie", "Wszystkie publikacje +1 PZ", "Brytyjska tradycja"),
-                InstituteCard("Stanford", "9K, 2 PZ", 3, "+1 heks fizyka", "Karty Okazji podwĂłjne bonusy", "Dolina Krzemowa")
-            ]
-
-            # StwĂłrz Wielkie Projekty tylko jeĹ›li nie zostaĹ‚y wczytane z CSV
-            if not hasattr(self, 'large_projects') or not self.large_projects:
-                self.large_projects = [
-                LargeProject(
-                        name="FUZJA JÄ„DROWA",
-                        requirements="22 PB + 20K + 2 ukoĹ„czone badania fizyczne",
-                        director_reward="+10 PZ + wszystkie akcje kosztujÄ… -1 PA",
-                        member_reward="+4 PZ kaĹĽdy",
-                        description="Reaktor fuzji jÄ…drowej - przeĹ‚om energetyczny"
-                    ),
-                    LargeProject(
-                        name="SUPERPRZEWODNIK",
-                        requirements="18 PB + 25K + 2 ukoĹ„czone badania fizyczne",
-                        director_reward="+8 PZ + karta Superprzewodnik",
-                        member_reward="+3 PZ kaĹĽdy",
-                        description="MateriaĹ‚ o zerowej rezystancji"
-                    ),
-                    LargeProject(
-                        name="TERAPIA GENOWA",
-                        requirements="15 PB + 30K + 1 profesor + 1 badanie biologiczne",
-                        director_reward="+6 PZ + karta Terapia genowa",
-                        member_reward="+2 PZ + 5K kaĹĽdy",
-                        description="Uniwersalna terapia genowa"
-                    ),
-                    LargeProject(
-                        name="EKSPLORACJA MARSA",
-                        requirements="20 PB + 35K + 3 ukoĹ„czone badania",
-                        director_reward="+7 PZ + dostÄ™p do Mars Journal",
-                        member_reward="+3 PZ + 1 dodatkowa karta",
-                        description="Pierwsza staĹ‚a baza na Marsie"
-                    ),
-                    LargeProject(
-                        name="NANOMATERIAĹY",
-                        requirements="16 PB + 15K + 2 badania chemiczne + 1 fizyczne",
-                        director_reward="+5 PZ + granty chemiczne +3K",
-                        member_reward="+2 PZ + ochrona przed kryzysem",
-                        description="Rewolucyjne nanomateriaĹ‚y"
-                )
-            ]
-
-            print("Dane gry zaĹ‚adowane pomyĹ›lnie!")
-
-        except Exception as e:
-            print(f"BĹ‚Ä…d podczas wczytywania danych: {e}")
-
-        # StwĂłrz karty konsorcjĂłw (15 sztuk) - zawsze
-        if not hasattr(self, 'consortium_cards') or not self.consortium_cards:
-            self.consortium_cards = [ConsortiumCard() for _ in range(15)]
-
-        # StwĂłrz karty intryg (20 sztuk) - zawsze
-        if not hasattr(self, 'intrigue_cards') or not self.intrigue_cards:
-            self.intrigue_cards = [
-                IntrigueCard("SabotaĹĽ", "Przeciwnik traci 1 heks z badania", "opponent", "ZakĹ‚Ăłcenie prac badawczych przeciwnika",
-                    [IntrigueEffect("opponent", "research_hex", "subtract", 1, "research_hex")]),
-
-                IntrigueCard("Szpiegostwo", "Skopiuj kartÄ™ badania przeciwnika", "opponent", "KradzieĹĽ pomysĹ‚Ăłw naukowych",
-                    [IntrigueEffect("opponent", "research_card", "copy", 1, "research_card")]),
-
-                IntrigueCard("Skandal", "Przeciwnik traci 1 punkt reputacji", "opponent", "Ujawnienie kompromitujÄ…cych faktĂłw",
-                    [IntrigueEffect("opponent", "reputation", "subtract", 1)]),
-
-                IntrigueCard("Poaching", "Przejmij naukowca od przeciwnika", "opponent", "Przeteapranie cennego pracownika",
-                    [IntrigueEffect("opponent", "scientist", "steal", 1, "scientist")]),
-
-                IntrigueCard("Blokada grantu", "Zablokuj grant przeciwnika na 1 rundÄ™", "opponent", "Lobbowanie przeciw konkurencji",
-                    [IntrigueEffect("opponent", "grant", "block", 1, "grant", 1)]),
-
-                IntrigueCard("PrzejÄ™cie publikacji", "Przejmij pierwszeĹ„stwo publikacji", "opponent", "Szybsza publikacja tego samego tematu",
-                    [IntrigueEffect("opponent", "publication", "steal", 1, "publication")]),
-
-                IntrigueCard("Audit finansowy", "Przeciwnik traci 3K", "opponent", "Nieprzewidziane koszty kontroli",
-                    [IntrigueEffect("opponent", "credits", "subtract", 3000)]),
-
-                IntrigueCard("Atak hakera", "Przeciwnik traci 2 PB", "opponent", "Cyberatak na systemy badawcze",
-                    [IntrigueEffect("opponent", "research_points", "subtract", 2)]),
-
-                IntrigueCard("Kryzys wizerunkowy", "Wszystkich przeciwnikĂłw -1 reputacja", "all", "Skandal dotyczÄ…cy caĹ‚ej branĹĽy",
-                    [IntrigueEffect("all_opponents", "reputation", "subtract", 1)]),
-
-                IntrigueCard("MiÄ™dzynarodowy bojkot", "Wszyscy tracÄ… dostÄ™p do konsorcjĂłw na rundÄ™", "all", "Polityczny kryzys naukowy",
-                    [IntrigueEffect("all_players", "consortium_access", "block", 1, "consortium", 1)]),
-
-                IntrigueCard("KradzieĹĽ IP", "Skopiuj kartÄ™ okazji przeciwnika", "opponent", "PrzemysĹ‚owe szpiegostwo",
-                    [IntrigueEffect("opponent", "opportunity_card", "copy", 1, "opportunity_card")]),
-
-                IntrigueCard("Podkupstwo", "Przejmij czĹ‚onkostwo w konsorcjum", "opponent", "Nieczyste zagrania finansowe",
-                    [IntrigueEffect("opponent", "consortium_membership", "steal", 1, "consortium")]),
-
-                IntrigueCard("Dezinformacja", "Przeciwnik nie moĹĽe publikowaÄ‡ przez rundÄ™", "opponent", "FaĹ‚szywe doniesienia o wynikach",
-                    [IntrigueEffect("opponent", "publication_ability", "block", 1, "publication", 1)]),
-
-                IntrigueCard("Przeciek", "Ujawnij rÄ™kÄ™ przeciwnika", "opponent", "Wyciek poufnych informacji",
-                    [IntrigueEffect("opponent", "hand_cards", "reveal", 0, "cards")]),
-
-                IntrigueCard("Awaria sprzÄ™tu", "Przeciwnik traci 2 heksy z aktywnego badania", "opponent", "SabotaĹĽ laboratorium",
-                    [IntrigueEffect("opponent", "research_hex", "subtract", 2, "research_hex")]),
-
-                IntrigueCard("Strajk pracownikĂłw", "Przeciwnik traci akcjÄ™ na rundÄ™", "opponent", "Niepokoje spoĹ‚eczne w instytucie",
-                    [IntrigueEffect("opponent", "action_ability", "block", 1, "action", 1)]),
-
-                IntrigueCard("Epidemia", "Wszyscy tracÄ… po 1 naukowcu", "all", "Choroba dziesiÄ…tkuje kadry naukowe",
-                    [IntrigueEffect("all_players", "scientist", "subtract", 1, "scientist")]),
-
-                IntrigueCard("Kryzys energetyczny", "Wszyscy tracÄ… 2K", "all", "RosnÄ…ce koszty energii",
-                    [IntrigueEffect("all_players", "credits", "subtract", 2000)]),
-
-                IntrigueCard("Oszustwo naukowe", "Przeciwnik traci jednÄ… publikacjÄ™", "opponent", "Ujawnienie faĹ‚szowanych danych",
-                    [IntrigueEffect("opponent", "publications", "subtract", 1)]),
-
-                IntrigueCard("Afera korupcyjna", "Przeciwnik traci aktualny grant", "opponent", "Skandal finansowy w instytucie",
-                    [IntrigueEffect("opponent", "current_grant", "remove", 1, "grant")])
-            ]
-
-        # StwĂłrz karty okazji (10 sztuk) - zawsze
-        if not hasattr(self, 'opportunity_cards') or not self.opportunity_cards:
-            self.opportunity_cards = [
-                OpportunityCard("Niespodziana dotacja", "credits", "5K", "Brak", "RzÄ…dowe wsparcie dla nauki", "OKAZJA", [
-                    OpportunityEffect("credits", "add", 5000, condition="Brak")
-                ]),
-                OpportunityCard("Odkrycie w laboratorium", "research_points", "3PB", "Brak", "Przypadkowe odkrycie podczas rutynowych badaĹ„", "OKAZJA", [
-                    OpportunityEffect("research_points", "add", 3, condition="Brak")
-                ]),
-                OpportunityCard("Nagroda naukowa", "reputation", "2", "Min. 1 publikacja", "PrestiĹĽowe wyrĂłĹĽnienie za osiÄ…gniÄ™cia", "OKAZJA", [
-                    OpportunityEffect("reputation", "add", 2, condition="Min. 1 publikacja")
-                ]),
-                OpportunityCard("Dodatkowe finansowanie", "credits", "7K", "Aktywne badanie", "Dofinansowanie trwajÄ…cego projektu", "OKAZJA", [
-                    OpportunityEffect("credits", "add", 7000, condition="Aktywne badanie")
-                ]),
-                OpportunityCard("PrzeĹ‚om metodologiczny", "hex_tokens", "2", "Aktywne badanie", "Nowa metoda przyspiesza badania", "OKAZJA", [
-                    OpportunityEffect("hex_tokens", "add", 2, condition="Aktywne badanie")
-                ]),
-                OpportunityCard("WspĂłĹ‚praca miÄ™dzynarodowa", "action_points", "2", "Reputacja 3+", "Dodatkowe moĹĽliwoĹ›ci dziaĹ‚ania", "OKAZJA", [
-                    OpportunityEffect("action_points", "add", 2, condition="Reputacja 3+")
-                ]),
-                OpportunityCard("Patent komercyjny", "credits", "10K", "UkoĹ„czone badanie", "SprzedaĹĽ praw do wynalazku", "OKAZJA", [
-                    OpportunityEffect("credits", "add", 10000, condition="UkoĹ„czone badanie")
-                ]),
-                OpportunityCard("Visiting professor", "research_points", "5PB", "Min. 1 profesor", "Wizyta wybitnego naukowca", "OKAZJA", [
-                    OpportunityEffect("research_points", "add", 5, condition="Min. 1 profesor")
-                ]),
-                OpportunityCard("Technologiczny venture", "credits", "8K", "Badanie chemiczne lub fizyczne", "Inwestycja w start-up", "OKAZJA", [
-                    OpportunityEffect("credits", "add", 8000, condition="Badanie chemiczne lub fizyczne")
-                ]),
-                OpportunityCard("SzczÄ™Ĺ›liwy przypadek", "research_points", "4PB", "Brak", "Nieoczekiwane odkrycie", "OKAZJA", [
-                    OpportunityEffect("research_points", "add", 4, condition="Brak")
-                ])
-            ]
-
-        # StwĂłrz scenariusze fallback tylko jeĹ›li nie wczytano z CSV
-        if not hasattr(self, 'scenarios') or not self.scenarios:
-            print("UĹĽywam domyĹ›lnego scenariusza fallback")
-            self.scenarios = [
-                ScenarioCard(
-                    name="Podstawowy Scenariusz",
-                    story_element="Standardowa rozgrywka naukowa bez specjalnych modyfikatorĂłw.",
-                    global_modifiers="Brak modyfikatorĂłw",
-                    max_rounds=8,
-                    victory_conditions="100 PZ",
-                    crisis_count=2,
-                    crisis_rounds=[4, 7],
-                    description="DomyĹ›lny scenariusz uĹĽywany gdy CSV nie jest dostÄ™pny."
-                )
-            ]
-
-        # StwĂłrz karty kryzysĂłw - zawsze
-        if not hasattr(self, 'crisis_cards') or not self.crisis_cards:
-            self.crisis_cards = [
-                CrisisCard("Krach Finansowy", "Wszyscy gracze tracÄ… 50% kredytĂłw",
-                          "Globalny kryzys ekonomiczny wpĹ‚ywa na finansowanie nauki", "Kredyty: -50%"),
-                CrisisCard("Cyberatak", "Wszyscy gracze tracÄ… 2 PB",
-                          "Hakerzy zaatakowali systemy badawcze na caĹ‚ym Ĺ›wiecie", "Badania: -2 PB"),
-                CrisisCard("Pandemia", "Wszyscy gracze tracÄ… 1 naukowca (losowo)",
-                          "Choroba dziesiÄ…tkuje kadry naukowe", "Personel: -1 naukowiec"),
-                CrisisCard("Protest SpoĹ‚eczny", "Wszyscy gracze: -1 Reputacja",
-                          "SpoĹ‚eczeĹ„stwo protestuje przeciwko niektĂłrym badaniom", "Reputacja: -1"),
-                CrisisCard("Kryzys Energetyczny", "Wszystkie akcje kosztujÄ… +1 PA",
-                          "Niedobory energii spowalniajÄ… wszystkie dziaĹ‚ania", "Akcje: +1 PA"),
-                CrisisCard("Regulacje Prawne", "Nowe badania kosztujÄ… +2K",
-                          "Nowe przepisy zwiÄ™kszajÄ… koszty rozpoczynania badaĹ„", "Badania: +2K koszt"),
-                CrisisCard("Strajk PracownikĂłw", "Pensje naukowcĂłw podwojone na 2 rundy",
-                          "Naukowcy domagajÄ… siÄ™ wyĹĽszych pensji", "Pensje: x2 przez 2 rundy"),
-                CrisisCard("Katastrofa Naturalna", "Wszyscy gracze tracÄ… 1 aktywne badanie",
-                          "KlÄ™ska ĹĽywioĹ‚owa niszczy laboratoria", "Badania: -1 aktywne"),
-                CrisisCard("Skandal Korupcyjny", "Gracz z najwyĹĽszÄ… reputacjÄ… traci 2 punkty",
-                          "Ujawniono aferÄ™ w najwiÄ™kszej instytucji", "Lider: -2 Reputacja"),
-                CrisisCard("Wojna Handlowa", "Konsorcja miÄ™dzynarodowe: +3K koszt doĹ‚Ä…czenia",
-                          "Konflikty geopolityczne utrudniajÄ… wspĂłĹ‚pracÄ™", "Konsorcja: +3K"),
-                CrisisCard("Kryzys Zaufania", "Publikacje: -1 PZ przez 2 rundy",
-                          "SpoĹ‚eczeĹ„stwo traci zaufanie do nauki", "Publikacje: -1 PZ"),
-                CrisisCard("NiedobĂłr MateriaĹ‚Ăłw", "Wszystkie zakupy kosztujÄ… +1K",
-                          "Problemy z Ĺ‚aĹ„cuchem dostaw zwiÄ™kszajÄ… koszty", "Zakupy: +1K"),
-                CrisisCard("Exodus TalentĂłw", "KaĹĽdy gracz moĹĽe straciÄ‡ 1 profesora (50% szans)",
-                          "Najlepsi naukowcy emigrujÄ… za granicÄ™", "Profesorowie: 50% utraty"),
-                CrisisCard("Kryzys Polityczny", "Granty rzÄ…dowe niedostÄ™pne przez 2 rundy",
-                          "NiestabilnoĹ›Ä‡ polityczna wstrzymuje finansowanie", "Granty: STOP na 2 rundy"),
-                CrisisCard("Awaria Internetu", "WspĂłĹ‚praca miÄ™dzynarodowa niemoĹĽliwa przez rundÄ™",
-                          "Globalna awaria sieci paraliĹĽuje komunikacjÄ™", "Konsorcja: STOP na rundÄ™")
-            ]
-
-        # Zmieszaj gĹ‚ĂłwnÄ… taliÄ™ (badania + konsorcja + intrygi + okazje) - zawsze
-        self.main_deck = (
-            self.research_cards.copy() +
-            self.consortium_cards.copy() +
-            self.intrigue_cards.copy() +
-            self.opportunity_cards.copy()
-        )
-        random.shuffle(self.main_deck)
-
 class SimpleHexWidget(tk.Frame):
     """Uproszczony widget do wizualizacji postÄ™pu badaĹ„"""
 
@@ -986,20 +290,9 @@ class PrincipiaGame:
         # Apply modern theme to root window
         self.root.configure(bg=ModernTheme.BACKGROUND)
 
-        self.game_data = GameData()
-        self.players = []
-        self.current_player_idx = 0
-        self.current_round = 1
-        self.current_phase = GamePhase.GRANTY
-        self.available_grants = []
-        self.available_journals = []
-        self.available_scientists = []
-        self.game_ended = False
-
-        # System scenariuszy
-        self.current_scenario = None
-        self.active_crises = []  # Aktywne kryzysy wpĹ‚ywajÄ…ce na grÄ™
-        self.crisis_deck = []  # Talia kryzysĂłw dla obecnego scenariusza
+        # Stan i reguĹ‚y gry - interfejs jest tylko widokiem nad silnikiem
+        self.engine = GameEngine(GameData(), on_log=self.log_message, on_game_over=self.show_game_results,
+                                 on_crisis=self.reveal_crisis)
 
         # Zmienne sieciowe
         self.is_network_game = False
@@ -1007,18 +300,26 @@ class PrincipiaGame:
         self.game_server = None
         self.game_client = None
         self.network_player_id = None
+        # Zdarzenia z wÄ…tkĂłw sieciowych - obsĹ‚ugiwane w pÄ™tli tkinter
+        self.network_inbox = NetworkInbox()
+        self.network_inbox_active = False
+        self.network_state = {}
+        self.network_repaints = 0
+
+        # Gracze komputerowi (miejsce -> bot) i trwajÄ…ce przeszukiwanie
+        self.bots = {}
+        self.bot_job = None
+        self.bot_turn_pending = False
+
+        # Ruch wysĹ‚any do kolejki poleceĹ„ serwera (host): (ruch, miejsce, on_done, on_error)
+        self.pending_move = None
+        # Akcja dodatkowa czekajÄ…ca na wybĂłr w oknie: (karta akcji, indeks akcji)
+        self.pending_choice_action = None
 
         # Aktualna aktywnoĹ›Ä‡
-        self.current_action_card = None
-        self.remaining_action_points = 0
         self.research_selection_mode = False
         self.selected_research_for_start = None
 
-        # Hex placement state
-        self.pending_hex_placements = 0  # Number of hexes waiting to be placed
-        self.hex_placement_mode = False
-        self.current_research_for_hex = None
-
         # Developer mode
         self.developer_mode = False
 
@@ -1060,6 +361,12 @@ class PrincipiaGame:
                                           **ModernTheme.configure_style('header'))
         self.action_points_label.pack(side='left', padx=(ModernTheme.SPACING_XL, 0))
 
+        # Ping graczy sieciowych (widoczny tylko u hosta)
+        self.network_stats_label = tk.Label(info_row, text="",
+                                          **ModernTheme.configure_style('default'))
+        self.network_stats_label.pack(side='left', padx=(ModernTheme.SPACING_XL, 0))
+        self.network_stats_label.pack_forget()  # Hide initially
+
         # Developer mode indicator (initially hidden) - z lepszymi kolorami
         self.dev_mode_label = tk.Label(info_row, text="đź”§ DEVELOPER MODE",
                                      font=('Segoe UI', ModernTheme.FONT_SIZE_MEDIUM, 'bold'),
@@ -1550,26 +857,7 @@ class PrincipiaGame:
 
         scientist_idx = selection[0]
         if scientist_idx < len(self.available_scientists):
-            scientist = self.available_scientists[scientist_idx]
-            current_player = self.players[self.current_player_idx]
-
-            # SprawdĹş koszty
-            eff_salary = scientist.salary if scientist.salary >= 100 else scientist.salary * 1000
-            hire_cost = eff_salary * 2
-            if current_player.credits < hire_cost:
-                messagebox.showwarning("BĹ‚Ä…d", f"Brak Ĺ›rodkĂłw! Koszt: {hire_cost}K")
-                return
-
-            # Zatrudnij
-            current_player.credits -= hire_cost
-            current_player.scientists.append(scientist)
-
-            # UsuĹ„ z rynku
-            self.available_scientists.remove(scientist)
-
-            self.log_message(f"Zatrudniono: {scientist.name} za {hire_cost//1000}K")
-            self.update_markets()
-            self.update_ui()
+            self.hire_scientist_from_market(self.available_scientists[scientist_idx])
 
     def publish_article(self):
         """Publikuje artykuĹ‚ w wybranym czasopiĹ›mie"""
@@ -1583,35 +871,7 @@ class PrincipiaGame:
 
         journal_idx = selection[0]
         if journal_idx < len(self.available_journals):
-            journal = self.available_journals[journal_idx]
-            current_player = self.players[self.current_player_idx]
-
-            # SprawdĹş koszty
-            if current_player.research_points < journal.pb_cost:
-                messagebox.showwarning("BĹ‚Ä…d", f"Brak punktĂłw badaĹ„! Koszt: {journal.pb_cost} PB")
-                return
-
-            # SprawdĹş wymagania reputacji (parsuj z requirements)
-            rep_required = 0
-            if 'Rep' in journal.requirements:
-                try:
-                    rep_required = int(journal.requirements.replace('Rep', '').strip())
-                except:
-                    rep_required = 0
-            if current_player.reputation < rep_required:
-                messagebox.showwarning("BĹ‚Ä…d", f"Za niska reputacja! Wymagane: {rep_required}")
-                return
-
-            # Publikuj
-            current_player.research_points -= journal.pb_cost
-            current_player.prestige_points += journal.pz_reward
-            current_player.activity_points += 3  # Punkt aktywnoĹ›ci za publikacjÄ™
-            try:
-                current_player.round_activity_points += 3
-            except Exception:
-                pass
-            self.log_message(f"Opublikowano w {journal.name} za {journal.pb_cost} PB, +{journal.pz_reward} PZ")
-            self.update_ui()
+            self.publish_in_journal_from_market(self.available_journals[journal_idx])
 
     def take_selected_grant(self):
         """Bierze wybrany grant z listy"""
@@ -1627,18 +887,7 @@ class PrincipiaGame:
         available_grants = [g for g in self.game_data.grants if not any(p.current_grant and p.current_grant.name == g.name for p in self.players)]
 
         if grant_idx < len(available_grants):
-            grant = available_grants[grant_idx]
-            current_player = self.players[self.current_player_idx]
-
-            if current_player.current_grant:
-                messagebox.showwarning("BĹ‚Ä…d", "Masz juĹĽ aktywny grant!")
-                return
-
-            # WeĹş grant
-            current_player.current_grant = grant
-            self.log_message(f"WziÄ™to grant: {grant.name}")
-            self.update_markets()
-            self.update_ui()
+            self.take_grant(available_grants[grant_idx])
 
 
     def update_markets(self):
@@ -1754,6 +1003,7 @@ class PrincipiaGame:
 
         self.player_name_vars = []
         self.player_entries = []
+        self.player_bot_vars = []
         self.update_player_entries()
 
         # Konfiguracja sieciowa (dla trybu doĹ‚Ä…czania)
@@ -1768,6 +1018,11 @@ class PrincipiaGame:
         self.host_port = tk.IntVar(value=8888)
         tk.Entry(network_frame, textvariable=self.host_port, width=10).grid(row=1, column=1, padx=5, pady=2)
 
+        tk.Label(network_frame, text="Typ serwera:").grid(row=2, column=0, sticky='w', padx=5, pady=2)
+        self.server_backend = tk.StringVar(value="threaded")
+        ttk.Combobox(network_frame, textvariable=self.server_backend, values=list(SERVER_BACKENDS),
+                     state='readonly', width=10).grid(row=2, column=1, sticky='w', padx=5, pady=2)
+
         # Przyciski
         button_frame = tk.Frame(config_window)
         button_frame.pack(fill='x', padx=10, pady=10)
@@ -1786,6 +1041,7 @@ class PrincipiaGame:
 
         self.player_name_vars.clear()
         self.player_entries.clear()
+        self.player_bot_vars.clear()
 
         # Kolory dostÄ™pne dla graczy
         colors = ['red', 'blue', 'green', 'purple']
@@ -1805,8 +1061,14 @@ class PrincipiaGame:
             entry = tk.Entry(row_frame, textvariable=name_var, width=20)
             entry.pack(side='left', padx=5)
 
+            # Puste miejsce zajmie gracz komputerowy (MCTS albo strategia heurystyczna)
+            bot_var = tk.StringVar(value=HUMAN_SEAT)
+            ttk.Combobox(row_frame, textvariable=bot_var, values=[HUMAN_SEAT] + BOT_CHOICES,
+                         state='readonly', width=18).pack(side='left', padx=5)
+
             self.player_name_vars.append(name_var)
             self.player_entries.append(entry)
+            self.player_bot_vars.append(bot_var)
 
     def start_configured_game(self, config_window):
         """Rozpoczyna grÄ™ z podanÄ… konfiguracjÄ…"""
@@ -1814,28 +1076,50 @@ class PrincipiaGame:
         mode = self.game_mode.get()
         player_count = self.player_count.get()
         player_names = [var.get().strip() or f"Gracz {i+1}" for i, var in enumerate(self.player_name_vars)]
+        bot_policies = {i: var.get() for i, var in enumerate(self.player_bot_vars) if var.get() != HUMAN_SEAT}
 
         config_window.destroy()
 
         if mode == "local":
-            self.setup_local_game(player_count, player_names)
+            self.setup_local_game(player_count, player_names, bot_policies)
         elif mode == "host":
-            self.setup_host_game(player_count, player_names)
+            self.setup_host_game(player_count, player_names, bot_policies)
         elif mode == "join":
             self.join_network_game()
 
-    def setup_local_game(self, player_count, player_names):
+    def setup_local_game(self, player_count, player_names, bot_policies=None):
         """Konfiguruje grÄ™ lokalnÄ…"""
         self.is_network_game = False
-        self.setup_game(player_count, player_names)
+        self.bind_engine_events(via_inbox=False)
+        self.setup_game(player_count, player_names, bot_policies=bot_policies)
 
-    def setup_host_game(self, player_count, player_names):
+    def setup_host_game(self, player_count, player_names, bot_policies=None):
         """Konfiguruje grÄ™ jako host sieciowy"""
+        if self.developer_mode:
+            self.toggle_developer_mode()
         self.is_network_game = True
         self.is_host = True
 
+        # Dziennik akcji - pozwala wznowiÄ‡ grÄ™ po awarii hosta
+        journal_dir = host_journal_dir(self.host_port.get())
+        recovered = None
+        seed = None
+        if ActionJournal.exists(journal_dir):
+            if messagebox.askyesno("Przerwana gra",
+                                   "Znaleziono dziennik przerwanej gry na tym porcie. WznowiÄ‡ jÄ…?"):
+                recovered = ActionJournal.load(journal_dir)
+                snapshot = recovered[0]
+                if snapshot and snapshot.get('game'):
+                    player_names = [player['name'] for player in snapshot['game']['players']]
+                    player_count = len(player_names)
+                    # Ziarno tylko do konfiguracji - kolejnoĹ›Ä‡ talii i rynki przywraca snapshot
+                    seed = snapshot['game'].get('seed')
+            else:
+                ActionJournal.clear(journal_dir)
+
         # Uruchom serwer gry
-        self.game_server = GameServer(port=self.host_port.get())
+        self.game_server = create_game_server(self.server_backend.get(), port=self.host_port.get(),
+                                              journal=ActionJournal(journal_dir))
         if self.game_server.start(self):
             # Pobierz lokalne IP
             local_ip = self.get_local_ip()
@@ -1848,9 +1132,26 @@ class PrincipiaGame:
             # PokaĹĽ dialog z informacjami o serwerze
             self.show_server_info_dialog(local_ip, port)
 
-            self.setup_game(player_count, player_names)
+            # OdĹ›wieĹĽaj ping graczy w panelu informacji
+            self.network_stats_label.pack(side='left', padx=(ModernTheme.SPACING_XL, 0))
+            self.update_network_stats()
+            self.start_network_inbox()
+            self.bind_engine_events(via_inbox=True)
+
+            with self.state_lock():
+                self.setup_game(player_count, player_names, seed, bot_policies)
+            if recovered:
+                missing = self.game_server.restore_from_journal(*recovered)
+                self.log_message("â™»ď¸Ź Wznowiono przerwanÄ… grÄ™ z dziennika")
+                if missing:
+                    self.log_message(f"âš ď¸Ź Nie odtworzono kart: {', '.join(missing)}")
+                self.update_ui()
+            # Stan po rozdaniu - dalej rozsyĹ‚a go i zapisuje wÄ…tek poleceĹ„ po kaĹĽdym ruchu
+            self.game_server.publish_state()
+            self.game_server.checkpoint()
         else:
             messagebox.showerror("BĹ‚Ä…d", "Nie udaĹ‚o siÄ™ uruchomiÄ‡ serwera gry")
+            self.game_server.journal.close()
             self.is_network_game = False
             self.is_host = False
 
@@ -1962,6 +1263,8 @@ class PrincipiaGame:
         host = self.host_address.get()
         port = self.host_port.get()
 
+        if self.developer_mode:
+            self.toggle_developer_mode()
         self.is_network_game = True
         self.is_host = False
 
@@ -1970,6 +1273,7 @@ class PrincipiaGame:
         if self.game_client.connect(host, port, player_name, self):
             self.log_message(f"đź”— PoĹ‚Ä…czono z grÄ… na {host}:{port} jako {player_name}")
             self.log_message("âŹł Oczekiwanie na rozpoczÄ™cie gry...")
+            self.start_network_inbox()
 
             # Ukryj normalny interfejs gry do czasu synchronizacji
             self.show_network_waiting_ui()
@@ -2018,61 +1322,20 @@ class PrincipiaGame:
         # PrzywrĂłÄ‡ normalny interfejs
         self.create_interface()
 
-    def setup_game(self, player_count=3, player_names=None):
-        """Konfiguruje nowÄ… grÄ™"""
+    def setup_game(self, player_count=3, player_names=None, seed=None, bot_policies=None):
+        """Konfiguruje nowÄ… grÄ™ (`seed` - ziarno losowaĹ„, np. przy wznowieniu;
+        `bot_policies` - miejsce -> gracz komputerowy z BOT_CHOICES)"""
         try:
-            self.game_data.load_data()
+            self.engine.seed_game(seed)
+            self.game_data.load_data(self.engine.rng)
             self.log_message("Wczytano dane gry")
 
             # WybĂłr scenariusza
             self.select_scenario()
 
             # StwĂłrz graczy z podanÄ… konfiguracjÄ…
-            colors = ['red', 'blue', 'green', 'purple']
-            if player_names is None:
-                player_names = [f'Gracz {i+1}' for i in range(player_count)]
-
-            self.players = []
-            for i in range(player_count):
-                player = Player(
-                    name=player_names[i],
-                    color=colors[i]
-                )
-
-                # Przypisz losowy instytut
-                if self.game_data.institutes:
-                    player.institute = random.choice(self.game_data.institutes)
-
-                    # Parsuj zasoby startowe
-                    resources = player.institute.starting_resources.split(', ')
-                    for resource in resources:
-                        if 'K' in resource:
-                            credit_val = self.game_data.safe_int_parse(resource.replace('K', '').strip())
-                            player.credits = credit_val * 1000
-                        elif 'PZ' in resource:
-                            pz_val = self.game_data.safe_int_parse(resource.replace('PZ', '').strip())
-                            player.prestige_points = pz_val
-
-                    player.reputation = player.institute.starting_reputation
-
-                # Daj karty akcji
-                player.action_cards = self.game_data.create_action_cards()
-
-                # Daj startowe karty badaĹ„ (maksymalnie 5)
-                if self.game_data.main_deck:
-                    start_cards = min(5, len(self.game_data.main_deck))
-                    player.hand_cards = self.game_data.main_deck[:start_cards]
-                    # UsuĹ„ rozdane karty z talii
-                    self.game_data.main_deck = self.game_data.main_deck[start_cards:]
-
-                # Daj kaĹĽdemu graczowi jednÄ… kartÄ™ konsorcjum na start
-                if self.game_data.consortium_cards:
-                    player.hand_cards.append(ConsortiumCard())
-
-                # Daj startowego doktoranta
-                player.scientists.append(Scientist("Doktorant", ScientistType.DOKTORANT, "Uniwersalny", 0, 1, "Brak", "MĹ‚ody naukowiec"))
-
-                self.players.append(player)
+            self.engine.setup_players(player_count, player_names)
+            self.setup_bots(bot_policies or {})
 
             self.setup_players_ui()
             self.prepare_round()
@@ -2144,402 +1407,253 @@ class PrincipiaGame:
                                     font=('Arial', 8))
             actions_label.pack(anchor='w', padx=5)
 
-    def prepare_round(self):
-        """Przygotowuje nowÄ… rundÄ™"""
-        # Resetuj karty akcji graczy
-        for player in self.players:
-            for card in player.action_cards:
-                card.is_used = False
-            player.has_passed = False
-            # Reset rundowych punktĂłw aktywnoĹ›ci (do subwencji)
-            try:
-                player.round_activity_points = 0
-            except Exception:
-                pass
-
-        # Przygotuj granty na rundÄ™
-        available_grant_count = min(6, len(self.game_data.grants))
-        self.available_grants = random.sample(self.game_data.grants, available_grant_count)
-
-        # Przygotuj czasopisma
-        available_journal_count = min(4, len(self.game_data.journals))
-        self.available_journals = random.sample(self.game_data.journals, available_journal_count)
-
-        # Przygotuj naukowcĂłw na rynek
-        available_scientist_count = min(4, len(self.game_data.scientists))
-        self.available_scientists = random.sample(self.game_data.scientists, available_scientist_count)
-
-        self.current_phase = GamePhase.GRANTY
-        self.current_player_idx = 0
-        self.current_action_card = None
-        self.remaining_action_points = 0
-        self.update_ui()
-        self.log_message(f"RozpoczÄ™to rundÄ™ {self.current_round}")
-
-    def next_phase(self):
-        """Przechodzi do nastÄ™pnej fazy gry"""
-        if self.current_phase == GamePhase.GRANTY:
-            self.current_phase = GamePhase.AKCJE
-            self.pass_btn['state'] = 'normal'
-            self.log_message("PrzejĹ›cie do fazy akcji")
+    def setup_bots(self, bot_policies):
+        """Gracze komputerowi na wybranych miejscach.
 
-        elif self.current_phase == GamePhase.AKCJE:
-            self.current_phase = GamePhase.PORZADKOWA
-            self.pass_btn['state'] = 'disabled'
-            self.end_action_btn['state'] = 'disabled'
-            self.log_message("PrzejĹ›cie do fazy porzÄ…dkowej")
-
-        elif self.current_phase == GamePhase.PORZADKOWA:
-            self.end_round()
-
-        self.update_ui()
-
-    def player_pass(self):
-        """Gracz pasuje w fazie akcji"""
-        if self.current_phase == GamePhase.AKCJE:
-            current_player = self.players[self.current_player_idx]
-            current_player.has_passed = True
-
-            # Bonus za pasowanie zaleĹĽny od liczby kart na rÄ™ku
-            hand_size = len(current_player.hand_cards)
-            pass_bonus = {5: 0, 4: 1000, 3: 3000, 2: 5000, 1: 8000}.get(hand_size, 0)
-            current_player.credits += pass_bonus
-
-            self.log_message(f"{current_player.name} pasuje (bonus: {pass_bonus//1000}K)")
-
-            # ZakoĹ„cz aktualnÄ… akcjÄ™
-            self.current_action_card = None
-            self.remaining_action_points = 0
-
-            # SprawdĹş czy wszyscy spasowali
-            if all(p.has_passed for p in self.players):
-                self.current_phase = GamePhase.PORZADKOWA
-                self.pass_btn['state'] = 'disabled'
-                self.end_action_btn['state'] = 'disabled'
-                self.log_message("Wszyscy gracze spasowali - przejĹ›cie do fazy porzÄ…dkowej")
+        Boty MCTS dzielÄ… jeden obiekt (i pulÄ™ procesĂłw); strategie
+        heurystyczne losujÄ… generatorem z ziarna gry i miejsca, jak w symulacjach.
+        """
+        self.close_bots()
+        mcts = None
+        for seat, name in sorted(bot_policies.items()):
+            if name == MCTSBot.name:
+                mcts = mcts or MCTSBot(time_limit=BOT_TIME_LIMIT)
+                self.bots[seat] = mcts
             else:
-                self.next_player()
-
-            self.update_ui()
+                self.bots[seat] = POLICIES[name](random.Random(f"{self.engine.seed}:{seat}"))
+            self.log_message(f"đź¤– {self.players[seat].name} - gracz komputerowy ({name})")
+
+    def close_bots(self):
+        for bot in set(self.bots.values()):
+            if isinstance(bot, MCTSBot):
+                bot.close()
+        self.bots = {}
+        self.bot_job = None
+
+    def schedule_bot_turn(self):
+        """Planuje ruch bota, jeĹ›li teraz jego kolej (wywoĹ‚ywane po kaĹĽdym odĹ›wieĹĽeniu)"""
+        if (not self.bots or self.bot_turn_pending or self.pending_move is not None
+                or self.game_ended or not self.players):
+            return
+        if self.current_phase == GamePhase.PORZADKOWA:
+            # FazÄ™ porzÄ…dkowÄ… koĹ„czy czĹ‚owiek, chyba ĹĽe przy stole sÄ… same boty
+            if len(self.bots) < len(self.players):
+                return
+        elif self.current_player_idx not in self.bots:
+            return
+        self.bot_turn_pending = True
+        self.root.after(BOT_TICK_MS, self.play_bot_turn)
 
-    def end_current_action(self):
-        """KoĹ„czy aktualnÄ… akcjÄ™"""
-        if self.current_action_card:
-            self.log_message(f"ZakoĹ„czono akcjÄ™ {self.current_action_card.action_type.value}")
-            self.current_action_card = None
-            self.remaining_action_points = 0
-            self.next_player()
-            self.update_ui()
+    def play_bot_turn(self):
+        """Jeden ruch bota; w fazie akcji przeszukiwanie idzie w tle, UI sprawdza je co BOT_TICK_MS"""
+        self.bot_turn_pending = False
+        if self.game_ended or not self.players or self.pending_move is not None:
+            return
+        seat = self.current_player_idx
+        bot = self.bots.get(seat)
 
-    def next_player(self):
-        """Przechodzi do nastÄ™pnego gracza"""
-        self.current_player_idx = (self.current_player_idx + 1) % len(self.players)
-        # JeĹ›li wszyscy spasowali, pomiĹ„
-        attempts = 0
-        while self.players[self.current_player_idx].has_passed and attempts < len(self.players):
-            self.current_player_idx = (self.current_player_idx + 1) % len(self.players)
-            attempts += 1
-
-    def end_round(self):
-        """KoĹ„czy rundÄ™ i przechodzi do nastÄ™pnej"""
-        # ZapĹ‚aÄ‡ pensje
-        for player in self.players:
-            self.pay_salaries(player)
+        if self.current_phase == GamePhase.PORZADKOWA:
+            self.next_phase()
+            return
 
-        # SprawdĹş cele grantĂłw
-        for player in self.players:
-            self.check_grant_completion(player)
+        if bot is None:
+            return
 
-        # SprawdĹş warunki koĹ„ca gry
-        if self.check_end_game():
+        if self.current_phase == GamePhase.GRANTY:
+            player = self.players[seat]
+            with self.state_lock():
+                grant = bot.choose_grant(self.engine, player) if player.current_grant is None else None
+                index = _index_in(self.available_grants, grant) if grant is not None else None
+
+            def done(result):
+                if grant is None:
+                    self.log_message(f"đź¤– {player.name} nie bierze grantu")
+                # Koniec kolejki grantĂłw - dalej prowadzi gracz przy pierwszym miejscu
+                if self.current_player_idx <= seat and self.current_player_idx in self.bots:
+                    self.next_phase()
+            self.submit_move(Move(MOVE_TAKE_GRANT, index), on_done=done, on_error=self.log_message, seat=seat)
             return
 
-        # Rozliczenie subwencji rzÄ…dowej (6 punktĂłw aktywnoĹ›ci w tej rundzie â†’ 10K)
-        try:
-            for player in self.players:
-                cg = player.current_grant
-                if cg and not getattr(cg, 'is_completed', False) and 'subwencja' in (cg.name or '').lower():
-                    rap = getattr(player, 'round_activity_points', 0)
-                    if rap >= 6:
-                        cg.is_completed = True
-                        player.credits += 10000
-                        self.log_message(f"{player.name} zrealizowaĹ‚ subwencjÄ™: +10K")
-        except Exception:
-            pass
+        if self.current_phase != GamePhase.AKCJE:
+            return
+        if not isinstance(bot, MCTSBot):
+            # Strategia heurystyczna - ruch od razu
+            with self.state_lock():
+                move = bot.choose_move(self.engine)
+            self.apply_bot_move(move, seat)
+            return
+        if self.bot_job is None:
+            with self.state_lock():
+                self.bot_job = bot.start_search(self.engine)
+        if not self.bot_job.done():
+            self.bot_turn_pending = True
+            self.root.after(BOT_TICK_MS, self.play_bot_turn)
+            return
 
-        # Auto-ukoĹ„czenie Wielkich ProjektĂłw (jeĹ›li speĹ‚niono progi PB/K)
-        try:
-            import re
-            for project in self.game_data.large_projects:
-                if project.is_completed or not project.director:
-                    continue
-                # Wymagania: PB i K
-                req_txt = project.requirements or ''
-                m_pb = re.search(r"(\d+)\s*PB", req_txt, flags=re.I)
-                pb_req = int(m_pb.group(1)) if m_pb else 0
-                m_k = re.search(r"(\d+)\s*K", req_txt, flags=re.I)
-                k_req = (int(m_k.group(1)) * 1000) if m_k else 0
-                if project.contributed_pb >= pb_req and project.contributed_credits >= k_req:
-                    # Nagrody (kierownik i czĹ‚onkowie): sumujemy PZ i jednorazowe K
-                    def parse_reward(txt):
-                        pz = 0; kredyty = 0
-                        m = re.search(r"(\d+)\s*PZ", txt or '', flags=re.I)
-                        if m: pz = int(m.group(1))
-                        for x in re.findall(r"(\d+)\s*K(?!\s*/\s*rund)", txt or '', flags=re.I):
-                            kredyty += int(x) * 1000
-                        return pz, kredyty
-                    pz_dir, k_dir = parse_reward(project.director_reward)
-                    project.director.prestige_points += pz_dir
-                    project.director.credits += k_dir
-                    pz_mem, k_mem = parse_reward(project.member_reward)
-                    for member in getattr(project, 'members', []):
-                        if member is project.director:
-                            continue
-                        member.prestige_points += pz_mem
-                        member.credits += k_mem
-                    project.is_completed = True
-                    self.log_message(f"Ukonczono projekt: {project.name}. Kierownik +{pz_dir} PZ, +{k_dir//1000}K; czlonkowie +{pz_mem} PZ, +{k_mem//1000}K")
-        except Exception:
-            pass
+        move = self.bot_job.result()
+        self.bot_job = None
+        self.apply_bot_move(move, seat)
 
-        self.current_round += 1
-        self.prepare_round()
+    def state_lock(self):
+        """Blokada na czas czytania stanu gry w oknie.
 
-    def pay_salaries(self, player: Player):
-        """PĹ‚aci pensje dla gracza"""
-        total_salary = 0
+        Na hoĹ›cie stan zmienia wÄ…tek poleceĹ„ serwera, wiÄ™c widok i boty
+        czytajÄ… go pod blokadÄ… kolejki; w grze lokalnej blokada jest pusta.
+        """
+        if self.is_network_game and self.is_host and self.game_server:
+            return self.game_server.commands.lock
+        return contextlib.nullcontext()
 
-        for scientist in player.scientists:
-            if scientist.type != ScientistType.DOKTORANT:
-                eff_salary = scientist.salary if scientist.salary >= 100 else scientist.salary * 1000
-                total_salary += eff_salary
+    def submit_move(self, move: Move, on_done=None, on_error=None, seat: Optional[int] = None):
+        """Wykonuje ruch z tego okna - czĹ‚owieka, bota albo okna wyboru.
 
-        # Dodaj karÄ™ za przeciÄ…ĹĽenie (wiÄ™cej niĹĽ 3 naukowcĂłw, nie liczÄ…c doktorantĂłw)
-        non_doctoral_count = len([s for s in player.scientists
-                                if s.type != ScientistType.DOKTORANT])
-        if non_doctoral_count > 3:
-            overload_penalty = (non_doctoral_count - 3) * 1000
-            total_salary += overload_penalty
-            self.log_message(f"{player.name}: kara przeciÄ…ĹĽenia {overload_penalty//1000}K")
+        Na hoĹ›cie ruch idzie do kolejki poleceĹ„ serwera jak akcje zdalnych
+        graczy, a wynik wraca przez skrzynkÄ™ (INBOX_DONE); naraz czeka jeden
+        ruch. W grze lokalnej silnik sprawdza i wykonuje go od razu. `on_done(wynik)`
+        dostaje wynik ruchu, `on_error(komunikat)` powĂłd odrzucenia
+        (domyĹ›lnie ostrzeĹĽenie w oknie).
+        """
+        seat = self.current_player_idx if seat is None else seat
+        if self.is_network_game and self.is_host and self.game_server:
+            if self.pending_move is not None:
+                return
+            self.pending_move = (move, seat, on_done, on_error)
+            if not self.game_server.submit_local_move(move, seat):
+                self.pending_move = None
+                self.move_failed("Serwer nie nadÄ…ĹĽa z akcjami - sprĂłbuj ponownie", on_error)
+            return
 
-        # SprawdĹş czy moĹĽe zapĹ‚aciÄ‡
-        # Korekta total_salary (konwersja 2/3 â†’ 2K/3K, kara przeciÄ…ĹĽenia)
         try:
-            _total = 0
-            for s in player.scientists:
-                if s.type != ScientistType.DOKTORANT:
-                    _sal = s.salary if s.salary >= 100 else s.salary * 1000
-                    _total += _sal
-            _count = len(player.scientists)
-            if _count > 3:
-                _total += _count * 1000
-            total_salary = _total
-        except Exception:
-            pass
+            result = self.engine.apply_checked(move)
+        except RuleViolation as e:
+            self.move_failed(str(e), on_error)
+            return
+        self.finish_move(move, seat, result, on_done)
+        self.update_ui()
 
-        if player.credits >= total_salary:
-            player.credits -= total_salary
-            # PrzywrĂłÄ‡ aktywnoĹ›Ä‡ pĹ‚atnych naukowcĂłw
-            try:
-                for s in player.scientists:
-                    if s.type != ScientistType.DOKTORANT:
-                        s.is_paid = True
-            except Exception:
-                pass
-            self.log_message(f"{player.name} zapĹ‚aciĹ‚ {total_salary//1000}K pensji")
+    def finish_pending_move(self, result, reason):
+        """Wynik ruchu hosta z kolejki poleceĹ„ (w pÄ™tli tkinter)"""
+        if self.pending_move is None:
+            return
+        move, seat, on_done, on_error = self.pending_move
+        self.pending_move = None
+        if reason is None:
+            self.finish_move(move, seat, result, on_done)
         else:
-            # Nie moĹĽe zapĹ‚aciÄ‡ - kara reputacji tylko za pierwszÄ… niewypĹ‚atÄ™
-            unpaid_count = len([s for s in player.scientists if not s.is_paid])
-            if unpaid_count == 0:  # Pierwsza niewypĹ‚ata
-                player.reputation = max(0, player.reputation - 1)
-                self.log_message(f"{player.name}: niewypĹ‚ata pensji, -1 Reputacja")
-
-            # Oznacz naukowcĂłw jako niewypĹ‚aconych
-            for scientist in player.scientists:
-                if scientist.type != ScientistType.DOKTORANT:
-                    scientist.is_paid = False
-
-    def meets_grant_requirements(self, player: Player, grant: GrantCard) -> bool:
-        """Heurystyczna walidacja wymagaĹ„ grantu z pola tekstowego."""
-        req = (grant.requirements or '').lower()
-        if not req or 'brak wymag' in req:
-            return True
-
-        # Reputacja X+
-        if 'reputacja' in req:
-            import re
-            m = re.search(r'reputacja\s*(\d+)', req)
-            if m and player.reputation < int(m.group(1)):
-                return False
-
-        # Min. 1 doktor/profesor/doktorant
-        if 'min. 1 doktorant' in req:
-            if not any(s.type == ScientistType.DOKTORANT for s in player.scientists):
-                return False
-        if 'min. 1 doktor' in req and 'doktorant' not in req:
-            if not any(s.type == ScientistType.DOKTOR for s in player.scientists):
-                return False
-        if 'min. 1 profesor' in req:
-            if not any(s.type == ScientistType.PROFESOR for s in player.scientists):
-                return False
-
-        # Naukowiec w dziedzinie (fizyk/biolog/chemik)
-        if 'naukowiec fizyk' in req and not any('fiz' in s.field.lower() for s in player.scientists):
-            return False
-        if 'naukowiec biolog' in req and not any('bio' in s.field.lower() for s in player.scientists):
-            return False
-        if 'naukowiec chemik' in req and not any('chem' in s.field.lower() for s in player.scientists):
-            return False
-
-        # Min. 2 naukowcĂłw
-        if 'min. 2 naukowc' in req:
-            if len(player.scientists) < 2:
-                return False
-
-        # Naukowcy z 2 rĂłĹĽnych dziedzin
-        if '2 rĂłĹĽnych dziedzin' in req or '2 roznych dziedzin' in req:
-            fields = set(s.field for s in player.scientists)
-            if len(fields) < 2:
-                return False
-
-        # Min. 1 konsorcjum
-        if 'min. 1 konsorcjum' in req or 'min. 1 konsorcja' in req:
-            in_any = False
-            for p in self.game_data.large_projects:
-                if p.director == player or player in getattr(p, 'members', []):
-                    in_any = True
-                    break
-            if not in_any:
-                return False
+            self.move_failed(reason, on_error)
+
+    def finish_move(self, move: Move, seat: int, result, on_done):
+        """Po wykonanym ruchu: powiadomienia kierownikĂłw konsorcjĂłw i dalsza obsĹ‚uga okna"""
+        joined = move.kind == MOVE_JOIN or (move.kind == MOVE_ADDITIONAL and isinstance(move.param, tuple)
+                                             and move.param[1] == 'join')
+        if joined:
+            project_idx = move.arg if move.kind == MOVE_JOIN else move.param[0]
+            self.notify_membership_request(self.game_data.large_projects[project_idx], self.players[seat])
+        elif move.kind in (MOVE_APPROVE, MOVE_REJECT):
+            self.drop_membership_notification(self.game_data.large_projects[move.arg], self.players[move.param])
+        if on_done:
+            on_done(result or {})
+
+    def move_failed(self, text: str, on_error=None):
+        if on_error:
+            on_error(text)
+        else:
+            messagebox.showwarning("Uwaga", text)
 
-        return True
+    def apply_bot_move(self, move: Move, seat: int):
+        """Wykonuje ruch bota jak ruch czĹ‚owieka; odrzucony ruch koĹ„czy siÄ™ pasem"""
+        def rejected(text):
+            self.log_message(f"âš ď¸Ź Bot: {text} - pas")
+            self.submit_move(Move(MOVE_PASS), on_error=self.log_message, seat=seat)
+        self.submit_move(move, on_error=rejected, seat=seat)
 
-    def check_grant_completion(self, player: Player):
-        """Sprawdza czy gracz ukoĹ„czyĹ‚ cel grantu"""
-        if not player.current_grant or player.current_grant.is_completed:
-            return
+    def prepare_round(self):
+        """Przygotowuje nowÄ… rundÄ™"""
+        self.engine.prepare_round()
+        self.update_ui()
 
-        goal = player.current_grant.goal.lower()
-        completed = False
+    def next_phase(self):
+        """Przechodzi do nastÄ™pnej fazy gry"""
+        self.submit_move(Move(MOVE_NEXT_PHASE), on_done=lambda result: self.update_phase_buttons())
 
-        if "publikacj" in goal:
-            required_pubs = 2
-            if player.publications >= required_pubs:
-                completed = True
+    def update_phase_buttons(self):
+        """Przyciski pasowania i koĹ„ca akcji zaleĹĽne od fazy"""
+        if self.current_phase == GamePhase.AKCJE:
+            self.pass_btn['state'] = 'normal'
+        elif self.current_phase == GamePhase.PORZADKOWA:
+            self.pass_btn['state'] = 'disabled'
+            self.end_action_btn['state'] = 'disabled'
 
-        elif "badanie" in goal:
-            if len(player.completed_research) >= 1:
-                completed = True
+    def player_pass(self):
+        """Gracz pasuje w fazie akcji"""
+        if self.current_phase == GamePhase.AKCJE:
+            self.submit_move(Move(MOVE_PASS), on_done=lambda result: self.update_phase_buttons())
 
-        elif "konsorcjum" in goal:
-            # SprawdĹş czy zaĹ‚oĹĽyĹ‚ konsorcjum
-            for project in self.game_data.large_projects:
-                if project.director == player:
-                    completed = True
-                    break
+    def end_current_action(self):
+        """KoĹ„czy aktualnÄ… akcjÄ™"""
+        if self.current_action_card:
+            self.submit_move(Move(MOVE_END_ACTION))
 
-        elif "aktywnoĹ›ci" in goal:
-            # Punkty aktywnoĹ›ci: zatrudnienie (2p), publikacja (3p), ukoĹ„czenie badania (4p), konsorcjum (5p)
-            activity_points = 0
-            activity_points += len(player.scientists) * 2  # Zatrudnienie
-            activity_points += player.publications * 3  # Publikacje
-            activity_points += len(player.completed_research) * 4  # Badania
-
-            for project in self.game_data.large_projects:
-                if project.director == player:
-                    activity_points += 5
-
-            required_activity = self.game_data.safe_int_parse(goal.split()[0], 10)
-            if activity_points >= required_activity:
-                completed = True
-
-        if completed:
-            player.current_grant.is_completed = True
-            # Daj nagrodÄ™
-            reward = player.current_grant.reward
-            credits = self.game_data.safe_int_parse(reward.replace('K', ''), 0) * 1000
-            if credits > 0:
-                player.credits += credits
-                self.log_message(f"{player.name} ukoĹ„czyĹ‚ grant: +{credits//1000}K")
-
-    def check_end_game(self) -> bool:
-        """Sprawdza warunki koĹ„ca gry"""
-        # SprawdĹş rĂłĹĽne warunki koĹ„ca gry
-        for player in self.players:
-            # Warunek 1: 35 PZ
-            if player.prestige_points >= 35:
-                self.end_game(f"{player.name} osiÄ…gnÄ…Ĺ‚ 35 PZ!")
-                return True
-
-            # Warunek 2: 6 ukoĹ„czonych badaĹ„
-            if len(player.completed_research) >= 6:
-                self.end_game(f"{player.name} ukoĹ„czyĹ‚ 6 badaĹ„!")
-                return True
-
-        # Warunek 3: 3 Wielkie Projekty ukoĹ„czone
-        completed_projects = len([p for p in self.game_data.large_projects if p.is_completed])
-        if completed_projects >= 3:
-            self.end_game("UkoĹ„czono 3 Wielkie Projekty!")
-            return True
-
-        return False
-
-    def end_game(self, reason: str):
-        """KoĹ„czy grÄ™"""
-        self.game_ended = True
-        self.log_message(f"KONIEC GRY: {reason}")
-
-        # PokaĹĽ wyniki koĹ„cowe
-        results = []
-        for player in self.players:
-            total_score = player.prestige_points
-            results.append((player.name, total_score, player.prestige_points, len(player.completed_research), player.publications))
+    def next_player(self):
+        """Przechodzi do nastÄ™pnego gracza"""
+        self.engine.next_player()
 
-        results.sort(key=lambda x: x[1], reverse=True)
+    def meets_grant_requirements(self, player: Player, grant: GrantCard) -> bool:
+        """Heurystyczna walidacja wymagaĹ„ grantu z pola tekstowego."""
+        return self.engine.meets_grant_requirements(player, grant)
 
-        result_text = "WYNIKI KOĹCOWE:\n\n"
+    def show_game_results(self, reason: str, results: list):
+        """Pokazuje wyniki koĹ„cowe (wywoĹ‚ywane przez silnik po koĹ„cu gry)"""
+        result_text = f"{reason}\n\nWyniki koĹ„cowe:\n\n"
         for i, (name, score, pz, research, pubs) in enumerate(results, 1):
             result_text += f"{i}. {name}: {score} PZ ({research} badaĹ„, {pubs} publikacji)\n"
 
         messagebox.showinfo("Koniec gry", result_text)
 
     def update_ui(self):
-        """Aktualizuje interfejs uĹĽytkownika"""
-        self.round_label.config(text=f"Runda: {self.current_round}")
-        self.phase_label.config(text=f"Faza: {self.current_phase.value}")
+        """Aktualizuje interfejs uĹĽytkownika.
 
-        if self.current_action_card:
-            self.action_points_label.config(text=f"PA: {self.remaining_action_points}/{self.current_action_card.action_points}")
-        else:
-            self.action_points_label.config(text="PA: 0/0")
+        Tylko rysuje stan gry - na hoĹ›cie zmiany rozsyĹ‚a klientom i zapisuje
+        w dzienniku wÄ…tek poleceĹ„ serwera, a tu stan jest czytany pod blokadÄ….
+        """
+        with self.state_lock():
+            self.round_label.config(text=f"Runda: {self.current_round}")
+            self.phase_label.config(text=f"Faza: {self.current_phase.value}")
 
-        if self.players:
-            current_player = self.players[self.current_player_idx]
-            self.current_player_label.config(text=f"Gracz: {current_player.name}")
+            if self.current_action_card:
+                self.action_points_label.config(text=f"PA: {self.remaining_action_points}/{self.current_action_card.action_points}")
+            else:
+                self.action_points_label.config(text="PA: 0/0")
 
-        # Ustaw stan przyciskĂłw
-        if self.current_action_card and self.remaining_action_points > 0:
-            self.end_action_btn['state'] = 'normal'
-        else:
-            self.end_action_btn['state'] = 'disabled'
+            if self.players:
+                current_player = self.players[self.current_player_idx]
+                self.current_player_label.config(text=f"Gracz: {current_player.name}")
 
-        self.setup_players_ui()
-        self.setup_game_area()
-        self.setup_research_area()
-        self.update_markets()
-        self.setup_achievements_tab()  # OdĹ›wieĹĽ zakĹ‚adkÄ™ osiÄ…gniÄ™Ä‡
-        self.update_notifications()  # OdĹ›wieĹĽ powiadomienia
-
-        # Update developer tools if active
-        if self.developer_mode and hasattr(self, 'dev_player_combo'):
-            self.update_dev_player_list()
-            self.update_dev_resource_displays()
-            if hasattr(self, 'dev_card_player_combo'):
-                self.update_dev_card_players()
-            if hasattr(self, 'dev_current_player_combo'):
-                self.update_dev_gamestate_displays()
-            if hasattr(self, 'dev_scientist_player_combo'):
-                self.update_dev_scientist_players()
+            # Ustaw stan przyciskĂłw
+            if self.current_action_card and self.remaining_action_points > 0:
+                self.end_action_btn['state'] = 'normal'
+            else:
+                self.end_action_btn['state'] = 'disabled'
+
+            self.setup_players_ui()
+            self.setup_game_area()
+            self.setup_research_area()
+            self.update_markets()
+            self.setup_achievements_tab()  # OdĹ›wieĹĽ zakĹ‚adkÄ™ osiÄ…gniÄ™Ä‡
+            self.update_notifications()  # OdĹ›wieĹĽ powiadomienia
+
+            # Update developer tools if active
+            if self.developer_mode and hasattr(self, 'dev_player_combo'):
+                self.update_dev_player_list()
+                self.update_dev_resource_displays()
+                if hasattr(self, 'dev_card_player_combo'):
+                    self.update_dev_card_players()
+                if hasattr(self, 'dev_current_player_combo'):
+                    self.update_dev_gamestate_displays()
+                if hasattr(self, 'dev_scientist_player_combo'):
+                    self.update_dev_scientist_players()
+
+            self.schedule_bot_turn()
 
     def setup_game_area(self):
         """Konfiguruje gĹ‚Ăłwny obszar gry w zaleĹĽnoĹ›ci od fazy"""
@@ -2701,339 +1815,76 @@ class PrincipiaGame:
 
     def play_action_card(self, action_card: ActionCard):
         """Gracz zagrywa kartÄ™ akcji"""
-        if action_card.is_used:
-            messagebox.showwarning("Uwaga", "Ta karta zostaĹ‚a juĹĽ uĹĽyta w tej rundzie!")
-            return
-
-        current_player = self.players[self.current_player_idx]
-
-        # Oznacz kartÄ™ jako uĹĽytÄ…
-        action_card.is_used = True
-        self.current_action_card = action_card
-        self.remaining_action_points = action_card.action_points
-
-        # Wykonaj akcjÄ™ podstawowÄ…
-        self.execute_basic_action(action_card)
-
-        self.log_message(f"{current_player.name} zagraĹ‚ kartÄ™: {action_card.action_type.value}")
-        self.update_ui()
-
-    def execute_basic_action(self, action_card: ActionCard):
-        """Wykonuje akcjÄ™ podstawowÄ… karty"""
-        current_player = self.players[self.current_player_idx]
-
-        if action_card.action_type == ActionType.PROWADZ_BADANIA:
-            doktoranci = [s for s in current_player.scientists if s.type == ScientistType.DOKTORANT]
-            if doktoranci and doktoranci[0].is_paid and current_player.active_research:
-                self.add_hex_to_research(current_player, 1)
-                self.log_message(f"Aktywowano doktoranta (+1 heks)")
-            elif doktoranci and doktoranci[0].is_paid:
-                self.log_message(f"Doktorant gotowy - rozpocznij badanie aby go aktywowaÄ‡")
-            else:
-                self.log_message(f"Brak aktywnego doktoranta")
-
-        elif action_card.action_type == ActionType.ZATRUDNIJ:
-            current_player.credits += 1000
-            self.log_message(f"Otrzymano 1K")
-
-        elif action_card.action_type == ActionType.PUBLIKUJ:
-            # Akcja podstawowa: moĹĽliwoĹ›Ä‡ publikacji w czasopiĹ›mie z rynku
-            # PokaĹĽ okno wyboru czasopisma
-            self.show_journal_selection_for_publish()
-            self.log_message(f"MoĹĽesz opublikowaÄ‡ w dostÄ™pnych czasopismach (akcja podstawowa)")
+        index = _index_in(self.players[self.current_player_idx].action_cards, action_card)
 
-        elif action_card.action_type == ActionType.FINANSUJ:
-            current_player.credits += 2000
-            self.log_message(f"Otrzymano 2K")
-
-        elif action_card.action_type == ActionType.ZARZADZAJ:
-            current_player.credits += 2000
-            self.log_message(f"Otrzymano 2K")
-
-    def execute_additional_action(self, action_desc: str, cost: int):
-        # CERN: -1 PA dla akcji konsorcjum w ramach FINANSUJ
-        current_player = self.players[self.current_player_idx]
-        effective_cost = cost
-        try:
-            is_consortium_action = 'konsorcj' in (action_desc or '').lower()
-            is_finansuj = bool(self.current_action_card and self.current_action_card.action_type == ActionType.FINANSUJ)
-            inst_name = (current_player.institute.name if current_player.institute else '').lower()
-            if is_consortium_action and is_finansuj and 'cern' in inst_name:
-                effective_cost = max(0, cost - 1)
-        except Exception:
-            effective_cost = cost
-        """Wykonuje akcjÄ™ dodatkowÄ…"""
-        if self.remaining_action_points < effective_cost:
-            messagebox.showwarning("Uwaga", "Brak wystarczajÄ…cych punktĂłw akcji!")
-            return
+        def done(result):
+            # PublikacjÄ™ wybiera gracz w oknie czasopism
+            if action_card.action_type == ActionType.PUBLIKUJ:
+                self.show_journal_selection_for_publish()
+            if self.hex_placement_mode:
+                self.auto_expand_research_widget(self.current_research_for_hex)
+        self.submit_move(Move(MOVE_PLAY_CARD, index), on_done=done)
 
-        current_player = self.players[self.current_player_idx]
-        self.remaining_action_points -= effective_cost
-
-        # Parsuj akcjÄ™ i wykonaj
-        if "doktora" in action_desc.lower() and "aktywuj" in action_desc.lower():
-            self.use_scientist(ScientistType.DOKTOR, 2)
-        elif "profesora" in action_desc.lower() and "aktywuj" in action_desc.lower():
-            self.use_scientist(ScientistType.PROFESOR, 3)
-        elif "rozpocznij" in action_desc.lower() and "badanie" in action_desc.lower():
-            self.enter_research_selection_mode()
-        elif "zatrudnij doktora" in action_desc.lower():
-            self.show_scientist_selection(ScientistType.DOKTOR, cost)
-        elif "zatrudnij profesora" in action_desc.lower():
-            self.show_scientist_selection(ScientistType.PROFESOR, cost)
-        elif "zatrudnij doktoranta" in action_desc.lower():
-            self.hire_scientist(ScientistType.DOKTORANT)
-        elif "weĹş 3k" in action_desc.lower():
-            current_player.credits += 3000
-            self.log_message(f"Otrzymano 3K")
-        elif "konsultacje" in action_desc.lower():
-            self.commercial_consulting()
-        elif "wpĹ‚aÄ‡ do konsorcjum" in action_desc.lower():
-            self.contribute_to_consortium()
-        elif "zaĹ‚ĂłĹĽ konsorcjum" in action_desc.lower():
-            self.start_consortium()
-        elif "kredyt awaryjny" in action_desc.lower():
-            current_player.credits += 5000
-            current_player.reputation = max(0, current_player.reputation - 1)
-            self.log_message(f"Kredyt awaryjny (+5K, -1 Rep)")
-        elif "odĹ›wieĹĽ rynek" in action_desc.lower():
-            self.refresh_market()
-        elif "kampania pr" in action_desc.lower():
-            if current_player.credits >= 4000:
-                current_player.credits -= 4000
-                current_player.reputation = min(5, current_player.reputation + 1)
-                self.log_message(f"Kampania PR (+1 Rep)")
-        elif "poprawa wizerunku" in action_desc.lower():
-            if current_player.research_points >= 2:
-                current_player.research_points -= 2
-                current_player.reputation = min(5, current_player.reputation + 1)
-                self.log_message(f"Poprawa wizerunku (+1 Rep)")
-
-        self.log_message(f"Wykonano: {action_desc}")
-        self.update_ui()
-        self.update_action_menu()
+    def execute_additional_action(self, action_desc: str, cost: int):
+        """Wykonuje akcjÄ™ dodatkowÄ… (reguĹ‚y i koszt w PA - w silniku).
 
-    def add_hex_to_research(self, player: Player, hex_count: int):
-        """Inicjuje tryb ukĹ‚adania heksĂłw dla gracza"""
-        if not player.active_research:
-            messagebox.showinfo("Info", "Brak aktywnych badaĹ„. Najpierw rozpocznij badanie.")
+        Akcja z wyborem otwiera okno, a ruch z wybranÄ… opcjÄ… (i pobraniem PA)
+        wysyĹ‚a dopiero ono przez `submit_choice_action`.
+        """
+        index = list(self.current_action_card.additional_actions).index((action_desc, cost))
+        try:
+            with self.state_lock():
+                kind = self.engine.check_additional_action(index)
+        except RuleViolation as e:
+            messagebox.showwarning("Uwaga", str(e))
             return
 
-        if player.hex_tokens < hex_count:
-            messagebox.showwarning("Uwaga", "Brak wystarczajÄ…cej liczby heksĂłw!")
+        if kind in CHOICE_ACTIONS:
+            self.pending_choice_action = (self.current_action_card, index)
+            if kind == 'start_research':
+                self.enter_research_selection_mode()
+            elif kind == 'hire_doktor':
+                self.show_scientist_selection(ScientistType.DOKTOR, cost)
+            elif kind == 'hire_profesor':
+                self.show_scientist_selection(ScientistType.PROFESOR, cost)
+            elif kind == 'contribute':
+                self.contribute_to_consortium()
+            elif kind == 'found_consortium':
+                self.start_consortium()
             return
 
-        # ZnajdĹş pierwsze aktywne badanie
-        research = player.active_research[0]
-
-        # WprowadĹş tryb ukĹ‚adania heksĂłw
-        self.pending_hex_placements = hex_count
-        self.hex_placement_mode = True
-        self.current_research_for_hex = research
+        def done(result):
+            if self.hex_placement_mode:
+                self.auto_expand_research_widget(self.current_research_for_hex)
+        self.submit_move(Move(MOVE_ADDITIONAL, index), on_done=done)
 
-        self.log_message(f"UkĹ‚adaj {hex_count} heks(Ăłw) na mapie badania '{research.name}'. Kliknij na dozwolone pola.")
-        self.update_ui()
+    def submit_choice_action(self, choice, on_done=None, on_error=None):
+        """Wykonuje akcjÄ™ dodatkowÄ… czekajÄ…cÄ… na wybĂłr gracza w oknie"""
+        card, index = self.pending_choice_action or (None, None)
+        if card is None or card is not self.current_action_card:
+            messagebox.showwarning("Uwaga", "Ta akcja dodatkowa nie jest juĹĽ dostÄ™pna")
+            return
 
-        # Auto-expand odpowiedni widget badania
-        self.auto_expand_research_widget(research)
+        def done(result):
+            self.pending_choice_action = None
+            if on_done:
+                on_done(result)
+        self.submit_move(Move(MOVE_ADDITIONAL, index, choice), on_done=done, on_error=on_error)
 
     def on_hex_clicked(self, position, research: ResearchCard):
         """ObsĹ‚uguje klikniÄ™cie na heks podczas ukĹ‚adania"""
-        if not self.hex_placement_mode or research != self.current_research_for_hex:
+        if not self.hex_placement_mode or research is not self.current_research_for_hex:
             return
 
-        current_player = self.players[self.current_player_idx]
-
-        # SprawdĹş czy moĹĽna poĹ‚oĹĽyÄ‡ heks na tej pozycji
-        if research.hex_research_map.can_place_hex(position, research.player_path):
-            # UmieĹ›Ä‡ heks
-            result = research.hex_research_map.place_hex(position, current_player.color, research.player_path)
-
-            if result['success']:
-                # UsuĹ„ heks z puli gracza
-                current_player.hex_tokens -= 1
-                self.pending_hex_placements -= 1
-
-                # Aktualizuj postÄ™p badania
-                research.hexes_placed = len(research.player_path)
-
-                self.log_message(f"PoĹ‚oĹĽono heks na pozycji ({position.q},{position.r})")
-
-                # SprawdĹş bonusy
-                if result['bonus']:
-                    self.apply_hex_bonus(current_player, result['bonus'])
-                    self.log_message(f"Bonus z heksa: {result['bonus']}")
-
-                # SprawdĹş ukoĹ„czenie badania
-                if result['completed']:
-                    self.log_message(f"Badanie '{research.name}' zostaĹ‚o ukoĹ„czone!")
-                    self.complete_research(current_player, research)
-                    self.hex_placement_mode = False
-                    self.pending_hex_placements = 0
-                    self.current_research_for_hex = None
-                    self.auto_collapse_all_research_widgets()
-                    self.update_ui()
-                    return
-
-                # SprawdĹş czy pozostaĹ‚y jeszcze heksy do poĹ‚oĹĽenia
-                if self.pending_hex_placements <= 0:
-                    self.hex_placement_mode = False
-                    self.current_research_for_hex = None
-                    self.auto_collapse_all_research_widgets()
-                    self.log_message("Wszystkie heksy zostaĹ‚y poĹ‚oĹĽone.")
-
-                self.update_ui()
-            else:
-                self.log_message("Nie moĹĽna poĹ‚oĹĽyÄ‡ heksa w tym miejscu!")
-        else:
-            self.log_message("Nie moĹĽna poĹ‚oĹĽyÄ‡ heksa w tym miejscu! Heks musi przylegaÄ‡ do juĹĽ poĹ‚oĹĽonych.")
-
-    def apply_hex_bonus(self, player: Player, bonus: str):
-        """Aplikuje bonus z heksa bonusowego"""
-        if "+1PB" in bonus:
-            player.research_points += 1
-        elif "+2PB" in bonus:
-            player.research_points += 2
-        elif "+3PB" in bonus:
-            player.research_points += 3
-        elif "+1PZ" in bonus:
-            player.prestige_points += 1
-        elif "+2PZ" in bonus:
-            player.prestige_points += 2
-        elif "+1K" in bonus:
-            player.credits += 1000
-        elif "+2K" in bonus:
-            player.credits += 2000
-        elif "+3K" in bonus:
-            player.credits += 3000
-        elif "+1Rep" in bonus:
-            player.reputation = min(5, player.reputation + 1)
+        def done(result):
+            if not self.hex_placement_mode:
+                self.auto_collapse_all_research_widgets()
+        # KlikniÄ™cie poza dozwolonym polem niczego nie zmienia
+        self.submit_move(Move(MOVE_PLACE_HEX, (position.q, position.r)), on_done=done, on_error=lambda text: None)
 
     def complete_research(self, player: Player, research: ResearchCard):
         """KoĹ„czy badanie"""
-        research.is_completed = True
-        player.active_research.remove(research)
-        player.completed_research.append(research)
-
-        # Reset hex map for this player
-        if research.hex_research_map:
-            research.hex_research_map.reset_player_progress(player.color)
-
-        # Clear player path
-        research.player_path = []
-
-        # Odzyskaj heksy - gracz zawsze wraca do 20 heksĂłw
-        player.hex_tokens = 20
-
-        # Daj nagrodÄ™ podstawowÄ…
-        self.apply_research_reward(player, research.basic_reward)
-
-        # Bonusy instytutĂłw po ukoĹ„czeniu badania
-        try:
-            inst_name = (player.institute.name if player.institute else '').lower()
-            if 'max planck' in inst_name:
-                player.research_points += 1  # +1 PB za kaĹĽde ukoĹ„czone badanie
-            if 'cambridge' in inst_name:
-                player.credits += 2000       # +2K za badanie
-        except Exception:
-            pass
-
-        # ZwiÄ™ksz punkty aktywnoĹ›ci
-        player.activity_points += 4
-        try:
-            player.round_activity_points += 4
-        except Exception:
-            pass
-
-        self.log_message(f"UkoĹ„czono badanie: {research.name}")
-
-    def apply_research_reward(self, player: Player, reward: str):
-        """Aplikuje nagrodÄ™ za ukoĹ„czone badanie"""
-        parts = reward.split(', ')
-        for part in parts:
-            part = part.strip()
-            if 'PB' in part:
-                pb = self.game_data.safe_int_parse(part.split(' ')[0], 0)
-                player.research_points += pb
-            elif 'PZ' in part:
-                pz = self.game_data.safe_int_parse(part.split(' ')[0], 0)
-                player.prestige_points += pz
-
-    def use_scientist(self, scientist_type: ScientistType, hexes: int):
-        """UĹĽywa naukowca do badaĹ„"""
-        current_player = self.players[self.current_player_idx]
-        scientists = [s for s in current_player.scientists
-                     if s.type == scientist_type and s.is_paid]
-
-        if scientists:
-            # Bonusy instytutĂłw: MIT/Stanford +1 heks przy badaniach fizycznych
-            extra_hex = 0
-            try:
-                inst_name = (current_player.institute.name if current_player.institute else '').lower()
-                is_mit_or_stanford = ('mit' in inst_name) or ('stanford' in inst_name)
-                # JeĹ›li aktywne badanie dotyczy fizyki, dodaj +1 heks
-                if is_mit_or_stanford and current_player.active_research:
-                    active = current_player.active_research[0]
-                    if 'fiz' in (active.field or '').lower():
-                        extra_hex = 1
-            except Exception:
-                pass
-            self.add_hex_to_research(current_player, hexes + extra_hex)
-            self.log_message(f"Aktywowano {scientist_type.value} (+{hexes} heks)")
-        else:
-            messagebox.showwarning("Uwaga", f"Brak dostÄ™pnego {scientist_type.value}!")
-
-    def hire_scientist(self, scientist_type: ScientistType):
-        """Zatrudnia naukowca"""
-        current_player = self.players[self.current_player_idx]
-
-        # SprawdĹş czy moĹĽe sobie pozwoliÄ‡
-        cost = {
-            ScientistType.DOKTORANT: 0,
-            ScientistType.DOKTOR: 2000,
-            ScientistType.PROFESOR: 3000
-        }.get(scientist_type, 0)
-
-        if current_player.credits >= cost:
-            # StwĂłrz nowego naukowca
-            if scientist_type == ScientistType.DOKTORANT:
-                new_scientist = Scientist(f"Doktorant {len(current_player.scientists)+1}",
-                                        ScientistType.DOKTORANT, "Uniwersalny", 0, 1, "Brak", "MĹ‚ody naukowiec")
-            elif scientist_type == ScientistType.DOKTOR:
-                new_scientist = Scientist(f"Dr {len(current_player.scientists)+1}",
-                                        ScientistType.DOKTOR, "Uniwersalny", 2000, 2, "Brak", "Doktor nauk")
-            else:  # PROFESOR
-                new_scientist = Scientist(f"Prof. {len(current_player.scientists)+1}",
-                                        ScientistType.PROFESOR, "Uniwersalny", 3000, 3, "Brak", "Profesor nauk")
-
-            current_player.scientists.append(new_scientist)
-            if cost > 0:
-                current_player.credits -= cost
-            self.log_message(f"Zatrudniono: {new_scientist.name}")
-        else:
-            messagebox.showwarning("Uwaga", "Brak wystarczajÄ…cych Ĺ›rodkĂłw!")
-
-    def start_new_research(self):
-        """Rozpoczyna nowe badanie"""
-        current_player = self.players[self.current_player_idx]
-        if current_player.hand_cards:
-            # WeĹş pierwszÄ… kartÄ™ z rÄ™ki
-            card = current_player.hand_cards[0]
-            current_player.hand_cards.remove(card)
-            current_player.active_research.append(card)
-            card.is_active = True
-            self.log_message(f"RozpoczÄ™to badanie: {card.name}")
-
-    def commercial_consulting(self):
-        """Konsultacje komercyjne"""
-        current_player = self.players[self.current_player_idx]
-        professors = [s for s in current_player.scientists if s.type == ScientistType.PROFESOR and s.is_paid]
-
-        if professors:
-            current_player.credits += 4000
-            self.log_message(f"Konsultacje komercyjne (+4K)")
-        else:
-            messagebox.showwarning("Uwaga", "Brak dostÄ™pnego profesora!")
+        self.engine.complete_research(player, research)
 
     def contribute_to_consortium(self):
         """WpĹ‚aca do konsorcjum lub skĹ‚ada wniosek o doĹ‚Ä…czenie"""
@@ -3184,93 +2035,19 @@ class PrincipiaGame:
 
     def contribute_resources_to_project(self, project, resource_type, amount, popup):
         """Kierownik wpĹ‚aca zasoby bezpoĹ›rednio do swojego konsorcjum"""
-        current_player = self.players[self.current_player_idx]
-
-        if resource_type == "pb":
-            if current_player.research_points >= amount:
-                current_player.research_points -= amount
-                project.contributed_pb += amount
-                self.log_message(f"{current_player.name} wpĹ‚aciĹ‚ {amount} PB do konsorcjum: {project.name}")
-            else:
-                messagebox.showwarning("Uwaga", f"Brak wystarczajÄ…cych punktĂłw badawczych! Potrzebujesz {amount} PB")
-                return
-        elif resource_type == "credits":
-            if current_player.credits >= amount:
-                current_player.credits -= amount
-                project.contributed_credits += amount
-                self.log_message(f"{current_player.name} wpĹ‚aciĹ‚ {amount//1000}K do konsorcjum: {project.name}")
-            else:
-                messagebox.showwarning("Uwaga", f"Brak wystarczajÄ…cych Ĺ›rodkĂłw! Potrzebujesz {amount//1000}K")
-                return
-
-        popup.destroy()
-        self.update_ui()
-
-    # ===== Wielkie Projekty: parsowanie wymagan i nagrod, ukonczenie =====
-    def parse_requirements_numbers(self, requirements_text):
-        import re
-        txt = requirements_text or ''
-        pb_req = 0
-        m = re.search(r"(\d+)\s*PB", txt, flags=re.I)
-        if m:
-            pb_req = int(m.group(1))
-        k_req = 0
-        m = re.search(r"(\d+)\s*K", txt, flags=re.I)
-        if m:
-            k_req = int(m.group(1)) * 1000
-        comp_req = 0
-        m = re.search(r"(\d+)\s*uko\w*czone badania", txt, flags=re.I)
-        if m:
-            comp_req = int(m.group(1))
-        needs_prof = ('profesor' in txt.lower())
-        return pb_req, k_req, comp_req, needs_prof
+        project_idx = _index_in(self.game_data.large_projects, project)
+        self.submit_choice_action((project_idx, resource_type), on_done=lambda result: popup.destroy())
+    def parse_requirements_numbers(self, requirements_text):
+        return parse_project_requirements(requirements_text)
 
-    def parse_reward_numbers(self, reward_text):
-        import re
-        txt = reward_text or ''
-        pz = 0
-        kredyty = 0
-        m = re.search(r"(\d+)\s*PZ", txt, flags=re.I)
-        if m:
-            pz = int(m.group(1))
-        for m in re.findall(r"(\d+)\s*K(?!\s*/\s*rund)", txt, flags=re.I):
-            kredyty += int(m) * 1000
-        return pz, kredyty
+    def parse_reward_numbers(self, reward_text):
+        return parse_project_reward(reward_text)
 
-    def can_complete_project(self, project):
-        if project.is_completed or not project.director:
-            return False
-        pb_req, k_req, comp_req, needs_prof = self.parse_requirements_numbers(project.requirements)
-        if project.contributed_pb < pb_req:
-            return False
-        if project.contributed_credits < k_req:
-            return False
-        director = project.director
-        if comp_req and len(director.completed_research) < comp_req:
-            return False
-        if needs_prof and not any(s.type == ScientistType.PROFESOR for s in director.scientists):
-            return False
-        return True
+    def can_complete_project(self, project):
+        return self.engine.can_complete_project(project)
 
-    def complete_project(self, project):
-        if project.is_completed:
-            return
-        if not self.can_complete_project(project):
-            messagebox.showwarning("Uwaga", "Nie spelniono wszystkich wymagan projektu")
-            return
-        director = project.director
-        pz_dir, k_dir = self.parse_reward_numbers(project.director_reward)
-        director.prestige_points += pz_dir
-        director.credits += k_dir
-        pz_mem, k_mem = self.parse_reward_numbers(project.member_reward)
-        for member in project.members:
-            if member is director:
-                continue
-            member.prestige_points += pz_mem
-            member.credits += k_mem
-        project.is_completed = True
-        self.log_message(f"Ukonczono projekt: {project.name}. Kierownik +{pz_dir} PZ, +{k_dir//1000}K; czlonkowie +{pz_mem} PZ, +{k_mem//1000}K")
-        self.update_ui()
+    def complete_project(self, project):
+        self.submit_move(Move(MOVE_COMPLETE_PROJECT, _index_in(self.game_data.large_projects, project)))
 
     def show_consortium_selection_for_join(self, available_consortiums):
         """Pokazuje interfejs wyboru konsorcjum do zĹ‚oĹĽenia wniosku o czĹ‚onkostwo"""
@@ -3346,81 +2123,46 @@ class PrincipiaGame:
 
     def request_consortium_membership(self, project, popup):
         """SkĹ‚ada wniosek o czĹ‚onkostwo w konsorcjum"""
-        current_player = self.players[self.current_player_idx]
-
-        # SprawdĹş czy gracz juĹĽ jest czĹ‚onkiem lub juĹĽ zĹ‚oĹĽyĹ‚ wniosek
-        if current_player in project.members:
-            messagebox.showinfo("Info", "JesteĹ› juĹĽ czĹ‚onkiem tego konsorcjum!")
-            return
-
-        if current_player in project.pending_members:
-            messagebox.showinfo("Info", "JuĹĽ zĹ‚oĹĽyĹ‚eĹ› wniosek o doĹ‚Ä…czenie do tego konsorcjum!")
-            return
-
-        # Dodaj gracza do listy oczekujÄ…cych
-        project.pending_members.append(current_player)
-
-        self.log_message(f"{current_player.name} zĹ‚oĹĽyĹ‚ wniosek o doĹ‚Ä…czenie do konsorcjum: {project.name}")
-
-        # Powiadomienie kierownika
-        if hasattr(self, 'consortium_notifications'):
-            self.consortium_notifications.append({
-                'type': 'membership_request',
-                'project': project,
-                'applicant': current_player,
-                'director': project.director
-            })
-        else:
-            self.consortium_notifications = [{
-                'type': 'membership_request',
-                'project': project,
-                'applicant': current_player,
-                'director': project.director
-            }]
+        project_idx = _index_in(self.game_data.large_projects, project)
+        self.submit_choice_action((project_idx, 'join'),
+                                  on_done=lambda result: self.membership_requested(project, popup),
+                                  on_error=lambda text: messagebox.showinfo("Info", text))
 
+    def membership_requested(self, project, popup):
         messagebox.showinfo("Sukces", f"ZĹ‚oĹĽono wniosek o doĹ‚Ä…czenie do konsorcjum '{project.name}'. Kierownik zostanie powiadomiony.")
-
         popup.destroy()
-        self.update_ui()
 
-    def approve_consortium_membership(self, project, applicant):
+    def notify_membership_request(self, project, applicant: Optional[Player] = None):
+        """Powiadomienie kierownika o wniosku gracza (domyĹ›lnie aktualnego)"""
+        if not hasattr(self, 'consortium_notifications'):
+            self.consortium_notifications = []
+        self.consortium_notifications.append({
+            'type': 'membership_request',
+            'project': project,
+            'applicant': applicant or self.players[self.current_player_idx],
+            'director': project.director
+        })
+
+    def drop_membership_notification(self, project, applicant):
+        if hasattr(self, 'consortium_notifications'):
+            self.consortium_notifications = [
+                notif for notif in self.consortium_notifications
+                if not (notif.get('type') == 'membership_request' and
+                       notif.get('project') == project and
+                       notif.get('applicant') == applicant)
+            ]
+
+    def approve_consortium_membership(self, project, applicant, on_done=None):
         """Kierownik akceptuje wniosek o czĹ‚onkostwo"""
-        if applicant in project.pending_members:
-            project.pending_members.remove(applicant)
-            project.members.append(applicant)
-
-            # UsuĹ„ powiadomienie
-            if hasattr(self, 'consortium_notifications'):
-                self.consortium_notifications = [
-                    notif for notif in self.consortium_notifications
-                    if not (notif.get('type') == 'membership_request' and
-                           notif.get('project') == project and
-                           notif.get('applicant') == applicant)
-                ]
-
-            self.log_message(f"{project.director.name} zaakceptowaĹ‚ {applicant.name} do konsorcjum: {project.name}")
-            self.update_ui()
-            return True
-        return False
+        self.decide_membership(MOVE_APPROVE, project, applicant, on_done)
+
+    def decide_membership(self, kind: str, project, applicant, on_done=None):
+        seat = _index_in(self.players, applicant)
+        self.submit_move(Move(kind, _index_in(self.game_data.large_projects, project), seat), on_done=on_done)
 
-    def reject_consortium_membership(self, project, applicant):
+    def reject_consortium_membership(self, project, applicant, on_done=None):
         """Kierownik odrzuca wniosek o czĹ‚onkostwo"""
-        if applicant in project.pending_members:
-            project.pending_members.remove(applicant)
-
-            # UsuĹ„ powiadomienie
-            if hasattr(self, 'consortium_notifications'):
-                self.consortium_notifications = [
-                    notif for notif in self.consortium_notifications
-                    if not (notif.get('type') == 'membership_request' and
-                           notif.get('project') == project and
-                           notif.get('applicant') == applicant)
-                ]
-
-            self.log_message(f"{project.director.name} odrzuciĹ‚ wniosek {applicant.name} o czĹ‚onkostwo w konsorcjum: {project.name}")
-            self.update_ui()
-            return True
-        return False
+        self.decide_membership(MOVE_REJECT, project, applicant, on_done)
 
     def show_consortium_management_panel(self):
         """Pokazuje panel zarzÄ…dzania konsorcjami dla kierownikĂłw"""
@@ -3499,12 +2241,12 @@ class PrincipiaGame:
                     button_frame.pack(side='right', padx=5)
 
                     accept_btn = tk.Button(button_frame, text="âś… Akceptuj",
-                                         command=lambda p=project, a=applicant: [self.approve_consortium_membership(p, a), popup.destroy(), self.show_consortium_management_panel()],
+                                         command=lambda p=project, a=applicant: [popup.destroy(), self.approve_consortium_membership(p, a, on_done=lambda result: self.show_consortium_management_panel())],
                                          bg='lightgreen', font=('Arial', 8))
                     accept_btn.pack(side='left', padx=2)
 
                     reject_btn = tk.Button(button_frame, text="âťŚ OdrzuÄ‡",
-                                         command=lambda p=project, a=applicant: [self.reject_consortium_membership(p, a), popup.destroy(), self.show_consortium_management_panel()],
+                                         command=lambda p=project, a=applicant: [popup.destroy(), self.reject_consortium_membership(p, a, on_done=lambda result: self.show_consortium_management_panel())],
                                          bg='lightcoral', font=('Arial', 8))
                     reject_btn.pack(side='left', padx=2)
 
@@ -3624,42 +2366,9 @@ class PrincipiaGame:
 
     def request_consortium_membership_independent(self, project, popup):
         """SkĹ‚ada wniosek o czĹ‚onkostwo niezaleĹĽnie od kart akcji"""
-        current_player = self.players[self.current_player_idx]
-
-        # SprawdĹş czy gracz juĹĽ jest czĹ‚onkiem lub juĹĽ zĹ‚oĹĽyĹ‚ wniosek
-        if current_player in project.members:
-            messagebox.showinfo("Info", "JesteĹ› juĹĽ czĹ‚onkiem tego konsorcjum!")
-            return
-
-        if current_player in project.pending_members:
-            messagebox.showinfo("Info", "JuĹĽ zĹ‚oĹĽyĹ‚eĹ› wniosek o doĹ‚Ä…czenie do tego konsorcjum!")
-            return
-
-        # Dodaj gracza do listy oczekujÄ…cych
-        project.pending_members.append(current_player)
-
-        self.log_message(f"{current_player.name} zĹ‚oĹĽyĹ‚ wniosek o doĹ‚Ä…czenie do konsorcjum: {project.name} (niezaleĹĽnie)")
-
-        # Powiadomienie kierownika
-        if hasattr(self, 'consortium_notifications'):
-            self.consortium_notifications.append({
-                'type': 'membership_request',
-                'project': project,
-                'applicant': current_player,
-                'director': project.director
-            })
-        else:
-            self.consortium_notifications = [{
-                'type': 'membership_request',
-                'project': project,
-                'applicant': current_player,
-                'director': project.director
-            }]
-
-        messagebox.showinfo("Sukces", f"ZĹ‚oĹĽono wniosek o doĹ‚Ä…czenie do konsorcjum '{project.name}'. Kierownik zostanie powiadomiony.")
-
-        popup.destroy()
-        self.update_ui()
+        self.submit_move(Move(MOVE_JOIN, _index_in(self.game_data.large_projects, project)),
+                         on_done=lambda result: self.membership_requested(project, popup),
+                         on_error=lambda text: messagebox.showinfo("Info", text))
 
     def start_consortium(self):
         """ZakĹ‚ada konsorcjum"""
@@ -3741,38 +2450,9 @@ class PrincipiaGame:
                  font=('Arial', 10), bg='lightgray').pack(pady=10)
 
     def found_consortium_for_project(self, project, consortium_card, popup):
-        """ZaĹ‚oĹĽyÄ‡ konsorcjum dla wybranego projektu"""
-        current_player = self.players[self.current_player_idx]
-
-        # UsuĹ„ kartÄ™ konsorcjum z rÄ™ki
-        if consortium_card in current_player.hand_cards:
-            current_player.hand_cards.remove(consortium_card)
-
-        # Ustaw kierownika i dodaj do czĹ‚onkĂłw
-        project.director = current_player
-        project.members.append(current_player)
-
-        # ZwiÄ™ksz punkty aktywnoĹ›ci
-        current_player.activity_points += 5
-        try:
-            current_player.round_activity_points += 5
-        except Exception:
-            pass
-
-        self.log_message(f"{current_player.name} zaĹ‚oĹĽyĹ‚ konsorcjum: {project.name} (uĹĽyto KartÄ™ Konsorcjum)")
-
-        popup.destroy()
-        self.update_ui()
-
-    def refresh_market(self):
-        """OdĹ›wieĹĽa rynek"""
-        available_journal_count = min(4, len(self.game_data.journals))
-        self.available_journals = random.sample(self.game_data.journals, available_journal_count)
-
-        available_scientist_count = min(4, len(self.game_data.scientists))
-        self.available_scientists = random.sample(self.game_data.scientists, available_scientist_count)
-
-        self.log_message("OdĹ›wieĹĽono rynek czasopism i naukowcĂłw")
+        """ZaĹ‚oĹĽyÄ‡ konsorcjum dla wybranego projektu (kartÄ™ konsorcjum z rÄ™ki bierze silnik)"""
+        project_idx = _index_in(self.game_data.large_projects, project)
+        self.submit_choice_action(project_idx, on_done=lambda result: popup.destroy())
 
     def setup_cleanup_phase(self):
         """Konfiguruje interfejs fazy porzÄ…dkowej"""
@@ -3959,22 +2639,6 @@ class PrincipiaGame:
                 if self.hex_placement_mode and research == self.current_research_for_hex:
                     research_widget.expand()
 
-    def start_research(self, card: ResearchCard):
-        """Rozpoczyna badanie z panelu kart"""
-        current_player = self.players[self.current_player_idx]
-        if card in current_player.hand_cards:
-            current_player.hand_cards.remove(card)
-            current_player.active_research.append(card)
-            card.is_active = True
-
-            # Initialize research for hex placement
-            card.player_color = current_player.color
-            card.player_path = []
-            card.hexes_placed = 0
-
-            self.log_message(f"RozpoczÄ™to badanie: {card.name}")
-            self.update_ui()
-
     def collapse_siblings(self, current_widget):
         """Zwija wszystkie inne widgety badaĹ„ (accordion behavior)"""
         if hasattr(self, 'research_widgets'):
@@ -3999,43 +2663,15 @@ class PrincipiaGame:
 
     def take_grant(self, grant: GrantCard):
         """Gracz bierze grant"""
-        current_player = self.players[self.current_player_idx]
-
-        if current_player.current_grant is None:
-            # Walidacja wymagaĹ„ grantu
-            try:
-                if not self.meets_grant_requirements(current_player, grant):
-                    messagebox.showwarning("Uwaga", "Nie speĹ‚niasz wymagaĹ„ tego grantu")
-                    return
-            except Exception:
-                pass
-            current_player.current_grant = grant
-            self.available_grants.remove(grant)
-            self.log_message(f"WziÄ™to grant: {grant.name}")
-
-            # PrzejdĹş do nastÄ™pnego gracza
-            self.next_player()
-            self.update_ui()
-        else:
-            messagebox.showwarning("Uwaga", "Masz juĹĽ grant w tej rundzie!")
+        index = _index_in(self.available_grants, grant)
+        if index is None:
+            messagebox.showwarning("Uwaga", "Ten grant nie jest juĹĽ dostÄ™pny")
+            return
+        self.submit_move(Move(MOVE_TAKE_GRANT, index))
 
     def take_subvention(self):
         """Przydziela subwencjÄ™ rzÄ…dowÄ… graczowi (cel: 6 AP w tej rundzie, nagroda: 10K)."""
-        current_player = self.players[self.current_player_idx]
-        if current_player.current_grant is not None:
-            messagebox.showwarning("Uwaga", "Masz juĹĽ grant w tej rundzie!")
-            return
-        sub = GrantCard(
-            name="Subwencja RzÄ…dowa",
-            requirements="Brak wymagaĹ„",
-            goal="6 punktĂłw aktywnoĹ›ci w rundzie",
-            reward="10K",
-            round_bonus="",
-            description="Wsparcie paĹ„stwowe, gdy brak dostÄ™pnych grantĂłw"
-        )
-        current_player.current_grant = sub
-        self.log_message(f"Przydzielono subwencjÄ™ rzÄ…dowÄ… graczowi {current_player.name}")
-        self.update_ui()
+        self.submit_move(Move(MOVE_SUBVENTION))
 
     def enter_research_selection_mode(self):
         """WĹ‚Ä…cza tryb selekcji badania do rozpoczÄ™cia"""
@@ -4225,222 +2861,30 @@ class PrincipiaGame:
         if not self.players:
             messagebox.showwarning("BĹ‚Ä…d", "Brak graczy!")
             return
-
-        current_player = self.players[self.current_player_idx]
-
-        # SprawdĹş koszty
-        eff_salary = scientist.salary if scientist.salary >= 100 else scientist.salary * 1000
-        hire_cost = eff_salary * 2
-        if current_player.credits < hire_cost:
-            messagebox.showwarning("BĹ‚Ä…d", f"Brak Ĺ›rodkĂłw! Koszt: {hire_cost}K")
-            return
-
-        # Zatrudnij
-        current_player.credits -= hire_cost
-        current_player.scientists.append(scientist)
-
-        # UsuĹ„ z rynku
-        self.available_scientists.remove(scientist)
-
-        self.log_message(f"Zatrudniono: {scientist.name} za {hire_cost//1000}K")
-        self.update_markets()
-        self.update_ui()
+        self.hire_scientist_from_market(scientist)
 
     def publish_in_journal_direct(self, journal):
         """Publikuje w konkretnym czasopiĹ›mie bezpoĹ›rednio"""
         if not self.players:
             messagebox.showwarning("BĹ‚Ä…d", "Brak graczy!")
             return
-
-        current_player = self.players[self.current_player_idx]
-
-        # SprawdĹş koszty
-        if current_player.research_points < journal.pb_cost:
-            messagebox.showwarning("BĹ‚Ä…d", f"Brak punktĂłw badaĹ„! Koszt: {journal.pb_cost} PB")
-            return
-
-        # SprawdĹş wymagania reputacji (parsuj z requirements)
-        rep_required = 0
-        if "Reputacja" in journal.requirements:
-            try:
-                rep_text = journal.requirements.split("Reputacja")[1].strip()
-                rep_required = int(rep_text.split("+")[0].strip())
-            except:
-                rep_required = 0
-
-        if current_player.reputation < rep_required:
-            messagebox.showwarning("BĹ‚Ä…d", f"NiewystarczajÄ…ca reputacja! Wymagana: {rep_required}")
-            return
-
-        # Dodatkowe progi reputacji vs nagroda PZ (globalne)
-        try:
-            rep = current_player.reputation
-            if rep <= 1 and journal.pz_reward >= 4:
-                messagebox.showwarning("Uwaga", "Reputacja zbyt niska na publikacjÄ™ o tej wartoĹ›ci PZ")
-                return
-            if rep == 2 and journal.pz_reward >= 6:
-                messagebox.showwarning("Uwaga", "Reputacja zbyt niska na publikacjÄ™ o tej wartoĹ›ci PZ")
-                return
-        except Exception:
-            pass
-
-        # Publikuj
-        current_player.research_points -= journal.pb_cost
-        pz_gain = journal.pz_reward
-        try:
-            # Cambridge: wszystkie publikacje +1 PZ
-            if current_player.institute and 'cambridge' in current_player.institute.name.lower():
-                pz_gain += 1
-        except Exception:
-            pass
-        current_player.prestige_points += pz_gain
-        current_player.publications += 1
-        current_player.activity_points += 3  # Punkt aktywnoĹ›ci za publikacjÄ™
-        try:
-            current_player.round_activity_points += 3
-        except Exception:
-            pass
-
-        # Harvard: publikacja IF 6+ â†’ +1 reputacja
-        try:
-            if current_player.institute and 'harvard' in current_player.institute.name.lower() and journal.impact_factor >= 6:
-                current_player.reputation = min(5, current_player.reputation + 1)
-        except Exception:
-            pass
-        try:
-            current_player.round_activity_points += 3
-        except Exception:
-            pass
-        try:
-            current_player.round_activity_points += 3
-        except Exception:
-            pass
-
-        # Dodaj do historii publikacji
-        import copy
-        current_player.publication_history.append(copy.deepcopy(journal))
-
-        self.log_message(f"Opublikowano w {journal.name} za {journal.pb_cost} PB, +{pz_gain} PZ")
-        self.update_ui()
+        self.publish_in_journal_from_market(journal)
 
     def hire_scientist_from_market(self, scientist):
         """Zatrudnia naukowca z rynku podczas akcji ZATRUDNIJ PERSONEL"""
-        if not (hasattr(self, 'current_action_card') and self.current_action_card and
-                self.current_action_card.action_type == ActionType.ZATRUDNIJ):
-            messagebox.showwarning("BĹ‚Ä…d", "Musisz najpierw zagraÄ‡ kartÄ™ ZATRUDNIJ PERSONEL!")
-            return
-
-        current_player = self.players[self.current_player_idx]
-
-        # SprawdĹş koszty w punktach akcji
-        pa_cost = 2 if scientist.type == ScientistType.DOKTOR else 3 if scientist.type == ScientistType.PROFESOR else 1
-        if self.remaining_action_points < pa_cost:
-            messagebox.showwarning("BĹ‚Ä…d", f"Brak punktĂłw akcji! Wymagane: {pa_cost} PA")
-            return
-
-        # SprawdĹş koszty finansowe (koszt zatrudnienia = 2x pensja)
-        eff_salary = scientist.salary if scientist.salary >= 100 else scientist.salary * 1000
-        hire_cost = eff_salary * 2
-        if current_player.credits < hire_cost:
-            messagebox.showwarning("BĹ‚Ä…d", f"Brak Ĺ›rodkĂłw! Koszt: {hire_cost}K")
+        index = _index_in(self.available_scientists, scientist)
+        if index is None:
+            messagebox.showwarning("BĹ‚Ä…d", "Tego naukowca nie ma juĹĽ na rynku")
             return
-
-        # Zatrudnij
-        current_player.credits -= hire_cost
-        current_player.scientists.append(scientist)
-        self.remaining_action_points -= pa_cost
-
-        # UsuĹ„ z rynku
-        self.available_scientists.remove(scientist)
-
-        # Dodaj punkty aktywnoĹ›ci
-        current_player.activity_points += 2
-        try:
-            current_player.round_activity_points += 2
-        except Exception:
-            pass
-        try:
-            current_player.round_activity_points += 2
-        except Exception:
-            pass
-        try:
-            current_player.round_activity_points += 2
-        except Exception:
-            pass
-
-        self.log_message(f"Zatrudniono {scientist.name} za {hire_cost//1000}K (-{pa_cost} PA)")
-        self.update_markets()
-        self.update_ui()
-        self.update_action_menu()
+        self.submit_move(Move(MOVE_HIRE, index), on_error=lambda text: messagebox.showwarning("BĹ‚Ä…d", text))
 
     def publish_in_journal_from_market(self, journal):
         """Publikuje w czasopiĹ›mie z rynku podczas akcji PUBLIKUJ"""
-        if not (hasattr(self, 'current_action_card') and self.current_action_card and
-                self.current_action_card.action_type == ActionType.PUBLIKUJ):
-            messagebox.showwarning("BĹ‚Ä…d", "Musisz najpierw zagraÄ‡ kartÄ™ PUBLIKUJ!")
-            return
-
-        current_player = self.players[self.current_player_idx]
-
-        # SprawdĹş koszty
-        if current_player.research_points < journal.pb_cost:
-            messagebox.showwarning("BĹ‚Ä…d", f"Brak punktĂłw badaĹ„! Koszt: {journal.pb_cost} PB")
-            return
-
-        # SprawdĹş wymagania reputacji
-        rep_required = 0
-        if "Reputacja" in journal.requirements:
-            try:
-                rep_text = journal.requirements.split("Reputacja")[1].strip()
-                rep_required = int(rep_text.split("+")[0].strip())
-            except:
-                rep_required = 0
-
-        if current_player.reputation < rep_required:
-            messagebox.showwarning("BĹ‚Ä…d", f"NiewystarczajÄ…ca reputacja! Wymagana: {rep_required}")
+        index = _index_in(self.available_journals, journal)
+        if index is None:
+            messagebox.showwarning("BĹ‚Ä…d", "Tego czasopisma nie ma juĹĽ na rynku")
             return
-
-        # Dodatkowe progi reputacji vs PZ
-        try:
-            rep = current_player.reputation
-            if rep <= 1 and journal.pz_reward >= 4:
-                messagebox.showwarning("Uwaga", "Reputacja zbyt niska na publikacjÄ™ o tej wartoĹ›ci PZ")
-                return
-            if rep == 2 and journal.pz_reward >= 6:
-                messagebox.showwarning("Uwaga", "Reputacja zbyt niska na publikacjÄ™ o tej wartoĹ›ci PZ")
-                return
-        except Exception:
-            pass
-
-        # Publikuj (akcja podstawowa - nie kosztuje PA)
-        current_player.research_points -= journal.pb_cost
-        pz_gain = journal.pz_reward
-        try:
-            if current_player.institute and 'cambridge' in current_player.institute.name.lower():
-                pz_gain += 1
-        except Exception:
-            pass
-        current_player.prestige_points += pz_gain
-        current_player.publications += 1
-        current_player.activity_points += 3
-        try:
-            current_player.round_activity_points += 3
-        except Exception:
-            pass
-
-        # Harvard bonus: IF 6+ â†’ +1 reputacja
-        try:
-            if current_player.institute and 'harvard' in current_player.institute.name.lower() and journal.impact_factor >= 6:
-                current_player.reputation = min(5, current_player.reputation + 1)
-        except Exception:
-            pass
-
-        # Dodaj do historii publikacji
-        import copy
-        current_player.publication_history.append(copy.deepcopy(journal))
-
-        self.log_message(f"Opublikowano w {journal.name} za {journal.pb_cost} PB â†’ +{pz_gain} PZ")
-        self.update_ui()
+        self.submit_move(Move(MOVE_PUBLISH, index), on_error=lambda text: messagebox.showwarning("BĹ‚Ä…d", text))
 
     def show_journal_selection_for_publish(self):
         """Pokazuje okno wyboru czasopisma dla akcji podstawowej PUBLIKUJ"""
@@ -4493,7 +2937,7 @@ class PrincipiaGame:
             tk.Label(details_frame, text=f"â­ +{journal.pz_reward} PZ", font=('Arial', 10), bg='lightyellow').pack(side='left', padx=(10,0))
 
             # Wymagania
-            if journal.requirements != "Brak wymagaĹ„":
+            if journal.requirements != "Brak wymagań":
                 req_frame = tk.Frame(journal_frame, bg='lightyellow')
                 req_frame.pack(fill='x', padx=5, pady=2)
                 tk.Label(req_frame, text=f"đź“‹ {journal.requirements}", font=('Arial', 9), bg='lightyellow').pack()
@@ -4588,30 +3032,12 @@ class PrincipiaGame:
                  font=('Arial', 10), bg='lightgray').pack(pady=10)
 
     def hire_scientist_from_action(self, scientist, pa_cost: int):
-        """Zatrudnia naukowca podczas akcji z menu"""
-        current_player = self.players[self.current_player_idx]
-
-        # SprawdĹş koszty finansowe
-        eff_salary = scientist.salary if scientist.salary >= 100 else scientist.salary * 1000
-        hire_cost = eff_salary * 2
-        if current_player.credits < hire_cost:
-            messagebox.showwarning("BĹ‚Ä…d", f"Brak Ĺ›rodkĂłw! Koszt: {hire_cost}K")
+        """Zatrudnia naukowca wybranego w akcji dodatkowej (PA pobiera ten sam ruch)"""
+        index = _index_in(self.available_scientists, scientist)
+        if index is None:
+            messagebox.showwarning("BĹ‚Ä…d", "Tego naukowca nie ma juĹĽ na rynku")
             return
-
-        # Zatrudnij (PA zostaĹ‚o juĹĽ odejmowane w execute_additional_action)
-        current_player.credits -= hire_cost
-        current_player.scientists.append(scientist)
-
-        # UsuĹ„ z rynku
-        self.available_scientists.remove(scientist)
-
-        # Dodaj punkty aktywnoĹ›ci
-        current_player.activity_points += 2
-
-        self.log_message(f"Zatrudniono {scientist.name} za {hire_cost//1000}K")
-        self.update_markets()
-        self.update_ui()
-        self.update_action_menu()
+        self.submit_choice_action(index, on_error=lambda text: messagebox.showwarning("BĹ‚Ä…d", text))
 
     def show_employed_scientists(self, player):
         """Pokazuje okno z zatrudnionymi naukowcami gracza"""
@@ -4692,29 +3118,22 @@ class PrincipiaGame:
             messagebox.showwarning("Uwaga", "Nie wybrano karty badania!")
             return
 
-        current_player = self.players[self.current_player_idx]
-        card = self.selected_research_for_start
-
-        # Rozpocznij badanie
-        current_player.hand_cards.remove(card)
-        current_player.active_research.append(card)
-        card.is_active = True
-
-        self.log_message(f"RozpoczÄ™to badanie: {card.name}")
-
-        # WyjdĹş z trybu selekcji
-        self.research_selection_mode = False
-        self.selected_research_for_start = None
+        card_idx = _index_in(self.players[self.current_player_idx].hand_cards, self.selected_research_for_start)
+        if card_idx is None:
+            messagebox.showwarning("Uwaga", "Tej karty nie ma na rÄ™ku!")
+            return
 
-        self.update_ui()
+        def done(result):
+            # WyjdĹş z trybu selekcji
+            self.research_selection_mode = False
+            self.selected_research_for_start = None
+        self.submit_choice_action(card_idx, on_done=done)
 
     def cancel_research_selection(self):
-        """Anuluje selekcjÄ™ badania"""
+        """Anuluje selekcjÄ™ badania (PA pobiera dopiero zatwierdzony wybĂłr)"""
         self.research_selection_mode = False
         self.selected_research_for_start = None
-
-        # ZwrĂłÄ‡ punkt akcji
-        self.remaining_action_points += 1
+        self.pending_choice_action = None
 
         self.log_message("Anulowano wybĂłr badania")
         self.update_ui()
@@ -4821,83 +3240,34 @@ class PrincipiaGame:
 
     def prepare_crisis_deck(self):
         """Przygotowuje taliÄ™ kryzysĂłw na podstawie wybranego scenariusza"""
-        if not self.current_scenario:
-            return
-
-        # Wybierz losowe kryzysy z dostÄ™pnej puli
-        available_crises = self.game_data.crisis_cards.copy()
-        random.shuffle(available_crises)
-
-        # Dobierz odpowiedniÄ… liczbÄ™ kryzysĂłw
-        self.crisis_deck = available_crises[:self.current_scenario.crisis_count]
-
-        self.log_message(f"Przygotowano {len(self.crisis_deck)} kryzysĂłw na rundy {self.current_scenario.crisis_rounds}")
+        self.engine.prepare_crisis_deck()
 
     def check_for_crisis(self):
-        """Sprawdza czy w aktualnej rundzie powinien zostaÄ‡ odkryty kryzys"""
-        if not self.current_scenario or not self.crisis_deck:
-            return
-
-        # SprawdĹş czy aktualna runda jest w liĹ›cie rund kryzysowych
-        if self.game_data.current_round in self.current_scenario.crisis_rounds:
-            # ZnajdĹş indeks rundy w liĹ›cie
-            crisis_index = self.current_scenario.crisis_rounds.index(self.game_data.current_round)
-
-            # SprawdĹş czy mamy jeszcze kryzysy do odkrycia
-            if crisis_index < len(self.crisis_deck):
-                crisis = self.crisis_deck[crisis_index]
-                self.reveal_crisis(crisis)
+        """Sprawdza czy w aktualnej rundzie powinien zostaÄ‡ odkryty kryzys (harmonogram scenariusza w silniku)"""
+        return self.engine.check_for_crisis()
 
     def reveal_crisis(self, crisis: CrisisCard):
-        """Odkrywa i aktywuje kryzys"""
-        self.game_data.revealed_crises.append(crisis)
-
-        # PokaĹĽ informacjÄ™ o kryzysie
+        """Pokazuje kryzys odkryty przez silnik (efekty sÄ… juĹĽ zastosowane)"""
         messagebox.showinfo(
-            f"KRYZYS - Runda {self.game_data.current_round}",
+            f"KRYZYS - Runda {self.current_round}",
             f"đźš¨ {crisis.name}\n\n{crisis.description}\n\nEfekt: {crisis.effect}\n\nEfekt jest aktywny natychmiast!"
         )
-
-        # Zastosuj efekt kryzysu
-        self.apply_crisis_effect(crisis)
-
-        # Aktualizuj interfejs
         self.update_crisis_display()
-        self.log_message(f"KRYZYS AKTYWOWANY: {crisis.name}")
-
-    def apply_crisis_effect(self, crisis: CrisisCard):
-        """Stosuje efekt kryzysu do wszystkich graczy"""
-        # Tutaj moĹĽna dodaÄ‡ konkretnÄ… logikÄ™ dla rĂłĹĽnych typĂłw kryzysĂłw
-        # Na razie tylko logujemy efekt
-        self.log_message(f"Efekt kryzysu: {crisis.effect}")
-
-        # PrzykĹ‚ady moĹĽliwych efektĂłw (do rozwiniÄ™cia w przyszĹ‚oĹ›ci):
-        if "pensje" in crisis.effect.lower():
-            self.log_message("đź’° Wszystkie pensje kosztujÄ… wiÄ™cej w tej rundzie")
-        elif "badania" in crisis.effect.lower():
-            self.log_message("đź”¬ Badania sÄ… trudniejsze w tej rundzie")
-        elif "reputacja" in crisis.effect.lower():
-            self.log_message("â­ WpĹ‚yw na reputacjÄ™ wszystkich graczy")
 
     def advance_round(self):
-        """Rozpoczyna nowÄ… rundÄ™ i sprawdza kryzysy"""
-        self.game_data.current_round += 1
-        self.log_message(f"\nđź•’ RUNDA {self.game_data.current_round}")
-
-        # SprawdĹş czy koĹ„czymy grÄ™
-        if self.current_scenario and self.game_data.current_round > self.current_scenario.max_rounds:
-            self.end_game()
+        """KoĹ„czy bieĹĽÄ…cÄ… rundÄ™ przez fazy silnika (pensje, granty, kryzysy nowej rundy)"""
+        if self.game_ended:
             return
 
-        # SprawdĹş kryzysy na poczÄ…tek rundy
-        self.check_for_crisis()
-
-        # Aktualizuj interfejs
-        self.update_round_display()
+        def done(result):
+            if not self.game_ended:
+                self.log_message(f"\nđź•’ RUNDA {self.current_round}")
+            self.update_phase_buttons()
+        self.submit_move(Move(MOVE_NEXT_ROUND), on_done=done)
 
     def update_round_display(self):
         """Aktualizuje wyĹ›wietlanie informacji o rundzie"""
-        round_info = f"Runda: {self.game_data.current_round}"
+        round_info = f"Runda: {self.current_round}"
         if self.current_scenario:
             round_info += f"/{self.current_scenario.max_rounds}"
 
@@ -4905,10 +3275,10 @@ class PrincipiaGame:
 
     def update_crisis_display(self):
         """Aktualizuje wyĹ›wietlanie aktywnych kryzysĂłw"""
-        if not self.game_data.revealed_crises:
+        if not self.active_crises:
             self.active_crisis_text.config(text="Brak", foreground='green')
         else:
-            crisis_names = [crisis.name for crisis in self.game_data.revealed_crises]
+            crisis_names = [crisis.name for crisis in self.active_crises]
             crisis_text = ", ".join(crisis_names)
             self.active_crisis_text.config(text=crisis_text, foreground='red')
 
@@ -4929,44 +3299,6 @@ class PrincipiaGame:
             f"Warunki zwyciÄ™stwa: {self.current_scenario.victory_conditions}"
         )
 
-    def hire_scientist(self, scientist_type: ScientistType):
-        """Zatrudnia naukowca bezpoĹ›rednio (np. doktoranta)"""
-        current_player = self.players[self.current_player_idx]
-
-        # UtwĂłrz nowego naukowca odpowiedniego typu
-        if scientist_type == ScientistType.DOKTORANT:
-            new_scientist = Scientist("Doktorant", ScientistType.DOKTORANT, "Uniwersalny", 0, 1, "Brak", "MĹ‚ody naukowiec")
-            hire_cost = 0  # Doktorant nie kosztuje pieniÄ™dzy
-        elif scientist_type == ScientistType.DOKTOR:
-            new_scientist = Scientist("Dr Nowy", ScientistType.DOKTOR, "Uniwersalny", 2000, 2, "Brak", "Nowo zatrudniony doktor")
-            hire_cost = 4000  # 2x pensja
-        elif scientist_type == ScientistType.PROFESOR:
-            new_scientist = Scientist("Prof. Nowy", ScientistType.PROFESOR, "Uniwersalny", 3000, 3, "Brak", "Nowo zatrudniony profesor")
-            hire_cost = 6000  # 2x pensja
-        else:
-            messagebox.showwarning("BĹ‚Ä…d", f"Nieznany typ naukowca: {scientist_type}")
-            return
-
-        # SprawdĹş koszty finansowe
-        if current_player.credits < hire_cost:
-            messagebox.showwarning("BĹ‚Ä…d", f"Brak Ĺ›rodkĂłw! Koszt: {hire_cost//1000}K")
-            return
-
-        # Zatrudnij
-        current_player.credits -= hire_cost
-        current_player.scientists.append(new_scientist)
-
-        # Dodaj punkty aktywnoĹ›ci
-        current_player.activity_points += 2
-
-        if hire_cost > 0:
-            self.log_message(f"Zatrudniono {new_scientist.name} za {hire_cost//1000}K")
-        else:
-            self.log_message(f"Zatrudniono {new_scientist.name} (bez kosztĂłw)")
-
-        self.update_ui()
-        self.update_action_menu()
-
     def preview_research_card(self, card):
         """Pokazuje podglÄ…d karty badania"""
         popup = tk.Toplevel(self.root)
@@ -5091,11 +3423,12 @@ class PrincipiaGame:
             "research_points": "Punkty badaĹ„",
             "reputation": "Reputacja",
             "hex": "Heksy",
-            "action_points": "Punkty akcji"
+            "action_points": "Punkty akcji",
+            "prestige_points": "Punkty prestiĹĽu"
         }
         bonus_name = bonus_types.get(card.bonus_type, card.bonus_type)
 
-        tk.Label(details_frame, text=f"Bonus: +{card.bonus_value} {bonus_name}",
+        tk.Label(details_frame, text=f"{bonus_name}: {card.bonus_value}", wraplength=420, justify='left',
                 font=('Arial', 12, 'bold'), fg='green').pack(anchor='w', pady=5)
 
         # Wymagania
@@ -5141,15 +3474,11 @@ class PrincipiaGame:
 
     def use_intrigue_card(self, card: IntrigueCard):
         """UĹĽywa kartÄ™ intrygi - wybiera cel i wykonuje efekt"""
-        current_player = self.players[self.current_player_idx]
-
-        # SprawdĹş czy karta wymaga wyboru celu
-        if card.target == "opponent" or any(effect.target_type == "opponent" for effect in card.effects):
+        # Cel wybiera gracz tylko dla kart na przeciwnika (jak w legal_moves silnika)
+        if intrigue_target(card) == 'opponent':
             self.select_target_for_intrigue(card)
-        elif card.target == "all" or any(effect.target_type in ["all_players", "all_opponents"] for effect in card.effects):
-            self.confirm_intrigue_usage(card, None)  # Brak konkretnego celu
-        else:  # self
-            self.confirm_intrigue_usage(card, current_player)
+        else:
+            self.confirm_intrigue_usage(card, None)
 
     def select_target_for_intrigue(self, card: IntrigueCard):
         """Pozwala wybraÄ‡ gracza jako cel karty intrygi"""
@@ -5192,12 +3521,10 @@ class PrincipiaGame:
 
     def confirm_intrigue_usage(self, card: IntrigueCard, target_player):
         """Potwierdza uĹĽycie karty intrygi i wykonuje efekt"""
-        current_player = self.players[self.current_player_idx]
-
         # Przygotuj tekst potwierdzenia
         if target_player:
             target_text = f"na gracza {target_player.name}"
-        elif card.target == "all":
+        elif intrigue_target(card) == 'all':
             target_text = "na wszystkich graczy"
         else:
             target_text = "na siebie"
@@ -5211,31 +3538,18 @@ class PrincipiaGame:
         )
 
         if confirm:
-            self.execute_intrigue_effects(card, target_player)
-            # UsuĹ„ kartÄ™ z rÄ™ki gracza
-            current_player.hand_cards.remove(card)
-            self.log_message(f"{current_player.name} uĹĽyĹ‚ karty intrygi: {card.name}")
-            self.update_ui()
-
-    def execute_intrigue_effects(self, card: IntrigueCard, target_player):
-        """Wykonuje wszystkie efekty karty intrygi"""
-        current_player = self.players[self.current_player_idx]
-
-        for effect in card.effects:
-            # OkreĹ›l listÄ™ graczy docelowych
-            targets = []
-            if effect.target_type == "opponent" and target_player:
-                targets = [target_player]
-            elif effect.target_type == "all_opponents":
-                targets = [p for p in self.players if p != current_player]
-            elif effect.target_type == "all_players":
-                targets = self.players
-            elif effect.target_type == "self":
-                targets = [current_player]
-
-            # Wykonaj efekt na kaĹĽdym celu
-            for target in targets:
-                self.apply_intrigue_effect(effect, target, current_player)
+            card_idx = _index_in(self.players[self.current_player_idx].hand_cards, card)
+            target_seat = _index_in(self.players, target_player) if target_player else None
+            self.submit_move(Move(MOVE_INTRIGUE, card_idx, target_seat),
+                             on_done=lambda result: self.show_revealed_hands(result.get('revealed', [])))
+
+    def show_revealed_hands(self, revealed):
+        """Pokazuje rÄ™ce odkryte kartÄ… intrygi ([miejsce gracza, nazwy kart])"""
+        for seat, card_names in revealed:
+            messagebox.showinfo(
+                f"RÄ™ka gracza {self.players[seat].name}",
+                f"Karty w rÄ™ce:\n" + "\n".join(card_names) if card_names else "Brak kart w rÄ™ce"
+            )
 
     def use_opportunity_card(self, card: OpportunityCard):
         """UĹĽywa kartÄ™ okazji - sprawdza warunki i wykonuje efekt na graczu"""
@@ -5252,127 +3566,17 @@ class PrincipiaGame:
         confirm = messagebox.askyesno(
             "Potwierdzenie",
             f"Czy na pewno chcesz uĹĽyÄ‡ kartÄ™ '{card.name}'?\n\n"
-            f"Efekt: {card.bonus_value} {card.bonus_type}\n"
+            f"Efekt: {card.bonus_value}\n"
             f"Opis: {card.description}",
             icon='question'
         )
 
         if confirm:
-            self.execute_opportunity_effects(card, current_player)
-            # UsuĹ„ kartÄ™ z rÄ™ki gracza
-            current_player.hand_cards.remove(card)
-            self.log_message(f"{current_player.name} uĹĽyĹ‚ karty okazji: {card.name}")
-            self.update_ui()
+            self.submit_move(Move(MOVE_OPPORTUNITY, _index_in(current_player.hand_cards, card)))
 
     def check_opportunity_conditions(self, card: OpportunityCard, player) -> bool:
         """Sprawdza czy gracz speĹ‚nia warunki uĹĽycia karty okazji"""
-        condition = card.requirements.lower()
-
-        if condition == "brak":
-            return True
-        elif "min. 1 publikacja" in condition:
-            return player.publications >= 1
-        elif "aktywne badanie" in condition:
-            return len(player.active_research) > 0
-        elif "reputacja 3+" in condition:
-            return player.reputation >= 3
-        elif "ukoĹ„czone badanie" in condition:
-            return len(player.completed_research) > 0
-        elif "min. 1 profesor" in condition:
-            return any(scientist.type == ScientistType.PROFESOR for scientist in player.scientists)
-        elif "badanie chemiczne lub fizyczne" in condition:
-            return any(research.field in ["Chemia", "Fizyka"] for research in player.active_research + player.completed_research)
-        else:
-            return True  # DomyĹ›lnie pozwĂłl
-
-    def execute_opportunity_effects(self, card: OpportunityCard, target_player):
-        """Wykonuje wszystkie efekty karty okazji"""
-        for effect in card.effects:
-            self.apply_opportunity_effect(effect, target_player)
-
-    def apply_opportunity_effect(self, effect: OpportunityEffect, target_player):
-        """Stosuje pojedynczy efekt okazji na graczu"""
-        # Stanford: podwaja zyski z kart okazji
-        try:
-            cp = self.players[self.current_player_idx]
-            stanford_mult = 2 if (cp and cp.institute and 'stanford' in cp.institute.name.lower()) else 1
-        except Exception:
-            stanford_mult = 1
-        if effect.operation == "add":
-            if effect.parameter == "credits":
-                target_player.credits += (effect.value * stanford_mult)
-                self.log_message(f"{target_player.name} zyskuje {effect.value//1000}K")
-            elif effect.parameter == "research_points":
-                target_player.research_points += (effect.value * stanford_mult)
-                self.log_message(f"{target_player.name} zyskuje {effect.value} PB")
-            elif effect.parameter == "reputation":
-                try:
-                    target_player.reputation = max(0, min(5, target_player.reputation + (effect.value * stanford_mult)))
-                except Exception:
-                    target_player.reputation += (effect.value * stanford_mult)
-                self.log_message(f"{target_player.name} zyskuje {effect.value} reputacji")
-            elif effect.parameter == "hex_tokens":
-                target_player.hex_tokens += effect.value
-                self.log_message(f"{target_player.name} zyskuje {effect.value} heksĂłw")
-            elif effect.parameter == "action_points":
-                try:
-                    self.remaining_action_points += (effect.value * stanford_mult)
-                except Exception:
-                    pass
-                self.log_message(f"{target_player.name} zyskuje {effect.value} punktĂłw akcji")
-            elif effect.parameter == "prestige_points":
-                target_player.prestige_points += effect.value
-                self.log_message(f"{target_player.name} zyskuje {effect.value} PZ")
-
-    def apply_intrigue_effect(self, effect: IntrigueEffect, target_player, source_player):
-        """Stosuje pojedynczy efekt intrygi na graczu"""
-        if effect.operation == "subtract":
-            if effect.parameter == "credits":
-                target_player.credits = max(0, target_player.credits - effect.value)
-                self.log_message(f"{target_player.name} traci {effect.value//1000}K")
-            elif effect.parameter == "reputation":
-                target_player.reputation = max(0, target_player.reputation - effect.value)
-                self.log_message(f"{target_player.name} traci {effect.value} reputacji")
-            elif effect.parameter == "research_points":
-                target_player.research_points = max(0, target_player.research_points - effect.value)
-                self.log_message(f"{target_player.name} traci {effect.value} PB")
-            elif effect.parameter == "publications":
-                target_player.publications = max(0, target_player.publications - effect.value)
-                self.log_message(f"{target_player.name} traci {effect.value} publikacji")
-
-        elif effect.operation == "add":
-            if effect.parameter == "credits":
-                target_player.credits += effect.value
-                self.log_message(f"{target_player.name} zyskuje {effect.value//1000}K")
-            elif effect.parameter == "reputation":
-                target_player.reputation = min(5, target_player.reputation + effect.value)
-                self.log_message(f"{target_player.name} zyskuje {effect.value} reputacji")
-            elif effect.parameter == "research_points":
-                target_player.research_points += effect.value
-                self.log_message(f"{target_player.name} zyskuje {effect.value} PB")
-
-        elif effect.operation == "steal":
-            if effect.special_type == "scientist" and target_player.scientists:
-                # Przejmij naukowca
-                stolen_scientist = target_player.scientists.pop()
-                source_player.scientists.append(stolen_scientist)
-                self.log_message(f"{source_player.name} przejmuje naukowca {stolen_scientist.name} od {target_player.name}")
-
-        elif effect.operation == "remove":
-            if effect.parameter == "current_grant" and target_player.current_grant:
-                grant_name = target_player.current_grant.name
-                target_player.current_grant = None
-                self.log_message(f"{target_player.name} traci grant: {grant_name}")
-
-        elif effect.operation == "reveal":
-            if effect.parameter == "hand_cards":
-                card_names = [card.name for card in target_player.hand_cards]
-                messagebox.showinfo(
-                    f"RÄ™ka gracza {target_player.name}",
-                    f"Karty w rÄ™ce:\n" + "\n".join(card_names) if card_names else "Brak kart w rÄ™ce"
-                )
-
-        # TODO: DodaÄ‡ obsĹ‚ugÄ™ pozostaĹ‚ych operacji (block, copy, itp.)
+        return self.engine.can_use_opportunity(card, player)
 
     def update_dev_resource_displays(self):
         """Update the resource displays in developer tools"""
@@ -5400,7 +3604,14 @@ class PrincipiaGame:
             pass  # Player selection invalid
 
     def toggle_developer_mode(self, event=None):
-        """Toggle developer mode on/off"""
+        """Toggle developer mode on/off.
+
+        NarzÄ™dzia deweloperskie zmieniajÄ… stan gry z pominiÄ™ciem kolejki
+        poleceĹ„ hosta, wiÄ™c w grze sieciowej sÄ… niedostÄ™pne.
+        """
+        if not self.developer_mode and self.is_network_game:
+            self.log_message("đź”§ Tryb deweloperski jest niedostÄ™pny w grze sieciowej")
+            return
         self.developer_mode = not self.developer_mode
 
         if self.developer_mode:
@@ -5789,9 +4000,8 @@ class PrincipiaGame:
                 card_obj = next((card for card in self.game_data.opportunity_cards if card.name == card_name), None)
 
             if card_obj:
-                # Create a copy to avoid modifying the original
-                import copy
-                card_copy = copy.deepcopy(card_obj)
+                # Create a copy to avoid modifying the original (immutable cards are shared)
+                card_copy = clone_state(card_obj, {})
                 player.hand_cards.append(card_copy)
 
                 self.log_message(f"đź”§ DEV: Added {card_name} to {player.name}'s hand")
@@ -6116,22 +4326,72 @@ class PrincipiaGame:
             self.notifications_frame.pack_forget()
 
     # Metody komunikacji sieciowej
-    def send_action_to_network(self, action_type, action_data):
-        """WysyĹ‚a akcjÄ™ gracza do sieci"""
-        if self.is_network_game and not self.is_host:
-            if self.game_client:
-                self.game_client.send_action(action_type, action_data)
-        elif self.is_network_game and self.is_host:
-            if self.game_server:
-                # Host rozgĹ‚asza akcjÄ™ do wszystkich klientĂłw
-                message = NetworkMessage(
-                    type=MessageType.PLAYER_ACTION,
-                    data={'action_type': action_type, 'action_data': action_data}
-                )
-                self.game_server._broadcast_message(message)
+    def start_network_inbox(self):
+        """Uruchamia cykliczne oprĂłĹĽnianie skrzynki zdarzeĹ„ sieciowych"""
+        if not self.network_inbox_active:
+            self.network_inbox_active = True
+            self.root.after(INBOX_TICK_MS, self.process_network_inbox)
+
+    def bind_engine_events(self, via_inbox: bool):
+        """WiÄ…ĹĽe log, kryzysy i koniec gry silnika z oknem.
+
+        Na hoĹ›cie silnik zmienia wÄ…tek poleceĹ„ serwera - zdarzenia idÄ… wtedy
+        przez skrzynkÄ™ i pokazuje je pÄ™tla tkinter (process_network_inbox).
+        """
+        if not via_inbox:
+            self.engine.on_log = self.log_message
+            self.engine.on_crisis = self.reveal_crisis
+            self.engine.on_game_over = self.show_game_results
+            return
+        inbox = self.network_inbox
+        self.engine.on_log = lambda message: inbox.push(INBOX_LOG, message)
+        self.engine.on_crisis = lambda crisis: inbox.push(INBOX_CRISIS, crisis)
+        self.engine.on_game_over = lambda reason, results: inbox.push(INBOX_GAME_OVER, (reason, results))
+
+    def process_network_inbox(self):
+        """ObsĹ‚uguje zdarzenia sieciowe w wÄ…tku interfejsu.
+
+        Wszystkie zdarzenia z jednego cyklu (np. seria akcji) dajÄ… co
+        najwyĹĽej jedno odĹ›wieĹĽenie UI.
+        """
+        if not self.is_network_game:
+            self.network_inbox_active = False
+            return
+
+        repaint = False
+        for kind, payload in self.network_inbox.drain():
+            if kind == INBOX_ACTION:
+                # Na hoĹ›cie akcjÄ™ zastosowaĹ‚ juĹĽ serwer - wystarczy odĹ›wieĹĽyÄ‡ widok
+                if not self.is_host:
+                    self.handle_network_action(payload)
+                repaint = True
+            elif kind == INBOX_STATE:
+                self.network_state = payload
+                repaint = True
+            elif kind == INBOX_PLAYERS:
+                self.log_message(f"đź‘Ą Gracze online: {len(payload)}")
+            elif kind == INBOX_ERROR:
+                self.log_message(f"âš ď¸Ź {payload.get('message')}")
+            elif kind == INBOX_LOG:
+                self.log_message(payload)
+            elif kind == INBOX_CRISIS:
+                self.reveal_crisis(payload)
+            elif kind == INBOX_GAME_OVER:
+                self.show_game_results(*payload)
+            elif kind == INBOX_DONE:
+                # Wynik ruchu z tego okna zastosowanego przez kolejkÄ™ poleceĹ„
+                command, result, reason = payload
+                self.finish_pending_move(result, reason)
+                repaint = True
+
+        if repaint and self.players:
+            self.update_ui()
+            self.network_repaints += 1
+
+        self.root.after(INBOX_TICK_MS, self.process_network_inbox)
 
     def handle_network_action(self, message):
-        """ObsĹ‚uguje akcjÄ™ od innego gracza przez sieÄ‡"""
+        """ObsĹ‚uguje akcjÄ™ od innego gracza przez sieÄ‡ (UI odĹ›wieĹĽa process_network_inbox)"""
         action_type = message.data.get('action_type')
         action_data = message.data.get('action_data')
 
@@ -6143,9 +4403,6 @@ class PrincipiaGame:
         elif action_type == 'research_start':
             self.handle_network_research_start(action_data)
 
-        # OdĹ›wieĹĽ UI
-        self.update_ui()
-
     def handle_network_play_card(self, action_data):
         """ObsĹ‚uguje zagranie karty przez innego gracza"""
         # TODO: ImplementowaÄ‡
@@ -6167,6 +4424,29 @@ class PrincipiaGame:
             # Zostanie wywoĹ‚ane przez serwer automatycznie
             pass
 
+    def update_network_stats(self):
+        """OdĹ›wieĹĽa ping graczy (RTT: Ĺ›rednia EWMA i p95) w panelu hosta"""
+        if not self.game_server or not self.game_server.running:
+            self.network_stats_label.pack_forget()
+            return
+
+        stats = self.game_server.get_connection_stats()
+        if stats:
+            parts = []
+            laggy = False
+            for entry in stats:
+                if entry['rtt_ewma_ms'] is None:
+                    parts.append(f"{entry['player_name']}: -")
+                    continue
+                parts.append(f"{entry['player_name']}: {entry['rtt_ewma_ms']:.0f} ms (p95 {entry['rtt_p95_ms']:.0f})")
+                laggy = laggy or entry['rtt_p95_ms'] > 200 or entry['missed'] > 0
+            self.network_stats_label.config(text="đź“¶ " + " | ".join(parts),
+                                            fg=ModernTheme.WARNING if laggy else ModernTheme.TEXT_PRIMARY)
+        else:
+            self.network_stats_label.config(text="đź“¶ Brak podĹ‚Ä…czonych graczy", fg=ModernTheme.TEXT_SECONDARY)
+
+        self.root.after(2000, self.update_network_stats)
+
     def cleanup_network(self):
         """CzyĹ›ci poĹ‚Ä…czenia sieciowe"""
         if self.game_server:
@@ -6179,8 +4459,21 @@ class PrincipiaGame:
         try:
             self.root.mainloop()
         finally:
-            # WyczyĹ›Ä‡ poĹ‚Ä…czenia sieciowe przy zamykaniu
+            # WyczyĹ›Ä‡ poĹ‚Ä…czenia sieciowe i procesy botĂłw przy zamykaniu
             self.cleanup_network()
+            self.close_bots()
+
+def _engine_state(name):
+    """Atrybut widoku przechowywany w silniku gry"""
+    return property(lambda self: getattr(self.engine, name),
+                    lambda self, value: setattr(self.engine, name, value))
+
+def _index_in(items, obj) -> Optional[int]:
+    """Indeks obiektu na liĹ›cie (po toĹĽsamoĹ›ci) - argument ruchu silnika"""
+    return next((idx for idx, item in enumerate(items) if item is obj), None)
+
+for _name in STATE_FIELDS:
+    setattr(PrincipiaGame, _name, _engine_state(_name))
 
 class CollapsibleResearchWidget(tk.Frame):
     """Widget dla zwijanych/rozwijanych paneli badaĹ„"""
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+principia-sim - symulator Monte Carlo gry PRINCIPIA (testy balansu).
+
+Rozgrywa N pełnych gier silnikiem `GameEngine` bez interfejsu na wszystkich
+rdzeniach (`ProcessPoolExecutor`). Każdy proces wczytuje dane gry raz
+i dostaje paczki gier; wraca tylko zagregowana statystyka paczki, więc
+przepustowość rośnie liniowo z liczbą procesów.
+
+Raport: procent zwycięstw dla każdego instytutu, średnia liczba rund,
+rozkład PZ (wszyscy gracze i zwycięzcy) oraz częstość warunków końca
+gry z `check_end_game`.
+
+Z `--seed` gra numer k (od 0) ma ziarno seed + k, więc cały przebieg
+jest powtarzalny niezależnie od liczby procesów, a pojedynczą partię
+można odtworzyć przez `GameEngine.new_game(..., seed=seed + k)`.
+
+Uruchomienie:
+    python principia_sim.py --games 10000 --players 3 --scenario "Quantum Net"
+    python principia_sim.py --games 2000 --policy scripted,random,random --seed 42 --json wyniki.json
+    python principia_sim.py --games 100000 --players 4 --policy greedy-pz,research-rusher,publisher,consortium-builder
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+from game_engine import GameEngine
+from game_model import GameData
+from game_policies import POLICIES, play_game
+
+DEFAULT_CHUNK = 200  # gier w jednym zadaniu procesu
+
+# Stan procesu roboczego (dane gry wczytywane raz na proces)
+_worker_engine: Optional[GameEngine] = None
+
+def _init_worker():
+    global _worker_engine
+    game_data = GameData()
+    with contextlib.redirect_stdout(io.StringIO()):  # komunikaty wczytywania - raz, w procesie głównym
+        game_data.load_data()
+    _worker_engine = GameEngine(game_data)
+
+def find_scenario(game_data: GameData, name: Optional[str]):
+    """Scenariusz po nazwie (bez rozróżniania wielkości liter) albo numerze od 1"""
+    if not name:
+        return game_data.scenarios[0]
+    if name.isdigit() and 1 <= int(name) <= len(game_data.scenarios):
+        return game_data.scenarios[int(name) - 1]
+    for scenario in game_data.scenarios:
+        if scenario.name.lower() == name.lower():
+            return scenario
+    raise ValueError(f"Nieznany scenariusz: {name}")
+
+def new_stats() -> dict:
+    return {
+        'games': 0,
+        'rounds': 0,
+        'end_conditions': Counter(),
+        'institute_games': Counter(),
+        'institute_wins': Counter(),
+        'policy_games': Counter(),
+        'policy_wins': Counter(),
+        'pz_all': Counter(),
+        'pz_winner': Counter(),
+    }
+
+def merge_stats(total: dict, part: dict):
+    for key, value in part.items():
+        if isinstance(value, Counter):
+            total[key].update(value)
+        else:
+            total[key] += value
+
+def simulate_chunk(games: int, policy_names: List[str], scenario_name: Optional[str],
+                   first_seed: Optional[int] = None) -> dict:
+    """Zadanie procesu roboczego: `games` gier, zwraca zagregowane statystyki"""
+    engine = _worker_engine
+    scenario = find_scenario(engine.game_data, scenario_name)
+    engine.max_rounds = scenario.max_rounds
+    policies = [POLICIES[name]() for name in policy_names]
+
+    stats = new_stats()
+    for k in range(games):
+        seed = first_seed + k if first_seed is not None else None
+        stats['rounds'] += play_game(engine, policies, scenario, seed)
+        stats['games'] += 1
+        stats['end_conditions'][engine.end_condition] += 1
+
+        # Zwycięzca: najwięcej PZ (remis - niższe miejsce przy stole)
+        winner = max(range(len(engine.players)), key=lambda i: engine.players[i].prestige_points)
+        for seat, player in enumerate(engine.players):
+            institute = player.institute.name if player.institute else '-'
+            stats['institute_games'][institute] += 1
+            stats['policy_games'][policy_names[seat]] += 1
+            stats['pz_all'][player.prestige_points] += 1
+            if seat == winner:
+                stats['institute_wins'][institute] += 1
+                stats['policy_wins'][policy_names[seat]] += 1
+                stats['pz_winner'][player.prestige_points] += 1
+    return stats
+
+def run_simulation(games: int, policy_names: List[str], scenario_name: Optional[str] = None,
+                   workers: Optional[int] = None, chunk: int = DEFAULT_CHUNK,
+                   seed: Optional[int] = None) -> dict:
+    """Rozdziela gry na procesy i scala wyniki"""
+    workers = workers or os.cpu_count() or 1
+    chunks = [chunk] * (games // chunk) + ([games % chunk] if games % chunk else [])
+    total = new_stats()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = []
+        for number, size in enumerate(chunks):
+            first_seed = seed + number * chunk if seed is not None else None
+            futures.append(pool.submit(simulate_chunk, size, policy_names, scenario_name, first_seed))
+        for future in futures:
+            merge_stats(total, future.result())
+    return total
+
+def distribution(counter: Counter) -> dict:
+    """Średnia, percentyle i zakres z histogramu wartości"""
+    count = sum(counter.values())
+    if not count:
+        return {'count': 0}
+    values = sorted(counter.items())
+    def percentile(p):
+        threshold = p * count
+        seen = 0
+        for value, n in values:
+            seen += n
+            if seen >= threshold:
+                return value
+        return values[-1][0]
+    return {
+        'count': count,
+        'mean': round(sum(v * n for v, n in values) / count, 2),
+        'min': values[0][0],
+        'p10': percentile(0.10),
+        'p50': percentile(0.50),
+        'p90': percentile(0.90),
+        'max': values[-1][0],
+    }
+
+def build_report(stats: dict, elapsed: float) -> dict:
+    games = stats['games']
+    return {
+        'games': games,
+        'games_per_s': round(games / elapsed, 1) if elapsed else 0.0,
+        'avg_rounds': round(stats['rounds'] / games, 2) if games else 0.0,
+        'end_conditions': {k: round(v / games, 4) for k, v in stats['end_conditions'].most_common()},
+        'institutes': {
+            name: {'games': n, 'win_rate': round(stats['institute_wins'][name] / n, 4)}
+            for name, n in sorted(stats['institute_games'].items())
+        },
+        'policies': {
+            name: {'games': n, 'win_rate': round(stats['policy_wins'][name] / n, 4)}
+            for name, n in sorted(stats['policy_games'].items())
+        },
+        'pz_all': distribution(stats['pz_all']),
+        'pz_winner': distribution(stats['pz_winner']),
+        'pz_histogram': dict(sorted(stats['pz_all'].items())),
+    }
+
+def print_report(report: dict, scenario: str, policy_names: List[str], workers: int, elapsed: float):
+    print(f"\n📊 PRINCIPIA - symulacja: {report['games']} gier, scenariusz '{scenario}'")
+    print(f"   Strategie: {', '.join(policy_names)} | procesy: {workers} | "
+          f"{elapsed:.1f} s ({report['games_per_s']:,.0f} gier/s)")
+    print(f"   Średnio rund: {report['avg_rounds']}")
+    if report.get('seed') is not None:
+        print(f"   Ziarno: {report['seed']} (gra k: {report['seed']} + k)")
+
+    print("\n🏁 Warunki końca gry:")
+    for condition, share in report['end_conditions'].items():
+        print(f"   {condition:<12} {share:7.1%}")
+
+    print("\n🏛️ Instytuty (udział w zwycięstwach / rozegrane miejsca):")
+    for name, entry in sorted(report['institutes'].items(), key=lambda item: -item[1]['win_rate']):
+        print(f"   {name:<22} {entry['win_rate']:7.1%}  ({entry['games']})")
+
+    if len(report['policies']) > 1:
+        print("\n🤖 Strategie:")
+        for name, entry in report['policies'].items():
+            print(f"   {name:<22} {entry['win_rate']:7.1%}  ({entry['games']})")
+
+    print("\n⭐ PZ na koniec gry:")
+    for label, key in (('wszyscy', 'pz_all'), ('zwycięzcy', 'pz_winner')):
+        d = report[key]
+        print(f"   {label:<10} śr. {d['mean']:5.1f} | min {d['min']} p10 {d['p10']} "
+              f"p50 {d['p50']} p90 {d['p90']} max {d['max']}")
+
+def main():
+    parser = argparse.ArgumentParser(prog='principia-sim', description="Symulator Monte Carlo gry PRINCIPIA")
+    parser.add_argument('--games', type=int, default=1000, help="Liczba gier")
+    parser.add_argument('--players', type=int, default=3, choices=[2, 3, 4])
+    parser.add_argument('--scenario', default=None,
+                        help="Nazwa albo numer (od 1) scenariusza z karty_scenariusze.csv")
+    parser.add_argument('--policy', default='scripted',
+                        help=f"Strategia dla wszystkich albo lista po przecinku na miejsce ({', '.join(sorted(POLICIES))})")
+    parser.add_argument('--workers', type=int, default=None, help="Procesy (domyślnie liczba rdzeni)")
+    parser.add_argument('--chunk', type=int, default=DEFAULT_CHUNK, help="Gier na zadanie procesu")
+    parser.add_argument('--seed', type=int, default=None, help="Ziarno pierwszej gry (powtarzalny przebieg)")
+    parser.add_argument('--json', default=None, help="Zapisz raport do pliku JSON")
+    parser.add_argument('--list-scenarios', action='store_true', help="Wypisz scenariusze i zakończ")
+    args = parser.parse_args()
+
+    game_data = GameData()
+    game_data.load_data()
+    if args.list_scenarios:
+        for number, scenario in enumerate(game_data.scenarios, 1):
+            print(f"{number:>2}. {scenario.name} ({scenario.max_rounds} rund)")
+        return
+
+    policy_names = args.policy.split(',')
+    if len(policy_names) == 1:
+        policy_names = policy_names * args.players
+    if len(policy_names) != args.players or any(name not in POLICIES for name in policy_names):
+        parser.error(f"--policy: podaj 1 albo {args.players} strategie z: {', '.join(sorted(POLICIES))}")
+    try:
+        scenario = find_scenario(game_data, args.scenario)
+    except ValueError as e:
+        parser.error(str(e))
+
+    workers = args.workers or os.cpu_count() or 1
+    started = time.perf_counter()
+    stats = run_simulation(args.games, policy_names, scenario.name, workers, args.chunk, args.seed)
+    elapsed = time.perf_counter() - started
+
+    report = build_report(stats, elapsed)
+    report.update({'scenario': scenario.name, 'players': args.players, 'policies_by_seat': policy_names,
+                   'seed': args.seed})
+    print_report(report, scenario.name, policy_names, workers, elapsed)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 Raport zapisany: {args.json}")
+
+if __name__ == '__main__':
+    main()